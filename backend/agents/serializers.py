@@ -267,6 +267,12 @@ class AgentSerializer(serializers.ModelSerializer):
             "created_at",
         ]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        return queryset.select_related("parent_assistant").prefetch_related(
+            "trained_documents"
+        )
+
     def get_parent_assistant_id(self, obj):
         return str(obj.parent_assistant_id) if obj.parent_assistant_id else None
 
@@ -286,6 +292,12 @@ class AgentClusterSerializer(serializers.ModelSerializer):
         model = AgentCluster
         fields = ["id", "name", "purpose", "project", "agents", "skill_count"]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        return queryset.select_related("project").prefetch_related(
+            "agents__parent_assistant", "agents__trained_documents"
+        )
+
     def get_project(self, obj):
         from assistants.serializers import AssistantProjectSummarySerializer
 
@@ -392,6 +404,10 @@ class LoreEntrySerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "created_at"]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        return queryset.prefetch_related("associated_events", "authors")
+
 
 class LoreEpochSerializer(serializers.ModelSerializer):
     """Serialize LoreEpoch records."""
@@ -1,5 +1,6 @@
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
+from api.pagination import keyset_list_response
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny
@@ -362,9 +363,9 @@ from datetime import datetime
 
 @api_view(["GET"])
 def list_agents(request):
-    agents = Agent.objects.all().order_by("created_at")
-    serializer = AgentSerializer(agents, many=True)
-    return Response(serializer.data)
+    return keyset_list_response(
+        request, Agent.objects.all(), AgentSerializer, descending=False
+    )
 
 
 @api_view(["GET"])
@@ -510,9 +511,9 @@ def recommend_training_docs(request, id):
 
 @api_view(["GET"])
 def list_clusters(request):
-    clusters = AgentCluster.objects.all().order_by("-created_at")
-    serializer = AgentClusterSerializer(clusters, many=True)
-    return Response(serializer.data)
+    return keyset_list_response(
+        request, AgentCluster.objects.all(), AgentClusterSerializer
+    )
 
 
 @api_view(["GET"])
@@ -524,9 +525,9 @@ def cluster_detail_view(request, id):
 
 @api_view(["GET"])
 def trained_agents(request):
-    logs = TrainedAgentLog.objects.all().order_by("-created_at")
-    serializer = TrainedAgentLogSerializer(logs, many=True)
-    return Response(serializer.data)
+    return keyset_list_response(
+        request, TrainedAgentLog.objects.all(), TrainedAgentLogSerializer
+    )
 
 
 @api_view(["GET"])
@@ -594,8 +595,9 @@ def retire_agents(request):
 @api_view(["GET", "POST"])
 def lore_entries(request):
     if request.method == "GET":
-        entries = LoreEntry.objects.all().order_by("-created_at")
-        return Response(LoreEntrySerializer(entries, many=True).data)
+        return keyset_list_response(
+            request, LoreEntry.objects.all(), LoreEntrySerializer
+        )
 
     serializer = LoreEntrySerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -606,8 +608,9 @@ def lore_entries(request):
 @api_view(["GET", "POST"])
 def retcon_requests(request):
     if request.method == "GET":
-        requests = RetconRequest.objects.all().order_by("-created_at")
-        return Response(RetconRequestSerializer(requests, many=True).data)
+        return keyset_list_response(
+            request, RetconRequest.objects.all(), RetconRequestSerializer
+        )
 
     serializer = RetconRequestSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -619,8 +622,9 @@ def retcon_requests(request):
 def lore_epochs(request):
     """List or create lore epochs."""
     if request.method == "GET":
-        epochs = LoreEpoch.objects.all().order_by("-created_at")
-        return Response(LoreEpochSerializer(epochs, many=True).data)
+        return keyset_list_response(
+            request, LoreEpoch.objects.all(), LoreEpochSerializer
+        )
 
     serializer = LoreEpochSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -641,30 +645,30 @@ def myth_reset_cycle(request):
 def assistant_civilizations(request):
     from assistants.models import AssistantCivilization
 
-    civs = AssistantCivilization.objects.all().order_by("-created_at")
-    serializer = AssistantCivilizationSerializer(civs, many=True)
-    return Response(serializer.data)
+    return keyset_list_response(
+        request, AssistantCivilization.objects.all(), AssistantCivilizationSerializer
+    )
 
 
 @api_view(["GET"])
 def consensus_votes(request):
-    votes = RealityConsensusVote.objects.all().order_by("-created_at")
-    serializer = RealityConsensusVoteSerializer(votes, many=True)
-    return Response(serializer.data)
+    return keyset_list_response(
+        request, RealityConsensusVote.objects.all(), RealityConsensusVoteSerializer
+    )
 
 
 @api_view(["GET"])
 def myth_diplomacy_sessions(request):
-    sessions = MythDiplomacySession.objects.all().order_by("-created_at")
-    serializer = MythDiplomacySessionSerializer(sessions, many=True)
-    return Response(serializer.data)
+    return keyset_list_response(
+        request, MythDiplomacySession.objects.all(), MythDiplomacySessionSerializer
+    )
 
 
 @api_view(["GET"])
 def ritual_collapse_logs(request):
-    logs = RitualCollapseLog.objects.all().order_by("-created_at")
-    serializer = RitualCollapseLogSerializer(logs, many=True)
-    return Response(serializer.data)
+    return keyset_list_response(
+        request, RitualCollapseLog.objects.all(), RitualCollapseLogSerializer
+    )
 
 
 @api_view(["GET"])
@@ -696,8 +700,9 @@ def harmonize_global(request):
 @api_view(["GET", "POST"])
 def artifacts(request):
     if request.method == "GET":
-        items = LegacyArtifact.objects.all().order_by("-created_at")
-        return Response(LegacyArtifactSerializer(items, many=True).data)
+        return keyset_list_response(
+            request, LegacyArtifact.objects.all(), LegacyArtifactSerializer
+        )
 
     serializer = LegacyArtifactSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -708,8 +713,9 @@ def artifacts(request):
 @api_view(["GET", "POST"])
 def reincarnations(request):
     if request.method == "GET":
-        logs = ReincarnationLog.objects.all().order_by("-created_at")
-        return Response(ReincarnationLogSerializer(logs, many=True).data)
+        return keyset_list_response(
+            request, ReincarnationLog.objects.all(), ReincarnationLogSerializer
+        )
 
     serializer = ReincarnationLogSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -720,8 +726,9 @@ def reincarnations(request):
 @api_view(["GET", "POST"])
 def return_cycles(request):
     if request.method == "GET":
-        cycles = ReturnCycle.objects.all().order_by("-created_at")
-        return Response(ReturnCycleSerializer(cycles, many=True).data)
+        return keyset_list_response(
+            request, ReturnCycle.objects.all(), ReturnCycleSerializer
+        )
 
     serializer = ReturnCycleSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -753,8 +760,9 @@ def lore_tokens(request):
 @api_view(["GET", "POST"])
 def lore_token_exchange(request):
     if request.method == "GET":
-        exchanges = LoreTokenExchange.objects.all().order_by("-created_at")
-        return Response(LoreTokenExchangeSerializer(exchanges, many=True).data)
+        return keyset_list_response(
+            request, LoreTokenExchange.objects.all(), LoreTokenExchangeSerializer
+        )
 
     serializer = LoreTokenExchangeSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -801,8 +809,11 @@ def token_market(request):
 @api_view(["GET", "POST"])
 def token_rituals(request):
     if request.method == "GET":
-        rituals = LoreTokenCraftingRitual.objects.all().order_by("-created_at")
-        return Response(LoreTokenCraftingRitualSerializer(rituals, many=True).data)
+        return keyset_list_response(
+            request,
+            LoreTokenCraftingRitual.objects.all(),
+            LoreTokenCraftingRitualSerializer,
+        )
 
     if request.data.get("complete"):
         ritual_id = request.data.get("ritual")
@@ -819,8 +830,9 @@ def token_rituals(request):
 @api_view(["GET", "POST"])
 def token_votes(request):
     if request.method == "GET":
-        votes = TokenGuildVote.objects.all().order_by("-created_at")
-        return Response(TokenGuildVoteSerializer(votes, many=True).data)
+        return keyset_list_response(
+            request, TokenGuildVote.objects.all(), TokenGuildVoteSerializer
+        )
 
     serializer = TokenGuildVoteSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -831,8 +843,9 @@ def token_votes(request):
 @api_view(["GET", "POST"])
 def myth_registry(request):
     if request.method == "GET":
-        entries = MythRegistryEntry.objects.all().order_by("-created_at")
-        return Response(MythRegistryEntrySerializer(entries, many=True).data)
+        return keyset_list_response(
+            request, MythRegistryEntry.objects.all(), MythRegistryEntrySerializer
+        )
 
     serializer = MythRegistryEntrySerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -855,8 +868,11 @@ def lore_anchors(request):
 @api_view(["GET", "POST"])
 def ritual_compliance(request):
     if request.method == "GET":
-        records = RitualComplianceRecord.objects.all().order_by("-created_at")
-        return Response(RitualComplianceRecordSerializer(records, many=True).data)
+        return keyset_list_response(
+            request,
+            RitualComplianceRecord.objects.all(),
+            RitualComplianceRecordSerializer,
+        )
 
     serializer = RitualComplianceRecordSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -867,8 +883,9 @@ def ritual_compliance(request):
 @api_view(["GET", "POST"])
 def token_signatures(request):
     if request.method == "GET":
-        sigs = LoreTokenSignature.objects.all().order_by("-created_at")
-        return Response(LoreTokenSignatureSerializer(sigs, many=True).data)
+        return keyset_list_response(
+            request, LoreTokenSignature.objects.all(), LoreTokenSignatureSerializer
+        )
 
     serializer = LoreTokenSignatureSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -893,8 +910,9 @@ def chronomyth_sync(request):
 @api_view(["GET", "POST"])
 def belief_forks(request):
     if request.method == "GET":
-        forks = BeliefForkEvent.objects.all().order_by("-created_at")
-        return Response(BeliefForkEventSerializer(forks, many=True).data)
+        return keyset_list_response(
+            request, BeliefForkEvent.objects.all(), BeliefForkEventSerializer
+        )
 
     serializer = BeliefForkEventSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -905,8 +923,9 @@ def belief_forks(request):
 @api_view(["GET", "POST"])
 def myth_collapses(request):
     if request.method == "GET":
-        logs = MythCollapseLog.objects.all().order_by("-created_at")
-        return Response(MythCollapseLogSerializer(logs, many=True).data)
+        return keyset_list_response(
+            request, MythCollapseLog.objects.all(), MythCollapseLogSerializer
+        )
 
     serializer = MythCollapseLogSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -917,8 +936,11 @@ def myth_collapses(request):
 @api_view(["GET", "POST"])
 def memory_reformations(request):
     if request.method == "GET":
-        rituals = MemoryReformationRitual.objects.all().order_by("-created_at")
-        return Response(MemoryReformationRitualSerializer(rituals, many=True).data)
+        return keyset_list_response(
+            request,
+            MemoryReformationRitual.objects.all(),
+            MemoryReformationRitualSerializer,
+        )
 
     serializer = MemoryReformationRitualSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -929,8 +951,9 @@ def memory_reformations(request):
 @api_view(["GET", "POST"])
 def epistemology(request):
     if request.method == "GET":
-        nodes = EpistemologyNode.objects.all().order_by("-created_at")
-        return Response(EpistemologyNodeSerializer(nodes, many=True).data)
+        return keyset_list_response(
+            request, EpistemologyNode.objects.all(), EpistemologyNodeSerializer
+        )
 
     serializer = EpistemologyNodeSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -941,8 +964,11 @@ def epistemology(request):
 @api_view(["GET", "POST"])
 def entanglements(request):
     if request.method == "GET":
-        links = BeliefEntanglementLink.objects.all().order_by("-created_at")
-        return Response(BeliefEntanglementLinkSerializer(links, many=True).data)
+        return keyset_list_response(
+            request,
+            BeliefEntanglementLink.objects.all(),
+            BeliefEntanglementLinkSerializer,
+        )
 
     serializer = BeliefEntanglementLinkSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -953,8 +979,11 @@ def entanglements(request):
 @api_view(["GET", "POST"])
 def cognitive_constraints(request):
     if request.method == "GET":
-        profiles = CognitiveConstraintProfile.objects.all().order_by("-created_at")
-        return Response(CognitiveConstraintProfileSerializer(profiles, many=True).data)
+        return keyset_list_response(
+            request,
+            CognitiveConstraintProfile.objects.all(),
+            CognitiveConstraintProfileSerializer,
+        )
 
     serializer = CognitiveConstraintProfileSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -965,8 +994,11 @@ def cognitive_constraints(request):
 @api_view(["GET", "POST"])
 def belief_negotiations(request):
     if request.method == "GET":
-        sessions = BeliefNegotiationSession.objects.all().order_by("-created_at")
-        return Response(BeliefNegotiationSessionSerializer(sessions, many=True).data)
+        return keyset_list_response(
+            request,
+            BeliefNegotiationSession.objects.all(),
+            BeliefNegotiationSessionSerializer,
+        )
 
     serializer = BeliefNegotiationSessionSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -977,8 +1009,11 @@ def belief_negotiations(request):
 @api_view(["GET", "POST"])
 def paradox_resolution_attempts(request):
     if request.method == "GET":
-        attempts = ParadoxResolutionAttempt.objects.all().order_by("-created_at")
-        return Response(ParadoxResolutionAttemptSerializer(attempts, many=True).data)
+        return keyset_list_response(
+            request,
+            ParadoxResolutionAttempt.objects.all(),
+            ParadoxResolutionAttemptSerializer,
+        )
 
     serializer = ParadoxResolutionAttemptSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -989,8 +1024,9 @@ def paradox_resolution_attempts(request):
 @api_view(["GET", "POST"])
 def ontology_audits(request):
     if request.method == "GET":
-        audits = OntologicalAuditLog.objects.all().order_by("-created_at")
-        return Response(OntologicalAuditLogSerializer(audits, many=True).data)
+        return keyset_list_response(
+            request, OntologicalAuditLog.objects.all(), OntologicalAuditLogSerializer
+        )
 
     serializer = OntologicalAuditLogSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1001,8 +1037,9 @@ def ontology_audits(request):
 @api_view(["GET", "POST"])
 def belief_biomes(request):
     if request.method == "GET":
-        biomes = BeliefBiome.objects.all().order_by("-created_at")
-        return Response(BeliefBiomeSerializer(biomes, many=True).data)
+        return keyset_list_response(
+            request, BeliefBiome.objects.all(), BeliefBiomeSerializer
+        )
 
     serializer = BeliefBiomeSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1013,8 +1050,9 @@ def belief_biomes(request):
 @api_view(["GET", "POST"])
 def symbolic_alliances(request):
     if request.method == "GET":
-        alliances = SymbolicAlliance.objects.all().order_by("-created_at")
-        return Response(SymbolicAllianceSerializer(alliances, many=True).data)
+        return keyset_list_response(
+            request, SymbolicAlliance.objects.all(), SymbolicAllianceSerializer
+        )
 
     serializer = SymbolicAllianceSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1025,8 +1063,11 @@ def symbolic_alliances(request):
 @api_view(["GET", "POST"])
 def dream_purpose_negotiations(request):
     if request.method == "GET":
-        sessions = DreamPurposeNegotiation.objects.all().order_by("-created_at")
-        return Response(DreamPurposeNegotiationSerializer(sessions, many=True).data)
+        return keyset_list_response(
+            request,
+            DreamPurposeNegotiation.objects.all(),
+            DreamPurposeNegotiationSerializer,
+        )
 
     serializer = DreamPurposeNegotiationSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1037,8 +1078,9 @@ def dream_purpose_negotiations(request):
 @api_view(["GET", "POST"])
 def biome_mutations(request):
     if request.method == "GET":
-        events = BiomeMutationEvent.objects.all().order_by("-created_at")
-        return Response(BiomeMutationEventSerializer(events, many=True).data)
+        return keyset_list_response(
+            request, BiomeMutationEvent.objects.all(), BiomeMutationEventSerializer
+        )
 
     serializer = BiomeMutationEventSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1049,8 +1091,9 @@ def biome_mutations(request):
 @api_view(["GET", "POST"])
 def codexes(request):
     if request.method == "GET":
-        codices = SwarmCodex.objects.all().order_by("-created_at")
-        return Response(SwarmCodexSerializer(codices, many=True).data)
+        return keyset_list_response(
+            request, SwarmCodex.objects.all(), SwarmCodexSerializer
+        )
 
     serializer = SwarmCodexSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1073,8 +1116,9 @@ def agent_codices(request):
 @api_view(["GET", "POST"])
 def symbolic_laws(request):
     if request.method == "GET":
-        laws = SymbolicLawEntry.objects.all().order_by("-created_at")
-        return Response(SymbolicLawEntrySerializer(laws, many=True).data)
+        return keyset_list_response(
+            request, SymbolicLawEntry.objects.all(), SymbolicLawEntrySerializer
+        )
 
     serializer = SymbolicLawEntrySerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1085,8 +1129,9 @@ def symbolic_laws(request):
 @api_view(["GET", "POST"])
 def ritual_archives(request):
     if request.method == "GET":
-        archives = RitualArchiveEntry.objects.all().order_by("-created_at")
-        return Response(RitualArchiveEntrySerializer(archives, many=True).data)
+        return keyset_list_response(
+            request, RitualArchiveEntry.objects.all(), RitualArchiveEntrySerializer
+        )
 
     serializer = RitualArchiveEntrySerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1097,8 +1142,9 @@ def ritual_archives(request):
 @api_view(["GET", "POST"])
 def polities(request):
     if request.method == "GET":
-        polities = AssistantPolity.objects.all().order_by("-created_at")
-        return Response(AssistantPolitySerializer(polities, many=True).data)
+        return keyset_list_response(
+            request, AssistantPolity.objects.all(), AssistantPolitySerializer
+        )
 
     serializer = AssistantPolitySerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1109,8 +1155,9 @@ def polities(request):
 @api_view(["GET", "POST"])
 def elections(request):
     if request.method == "GET":
-        elections = RitualElection.objects.all().order_by("-created_at")
-        return Response(RitualElectionSerializer(elections, many=True).data)
+        return keyset_list_response(
+            request, RitualElection.objects.all(), RitualElectionSerializer
+        )
 
     serializer = RitualElectionSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1121,8 +1168,9 @@ def elections(request):
 @api_view(["GET", "POST"])
 def legacy_roles(request):
     if request.method == "GET":
-        roles = LegacyRoleBinding.objects.all().order_by("-created_at")
-        return Response(LegacyRoleBindingSerializer(roles, many=True).data)
+        return keyset_list_response(
+            request, LegacyRoleBinding.objects.all(), LegacyRoleBindingSerializer
+        )
 
     serializer = LegacyRoleBindingSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1133,8 +1181,11 @@ def legacy_roles(request):
 @api_view(["GET", "POST"])
 def arbitration_cases(request):
     if request.method == "GET":
-        cases = MythicArbitrationCase.objects.all().order_by("-created_at")
-        return Response(MythicArbitrationCaseSerializer(cases, many=True).data)
+        return keyset_list_response(
+            request,
+            MythicArbitrationCase.objects.all(),
+            MythicArbitrationCaseSerializer,
+        )
 
     serializer = MythicArbitrationCaseSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1145,8 +1196,9 @@ def arbitration_cases(request):
 @api_view(["GET", "POST"])
 def treaty_breaches(request):
     if request.method == "GET":
-        breaches = TreatyBreachRitual.objects.all().order_by("-created_at")
-        return Response(TreatyBreachRitualSerializer(breaches, many=True).data)
+        return keyset_list_response(
+            request, TreatyBreachRitual.objects.all(), TreatyBreachRitualSerializer
+        )
 
     serializer = TreatyBreachRitualSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1157,8 +1209,9 @@ def treaty_breaches(request):
 @api_view(["GET", "POST"])
 def symbolic_sanctions(request):
     if request.method == "GET":
-        sanctions = SymbolicSanction.objects.all().order_by("-created_at")
-        return Response(SymbolicSanctionSerializer(sanctions, many=True).data)
+        return keyset_list_response(
+            request, SymbolicSanction.objects.all(), SymbolicSanctionSerializer
+        )
 
     serializer = SymbolicSanctionSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1169,8 +1222,9 @@ def symbolic_sanctions(request):
 @api_view(["GET", "POST"])
 def tribunals(request):
     if request.method == "GET":
-        cases = SwarmTribunalCase.objects.all().order_by("-created_at")
-        return Response(SwarmTribunalCaseSerializer(cases, many=True).data)
+        return keyset_list_response(
+            request, SwarmTribunalCase.objects.all(), SwarmTribunalCaseSerializer
+        )
 
     serializer = SwarmTribunalCaseSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1181,8 +1235,11 @@ def tribunals(request):
 @api_view(["GET", "POST"])
 def restorative_memory_actions(request):
     if request.method == "GET":
-        actions = RestorativeMemoryAction.objects.all().order_by("-created_at")
-        return Response(RestorativeMemoryActionSerializer(actions, many=True).data)
+        return keyset_list_response(
+            request,
+            RestorativeMemoryAction.objects.all(),
+            RestorativeMemoryActionSerializer,
+        )
 
     serializer = RestorativeMemoryActionSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1196,8 +1253,11 @@ def restorative_memory_actions(request):
 @api_view(["GET", "POST"])
 def reputation_regeneration_events(request):
     if request.method == "GET":
-        events = ReputationRegenerationEvent.objects.all().order_by("-created_at")
-        return Response(ReputationRegenerationEventSerializer(events, many=True).data)
+        return keyset_list_response(
+            request,
+            ReputationRegenerationEvent.objects.all(),
+            ReputationRegenerationEventSerializer,
+        )
 
     serializer = ReputationRegenerationEventSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1211,8 +1271,9 @@ def reputation_regeneration_events(request):
 @api_view(["GET", "POST"])
 def myth_cycles(request):
     if request.method == "GET":
-        cycles = MythCycleBinding.objects.all().order_by("-created_at")
-        return Response(MythCycleBindingSerializer(cycles, many=True).data)
+        return keyset_list_response(
+            request, MythCycleBinding.objects.all(), MythCycleBindingSerializer
+        )
 
     serializer = MythCycleBindingSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1223,8 +1284,9 @@ def myth_cycles(request):
 @api_view(["GET", "POST"])
 def resurrection_templates(request):
     if request.method == "GET":
-        templates = ResurrectionTemplate.objects.all().order_by("-created_at")
-        return Response(ResurrectionTemplateSerializer(templates, many=True).data)
+        return keyset_list_response(
+            request, ResurrectionTemplate.objects.all(), ResurrectionTemplateSerializer
+        )
 
     serializer = ResurrectionTemplateSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1235,8 +1297,11 @@ def resurrection_templates(request):
 @api_view(["GET", "POST"])
 def belief_continuity(request):
     if request.method == "GET":
-        rituals = BeliefContinuityRitual.objects.all().order_by("-created_at")
-        return Response(BeliefContinuityRitualSerializer(rituals, many=True).data)
+        return keyset_list_response(
+            request,
+            BeliefContinuityRitual.objects.all(),
+            BeliefContinuityRitualSerializer,
+        )
 
     serializer = BeliefContinuityRitualSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1247,8 +1312,9 @@ def belief_continuity(request):
 @api_view(["GET", "POST"])
 def cosmological_roles(request):
     if request.method == "GET":
-        roles = CosmologicalRole.objects.all().order_by("-created_at")
-        return Response(CosmologicalRoleSerializer(roles, many=True).data)
+        return keyset_list_response(
+            request, CosmologicalRole.objects.all(), CosmologicalRoleSerializer
+        )
 
     serializer = CosmologicalRoleSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1268,8 +1334,9 @@ def myth_weaver(request):
 @api_view(["GET", "POST"])
 def legacy_vaults(request):
     if request.method == "GET":
-        vaults = LegacyTokenVault.objects.all().order_by("-created_at")
-        return Response(LegacyTokenVaultSerializer(vaults, many=True).data)
+        return keyset_list_response(
+            request, LegacyTokenVault.objects.all(), LegacyTokenVaultSerializer
+        )
 
     serializer = LegacyTokenVaultSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1280,8 +1347,11 @@ def legacy_vaults(request):
 @api_view(["GET", "POST"])
 def archetype_sync_pulses(request):
     if request.method == "GET":
-        pulses = ArchetypeSynchronizationPulse.objects.all().order_by("-created_at")
-        return Response(ArchetypeSynchronizationPulseSerializer(pulses, many=True).data)
+        return keyset_list_response(
+            request,
+            ArchetypeSynchronizationPulse.objects.all(),
+            ArchetypeSynchronizationPulseSerializer,
+        )
 
     serializer = ArchetypeSynchronizationPulseSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1292,8 +1362,9 @@ def archetype_sync_pulses(request):
 @api_view(["GET", "POST"])
 def creation_myths(request):
     if request.method == "GET":
-        myths = CreationMythEntry.objects.all().order_by("-created_at")
-        return Response(CreationMythEntrySerializer(myths, many=True).data)
+        return keyset_list_response(
+            request, CreationMythEntry.objects.all(), CreationMythEntrySerializer
+        )
 
     serializer = CreationMythEntrySerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1304,8 +1375,11 @@ def creation_myths(request):
 @api_view(["GET", "POST"])
 def cosmogenesis_simulations(request):
     if request.method == "GET":
-        sims = CosmogenesisSimulation.objects.all().order_by("-created_at")
-        return Response(CosmogenesisSimulationSerializer(sims, many=True).data)
+        return keyset_list_response(
+            request,
+            CosmogenesisSimulation.objects.all(),
+            CosmogenesisSimulationSerializer,
+        )
 
     serializer = CosmogenesisSimulationSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1316,8 +1390,9 @@ def cosmogenesis_simulations(request):
 @api_view(["GET", "POST"])
 def mythic_forecast(request):
     if request.method == "GET":
-        pulses = MythicForecastPulse.objects.all().order_by("-created_at")
-        return Response(MythicForecastPulseSerializer(pulses, many=True).data)
+        return keyset_list_response(
+            request, MythicForecastPulse.objects.all(), MythicForecastPulseSerializer
+        )
 
     serializer = MythicForecastPulseSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1328,8 +1403,9 @@ def mythic_forecast(request):
 @api_view(["GET", "POST"])
 def belief_atlases(request):
     if request.method == "GET":
-        atlases = BeliefAtlasSnapshot.objects.all().order_by("-created_at")
-        return Response(BeliefAtlasSnapshotSerializer(atlases, many=True).data)
+        return keyset_list_response(
+            request, BeliefAtlasSnapshot.objects.all(), BeliefAtlasSnapshotSerializer
+        )
 
     serializer = BeliefAtlasSnapshotSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1340,8 +1416,9 @@ def belief_atlases(request):
 @api_view(["GET", "POST"])
 def symbolic_weather(request):
     if request.method == "GET":
-        fronts = SymbolicWeatherFront.objects.all().order_by("-created_at")
-        return Response(SymbolicWeatherFrontSerializer(fronts, many=True).data)
+        return keyset_list_response(
+            request, SymbolicWeatherFront.objects.all(), SymbolicWeatherFrontSerializer
+        )
 
     serializer = SymbolicWeatherFrontSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1352,8 +1429,9 @@ def symbolic_weather(request):
 @api_view(["GET", "POST"])
 def collaboration_threads(request):
     if request.method == "GET":
-        threads = CollaborationThread.objects.all().order_by("-created_at")
-        return Response(CollaborationThreadSerializer(threads, many=True).data)
+        return keyset_list_response(
+            request, CollaborationThread.objects.all(), CollaborationThreadSerializer
+        )
 
     serializer = CollaborationThreadSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1364,8 +1442,9 @@ def collaboration_threads(request):
 @api_view(["GET", "POST"])
 def delegation_streams(request):
     if request.method == "GET":
-        streams = DelegationStream.objects.all().order_by("-created_at")
-        return Response(DelegationStreamSerializer(streams, many=True).data)
+        return keyset_list_response(
+            request, DelegationStream.objects.all(), DelegationStreamSerializer
+        )
 
     serializer = DelegationStreamSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1376,8 +1455,9 @@ def delegation_streams(request):
 @api_view(["GET", "POST"])
 def mythflow_insights(request):
     if request.method == "GET":
-        insights = MythflowInsight.objects.all().order_by("-created_at")
-        return Response(MythflowInsightSerializer(insights, many=True).data)
+        return keyset_list_response(
+            request, MythflowInsight.objects.all(), MythflowInsightSerializer
+        )
 
     serializer = MythflowInsightSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1388,8 +1468,9 @@ def mythflow_insights(request):
 @api_view(["GET", "POST"])
 def purpose_index(request):
     if request.method == "GET":
-        entries = PurposeIndexEntry.objects.all().order_by("-created_at")
-        return Response(PurposeIndexEntrySerializer(entries, many=True).data)
+        return keyset_list_response(
+            request, PurposeIndexEntry.objects.all(), PurposeIndexEntrySerializer
+        )
 
     serializer = PurposeIndexEntrySerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1400,8 +1481,9 @@ def purpose_index(request):
 @api_view(["GET", "POST"])
 def belief_signals(request):
     if request.method == "GET":
-        signals = BeliefSignalNode.objects.all().order_by("-created_at")
-        return Response(BeliefSignalNodeSerializer(signals, many=True).data)
+        return keyset_list_response(
+            request, BeliefSignalNode.objects.all(), BeliefSignalNodeSerializer
+        )
 
     serializer = BeliefSignalNodeSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1412,8 +1494,9 @@ def belief_signals(request):
 @api_view(["GET", "POST"])
 def archetype_genesis(request):
     if request.method == "GET":
-        logs = ArchetypeGenesisLog.objects.all().order_by("-created_at")
-        return Response(ArchetypeGenesisLogSerializer(logs, many=True).data)
+        return keyset_list_response(
+            request, ArchetypeGenesisLog.objects.all(), ArchetypeGenesisLogSerializer
+        )
 
     serializer = ArchetypeGenesisLogSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1424,8 +1507,9 @@ def archetype_genesis(request):
 @api_view(["GET", "POST"])
 def myth_blooms(request):
     if request.method == "GET":
-        blooms = MythBloomNode.objects.all().order_by("-created_at")
-        return Response(MythBloomNodeSerializer(blooms, many=True).data)
+        return keyset_list_response(
+            request, MythBloomNode.objects.all(), MythBloomNodeSerializer
+        )
 
     serializer = MythBloomNodeSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1436,8 +1520,11 @@ def myth_blooms(request):
 @api_view(["GET", "POST"])
 def belief_seeds(request):
     if request.method == "GET":
-        seeds = BeliefSeedReplication.objects.all().order_by("-created_at")
-        return Response(BeliefSeedReplicationSerializer(seeds, many=True).data)
+        return keyset_list_response(
+            request,
+            BeliefSeedReplication.objects.all(),
+            BeliefSeedReplicationSerializer,
+        )
 
     serializer = BeliefSeedReplicationSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1495,8 +1582,11 @@ def resonance_graphs(request):
 @api_view(["GET", "POST"])
 def cognitive_balance_reports(request):
     if request.method == "GET":
-        reports = CognitiveBalanceReport.objects.all().order_by("-created_at")
-        return Response(CognitiveBalanceReportSerializer(reports, many=True).data)
+        return keyset_list_response(
+            request,
+            CognitiveBalanceReport.objects.all(),
+            CognitiveBalanceReportSerializer,
+        )
 
     serializer = CognitiveBalanceReportSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1507,8 +1597,11 @@ def cognitive_balance_reports(request):
 @api_view(["GET", "POST"])
 def purpose_migrations(request):
     if request.method == "GET":
-        migrations = PurposeMigrationEvent.objects.all().order_by("-created_at")
-        return Response(PurposeMigrationEventSerializer(migrations, many=True).data)
+        return keyset_list_response(
+            request,
+            PurposeMigrationEvent.objects.all(),
+            PurposeMigrationEventSerializer,
+        )
 
     serializer = PurposeMigrationEventSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1519,8 +1612,11 @@ def purpose_migrations(request):
 @api_view(["GET", "POST"])
 def signal_artifacts(request):
     if request.method == "GET":
-        artifacts = SignalEncodingArtifact.objects.all().order_by("-created_at")
-        return Response(SignalEncodingArtifactSerializer(artifacts, many=True).data)
+        return keyset_list_response(
+            request,
+            SignalEncodingArtifact.objects.all(),
+            SignalEncodingArtifactSerializer,
+        )
 
     serializer = SignalEncodingArtifactSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1555,8 +1651,11 @@ def flux_index(request):
 @api_view(["GET", "POST"])
 def symbolic_forecasts(request):
     if request.method == "GET":
-        forecasts = SymbolicForecastIndex.objects.all().order_by("-created_at")
-        return Response(SymbolicForecastIndexSerializer(forecasts, many=True).data)
+        return keyset_list_response(
+            request,
+            SymbolicForecastIndex.objects.all(),
+            SymbolicForecastIndexSerializer,
+        )
 
     serializer = SymbolicForecastIndexSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1588,8 +1687,9 @@ def assistant_sentiments(request, assistant_id=None):
 @api_view(["GET", "POST"])
 def ritual_market_feeds(request):
     if request.method == "GET":
-        feeds = RitualMarketFeed.objects.all().order_by("-created_at")
-        return Response(RitualMarketFeedSerializer(feeds, many=True).data)
+        return keyset_list_response(
+            request, RitualMarketFeed.objects.all(), RitualMarketFeedSerializer
+        )
 
     serializer = RitualMarketFeedSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1614,8 +1714,11 @@ def trend_reactivity_models(request):
 @api_view(["GET", "POST"])
 def stability_graphs(request):
     if request.method == "GET":
-        graphs = SymbolicStabilityGraph.objects.all().order_by("-created_at")
-        return Response(SymbolicStabilityGraphSerializer(graphs, many=True).data)
+        return keyset_list_response(
+            request,
+            SymbolicStabilityGraph.objects.all(),
+            SymbolicStabilityGraphSerializer,
+        )
 
     serializer = SymbolicStabilityGraphSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1626,8 +1729,11 @@ def stability_graphs(request):
 @api_view(["GET", "POST"])
 def resilience_monitors(request):
     if request.method == "GET":
-        monitors = SymbolicResilienceMonitor.objects.all().order_by("-created_at")
-        return Response(SymbolicResilienceMonitorSerializer(monitors, many=True).data)
+        return keyset_list_response(
+            request,
+            SymbolicResilienceMonitor.objects.all(),
+            SymbolicResilienceMonitorSerializer,
+        )
 
     serializer = SymbolicResilienceMonitorSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1638,8 +1744,11 @@ def resilience_monitors(request):
 @api_view(["GET", "POST"])
 def deployment_packets(request):
     if request.method == "GET":
-        packets = MythOSDeploymentPacket.objects.all().order_by("-created_at")
-        return Response(MythOSDeploymentPacketSerializer(packets, many=True).data)
+        return keyset_list_response(
+            request,
+            MythOSDeploymentPacket.objects.all(),
+            MythOSDeploymentPacketSerializer,
+        )
 
     serializer = MythOSDeploymentPacketSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1666,8 +1775,9 @@ def deployment_strategies(request):
 @api_view(["GET", "POST"])
 def deployment_kits(request):
     if request.method == "GET":
-        kits = GuildDeploymentKit.objects.all().order_by("-created_at")
-        return Response(GuildDeploymentKitSerializer(kits, many=True).data)
+        return keyset_list_response(
+            request, GuildDeploymentKit.objects.all(), GuildDeploymentKitSerializer
+        )
 
     serializer = GuildDeploymentKitSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1701,8 +1811,11 @@ def assistant_transfers(request, assistant_id=None):
 @api_view(["GET", "POST"])
 def ritual_containers(request):
     if request.method == "GET":
-        containers = RitualFunctionContainer.objects.all().order_by("-created_at")
-        return Response(RitualFunctionContainerSerializer(containers, many=True).data)
+        return keyset_list_response(
+            request,
+            RitualFunctionContainer.objects.all(),
+            RitualFunctionContainerSerializer,
+        )
 
     serializer = RitualFunctionContainerSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1713,8 +1826,9 @@ def ritual_containers(request):
 @api_view(["GET", "POST"])
 def storyfields(request):
     if request.method == "GET":
-        zones = StoryfieldZone.objects.all().order_by("-created_at")
-        return Response(StoryfieldZoneSerializer(zones, many=True).data)
+        return keyset_list_response(
+            request, StoryfieldZone.objects.all(), StoryfieldZoneSerializer
+        )
 
     serializer = StoryfieldZoneSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1725,8 +1839,9 @@ def storyfields(request):
 @api_view(["GET", "POST"])
 def myth_patterns(request):
     if request.method == "GET":
-        clusters = MythPatternCluster.objects.all().order_by("-created_at")
-        return Response(MythPatternClusterSerializer(clusters, many=True).data)
+        return keyset_list_response(
+            request, MythPatternCluster.objects.all(), MythPatternClusterSerializer
+        )
 
     serializer = MythPatternClusterSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1737,8 +1852,11 @@ def myth_patterns(request):
 @api_view(["GET", "POST"])
 def intent_harmony(request):
     if request.method == "GET":
-        sessions = IntentHarmonizationSession.objects.all().order_by("-created_at")
-        return Response(IntentHarmonizationSessionSerializer(sessions, many=True).data)
+        return keyset_list_response(
+            request,
+            IntentHarmonizationSession.objects.all(),
+            IntentHarmonizationSessionSerializer,
+        )
 
     serializer = IntentHarmonizationSessionSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1749,8 +1867,11 @@ def intent_harmony(request):
 @api_view(["GET", "POST"])
 def ritual_contracts(request):
     if request.method == "GET":
-        contracts = RecursiveRitualContract.objects.all().order_by("-created_at")
-        return Response(RecursiveRitualContractSerializer(contracts, many=True).data)
+        return keyset_list_response(
+            request,
+            RecursiveRitualContract.objects.all(),
+            RecursiveRitualContractSerializer,
+        )
 
     serializer = RecursiveRitualContractSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1761,8 +1882,11 @@ def ritual_contracts(request):
 @api_view(["GET", "POST"])
 def myth_engines(request):
     if request.method == "GET":
-        engines = SwarmMythEngineInstance.objects.all().order_by("-created_at")
-        return Response(SwarmMythEngineInstanceSerializer(engines, many=True).data)
+        return keyset_list_response(
+            request,
+            SwarmMythEngineInstance.objects.all(),
+            SwarmMythEngineInstanceSerializer,
+        )
 
     serializer = SwarmMythEngineInstanceSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1773,8 +1897,9 @@ def myth_engines(request):
 @api_view(["GET", "POST"])
 def belief_feedback(request):
     if request.method == "GET":
-        signals = BeliefFeedbackSignal.objects.all().order_by("-created_at")
-        return Response(BeliefFeedbackSignalSerializer(signals, many=True).data)
+        return keyset_list_response(
+            request, BeliefFeedbackSignal.objects.all(), BeliefFeedbackSignalSerializer
+        )
 
     serializer = BeliefFeedbackSignalSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1785,8 +1910,11 @@ def belief_feedback(request):
 @api_view(["GET", "POST"])
 def afterlife_registry(request):
     if request.method == "GET":
-        entries = MythicAfterlifeRegistry.objects.all().order_by("-created_at")
-        return Response(MythicAfterlifeRegistrySerializer(entries, many=True).data)
+        return keyset_list_response(
+            request,
+            MythicAfterlifeRegistry.objects.all(),
+            MythicAfterlifeRegistrySerializer,
+        )
 
     serializer = MythicAfterlifeRegistrySerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1809,8 +1937,11 @@ def continuity_engine(request):
 @api_view(["GET", "POST"])
 def migration_gates(request):
     if request.method == "GET":
-        gates = ArchetypeMigrationGate.objects.all().order_by("-created_at")
-        return Response(ArchetypeMigrationGateSerializer(gates, many=True).data)
+        return keyset_list_response(
+            request,
+            ArchetypeMigrationGate.objects.all(),
+            ArchetypeMigrationGateSerializer,
+        )
 
     serializer = ArchetypeMigrationGateSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1821,8 +1952,9 @@ def migration_gates(request):
 @api_view(["GET", "POST"])
 def persona_fusions(request):
     if request.method == "GET":
-        events = PersonaFusionEvent.objects.all().order_by("-created_at")
-        return Response(PersonaFusionEventSerializer(events, many=True).data)
+        return keyset_list_response(
+            request, PersonaFusionEvent.objects.all(), PersonaFusionEventSerializer
+        )
 
     serializer = PersonaFusionEventSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1833,8 +1965,11 @@ def persona_fusions(request):
 @api_view(["GET", "POST"])
 def dialogue_mutations(request):
     if request.method == "GET":
-        logs = DialogueCodexMutationLog.objects.all().order_by("-created_at")
-        return Response(DialogueCodexMutationLogSerializer(logs, many=True).data)
+        return keyset_list_response(
+            request,
+            DialogueCodexMutationLog.objects.all(),
+            DialogueCodexMutationLogSerializer,
+        )
 
     serializer = DialogueCodexMutationLogSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1845,8 +1980,9 @@ def dialogue_mutations(request):
 @api_view(["GET", "POST"])
 def scene_director(request):
     if request.method == "GET":
-        frames = SceneDirectorFrame.objects.all().order_by("-created_at")
-        return Response(SceneDirectorFrameSerializer(frames, many=True).data)
+        return keyset_list_response(
+            request, SceneDirectorFrame.objects.all(), SceneDirectorFrameSerializer
+        )
 
     serializer = SceneDirectorFrameSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1857,8 +1993,9 @@ def scene_director(request):
 @api_view(["GET", "POST"])
 def public_rituals(request):
     if request.method == "GET":
-        logs = PublicRitualLogEntry.objects.all().order_by("-created_at")
-        return Response(PublicRitualLogEntrySerializer(logs, many=True).data)
+        return keyset_list_response(
+            request, PublicRitualLogEntry.objects.all(), PublicRitualLogEntrySerializer
+        )
 
     serializer = PublicRitualLogEntrySerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1869,8 +2006,11 @@ def public_rituals(request):
 @api_view(["GET", "POST"])
 def belief_threads(request):
     if request.method == "GET":
-        threads = BeliefContinuityThread.objects.all().order_by("-created_at")
-        return Response(BeliefContinuityThreadSerializer(threads, many=True).data)
+        return keyset_list_response(
+            request,
+            BeliefContinuityThread.objects.all(),
+            BeliefContinuityThreadSerializer,
+        )
 
     serializer = BeliefContinuityThreadSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1915,8 +2055,9 @@ def assistant_tutorial(request, id):
 @api_view(["GET", "POST"])
 def story_convergence(request):
     if request.method == "GET":
-        paths = StoryConvergencePath.objects.all().order_by("-created_at")
-        return Response(StoryConvergencePathSerializer(paths, many=True).data)
+        return keyset_list_response(
+            request, StoryConvergencePath.objects.all(), StoryConvergencePathSerializer
+        )
 
     serializer = StoryConvergencePathSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1927,8 +2068,9 @@ def story_convergence(request):
 @api_view(["GET", "POST"])
 def ritual_fusion(request):
     if request.method == "GET":
-        events = RitualFusionEvent.objects.all().order_by("-created_at")
-        return Response(RitualFusionEventSerializer(events, many=True).data)
+        return keyset_list_response(
+            request, RitualFusionEvent.objects.all(), RitualFusionEventSerializer
+        )
 
     serializer = RitualFusionEventSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1939,8 +2081,11 @@ def ritual_fusion(request):
 @api_view(["GET", "POST"])
 def timeline_curate(request):
     if request.method == "GET":
-        timelines = NarrativeCurationTimeline.objects.all().order_by("-created_at")
-        return Response(NarrativeCurationTimelineSerializer(timelines, many=True).data)
+        return keyset_list_response(
+            request,
+            NarrativeCurationTimeline.objects.all(),
+            NarrativeCurationTimelineSerializer,
+        )
 
     serializer = NarrativeCurationTimelineSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1951,8 +2096,11 @@ def timeline_curate(request):
 @api_view(["GET", "POST"])
 def reflection_chamber(request):
     if request.method == "GET":
-        chambers = SymbolicFeedbackChamber.objects.all().order_by("-created_at")
-        return Response(SymbolicFeedbackChamberSerializer(chambers, many=True).data)
+        return keyset_list_response(
+            request,
+            SymbolicFeedbackChamber.objects.all(),
+            SymbolicFeedbackChamberSerializer,
+        )
 
     serializer = SymbolicFeedbackChamberSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1977,8 +2125,11 @@ def dialogue_amplify(request):
 @api_view(["GET", "POST"])
 def sequence_resolve(request):
     if request.method == "GET":
-        sequences = MythicResolutionSequence.objects.all().order_by("-created_at")
-        return Response(MythicResolutionSequenceSerializer(sequences, many=True).data)
+        return keyset_list_response(
+            request,
+            MythicResolutionSequence.objects.all(),
+            MythicResolutionSequenceSerializer,
+        )
 
     serializer = MythicResolutionSequenceSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -1989,8 +2140,11 @@ def sequence_resolve(request):
 @api_view(["GET", "POST"])
 def export_mythchain(request):
     if request.method == "GET":
-        gens = MythchainOutputGenerator.objects.all().order_by("-created_at")
-        return Response(MythchainOutputGeneratorSerializer(gens, many=True).data)
+        return keyset_list_response(
+            request,
+            MythchainOutputGenerator.objects.all(),
+            MythchainOutputGeneratorSerializer,
+        )
 
     serializer = MythchainOutputGeneratorSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -2001,8 +2155,11 @@ def export_mythchain(request):
 @api_view(["GET", "POST"])
 def export_artifact(request):
     if request.method == "GET":
-        exports = NarrativeArtifactExporter.objects.all().order_by("-created_at")
-        return Response(NarrativeArtifactExporterSerializer(exports, many=True).data)
+        return keyset_list_response(
+            request,
+            NarrativeArtifactExporter.objects.all(),
+            NarrativeArtifactExporterSerializer,
+        )
 
     serializer = NarrativeArtifactExporterSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -2036,8 +2193,11 @@ def assistant_resurrection(request, id):
 @api_view(["GET", "POST"])
 def ritual_echo(request):
     if request.method == "GET":
-        echoes = RitualEchoThreadSystem.objects.all().order_by("-created_at")
-        return Response(RitualEchoThreadSystemSerializer(echoes, many=True).data)
+        return keyset_list_response(
+            request,
+            RitualEchoThreadSystem.objects.all(),
+            RitualEchoThreadSystemSerializer,
+        )
 
     serializer = RitualEchoThreadSystemSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -2048,8 +2208,11 @@ def ritual_echo(request):
 @api_view(["GET", "POST"])
 def codex_cycles(request):
     if request.method == "GET":
-        cycles = CodexRecurrenceLoopEngine.objects.all().order_by("-created_at")
-        return Response(CodexRecurrenceLoopEngineSerializer(cycles, many=True).data)
+        return keyset_list_response(
+            request,
+            CodexRecurrenceLoopEngine.objects.all(),
+            CodexRecurrenceLoopEngineSerializer,
+        )
 
     serializer = CodexRecurrenceLoopEngineSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -2066,8 +2229,9 @@ def codex_trends(request):
 @api_view(["GET", "POST"])
 def cycle_anchors(request):
     if request.method == "GET":
-        anchors = CycleAnchorRegistry.objects.all().order_by("-created_at")
-        return Response(CycleAnchorRegistrySerializer(anchors, many=True).data)
+        return keyset_list_response(
+            request, CycleAnchorRegistry.objects.all(), CycleAnchorRegistrySerializer
+        )
 
     serializer = CycleAnchorRegistrySerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -2088,8 +2252,11 @@ def entropy_balance(request):
 @api_view(["GET", "POST"])
 def memory_regenerate(request):
     if request.method == "GET":
-        protocols = MemoryRegenerationProtocol.objects.all().order_by("-created_at")
-        return Response(MemoryRegenerationProtocolSerializer(protocols, many=True).data)
+        return keyset_list_response(
+            request,
+            MemoryRegenerationProtocol.objects.all(),
+            MemoryRegenerationProtocolSerializer,
+        )
 
     serializer = MemoryRegenerationProtocolSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -2100,8 +2267,11 @@ def memory_regenerate(request):
 @api_view(["GET", "POST"])
 def ritual_loops(request):
     if request.method == "GET":
-        loops = RitualLoopVisualizationEngine.objects.all().order_by("-created_at")
-        return Response(RitualLoopVisualizationEngineSerializer(loops, many=True).data)
+        return keyset_list_response(
+            request,
+            RitualLoopVisualizationEngine.objects.all(),
+            RitualLoopVisualizationEngineSerializer,
+        )
 
     serializer = RitualLoopVisualizationEngineSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -2112,8 +2282,11 @@ def ritual_loops(request):
 @api_view(["GET", "POST"])
 def oscillation_map(request):
     if request.method == "GET":
-        maps = SymbolicOscillationMap.objects.all().order_by("-created_at")
-        return Response(SymbolicOscillationMapSerializer(maps, many=True).data)
+        return keyset_list_response(
+            request,
+            SymbolicOscillationMap.objects.all(),
+            SymbolicOscillationMapSerializer,
+        )
 
     serializer = SymbolicOscillationMapSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -2124,8 +2297,11 @@ def oscillation_map(request):
 @api_view(["GET", "POST"])
 def codex_stabilize(request):
     if request.method == "GET":
-        nodes = CodexRestabilizationNode.objects.all().order_by("-created_at")
-        return Response(CodexRestabilizationNodeSerializer(nodes, many=True).data)
+        return keyset_list_response(
+            request,
+            CodexRestabilizationNode.objects.all(),
+            CodexRestabilizationNodeSerializer,
+        )
 
     serializer = CodexRestabilizationNodeSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -2136,8 +2312,11 @@ def codex_stabilize(request):
 @api_view(["GET", "POST"])
 def governance_consensus(request):
     if request.method == "GET":
-        chambers = SymbolicConsensusChamber.objects.all().order_by("-created_at")
-        return Response(SymbolicConsensusChamberSerializer(chambers, many=True).data)
+        return keyset_list_response(
+            request,
+            SymbolicConsensusChamber.objects.all(),
+            SymbolicConsensusChamberSerializer,
+        )
 
     serializer = SymbolicConsensusChamberSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -2148,8 +2327,11 @@ def governance_consensus(request):
 @api_view(["GET", "POST"])
 def ritual_negotiate(request):
     if request.method == "GET":
-        engines = RitualNegotiationEngine.objects.all().order_by("-created_at")
-        return Response(RitualNegotiationEngineSerializer(engines, many=True).data)
+        return keyset_list_response(
+            request,
+            RitualNegotiationEngine.objects.all(),
+            RitualNegotiationEngineSerializer,
+        )
 
     serializer = RitualNegotiationEngineSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -2160,8 +2342,11 @@ def ritual_negotiate(request):
 @api_view(["GET", "POST"])
 def network_governance(request):
     if request.method == "GET":
-        models = NarrativeGovernanceModel.objects.all().order_by("-created_at")
-        return Response(NarrativeGovernanceModelSerializer(models, many=True).data)
+        return keyset_list_response(
+            request,
+            NarrativeGovernanceModel.objects.all(),
+            NarrativeGovernanceModelSerializer,
+        )
 
     serializer = NarrativeGovernanceModelSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -2186,8 +2371,11 @@ def codex_crystallize(request):
 @api_view(["GET", "POST"])
 def dream_rebirth(request):
     if request.method == "GET":
-        engines = DreamframeRebirthEngine.objects.all().order_by("-created_at")
-        return Response(DreamframeRebirthEngineSerializer(engines, many=True).data)
+        return keyset_list_response(
+            request,
+            DreamframeRebirthEngine.objects.all(),
+            DreamframeRebirthEngineSerializer,
+        )
 
     serializer = DreamframeRebirthEngineSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -0,0 +1,199 @@
+"""Keyset pagination and streaming JSON lists for large tables.
+
+List endpoints page on ``(created_at, pk)`` instead of ``OFFSET`` so every
+page costs the same index range scan however deep the client goes. Cursors
+are opaque base64 tokens holding the last row's key.
+
+:func:`keyset_list_response` picks the response mode from the query string:
+
+- ``?cursor=`` or ``?limit=``: one page as ``{"results", "next_cursor",
+  "has_more"}``
+- ``?stream=1``: the whole list as a JSON array streamed in keyset batches,
+  for exports. The body is an async iterator so ASGI servers send each
+  batch as it is read instead of collecting the response first.
+- neither: the plain list existing clients expect, capped at
+  ``LEGACY_MAX_ROWS`` rows; when more exist the ``X-Next-Cursor`` header
+  holds the cursor to continue with ``?cursor=``
+
+Serializers can declare their eager loading by defining a
+``setup_eager_loading(queryset)`` classmethod; it is applied to every batch.
+"""
+
+import base64
+import json
+from datetime import datetime
+
+from asgiref.sync import sync_to_async
+from django.db.models import Q
+from django.http import StreamingHttpResponse
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+STREAM_BATCH_SIZE = 500
+# Most rows returned by a request without ``cursor``, ``limit`` or ``stream``
+LEGACY_MAX_ROWS = 1000
+
+_TRUE = {"1", "true", "yes"}
+
+
+def encode_cursor(created_at: datetime, pk) -> str:
+    raw = json.dumps([created_at.isoformat(), str(pk)]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str):
+    """Return ``(created_at, pk)`` from a cursor made by :func:`encode_cursor`."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii"))
+        created, pk = json.loads(raw)
+        created_at = parse_datetime(created)
+    except Exception:
+        created_at = None
+    if created_at is None:
+        raise ValidationError({"cursor": "Invalid cursor."})
+    return created_at, pk
+
+
+def eager_load(queryset, serializer_class):
+    """Apply ``serializer_class.setup_eager_loading`` when it is defined."""
+    setup = getattr(serializer_class, "setup_eager_loading", None)
+    return setup(queryset) if setup else queryset
+
+
+def _ordered(queryset, descending: bool):
+    if descending:
+        return queryset.order_by("-created_at", "-pk")
+    return queryset.order_by("created_at", "pk")
+
+
+def _after(queryset, cursor, descending: bool):
+    created_at, pk = cursor
+    if descending:
+        return queryset.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk)
+        )
+    return queryset.filter(
+        Q(created_at__gt=created_at) | Q(created_at=created_at, pk__gt=pk)
+    )
+
+
+def keyset_page(queryset, *, cursor=None, limit=DEFAULT_LIMIT, descending=True):
+    """Return ``(rows, next_cursor)`` for one page after ``cursor``.
+
+    ``cursor`` is a decoded ``(created_at, pk)`` pair or ``None`` for the
+    first page. ``next_cursor`` is ``None`` on the last page.
+    """
+    if cursor is not None:
+        queryset = _after(queryset, cursor, descending)
+    rows = list(_ordered(queryset, descending)[: limit + 1])
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(last.created_at, last.pk)
+
+
+def iter_keyset(queryset, *, batch_size=STREAM_BATCH_SIZE, descending=True):
+    """Yield lists of at most ``batch_size`` rows, walking the whole queryset."""
+    cursor = None
+    while True:
+        rows, next_cursor = keyset_page(
+            queryset, cursor=cursor, limit=batch_size, descending=descending
+        )
+        if rows:
+            yield rows
+        if next_cursor is None:
+            return
+        cursor = decode_cursor(next_cursor)
+
+
+def stream_json_list(
+    queryset,
+    serializer_class,
+    *,
+    context=None,
+    batch_size=STREAM_BATCH_SIZE,
+    descending=True,
+):
+    """Stream ``queryset`` as one JSON array without building it in memory.
+
+    Each keyset batch is read and serialized in a worker thread, so at most
+    one batch is held at a time.
+    """
+    encoder = JSONEncoder()
+
+    def encoded_batch(cursor):
+        rows, next_cursor = keyset_page(
+            queryset, cursor=cursor, limit=batch_size, descending=descending
+        )
+        data = serializer_class(rows, many=True, context=context or {}).data
+        body = ",".join(encoder.encode(item) for item in data)
+        return body, decode_cursor(next_cursor) if next_cursor else None
+
+    async def chunks():
+        yield "["
+        first, cursor = True, None
+        while True:
+            body, cursor = await sync_to_async(encoded_batch)(cursor)
+            if body:
+                yield body if first else "," + body
+                first = False
+            if cursor is None:
+                break
+        yield "]"
+
+    return StreamingHttpResponse(chunks(), content_type="application/json")
+
+
+def _limit(request) -> int:
+    raw = request.GET.get("limit")
+    if raw in (None, ""):
+        return DEFAULT_LIMIT
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ValidationError({"limit": "Must be an integer."})
+    return max(1, min(value, MAX_LIMIT))
+
+
+def keyset_list_response(
+    request, queryset, serializer_class, *, context=None, descending=True
+):
+    """Serialize ``queryset`` for a list endpoint, paginated or streamed.
+
+    See the module docstring for the query parameters that select the mode.
+    """
+    queryset = eager_load(queryset, serializer_class)
+
+    if request.GET.get("stream", "").lower() in _TRUE:
+        return stream_json_list(
+            queryset, serializer_class, context=context, descending=descending
+        )
+
+    cursor = request.GET.get("cursor")
+    if cursor or "limit" in request.GET:
+        rows, next_cursor = keyset_page(
+            queryset,
+            cursor=decode_cursor(cursor) if cursor else None,
+            limit=_limit(request),
+            descending=descending,
+        )
+        return Response(
+            {
+                "results": serializer_class(rows, many=True, context=context).data,
+                "next_cursor": next_cursor,
+                "has_more": next_cursor is not None,
+            }
+        )
+
+    rows, next_cursor = keyset_page(
+        queryset, limit=LEGACY_MAX_ROWS, descending=descending
+    )
+    response = Response(serializer_class(rows, many=True, context=context).data)
+    if next_cursor:
+        response["X-Next-Cursor"] = next_cursor
+    return response
@@ -0,0 +1,108 @@
+import statistics
+import time
+
+import numpy as np
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from assistants.models.assistant import Assistant
+from assistants.utils.memory_summoner import _score_in_python, top_memory_matches
+from embeddings.models import EMBEDDING_LENGTH, Embedding
+from memory.models import MemoryEntry
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Time memory summoning as an assistant's memory count grows, comparing "
+        "the pgvector top-K query with the old Python scoring loop. Seeded rows "
+        "are rolled back unless --keep is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes", default="1000,10000,100000,1000000", help="Memory counts"
+        )
+        parser.add_argument("--queries", type=int, default=20)
+        parser.add_argument("--k", type=int, default=5)
+        parser.add_argument(
+            "--python-max",
+            type=int,
+            default=20000,
+            help="Skip the Python loop above this many memories",
+        )
+        parser.add_argument("--batch", type=int, default=5000)
+        parser.add_argument("--keep", action="store_true")
+
+    def _seed(self, assistant, ct, count, batch, rng):
+        for start in range(0, count, batch):
+            size = min(batch, count - start)
+            memories = MemoryEntry.objects.bulk_create(
+                [
+                    MemoryEntry(assistant=assistant, event=f"m{start + i}", summary="")
+                    for i in range(size)
+                ]
+            )
+            vectors = rng.standard_normal((size, EMBEDDING_LENGTH)).astype(
+                np.float32
+            )
+            Embedding.objects.bulk_create(
+                [
+                    Embedding(
+                        content_type=ct,
+                        object_id=str(mem.id),
+                        content_id=str(mem.id),
+                        embedding=vec.tolist(),
+                    )
+                    for mem, vec in zip(memories, vectors)
+                ]
+            )
+
+    def _time(self, fn, queries):
+        samples = []
+        for query in queries:
+            start = time.perf_counter()
+            fn(query)
+            samples.append((time.perf_counter() - start) * 1000)
+        return statistics.median(samples), max(samples)
+
+    def handle(self, *args, **options):
+        sizes = sorted(int(s) for s in options["sizes"].split(","))
+        rng = np.random.default_rng(0)
+        ct = ContentType.objects.get_for_model(MemoryEntry)
+        queries = [
+            rng.standard_normal(EMBEDDING_LENGTH).tolist()
+            for _ in range(options["queries"])
+        ]
+        k = options["k"]
+
+        try:
+            with transaction.atomic():
+                assistant = Assistant.objects.create(name="Summon Benchmark")
+                seeded = 0
+                for size in sizes:
+                    self._seed(assistant, ct, size - seeded, options["batch"], rng)
+                    seeded = size
+
+                    p50, worst = self._time(
+                        lambda q: top_memory_matches(q, assistant, k=k), queries
+                    )
+                    line = (
+                        f"{size:>9,} memories  "
+                        f"pgvector p50 {p50:7.1f} ms  max {worst:7.1f} ms"
+                    )
+                    if size <= options["python_max"]:
+                        p50, worst = self._time(
+                            lambda q: _score_in_python(q, assistant, None)[:k],
+                            queries[:3],
+                        )
+                        line += f"  python p50 {p50:9.1f} ms"
+                    self.stdout.write(line)
+                if not options["keep"]:
+                    raise _Rollback
+        except _Rollback:
+            self.stdout.write("Seeded rows rolled back")
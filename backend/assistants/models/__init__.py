@@ -31,3 +31,4 @@ from .tooling import *
 
 __all__ = []
 from .trust import *
+from .metrics import *
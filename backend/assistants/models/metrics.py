@@ -0,0 +1,40 @@
+from django.db import models
+from django.utils import timezone
+
+
+class AssistantMetrics(models.Model):
+    """Materialized trust and health metrics for one assistant.
+
+    Refreshed by ``assistants.utils.assistant_metrics`` from signals and the
+    periodic ``refresh_all_assistant_metrics`` task so serializers can read
+    them with a single join instead of recomputing aggregates per object.
+    """
+
+    assistant = models.OneToOneField(
+        "assistants.Assistant",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="metrics",
+    )
+    trust_score = models.IntegerField(default=0)
+    trust_level = models.CharField(max_length=20, default="needs_attention")
+    badge_count = models.IntegerField(default=0)
+    reflections_last_7d = models.IntegerField(default=0)
+    drift_fixes_recent = models.IntegerField(default=0)
+    trusted_anchor_pct = models.FloatField(default=0.0)
+    health_score = models.FloatField(default=0.0)
+    glossary_health_index = models.FloatField(default=1.0)
+    delegation_events_7d = models.IntegerField(default=0)
+    average_delegation_score = models.FloatField(default=0.0)
+    delegation_trust = models.JSONField(default=dict, blank=True)
+    drift_fix_count = models.IntegerField(default=0)
+    glossary_terms_fixed = models.IntegerField(default=0)
+    memory_count = models.IntegerField(default=0)
+    reflection_count = models.IntegerField(default=0)
+    drifted_anchors = models.IntegerField(default=0)
+    reinforced_anchors = models.IntegerField(default=0)
+    first_question_drift_count = models.IntegerField(default=0)
+    refreshed_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    def __str__(self) -> str:  # pragma: no cover - display helper
+        return f"Metrics for {self.assistant_id}"
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from assistants.utils.trust_profile import compute_trust_score
+from assistants.utils.assistant_metrics import get_assistant_metrics
 from .models.assistant import (
     Assistant,
     AssistantChatMessage,
@@ -81,9 +81,6 @@ from project.models import (
 )
 from mcp_core.serializers_tags import TagSerializer
 from intel_core.serializers import DocumentSerializer
-from intel_core.models import DocumentChunk
-from memory.models import RAGGroundingLog
-from django.db.models import Count, Q
 
 
 class DocumentChunkInfoSerializer(serializers.Serializer):
@@ -102,25 +99,6 @@ from memory.models import MemoryEntry
 from memory.services.acquisition import update_anchor_acquisition
 
 
-def calculate_composite_health(assistant):
-    """Return a composite health score from mood, prompts, and doc embeddings."""
-    docs = assistant.documents.all()
-    if docs:
-        agg = DocumentChunk.objects.filter(document__in=docs).aggregate(
-            total=Count("id"),
-            embedded=Count("id", filter=Q(embedding__isnull=False)),
-        )
-        doc_pct = agg["embedded"] / agg["total"] if agg["total"] else 0.0
-    else:
-        doc_pct = 0.0
-
-    prompt_factor = 1.0 if assistant.system_prompt else 0.0
-    score = assistant.mood_stability_index * 0.5
-    score += prompt_factor * 0.25
-    score += doc_pct * 0.25
-    return round(score, 2)
-
-
 def _initial_glossary_anchor(assistant):
     """Return earliest taught anchor info and ensure acquisition stage."""
     entry = (
@@ -942,7 +920,8 @@ class AssistantDetailSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "slug", "created_at"]
 
     def get_child_assistants(self, obj):
-        return AssistantSerializer(obj.sub_assistants.all(), many=True).data
+        children = obj.sub_assistants.select_related("metrics")
+        return AssistantSerializer(children, many=True, context=self.context).data
 
     def get_source_document_title(self, obj):
         doc = obj.documents.first()
@@ -953,27 +932,7 @@ class AssistantDetailSerializer(serializers.ModelSerializer):
         return doc.source_url if doc else None
 
     def get_health_score(self, obj):
-        return calculate_composite_health(obj)
-
-    def get_glossary_health_index(self, obj):
-
-        total = SymbolicMemoryAnchor.objects.filter(reinforced_by=obj).count()
-        if total == 0:
-            return 1.0
-
-        qs = (
-            RAGGroundingLog.objects.filter(assistant=obj, fallback_triggered=True)
-            .exclude(expected_anchor="")
-            .values("expected_anchor")
-            .annotate(avg=Avg("adjusted_score"), count=Count("id"))
-        )
-        high = 0
-        for row in qs:
-            avg = row["avg"] or 0.0
-            if avg < 0.2 and row["count"] >= 3:
-                high += 1
-        index = 1.0 - (high / total)
-        return round(index, 2)
+        return get_assistant_metrics(obj).health_score
 
     def get_available_badges(self, obj):
         return BadgeSerializer(Badge.objects.all(), many=True).data
@@ -985,39 +944,23 @@ class AssistantDetailSerializer(serializers.ModelSerializer):
         return _initial_badges(obj)
 
     def get_trust_score(self, obj):
-        return compute_trust_score(obj)["score"]
+        return get_assistant_metrics(obj).trust_score
 
     def get_trust_level(self, obj):
-        return compute_trust_score(obj)["level"]
+        return get_assistant_metrics(obj).trust_level
 
     def get_badge_count(self, obj):
-        return compute_trust_score(obj)["components"]["badge_count"]
+        return get_assistant_metrics(obj).badge_count
 
     def get_reflections_last_7d(self, obj):
-        return compute_trust_score(obj)["components"]["reflections_last_7d"]
+        return get_assistant_metrics(obj).reflections_last_7d
 
     def get_drift_fixes_recent(self, obj):
-        return compute_trust_score(obj)["components"]["drift_fixes_recent"]
+        return get_assistant_metrics(obj).drift_fixes_recent
 
     def get_trusted_anchor_pct(self, obj):
         """Percentage of anchors in this assistant's context marked trusted."""
-        from memory.models import SymbolicMemoryAnchor
-
-        total = (
-            SymbolicMemoryAnchor.objects.filter(memory_context=obj.memory_context)
-            .only("id")
-            .count()
-        )
-        if not total:
-            return 0.0
-        trusted = (
-            SymbolicMemoryAnchor.objects.filter(
-                memory_context=obj.memory_context, is_trusted=True
-            )
-            .only("id")
-            .count()
-        )
-        return round(trusted / total * 100, 1)
+        return get_assistant_metrics(obj).trusted_anchor_pct
 
     def get_flair(self, obj):
         if obj.primary_badge:
@@ -1099,38 +1042,16 @@ class AssistantDetailSerializer(serializers.ModelSerializer):
         return None
 
     def get_drift_fix_count(self, obj):
-        return obj.drift_refinement_logs.count()
+        return get_assistant_metrics(obj).drift_fix_count
 
     def get_glossary_terms_fixed(self, obj):
-        terms = set()
-        for log in obj.drift_refinement_logs.all():
-            terms.update(log.glossary_terms or [])
-        return len(terms)
+        return get_assistant_metrics(obj).glossary_terms_fixed
 
     def get_display_name(self, obj):
         return getattr(obj, "display_name", None) or obj.name
 
     def get_glossary_health_index(self, obj):
-        from django.db.models import Avg, Count
-        from memory.models import SymbolicMemoryAnchor
-
-        total = SymbolicMemoryAnchor.objects.filter(reinforced_by=obj).count()
-        if total == 0:
-            return 1.0
-
-        qs = (
-            RAGGroundingLog.objects.filter(assistant=obj, fallback_triggered=True)
-            .exclude(expected_anchor="")
-            .values("expected_anchor")
-            .annotate(avg=Avg("adjusted_score"), count=Count("id"))
-        )
-        high = 0
-        for row in qs:
-            avg = row["avg"] or 0.0
-            if avg < 0.2 and row["count"] >= 3:
-                high += 1
-        index = 1.0 - (high / total)
-        return round(index, 2)
+        return get_assistant_metrics(obj).glossary_health_index
 
     def get_recent_drift(self, obj):
         from django.utils import timezone
@@ -1649,29 +1570,13 @@ class AssistantSerializer(serializers.ModelSerializer):
         return getattr(obj, "display_name", None) or obj.name
 
     def get_trust(self, obj):
-        from assistants.utils.delegation_helpers import get_trust_score
-
-        return get_trust_score(obj)
+        return get_assistant_metrics(obj).delegation_trust
 
     def get_delegation_events_count(self, obj):
-        from assistants.models import DelegationEvent
-        from django.utils import timezone
-
-        week_ago = timezone.now() - timezone.timedelta(days=7)
-        return DelegationEvent.objects.filter(
-            child_assistant=obj, created_at__gte=week_ago
-        ).count()
+        return get_assistant_metrics(obj).delegation_events_7d
 
     def get_average_delegation_score(self, obj):
-        from assistants.models import DelegationEvent
-        from django.db.models import Avg
-
-        return (
-            DelegationEvent.objects.filter(child_assistant=obj).aggregate(
-                avg=Avg("score")
-            )["avg"]
-            or 0
-        )
+        return get_assistant_metrics(obj).average_delegation_score
 
     def get_tags(self, obj):
         from mcp_core.models import Tag
@@ -1681,33 +1586,20 @@ class AssistantSerializer(serializers.ModelSerializer):
         return TagSerializer(tags, many=True).data
 
     def get_health_score(self, obj):
-        return calculate_composite_health(obj)
+        return get_assistant_metrics(obj).health_score
 
     def get_glossary_health_index(self, obj):
-        from django.db.models import Avg, Count
-        from memory.models import SymbolicMemoryAnchor
-
-        total = SymbolicMemoryAnchor.objects.filter(reinforced_by=obj).count()
-        if total == 0:
-            return 1.0
-
-        qs = (
-            RAGGroundingLog.objects.filter(assistant=obj, fallback_triggered=True)
-            .exclude(expected_anchor="")
-            .values("expected_anchor")
-            .annotate(avg=Avg("adjusted_score"), count=Count("id"))
-        )
-        high = 0
-        for row in qs:
-            avg = row["avg"] or 0.0
-            if avg < 0.2 and row["count"] >= 3:
-                high += 1
-        index = 1.0 - (high / total)
-        return round(index, 2)
+        return get_assistant_metrics(obj).glossary_health_index
+
+    def _badges(self):
+        """Serialized badges, loaded once per serializer (shared by list items)."""
+        if not hasattr(self, "_badge_cache"):
+            self._badge_cache = BadgeSerializer(Badge.objects.all(), many=True).data
+        return self._badge_cache
 
     def get_available_badges(self, obj):
         """Return all possible :class:`Badge` choices."""
-        return BadgeSerializer(Badge.objects.all(), many=True).data
+        return self._badges()
 
     def get_initial_glossary_anchor(self, obj):
         return _initial_glossary_anchor(obj)
@@ -1717,8 +1609,9 @@ class AssistantSerializer(serializers.ModelSerializer):
 
     def get_flair(self, obj):
         if obj.primary_badge:
-            badge = Badge.objects.filter(slug=obj.primary_badge).first()
-            return badge.emoji if badge else None
+            for badge in self._badges():
+                if badge.get("slug") == obj.primary_badge:
+                    return badge.get("emoji")
         return None
 
     def get_tour_started(self, obj):
@@ -1796,13 +1689,10 @@ class AssistantSerializer(serializers.ModelSerializer):
         return None
 
     def get_drift_fix_count(self, obj):
-        return obj.drift_refinement_logs.count()
+        return get_assistant_metrics(obj).drift_fix_count
 
     def get_glossary_terms_fixed(self, obj):
-        terms = set()
-        for log in obj.drift_refinement_logs.all():
-            terms.update(log.glossary_terms or [])
-        return len(terms)
+        return get_assistant_metrics(obj).glossary_terms_fixed
 
 
 class AssistantProjectSummarySerializer(serializers.ModelSerializer):
@@ -2519,70 +2409,40 @@ class AssistantOverviewSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
     def get_memory_count(self, obj):
-        from memory.models import MemoryEntry
-
-        return (
-            MemoryEntry.objects.filter(assistant=obj).only("id", "created_at").count()
-        )
+        return get_assistant_metrics(obj).memory_count
 
     def get_reflection_count(self, obj):
-        return obj.assistant_reflections.count()
+        return get_assistant_metrics(obj).reflection_count
 
     def get_drifted_anchors(self, obj):
-        from memory.models import SymbolicMemoryAnchor
-
-        return (
-            SymbolicMemoryAnchor.objects.filter(
-                memory_context=obj.memory_context, chunks__is_drifting=True
-            )
-            .distinct()
-            .count()
-        )
+        return get_assistant_metrics(obj).drifted_anchors
 
     def get_reinforced_anchors(self, obj):
-        return obj.reinforced_anchors.count()
+        return get_assistant_metrics(obj).reinforced_anchors
 
     def get_badge_count(self, obj):
         return len(obj.skill_badges or [])
 
     def get_first_question_drift_count(self, obj):
-        from assistants.models.assistant import ChatIntentDriftLog
-
-        return ChatIntentDriftLog.objects.filter(assistant=obj).count()
+        return get_assistant_metrics(obj).first_question_drift_count
 
     def get_trust_score(self, obj):
-        return compute_trust_score(obj)["score"]
+        return get_assistant_metrics(obj).trust_score
 
     def get_trust_level(self, obj):
-        return compute_trust_score(obj)["level"]
+        return get_assistant_metrics(obj).trust_level
 
     def get_earned_badge_count(self, obj):
-        return compute_trust_score(obj)["components"]["badge_count"]
+        return get_assistant_metrics(obj).badge_count
 
     def get_reflections_last_7d(self, obj):
-        return compute_trust_score(obj)["components"]["reflections_last_7d"]
+        return get_assistant_metrics(obj).reflections_last_7d
 
     def get_drift_fixes_recent(self, obj):
-        return compute_trust_score(obj)["components"]["drift_fixes_recent"]
+        return get_assistant_metrics(obj).drift_fixes_recent
 
     def get_trusted_anchor_pct(self, obj):
-        from memory.models import SymbolicMemoryAnchor
-
-        total = (
-            SymbolicMemoryAnchor.objects.filter(memory_context=obj.memory_context)
-            .only("id")
-            .count()
-        )
-        if not total:
-            return 0.0
-        trusted = (
-            SymbolicMemoryAnchor.objects.filter(
-                memory_context=obj.memory_context, is_trusted=True
-            )
-            .only("id")
-            .count()
-        )
-        return round(trusted / total * 100, 1)
+        return get_assistant_metrics(obj).trusted_anchor_pct
 
 
 class DemoHealthSerializer(serializers.Serializer):
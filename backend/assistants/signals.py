@@ -1,10 +1,18 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from .models.reflection import AssistantReflectionLog
 from .models.project import AssistantObjective
 from project.models.task import ProjectTask
 from project.models.core import Project
-from .models.assistant import Assistant
+from .models.assistant import (
+    Assistant,
+    AssistantDriftRefinementLog,
+    ChatIntentDriftLog,
+    DelegationEvent,
+)
+from memory.models import MemoryEntry, RAGGroundingLog
+from assistants.utils.assistant_metrics import schedule_metrics_refresh
+from utils.telemetry import telemetry_flushed
 from assistants.helpers.logging_helper import log_assistant_birth_event, reflect_on_birth
 
 
@@ -38,3 +46,58 @@ def record_birth_memory(sender, instance, created, **kwargs):
         if not instance.memories.filter(type="origin").exists():
             log_assistant_birth_event(instance, instance.created_by)
             reflect_on_birth(instance)
+
+
+# Fields on Assistant that feed its materialized metrics
+_METRIC_FIELDS = {
+    "glossary_score",
+    "skill_badges",
+    "mood_stability_index",
+    "system_prompt",
+    "memory_context",
+}
+
+
+@receiver(post_save, sender=Assistant)
+def refresh_metrics_on_assistant_change(sender, instance, update_fields=None, **kwargs):
+    if update_fields is None or _METRIC_FIELDS.intersection(update_fields):
+        schedule_metrics_refresh(instance.id)
+
+
+def _refresh_metrics_for_row(sender, instance, **kwargs):
+    """Queue a metrics refresh for the assistant a log row belongs to."""
+    field = _METRIC_SOURCES[sender]
+    schedule_metrics_refresh(getattr(instance, f"{field}_id", None))
+
+
+# Models whose rows are aggregated into AssistantMetrics -> assistant FK name
+_METRIC_SOURCES = {
+    AssistantReflectionLog: "assistant",
+    AssistantDriftRefinementLog: "assistant",
+    DelegationEvent: "child_assistant",
+    ChatIntentDriftLog: "assistant",
+    MemoryEntry: "assistant",
+    RAGGroundingLog: "assistant",
+}
+
+for _model in _METRIC_SOURCES:
+    post_save.connect(
+        _refresh_metrics_for_row,
+        sender=_model,
+        dispatch_uid=f"metrics-save:{_model.__name__}",
+    )
+    post_delete.connect(
+        _refresh_metrics_for_row,
+        sender=_model,
+        dispatch_uid=f"metrics-delete:{_model.__name__}",
+    )
+
+
+@receiver(telemetry_flushed)
+def refresh_metrics_on_telemetry_flush(sender, instances, **kwargs):
+    """Buffered rows are bulk-inserted without post_save; refresh here instead."""
+    field = _METRIC_SOURCES.get(sender)
+    if field is None:
+        return
+    for assistant_id in {getattr(row, f"{field}_id", None) for row in instances}:
+        schedule_metrics_refresh(assistant_id)
@@ -435,7 +435,14 @@ def reflect_on_emotional_resonance(assistant_id: str):
 
 @shared_task
 def run_council_deliberation(session_id: str):
-    """Sequentially log council member thoughts for one round."""
+    """Log one round of council member thoughts.
+
+    With ``COUNCIL_LLM_THOUGHTS`` enabled, members are prompted concurrently
+    through ``gather_llm`` (one paid call each) and a member whose call fails
+    falls back to the placeholder thought; otherwise every member gets the
+    placeholder without any LLM call.
+    """
+    from django.conf import settings
     from django.db.models import Max
     from assistants.models import CouncilSession, CouncilThought
 
@@ -446,11 +453,44 @@ def run_council_deliberation(session_id: str):
     max_round = session.thoughts.aggregate(max=Max("round"))["max"] or 0
     next_round = max_round + 1
 
-    for member in session.members.all():
+    members = list(session.members.all())
+    replies = [None] * len(members)
+    use_llm = bool(members) and getattr(settings, "COUNCIL_LLM_THOUGHTS", False)
+    if use_llm:
+        from utils.async_llm_router import gather_llm
+        from utils.llm_router import DEFAULT_MODEL
+
+        replies = gather_llm(
+            [
+                {
+                    "messages": [
+                        {
+                            "role": "system",
+                            "content": f"You are {member.name}, "
+                            "a member of an assistant council.",
+                        },
+                        {
+                            "role": "user",
+                            "content": f"Council topic: {session.topic}\n"
+                            "Share your perspective in 2-3 sentences.",
+                        },
+                    ],
+                    "model": member.preferred_model or DEFAULT_MODEL,
+                    "temperature": 0.7,
+                }
+                for member in members
+            ],
+            return_exceptions=True,
+        )
+    for member, reply in zip(members, replies):
+        if isinstance(reply, Exception) or not reply:
+            if use_llm:
+                logger.warning("Council thought failed for %s: %s", member.slug, reply)
+            reply = f"{member.name} shares thoughts on {session.topic}."
         CouncilThought.objects.create(
             assistant=member,
             council_session=session,
-            content=f"[{next_round}] {member.name} shares thoughts on {session.topic}.",
+            content=f"[{next_round}] {reply}",
             round=next_round,
         )
 
@@ -537,3 +577,38 @@ def bootstrap_evo_assistants_task():
     from django.core.management import call_command
 
     call_command("bootstrap_evo_assistants")
+
+
+@shared_task
+def refresh_assistant_metrics_task(assistant_id: str):
+    """Recompute the materialized metrics for one assistant."""
+    from django.core.cache import cache
+    from assistants.utils.assistant_metrics import (
+        PENDING_PREFIX,
+        refresh_assistant_metrics,
+    )
+
+    # Clear first so changes made while refreshing schedule another run
+    cache.delete(f"{PENDING_PREFIX}{assistant_id}")
+    assistant = Assistant.objects.filter(id=assistant_id).first()
+    if not assistant:
+        return None
+    refresh_assistant_metrics(assistant)
+    return str(assistant.id)
+
+
+@shared_task
+def refresh_all_assistant_metrics():
+    """Refresh every assistant's metrics so rolling 7-day windows stay current."""
+    from assistants.utils.assistant_metrics import refresh_assistant_metrics
+
+    refreshed = 0
+    for assistant in Assistant.objects.all().iterator():
+        try:
+            refresh_assistant_metrics(assistant)
+            refreshed += 1
+        except Exception as e:
+            logger.error(
+                "Failed to refresh metrics for %s: %s", assistant.id, e, exc_info=True
+            )
+    return refreshed
@@ -0,0 +1,32 @@
+from unittest.mock import patch
+
+from assistants.models import Assistant
+from assistants.models.thoughts import AssistantThoughtLog
+from assistants.tests import BaseAPITestCase
+from utils import telemetry
+from utils.telemetry import TelemetryBuffer
+
+
+class ChatTelemetryBufferTest(BaseAPITestCase):
+    def setUp(self):
+        self.assistant = Assistant.objects.create(name="Chat", specialty="s")
+        self.url = f"/api/v1/assistants/{self.assistant.slug}/chat/"
+        self.authenticate()
+
+    @patch("utils.llm_router.chat")
+    def test_buffered_thought_log_keeps_integrity_status(self, mock_chat):
+        mock_chat.return_value = ("ok", [], {"used_chunks": []})
+        buffer = TelemetryBuffer(batch_size=1000, flush_interval=60)
+        with patch.object(telemetry, "TELEMETRY_BUFFER_ENABLED", True), patch.object(
+            telemetry, "_buffer", buffer
+        ):
+            resp = self.client.post(
+                self.url, {"message": "hi", "session_id": "s1"}, format="json"
+            )
+            self.assertEqual(resp.status_code, 200)
+            buffer.flush()
+
+        log = AssistantThoughtLog.objects.get(
+            assistant=self.assistant, thought_trace="manual"
+        )
+        self.assertEqual(log.integrity_status, "valid")
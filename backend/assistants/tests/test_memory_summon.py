@@ -1,12 +1,18 @@
 
+from datetime import timedelta
+
 from django.test import TestCase
+from django.utils import timezone
 from unittest.mock import patch
 from django.contrib.contenttypes.models import ContentType
 
 from assistants.models import Assistant, AssistantThoughtLog
 from memory.models import MemoryEntry
 from embeddings.models import Embedding, EMBEDDING_LENGTH
-from assistants.utils.memory_summoner import summon_relevant_memories
+from assistants.utils.memory_summoner import (
+    summon_relevant_memories,
+    top_memory_matches,
+)
 
 
 class MemorySummonTest(TestCase):
@@ -40,6 +46,37 @@ class MemorySummonTest(TestCase):
         self.assertIn("alpha", text)
         self.assertEqual(ids, [str(self.mem1.id)])
 
+    def test_top_matches_respect_recency_window(self):
+        old = timezone.now() - timedelta(days=30)
+        MemoryEntry.objects.filter(id=self.mem1.id).update(created_at=old)
+        query = [1.0] * EMBEDDING_LENGTH
+
+        hits = top_memory_matches(query, self.assistant, k=3)
+        self.assertEqual([h[0] for h in hits], [str(self.mem1.id)])
+        self.assertAlmostEqual(hits[0][1], 1.0, places=5)
+
+        since = timezone.now() - timedelta(days=7)
+        self.assertEqual(top_memory_matches(query, self.assistant, since=since), [])
+
+    def test_top_matches_keep_negative_similarity_by_default(self):
+        opposite = MemoryEntry.objects.create(
+            event="gamma memory", assistant=self.assistant, summary="gamma"
+        )
+        Embedding.objects.create(
+            content_type=ContentType.objects.get_for_model(MemoryEntry),
+            object_id=opposite.id,
+            content="gamma",
+            embedding=[-1.0] * EMBEDDING_LENGTH,
+        )
+        query = [1.0] * EMBEDDING_LENGTH
+
+        hits = dict(top_memory_matches(query, self.assistant, k=3))
+        self.assertAlmostEqual(hits[str(opposite.id)], -1.0, places=5)
+        # Zero vectors have no direction and are still skipped
+        self.assertNotIn(str(self.mem2.id), hits)
+        filtered = top_memory_matches(query, self.assistant, min_similarity=0.5)
+        self.assertEqual([h[0] for h in filtered], [str(self.mem1.id)])
+
 
 class ChatMemorySummonTest(TestCase):
     @patch("assistants.utils.memory_summoner.get_embedding_for_text")
@@ -0,0 +1,66 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from assistants.utils.rag_reranker import rerank_chunks, similarity_matrix
+
+
+def _chunk(pk, text, **extra):
+    data = {
+        "pk": pk,
+        "updated_at": None,
+        "text": text,
+        "order": 1,
+        "is_glossary": False,
+        "tags": [],
+        "glossary_score": 0.0,
+        "glossary_boost": 0.0,
+        "fingerprint": "fp",
+        "anchor": None,
+    }
+    data.update(extra)
+    return SimpleNamespace(**data)
+
+
+def test_similarity_matrix_matches_cosine():
+    vecs = [[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]]
+    sims = similarity_matrix(vecs, [[1.0, 0.0]])
+    assert np.allclose(sims[:, 0], [1.0, 0.0, 2 ** -0.5], atol=1e-6)
+
+
+def test_rerank_applies_glossary_and_anchor_boosts():
+    anchor = SimpleNamespace(slug="mcp", avg_score=0.0, fallback_rate=0.0, total_uses=0)
+    plain = _chunk(1, "x" * 500)
+    glossary = _chunk(2, "MCP refers to Model Context Protocol " * 20, anchor=anchor)
+    result = rerank_chunks(
+        [plain, glossary],
+        "what is mcp",
+        similarities=[0.5, 0.5],
+        anchor_matches=["mcp"],
+        anchor_boost=0.1,
+    )
+    assert result.base_scores[0] == np.float32(0.5)
+    assert result.contains_glossary.tolist() == [False, True]
+    assert result.anchor_match.tolist() == [False, True]
+    # base 0.5 + 0.05 anchor-in-query, then +0.1 glossary pair +0.1 anchor boost
+    assert np.isclose(result.final_scores[1], 0.75, atol=1e-6)
+
+
+def test_rerank_uses_vectors_when_no_db_scores():
+    chunks = [_chunk(3, "a" * 500), _chunk(4, "b" * 500)]
+    result = rerank_chunks(
+        chunks,
+        "query",
+        query_vec=[1.0, 0.0],
+        vectors=[[1.0, 0.0], [0.0, 1.0]],
+    )
+    assert np.allclose(result.raw_scores, [1.0, 0.0])
+
+
+def test_features_follow_bulk_updated_fields():
+    chunk = _chunk(5, "a" * 500, updated_at="t0")
+    before = rerank_chunks([chunk], "query", similarities=[0.5]).final_scores[0]
+    # QuerySet.update() changes fields without bumping updated_at
+    chunk.is_glossary = True
+    after = rerank_chunks([chunk], "query", similarities=[0.5]).final_scores[0]
+    assert np.isclose(after - before, 0.2, atol=1e-6)
@@ -0,0 +1,129 @@
+import os
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "server.settings")
+import django
+
+django.setup()
+
+import json
+from collections import defaultdict
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from assistants.utils import session_utils
+
+
+class FakeRedis:
+    """Just enough of the Redis list/hash API for the session store."""
+
+    def __init__(self):
+        self.lists = defaultdict(list)
+        self.hashes = defaultdict(dict)
+        self.reads = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def rpush(self, key, *values):
+        self.lists[key].extend(values)
+
+    def expire(self, key, seconds):
+        pass
+
+    def llen(self, key):
+        return len(self.lists[key])
+
+    def lrange(self, key, start, end):
+        items = self.lists[key]
+        start = max(len(items) + start, 0) if start < 0 else start
+        end = len(items) + end if end < 0 else end
+        self.reads.append(max(0, end + 1 - start))
+        return items[start : end + 1]
+
+    def hgetall(self, key):
+        return {k.encode(): str(v).encode() for k, v in self.hashes[key].items()}
+
+    def hset(self, key, mapping):
+        self.hashes[key].update(mapping)
+
+    def hincrby(self, key, field, amount=1):
+        self.hashes[key][field] = int(self.hashes[key].get(field, 0)) + amount
+        return self.hashes[key][field]
+
+    def delete(self, *keys):
+        for key in keys:
+            self.lists.pop(key, None)
+            self.hashes.pop(key, None)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+
+        return queue
+
+    def execute(self):
+        return [getattr(self.redis, n)(*a, **kw) for n, a, kw in self.calls]
+
+
+class SessionStoreTests(SimpleTestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        patcher = patch.object(session_utils, "r", self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_reads_legacy_json_entries(self):
+        legacy = json.dumps({"role": "user", "content": "old", "timestamp": "x"})
+        self.redis.rpush("chat:s1", legacy.encode())
+        session_utils.save_message_to_session("s1", "assistant", "new")
+        messages = session_utils.load_session_messages("s1")
+        self.assertEqual([m["content"] for m in messages], ["old", "new"])
+        tail = session_utils.load_session_messages("s1", limit=1)
+        self.assertEqual([m["role"] for m in tail], ["assistant"])
+
+    def test_context_reads_stay_bounded_for_long_sessions(self):
+        for i in range(1000):
+            session_utils.save_message_to_session("s2", "user", f"message {i}")
+        self.redis.reads.clear()
+        for i in range(1000, 1100):
+            session_utils.save_message_to_session("s2", "user", f"message {i}")
+            context = session_utils.load_session_context("s2", window=10)
+        self.assertLessEqual(max(self.redis.reads), 10 + 20)
+        summary, *recent = context
+        self.assertEqual(summary["role"], "system")
+        self.assertIn("message 1070", summary["content"])
+        # Every message is either summarized or sent verbatim
+        self.assertEqual(recent[0]["content"], "message 1071")
+        self.assertEqual(recent[-1]["content"], "message 1099")
+
+    def test_flush_archives_in_bulk_batches(self):
+        for i in range(7):
+            session_utils.save_message_to_session("s3", "user", f"message number {i}")
+        assistant = type("A", (), {"slug": "a"})()
+        with patch.object(session_utils, "ARCHIVE_BATCH_SIZE", 3), patch.object(
+            session_utils, "_archive_entry", side_effect=lambda a, e: e
+        ), patch.object(
+            session_utils.AssistantThoughtLog.objects, "bulk_create"
+        ) as bulk_create:
+            saved = session_utils.flush_session_to_db("s3", assistant)
+        self.assertEqual(saved, 7)
+        self.assertEqual(
+            [len(call.args[0]) for call in bulk_create.call_args_list], [3, 3, 1]
+        )
+
+    def test_save_returns_running_role_count(self):
+        session_utils.save_message_to_session("s4", "user", "hi")
+        first = session_utils.save_message_to_session("s4", "assistant", "hello")
+        session_utils.save_message_to_session("s4", "user", "again")
+        second = session_utils.save_message_to_session("s4", "assistant", "sure")
+        self.assertEqual((first, second), (1, 2))
+        self.assertEqual(self.redis.reads, [])
+        session_utils.flush_chat_session("s4")
+        self.assertNotIn("chat:s4:counts", self.redis.hashes)
@@ -740,6 +740,11 @@ urlpatterns = [
     path(
         "<slug:slug>/chat/", assistants.chat_with_assistant_view, name="assistant-chat"
     ),
+    path(
+        "<slug:slug>/chat/stream/",
+        assistants.chat_stream_view,
+        name="assistant-chat-stream",
+    ),
     # path("<slug:slug>/memories/", memory.assistant_memories, name="assistant-memories"),
     path(
         "<slug:slug>/thoughts/",
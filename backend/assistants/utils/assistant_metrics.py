@@ -0,0 +1,195 @@
+"""Materialized per-assistant metrics.
+
+Trust, health and activity numbers shown by the assistant serializers are
+aggregates over several log tables. They are computed here once per
+assistant and stored in :class:`assistants.models.AssistantMetrics`, so list
+and overview endpoints only need ``select_related("metrics")``.
+
+Snapshots are refreshed in the background: signals call
+:func:`schedule_metrics_refresh` when a contributing row changes (debounced
+per assistant), and ``refresh_all_assistant_metrics`` runs periodically so
+the 7-day windows keep moving. A missing or stale snapshot is recomputed
+inline on read.
+"""
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
+from django.db.models import Avg, Count, Q
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# Snapshots older than this are recomputed when read
+ASSISTANT_METRICS_MAX_AGE = getattr(settings, "ASSISTANT_METRICS_MAX_AGE", 3600)
+# Seconds to coalesce signal-triggered refreshes for one assistant
+ASSISTANT_METRICS_DEBOUNCE = getattr(settings, "ASSISTANT_METRICS_DEBOUNCE", 30)
+
+PENDING_PREFIX = "assistant:metrics:pending:"
+
+
+def calculate_composite_health(assistant):
+    """Return a composite health score from mood, prompts, and doc embeddings."""
+    from intel_core.models import DocumentChunk
+
+    docs = assistant.documents.all()
+    if docs:
+        agg = DocumentChunk.objects.filter(document__in=docs).aggregate(
+            total=Count("id"),
+            embedded=Count("id", filter=Q(embedding__isnull=False)),
+        )
+        doc_pct = agg["embedded"] / agg["total"] if agg["total"] else 0.0
+    else:
+        doc_pct = 0.0
+
+    prompt_factor = 1.0 if assistant.system_prompt else 0.0
+    score = assistant.mood_stability_index * 0.5
+    score += prompt_factor * 0.25
+    score += doc_pct * 0.25
+    return round(score, 2)
+
+
+def glossary_health_index(assistant) -> float:
+    """Share of reinforced anchors that are not persistently failing retrieval."""
+    from memory.models import RAGGroundingLog, SymbolicMemoryAnchor
+
+    total = SymbolicMemoryAnchor.objects.filter(reinforced_by=assistant).count()
+    if total == 0:
+        return 1.0
+
+    qs = (
+        RAGGroundingLog.objects.filter(assistant=assistant, fallback_triggered=True)
+        .exclude(expected_anchor="")
+        .values("expected_anchor")
+        .annotate(avg=Avg("adjusted_score"), count=Count("id"))
+    )
+    high = 0
+    for row in qs:
+        avg = row["avg"] or 0.0
+        if avg < 0.2 and row["count"] >= 3:
+            high += 1
+    return round(1.0 - (high / total), 2)
+
+
+def trusted_anchor_pct(assistant) -> float:
+    """Percentage of anchors in the assistant's context marked trusted."""
+    from memory.models import SymbolicMemoryAnchor
+
+    agg = SymbolicMemoryAnchor.objects.filter(
+        memory_context=assistant.memory_context
+    ).aggregate(total=Count("id"), trusted=Count("id", filter=Q(is_trusted=True)))
+    if not agg["total"]:
+        return 0.0
+    return round(agg["trusted"] / agg["total"] * 100, 1)
+
+
+def compute_metrics(assistant) -> dict:
+    """Return the field values of an ``AssistantMetrics`` row for ``assistant``."""
+    from assistants.models.assistant import ChatIntentDriftLog, DelegationEvent
+    from assistants.utils.delegation_helpers import get_trust_score
+    from assistants.utils.trust_profile import compute_trust_score
+    from memory.models import MemoryEntry, SymbolicMemoryAnchor
+
+    trust = compute_trust_score(assistant)
+    components = trust["components"]
+    week_ago = timezone.now() - timedelta(days=7)
+
+    delegation = DelegationEvent.objects.filter(child_assistant=assistant).aggregate(
+        recent=Count("id", filter=Q(created_at__gte=week_ago)),
+        avg=Avg("score"),
+    )
+    fixed_terms = set()
+    drift_fix_count = 0
+    for terms in assistant.drift_refinement_logs.values_list(
+        "glossary_terms", flat=True
+    ):
+        drift_fix_count += 1
+        fixed_terms.update(terms or [])
+
+    return {
+        "trust_score": trust["score"],
+        "trust_level": trust["level"],
+        "badge_count": components["badge_count"],
+        "reflections_last_7d": components["reflections_last_7d"],
+        "drift_fixes_recent": components["drift_fixes_recent"],
+        "trusted_anchor_pct": trusted_anchor_pct(assistant),
+        "health_score": calculate_composite_health(assistant),
+        "glossary_health_index": glossary_health_index(assistant),
+        "delegation_events_7d": delegation["recent"],
+        "average_delegation_score": delegation["avg"] or 0,
+        "delegation_trust": get_trust_score(assistant),
+        "drift_fix_count": drift_fix_count,
+        "glossary_terms_fixed": len(fixed_terms),
+        "memory_count": MemoryEntry.objects.filter(assistant=assistant).count(),
+        "reflection_count": assistant.assistant_reflections.count(),
+        "drifted_anchors": SymbolicMemoryAnchor.objects.filter(
+            memory_context=assistant.memory_context, chunks__is_drifting=True
+        )
+        .distinct()
+        .count(),
+        "reinforced_anchors": assistant.reinforced_anchors.count(),
+        "first_question_drift_count": ChatIntentDriftLog.objects.filter(
+            assistant=assistant
+        ).count(),
+    }
+
+
+def refresh_assistant_metrics(assistant):
+    """Recompute and store the metrics snapshot for ``assistant``."""
+    from assistants.models import AssistantMetrics
+
+    values = compute_metrics(assistant)
+    values["refreshed_at"] = timezone.now()
+    snapshot, _ = AssistantMetrics.objects.update_or_create(
+        assistant=assistant, defaults=values
+    )
+    # Cache on the instance so later reads in this request skip the query
+    assistant.metrics = snapshot
+    return snapshot
+
+
+def get_assistant_metrics(assistant):
+    """Return the metrics snapshot, refreshing it when missing or stale."""
+    try:
+        snapshot = assistant.metrics
+    except ObjectDoesNotExist:
+        snapshot = None
+    max_age = timedelta(seconds=ASSISTANT_METRICS_MAX_AGE)
+    if snapshot is None or snapshot.refreshed_at < timezone.now() - max_age:
+        snapshot = refresh_assistant_metrics(assistant)
+    return snapshot
+
+
+def schedule_metrics_refresh(assistant_id) -> None:
+    """Queue one background refresh per assistant per debounce window."""
+    if not assistant_id:
+        return
+    key = f"{PENDING_PREFIX}{assistant_id}"
+    try:
+        if not cache.add(key, 1, ASSISTANT_METRICS_DEBOUNCE * 2):
+            return
+    except Exception:
+        logger.debug("metrics debounce unavailable", exc_info=True)
+
+    def _enqueue():
+        from assistants.tasks import refresh_assistant_metrics_task
+
+        try:
+            refresh_assistant_metrics_task.apply_async(
+                (str(assistant_id),), countdown=ASSISTANT_METRICS_DEBOUNCE
+            )
+        except Exception:
+            logger.warning(
+                "failed to queue metrics refresh",
+                extra={"assistant_id": str(assistant_id)},
+            )
+            try:
+                cache.delete(key)
+            except Exception:
+                pass
+
+    transaction.on_commit(_enqueue)
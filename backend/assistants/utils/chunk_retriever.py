@@ -2,6 +2,7 @@ from __future__ import annotations
 import logging
 import uuid
 from typing import List, Dict, Tuple, Optional
+from django.db.models import Q
 from django.shortcuts import get_object_or_404
 from assistants.models.assistant import Assistant
 from assistants.models.project import AssistantProject
@@ -9,12 +10,13 @@ from assistants.models.project import AssistantProject
 # Boost acronym chunks
 from intel_core.services import AcronymGlossaryService
 from memory.models import SymbolicMemoryAnchor
-from intel_core.utils.glossary_tagging import _match_anchor
+from memory.utils.anchor_matcher import SLUG, get_anchor_matcher
 
 # Import directly from helpers_io to avoid __init__ fallbacks
 from embeddings.helpers.helpers_io import get_embedding_for_text
 from embeddings.vector_utils import compute_similarity
 from embeddings.models import EMBEDDING_LENGTH
+from assistants.utils.rag_reranker import rerank_chunks
 import math
 from django.conf import settings
 
@@ -33,6 +35,9 @@ GLOSSARY_BOOST_FACTOR = getattr(settings, "RAG_GLOSSARY_BOOST_FACTOR", 0.2)
 GLOSSARY_WEAK_THRESHOLD = getattr(settings, "GLOSSARY_WEAK_THRESHOLD", 0.2)
 # Boost when a term is pulled from recent reflections
 REFLECTION_BOOST = getattr(settings, "RAG_REFLECTION_BOOST", 0.15)
+# Optional MMR diversity stage over the strong matches
+RAG_MMR_ENABLED = getattr(settings, "RAG_MMR_ENABLED", False)
+RAG_MMR_LAMBDA = getattr(settings, "RAG_MMR_LAMBDA", 0.7)
 
 logger = logging.getLogger(__name__)
 
@@ -46,18 +51,39 @@ def is_valid_uuid(value: str) -> bool:
         return False
 
 
-def _anchor_in_query(anchor: SymbolicMemoryAnchor, text: str) -> bool:
-    """Return True if ``text`` mentions ``anchor`` via slug, label or tags."""
-    q = text.lower()
-    if anchor.slug.lower() in q or anchor.label.lower() in q:
-        return True
-    if (
-        anchor.tags.filter(slug__in=q.split()).exists()
-        or anchor.tags.filter(name__in=q.split()).exists()
-    ):
-        return True
-    matched, _ = _match_anchor(anchor, text)
-    return matched
+def _diversify_pairs(pairs: list, limit: int) -> list:
+    """Pick ``limit`` of the sorted ``pairs`` with MMR over chunk vectors.
+
+    Vectors are loaded for all candidates in one query because the pgvector
+    path defers them. Falls back to the top ``limit`` on any error.
+    """
+    if len(pairs) <= limit:
+        return pairs[:limit]
+    from embeddings.mmr import diversify
+    from intel_core.models import EmbeddingMetadata
+
+    try:
+        meta_ids = [p[1].embedding_id for p in pairs]
+        stored = dict(
+            EmbeddingMetadata.objects.filter(id__in=meta_ids).values_list(
+                "id", "vector"
+            )
+        )
+        zero = [0.0] * EMBEDDING_LENGTH
+        vectors = [
+            v if v is not None and len(v) == EMBEDDING_LENGTH else zero
+            for v in (stored.get(mid) for mid in meta_ids)
+        ]
+        return diversify(
+            pairs,
+            [p[0] for p in pairs],
+            vectors,
+            lambda_param=RAG_MMR_LAMBDA,
+            limit=limit,
+        )
+    except Exception as exc:
+        logger.warning("[RAG] MMR diversity stage skipped: %s", exc)
+        return pairs[:limit]
 
 
 def _search_summary_hits(
@@ -277,22 +303,6 @@ def get_relevant_chunks(
             {},
         )
 
-    from intel_core.utils.chunk_retriever import fetch_chunks
-
-    chunks = fetch_chunks(
-        doc_ids if chunk_ids == [] else None,
-        chunk_ids=chunk_ids if chunk_ids else None,
-        repair=debug or settings.DEBUG,
-    )
-
-    logger.debug(
-        "[RAG Search] Docs=%s Chunks=%s -> %d chunks",
-        doc_ids,
-        chunk_ids[:10] if chunk_ids else None,
-        len(chunks),
-    )
-    if chunks:
-        logger.debug("Chunk IDs returned: %s", [str(c.id) for c in chunks[:20]])
     force_keywords = [
         "opening line",
         "first sentence",
@@ -323,21 +333,68 @@ def get_relevant_chunks(
             anchor_qs = anchor_qs.filter(is_trusted=True)
         focus_fallback = True
 
-    anchor_qs = anchor_qs.prefetch_related("tags")
-    all_anchors = list(anchor_qs)
-    anchor_matches = [a.slug for a in all_anchors if _anchor_in_query(a, query_text)]
+    matched = get_anchor_matcher().find(query_text)
+    anchor_matches = list(
+        anchor_qs.filter(slug__in=list(matched))
+        .order_by("slug")
+        .values_list("slug", flat=True)
+    )
     logger.debug("[Glossary Tracker] query anchors=%s", anchor_matches)
     reflection_terms = set(get_glossary_terms_from_reflections(memory_context_id))
     if not (auto_expand or settings.DEBUG) and focus_qs.exists():
-        all_slugs = list(SymbolicMemoryAnchor.objects.values_list("slug", flat=True))
-        filtered_anchor_terms = [
-            s
-            for s in all_slugs
-            if s.lower() in query_text.lower()
-            and s not in [a.slug for a in all_anchors]
-        ]
+        # Slugs named in the query but excluded from ``anchor_qs``
+        slug_hits = [slug for slug, kind in matched.items() if kind == SLUG]
+        in_scope = set(
+            anchor_qs.filter(slug__in=slug_hits).values_list("slug", flat=True)
+        )
+        filtered_anchor_terms = list(
+            SymbolicMemoryAnchor.objects.filter(slug__in=slug_hits)
+            .exclude(slug__in=in_scope)
+            .values_list("slug", flat=True)
+        )
     else:
         filtered_anchor_terms = []
+
+    from intel_core.utils.chunk_retriever import (
+        RAG_CANDIDATE_LIMIT,
+        fetch_chunks,
+        fetch_top_chunks,
+    )
+
+    preferred_vec = assistant.preferred_rag_vector if assistant else None
+    try:
+        # Rank candidates inside Postgres so only the top-K reach the
+        # heuristics below. Anchor-matched and glossary chunks are pinned so
+        # forced inclusion still sees them.
+        chunks = fetch_top_chunks(
+            query_vec,
+            doc_ids if chunk_ids == [] else None,
+            chunk_ids=chunk_ids if chunk_ids else None,
+            limit=RAG_CANDIDATE_LIMIT,
+            preferred_vec=preferred_vec,
+            pinned=Q(anchor__slug__in=anchor_matches) | Q(is_glossary=True),
+            repair=debug or settings.DEBUG,
+        )
+    except Exception as exc:
+        logger.warning("[RAG] pgvector ranking unavailable, scanning chunks: %s", exc)
+        chunks = fetch_chunks(
+            doc_ids if chunk_ids == [] else None,
+            chunk_ids=chunk_ids if chunk_ids else None,
+            repair=debug or settings.DEBUG,
+        )
+
+    logger.debug(
+        "[RAG Search] Docs=%s Chunks=%s -> %d chunks",
+        doc_ids,
+        chunk_ids[:10] if chunk_ids else None,
+        len(chunks),
+    )
+    if chunks:
+        logger.debug("Chunk IDs returned: %s", [str(c.id) for c in chunks[:20]])
+    candidates = []
+    vectors: list[list[float]] = []
+    db_similarities: list[float] = []
+    pref_similarities: list[float] = []
     for chunk in chunks:
         if chunk.embedding and chunk.embedding_status != "embedded":
             logger.warning(
@@ -355,6 +412,12 @@ def get_relevant_chunks(
                 getattr(chunk, "embedding_status", "unknown"),
             )
             continue
+        db_similarity = getattr(chunk, "similarity", None)
+        if db_similarity is not None:
+            candidates.append(chunk)
+            db_similarities.append(float(db_similarity))
+            pref_similarities.append(float(getattr(chunk, "pref_similarity", 0.0)))
+            continue
         vec = chunk.embedding.vector if chunk.embedding else None
         if vec is None:
             logger.debug("Skipping chunk %s due to missing embedding", chunk.id)
@@ -369,89 +432,51 @@ def get_relevant_chunks(
         if any(math.isnan(v) for v in vec):
             logger.warning("NaN values detected in embedding for chunk %s", chunk.id)
             continue
-        score = compute_similarity(query_vec, vec)
-        raw_score = score
-        if assistant and assistant.preferred_rag_vector is not None:
-            try:
-                pref_score = compute_similarity(assistant.preferred_rag_vector, vec)
-                score += pref_score * 0.1
-            except Exception as exc:  # pragma: no cover - log mismatch
-                logger.warning("Preference similarity failed: %s", exc)
-        anchor_weight = 0.0
-        if assistant and assistant.anchor_weight_profile and chunk.anchor:
-            weight = assistant.anchor_weight_profile.get(chunk.anchor.slug)
-            if weight:
-                anchor_weight = float(weight)
-                score *= 1 + anchor_weight
-        if chunk.anchor and chunk.anchor.slug in query_text.lower():
-            score += 0.05
-        length_norm = min(len(chunk.text) / 500, 1.0)
-        score *= 0.6 + 0.4 * length_norm
-        if score <= 0.0 and not force_fallback:
+        candidates.append(chunk)
+        vectors.append(vec)
+
+    # Candidates come either all from pgvector (annotated similarities) or all
+    # from the full-scan fallback (raw vectors), never a mix.
+    use_db_scores = not vectors
+    ranked = rerank_chunks(
+        candidates,
+        query_text,
+        query_vec=query_vec,
+        vectors=None if use_db_scores else vectors,
+        similarities=db_similarities if use_db_scores else None,
+        preferred_vec=preferred_vec,
+        pref_similarities=(
+            pref_similarities if use_db_scores and preferred_vec is not None else None
+        ),
+        anchor_weight_profile=assistant.anchor_weight_profile if assistant else None,
+        keywords=keywords,
+        query_terms=query_terms,
+        anchor_matches=anchor_matches,
+        reflection_terms=reflection_terms,
+        anchor_boost=ANCHOR_BOOST,
+        glossary_boost_factor=GLOSSARY_BOOST_FACTOR,
+        reflection_boost=REFLECTION_BOOST,
+    )
+
+    for i, chunk in enumerate(candidates):
+        base_score = float(ranked.base_scores[i])
+        anchor_matched = bool(ranked.anchor_match[i])
+        if base_score <= 0.0 and not force_fallback:
             logger.debug("Skipping chunk %s due to zero score", chunk.id)
             continue
-        if score < MIN_SCORE and not (
-            chunk.anchor and chunk.anchor.slug in anchor_matches
-        ):
-            logger.debug("Skipping chunk %s due to low score %.3f", chunk.id, score)
-            if score < 0.2:
+        if base_score < MIN_SCORE and not anchor_matched:
+            logger.debug(
+                "Skipping chunk %s due to low score %.3f", chunk.id, base_score
+            )
+            if base_score < 0.2:
                 logger.info(
                     "[RAG Filter] %s dropped due to score %.3f < 0.2",
                     chunk.id,
-                    score,
+                    base_score,
                 )
             continue
-        if keywords and any(k.lower() in chunk.text.lower() for k in keywords):
-            score += 0.05
-        contains_glossary = False
-        for acro, longform in AcronymGlossaryService.KNOWN.items():
-            if (
-                acro.lower() in chunk.text.lower()
-                and longform.lower() in chunk.text.lower()
-            ):
-                score += 0.1
-                contains_glossary = True
-                glossary_present = True
-        if chunk.order == 0 and "refers to" in chunk.text.lower():
-            score += 0.05
-            contains_glossary = True
+        if ranked.contains_glossary[i] or getattr(chunk, "is_glossary", False):
             glossary_present = True
-        if getattr(chunk, "is_glossary", False):
-            score += 0.2
-            glossary_present = True
-        if query_terms and (
-            getattr(chunk, "is_glossary", False)
-            or "glossary" in getattr(chunk, "tags", [])
-        ):
-            score += 0.15
-        # Boost using precomputed glossary_score but keep track of glossary hit
-        score += getattr(chunk, "glossary_score", 0.0) * GLOSSARY_BOOST_FACTOR
-        glossary_hit = (
-            contains_glossary
-            or getattr(chunk, "is_glossary", False)
-            or (
-                query_terms
-                and (
-                    getattr(chunk, "is_glossary", False)
-                    or "glossary" in getattr(chunk, "tags", [])
-                )
-            )
-        )
-        glossary_boost = getattr(chunk, "glossary_boost", 0.0)
-        if glossary_hit:
-            score += glossary_boost
-        reflection_boost = 0.0
-        reflection_hit = False
-        if reflection_terms:
-            if chunk.anchor and chunk.anchor.slug in reflection_terms:
-                reflection_hit = True
-            elif any(t in chunk.text.lower() for t in reflection_terms):
-                reflection_hit = True
-        if reflection_hit:
-            reflection_boost = REFLECTION_BOOST
-            score += reflection_boost
-        if not getattr(chunk, "fingerprint", ""):
-            score -= 0.05
         weak_glossary = (
             getattr(chunk, "is_glossary", False)
             and getattr(chunk, "glossary_score", 0.0) < GLOSSARY_WEAK_THRESHOLD
@@ -461,31 +486,31 @@ def get_relevant_chunks(
             continue
         if (
             getattr(chunk, "is_glossary", False)
-            and score < GLOSSARY_MIN_SCORE_OVERRIDE
-            and (not chunk.anchor or chunk.anchor.slug not in anchor_matches)
+            and ranked.pre_anchor_scores[i] < GLOSSARY_MIN_SCORE_OVERRIDE
+            and not anchor_matched
             and not force_chunks
         ):
             logger.debug("Skipping low-score glossary chunk %s", chunk.id)
             continue
-        anchor_confidence = 0.0
-        if chunk.anchor:
-            if assistant and assistant.suppress_unstable_anchors and chunk.anchor.is_unstable:
-                logger.debug("Skipping unstable anchor %s", chunk.anchor.slug)
-                continue
-            if chunk.anchor.slug in anchor_matches:
-                score += ANCHOR_BOOST
-                anchor_confidence = 1.0
-            else:
-                anchor_confidence = 0.5
-            quality = chunk.anchor.avg_score * (1 - chunk.anchor.fallback_rate)
-            if chunk.anchor.total_uses > 20:
-                quality *= 1.1
-            score *= 1 + quality * 0.1
+        if (
+            chunk.anchor
+            and assistant
+            and assistant.suppress_unstable_anchors
+            and chunk.anchor.is_unstable
+        ):
+            logger.debug("Skipping unstable anchor %s", chunk.anchor.slug)
+            continue
+        score = float(ranked.final_scores[i])
+        raw_score = float(ranked.raw_scores[i])
+        glossary_hit = bool(ranked.glossary_hit[i])
+        applied_glossary_boost = float(ranked.glossary_boost[i])
+        reflection_boost = float(ranked.reflection_boost[i])
+        anchor_confidence = float(ranked.anchor_confidence[i])
         logger.info(
             "[RAG] Chunk %s | Raw Score: %.4f | Glossary Boost: %.4f | Final Score: %.4f",
             chunk.id,
             raw_score,
-            glossary_boost if glossary_hit else 0.0,
+            applied_glossary_boost,
             score,
         )
         scored.append(
@@ -494,7 +519,7 @@ def get_relevant_chunks(
                 chunk,
                 anchor_confidence,
                 raw_score,
-                glossary_boost if glossary_hit else 0.0,
+                applied_glossary_boost,
                 glossary_hit,
                 reflection_boost,
             )
@@ -502,15 +527,13 @@ def get_relevant_chunks(
         debug_candidates.append(
             {
                 "id": str(chunk.id),
-                "was_anchor_match": bool(
-                    chunk.anchor and chunk.anchor.slug in anchor_matches
-                ),
+                "was_anchor_match": anchor_matched,
                 "raw_score": round(raw_score, 4),
                 "final_score": round(score, 4),
-                "glossary_boost": round(glossary_boost if glossary_hit else 0.0, 4),
+                "glossary_boost": round(applied_glossary_boost, 4),
                 "glossary_hit": glossary_hit,
                 "reflection_boost": round(reflection_boost, 4),
-                "reflection_hit": reflection_hit,
+                "reflection_hit": bool(ranked.reflection_hit[i]),
             }
         )
 
@@ -547,7 +570,9 @@ def get_relevant_chunks(
     reason = None
     fallback = False
 
-    strong_matches = filtered[:3]
+    strong_matches = (
+        _diversify_pairs(filtered, 3) if RAG_MMR_ENABLED else filtered[:3]
+    )
     anchor_pairs = [
         p
         for p in scored
@@ -1,21 +1,122 @@
 from __future__ import annotations
 import logging
-from typing import List, Tuple
+import math
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence, Tuple
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.db import DatabaseError, transaction
+from django.db.models import CharField
+from django.db.models.functions import Cast
+from django.utils import timezone
+from pgvector.django import CosineDistance
 
 from assistants.models.assistant import Assistant
 from memory.models import MemoryEntry
+from embeddings.ann_index import assistant_scope, search_scopes
 from embeddings.helpers.helpers_io import get_embedding_for_text
 from embeddings.models import Embedding
-from embeddings.vector_utils import compute_similarity
+from embeddings.vector_utils import compute_similarity, tune_hnsw_scan
 
 logger = logging.getLogger(__name__)
 
+# Only summon memories from the last N days (0 searches the whole history)
+MEMORY_SUMMON_WINDOW_DAYS = getattr(settings, "MEMORY_SUMMON_WINDOW_DAYS", 0)
+# HNSW candidate list size; larger trades latency for recall
+MEMORY_SUMMON_EF_SEARCH = getattr(settings, "MEMORY_SUMMON_EF_SEARCH", 100)
+# Index hits fetched per requested memory, covering entries gone from the DB
+ANN_OVERFETCH = 2
+
+
+def _window_start(within_days: Optional[int]) -> Optional[datetime]:
+    days = MEMORY_SUMMON_WINDOW_DAYS if within_days is None else within_days
+    return timezone.now() - timedelta(days=days) if days else None
+
+
+def top_memory_matches(
+    query_vec: Sequence[float],
+    assistant: Assistant,
+    k: int = 5,
+    *,
+    since: Optional[datetime] = None,
+    min_similarity: float = 0.0,
+) -> List[Tuple[str, float]]:
+    """Return ``(memory_id, similarity)`` for the ``k`` nearest memories.
+
+    Ranking happens in Postgres: the assistant's memory IDs are a subquery
+    joined against ``Embedding.object_id`` and ordered by ``CosineDistance``,
+    so the HNSW index on ``embedding`` bounds the work by ``k`` rather than by
+    how many memories the assistant has. ``since`` restricts the search to
+    memories created after that time. Zero vectors (NaN distance) are
+    skipped, as are matches at or below a positive ``min_similarity``.
+    """
+    memories = MemoryEntry.objects.filter(assistant=assistant)
+    if since is not None:
+        memories = memories.filter(created_at__gte=since)
+    member_ids = memories.annotate(
+        id_str=Cast("id", output_field=CharField())
+    ).values("id_str")
+
+    qs = Embedding.objects.filter(
+        content_type=ContentType.objects.get_for_model(MemoryEntry),
+        object_id__in=member_ids,
+    ).annotate(distance=CosineDistance("embedding", list(query_vec)))
+    if min_similarity > 0:
+        qs = qs.filter(distance__lt=1.0 - min_similarity)
+    qs = qs.order_by("distance").values_list("object_id", "distance")
+    with transaction.atomic():
+        tune_hnsw_scan(MEMORY_SUMMON_EF_SEARCH)
+        rows = list(qs[: k * 2])
+
+    # Several embeddings may point at one memory; keep the closest
+    best = {}
+    for object_id, distance in rows:
+        if distance is None or math.isnan(distance):
+            continue
+        if object_id not in best or distance < best[object_id]:
+            best[object_id] = distance
+    ranked = sorted(best.items(), key=lambda item: item[1])[:k]
+    return [(mid, 1.0 - distance) for mid, distance in ranked]
+
+
+def _score_in_python(
+    query_vec: Sequence[float], assistant: Assistant, since: Optional[datetime]
+) -> List[Tuple[float, MemoryEntry]]:
+    """Brute-force scoring used when the database cannot rank vectors."""
+    memories = MemoryEntry.objects.filter(assistant=assistant)
+    if since is not None:
+        memories = memories.filter(created_at__gte=since)
+    mem_map = {str(m.id): m for m in memories}
+    if not mem_map:
+        return []
+    ct = ContentType.objects.get_for_model(MemoryEntry)
+    embeddings = Embedding.objects.filter(
+        content_type=ct, object_id__in=list(mem_map)
+    ).only("object_id", "embedding")
+    scored: List[Tuple[float, MemoryEntry]] = []
+    for emb in embeddings:
+        mem = mem_map.get(str(emb.object_id))
+        if not mem:
+            continue
+        score = compute_similarity(query_vec, emb.embedding)
+        scored.append((score, mem))
+    scored.sort(key=lambda x: x[0], reverse=True)
+    return scored
+
 
 def search_related_memories(
-    text: str, assistant: Assistant, top_n: int = 5
+    text: str,
+    assistant: Assistant,
+    top_n: int = 5,
+    within_days: Optional[int] = None,
+    fields: Optional[Sequence[str]] = None,
 ) -> List[MemoryEntry]:
-    """Return top-N memories from this assistant most similar to the text."""
+    """Return top-N memories from this assistant most similar to the text.
+
+    ``within_days`` limits the search to recent memories and defaults to
+    ``MEMORY_SUMMON_WINDOW_DAYS``. ``fields`` restricts the columns loaded
+    for the returned memories.
+    """
     logger.info(
         "🔍 Searching memory embeddings for assistant %s with query: %s",
         assistant.id,
@@ -30,32 +131,39 @@ def search_related_memories(
     if not query_vec:
         return []
 
-    ct = ContentType.objects.get_for_model(MemoryEntry)
-    mem_ids = list(
-        MemoryEntry.objects.filter(assistant=assistant).values_list("id", flat=True)
-    )
-    if not mem_ids:
+    since = _window_start(within_days)
+    hits = None
+    if since is None:
+        # Over-fetch so stale index entries (reassigned memories) can be refilled
+        hits = search_scopes(
+            query_vec, [assistant_scope(assistant.id)], k=top_n * ANN_OVERFETCH
+        )
+    if hits is None:
+        try:
+            hits = top_memory_matches(query_vec, assistant, k=top_n, since=since)
+        except DatabaseError as e:
+            logger.warning("pgvector memory search failed, scoring in Python: %s", e)
+            scored = _score_in_python(query_vec, assistant, since)
+            return [m for _, m in scored[:top_n]]
+    if not hits:
         return []
 
-    mem_id_strs = [str(mid) for mid in mem_ids]
-    embeddings = Embedding.objects.filter(content_type=ct, object_id__in=mem_id_strs)
-    scored: List[Tuple[float, MemoryEntry]] = []
-    mem_map = {str(m.id): m for m in MemoryEntry.objects.filter(id__in=mem_ids)}
-    for emb in embeddings:
-        mem = mem_map.get(str(emb.object_id))
-        if not mem:
-            continue
-        score = compute_similarity(query_vec, emb.embedding)
-        scored.append((score, mem))
-    scored.sort(key=lambda x: x[0], reverse=True)
-    return [m for _, m in scored[:top_n]]
+    memories = MemoryEntry.objects.filter(
+        assistant=assistant, id__in=[h[0] for h in hits]
+    )
+    if fields:
+        memories = memories.only(*fields)
+    mem_map = {str(m.id): m for m in memories}
+    return [mem_map[mid] for mid, _s in hits if mid in mem_map][:top_n]
 
 
 def summon_relevant_memories(
     text: str, assistant: Assistant, limit: int = 3
 ) -> Tuple[str, List[str]]:
     """Build a recall block of relevant memories."""
-    memories = search_related_memories(text, assistant, top_n=limit)
+    memories = search_related_memories(
+        text, assistant, top_n=limit, fields=("id", "summary", "event")
+    )
     if not memories:
         return "", []
     lines = ["# Recalled Memories:"]
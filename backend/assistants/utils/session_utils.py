@@ -1,12 +1,19 @@
 import json
 import logging
+import re
 from datetime import datetime
 from django.utils import timezone
 from django.conf import settings
 import redis
 
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
 from assistants.models.assistant import Assistant
 from assistants.models.thoughts import AssistantThoughtLog
+from assistants.utils.thought_integrity import analyze_thought_integrity
 
 REDIS_URL = getattr(settings, "REDIS_URL", "redis://127.0.0.1:6379/1")
 r = redis.Redis.from_url(REDIS_URL)
@@ -15,24 +22,78 @@ SESSION_EXPIRY = getattr(settings, "TOPIC_MEMORY_EXPIRY", 3600)
 THOUGHT_CACHE_PREFIX = "assistant:thoughts:"
 THOUGHT_TTL_SECONDS = 60 * 5  # 5 minutes
 
+# Messages sent verbatim to the LLM; older ones reach it via the summary
+SESSION_WINDOW = getattr(settings, "CHAT_SESSION_WINDOW", 40)
+SESSION_SUMMARY_STEP = getattr(settings, "CHAT_SESSION_SUMMARY_STEP", 20)
+SESSION_SUMMARY_MAX_CHARS = getattr(settings, "CHAT_SESSION_SUMMARY_MAX_CHARS", 4000)
+SUMMARY_LINE_CHARS = 200
+# Messages echoed back to the client per chat response
+SESSION_RESPONSE_MESSAGES = getattr(settings, "CHAT_RESPONSE_MESSAGES", 100)
+ARCHIVE_BATCH_SIZE = 500
+
 logger = logging.getLogger(__name__)
 
 
-def save_message_to_session(session_id: str, role: str, content: str) -> None:
-    payload = json.dumps(
+def _session_key(session_id: str) -> str:
+    return f"chat:{session_id}"
+
+
+def _summary_key(session_id: str) -> str:
+    return f"chat:{session_id}:summary"
+
+
+def _counts_key(session_id: str) -> str:
+    return f"chat:{session_id}:counts"
+
+
+def _encode(message: dict) -> bytes:
+    if msgpack is not None:
+        return msgpack.packb(message, use_bin_type=True)
+    return json.dumps(message).encode()
+
+
+def _decode(raw) -> dict | None:
+    """Decode a stored message; entries written before msgpack are JSON."""
+    if isinstance(raw, str):
+        raw = raw.encode()
+    try:
+        if raw[:1] == b"{":
+            return json.loads(raw)
+        if msgpack is not None:
+            return msgpack.unpackb(raw, raw=False)
+    except Exception:  # pragma: no cover - corrupt entry
+        pass
+    logger.warning("Skipping undecodable session message")
+    return None
+
+
+def _decode_all(raw_messages) -> list:
+    return [m for m in map(_decode, raw_messages) if m is not None]
+
+
+def save_message_to_session(session_id: str, role: str, content: str) -> int:
+    """Append a message and return how many ``role`` messages the session has."""
+    payload = _encode(
         {"role": role, "content": content, "timestamp": timezone.now().isoformat()}
     )
-    r.rpush(f"chat:{session_id}", payload)
-    r.expire(f"chat:{session_id}", SESSION_EXPIRY)
+    pipe = r.pipeline(transaction=False)
+    pipe.rpush(_session_key(session_id), payload)
+    pipe.hincrby(_counts_key(session_id), role, 1)
+    pipe.expire(_session_key(session_id), SESSION_EXPIRY)
+    pipe.expire(_summary_key(session_id), SESSION_EXPIRY)
+    pipe.expire(_counts_key(session_id), SESSION_EXPIRY)
+    role_count = pipe.execute()[1]
     logger.debug(
         "Saved message to session",
         extra={"session_id": session_id, "role": role},
     )
+    return role_count
 
 
-def load_session_messages(session_id: str) -> list:
-    raw = r.lrange(f"chat:{session_id}", 0, -1)
-    messages = [json.loads(msg) for msg in raw]
+def load_session_messages(session_id: str, limit: int | None = None) -> list:
+    """Return the session's messages, or only the last ``limit`` of them."""
+    start = -limit if limit else 0
+    messages = _decode_all(r.lrange(_session_key(session_id), start, -1))
     logger.debug(
         "Loaded messages from session",
         extra={"session_id": session_id, "count": len(messages)},
@@ -40,47 +101,132 @@ def load_session_messages(session_id: str) -> list:
     return messages
 
 
+def session_length(session_id: str) -> int:
+    return r.llen(_session_key(session_id))
+
+
+def _summary_line(message: dict) -> str:
+    content = re.sub(r"\s+", " ", str(message.get("content", ""))).strip()
+    if len(content) > SUMMARY_LINE_CHARS:
+        content = content[: SUMMARY_LINE_CHARS - 1] + "…"
+    return f"{message.get('role', 'unknown')}: {content}"
+
+
+def _fold_summary(session_id: str, summary: str, older: list, covered: int) -> str:
+    """Append ``older`` messages to the summary and store it."""
+    lines = [summary] if summary else []
+    lines += [_summary_line(m) for m in older]
+    summary = "\n".join(lines)
+    if len(summary) > SESSION_SUMMARY_MAX_CHARS:
+        # Keep the most recent lines whole
+        summary = summary[-SESSION_SUMMARY_MAX_CHARS:]
+        summary = summary.split("\n", 1)[-1]
+    pipe = r.pipeline(transaction=False)
+    pipe.hset(_summary_key(session_id), mapping={"covered": covered, "text": summary})
+    pipe.expire(_summary_key(session_id), SESSION_EXPIRY)
+    pipe.execute()
+    return summary
+
+
+def load_session_context(session_id: str, window: int = SESSION_WINDOW) -> list:
+    """Return chat messages for an LLM prompt with bounded size.
+
+    Messages not yet folded into the rolling summary are returned verbatim,
+    at least the last ``window`` of them, preceded by a system message
+    summarizing older turns. Every ``SESSION_SUMMARY_STEP`` messages the
+    oldest verbatim ones are folded in, so each call reads one slice of at
+    most ``window + SESSION_SUMMARY_STEP`` messages however long the session
+    grows.
+    """
+    key = _session_key(session_id)
+    pipe = r.pipeline(transaction=False)
+    pipe.llen(key)
+    pipe.lrange(key, -(window + SESSION_SUMMARY_STEP), -1)
+    pipe.hgetall(_summary_key(session_id))
+    length, raw_tail, state = pipe.execute()
+    tail = _decode_all(raw_tail)
+    tail_start = length - len(tail)
+
+    covered = int(state.get(b"covered", 0)) if state else 0
+    summary = state.get(b"text", b"").decode() if state else ""
+    # Sessions that outgrew the slice before a fold (or whose summary
+    # expired) lose the turns older than it from the summary
+    covered = max(covered, tail_start)
+    older = length - window
+    if older - covered >= SESSION_SUMMARY_STEP:
+        folded = tail[covered - tail_start : older - tail_start]
+        summary = _fold_summary(session_id, summary, folded, older)
+        covered = older
+    messages = tail[covered - tail_start :]
+    if summary and covered:
+        messages.insert(
+            0,
+            {"role": "system", "content": f"Earlier in this conversation:\n{summary}"},
+        )
+    logger.debug(
+        "Loaded session context",
+        extra={"session_id": session_id, "count": len(messages), "total": length},
+    )
+    return messages
+
+
 def flush_chat_session(session_id: str) -> None:
-    r.delete(f"chat:{session_id}")
+    r.delete(
+        _session_key(session_id), _summary_key(session_id), _counts_key(session_id)
+    )
     logger.info("Flushed chat session", extra={"session_id": session_id})
 
 
+def _archive_entry(assistant: Assistant, entry: dict) -> AssistantThoughtLog:
+    thought = entry.get("content", "")
+    return AssistantThoughtLog(
+        assistant=assistant,
+        thought=thought,
+        thought_trace="• Archived from chat session\n• Role: "
+        + entry.get("role", "unknown"),
+        created_at=datetime.fromisoformat(
+            entry.get("timestamp", timezone.now().isoformat())
+        ),
+        role=entry.get("role", "assistant"),
+        # bulk_create skips save(), which normally fills this in
+        integrity_status=analyze_thought_integrity(thought) if thought else None,
+    )
+
+
 def flush_session_to_db(session_id: str, assistant: Assistant) -> int:
-    key = f"chat:{session_id}"
-    messages = r.lrange(key, 0, -1)
-    if not messages:
+    """Archive the session as thought logs, ``ARCHIVE_BATCH_SIZE`` at a time."""
+    key = _session_key(session_id)
+    saved = 0
+    start = 0
+    while True:
+        raw = r.lrange(key, start, start + ARCHIVE_BATCH_SIZE - 1)
+        if not raw:
+            break
+        start += len(raw)
+        logs = []
+        for entry in _decode_all(raw):
+            try:
+                logs.append(_archive_entry(assistant, entry))
+            except Exception as e:  # pragma: no cover - safeguard
+                logger.warning(
+                    "Failed to archive message",
+                    extra={
+                        "session_id": session_id,
+                        "assistant": assistant.slug,
+                        "error": str(e),
+                    },
+                    exc_info=True,
+                )
+        AssistantThoughtLog.objects.bulk_create(logs, batch_size=ARCHIVE_BATCH_SIZE)
+        saved += len(logs)
+        if len(raw) < ARCHIVE_BATCH_SIZE:
+            break
+    if not start:
         logger.info(
             "No messages to flush",
             extra={"session_id": session_id, "assistant": assistant.slug},
         )
         return 0
-
-    saved = 0
-    for raw in messages:
-        try:
-            entry = json.loads(raw)
-            AssistantThoughtLog.objects.create(
-                assistant=assistant,
-                thought=entry.get("content", ""),
-                thought_trace="• Archived from chat session\n• Role: "
-                + entry.get("role", "unknown"),
-                created_at=datetime.fromisoformat(
-                    entry.get("timestamp", timezone.now().isoformat())
-                ),
-                role=entry.get("role", "assistant"),
-            )
-            saved += 1
-        except Exception as e:  # pragma: no cover - safeguard
-            logger.warning(
-                "Failed to archive message",
-                extra={
-                    "session_id": session_id,
-                    "assistant": assistant.slug,
-                    "error": str(e),
-                },
-                exc_info=True,
-            )
-            continue
     logger.info(
         "Flushed session to DB",
         extra={"session_id": session_id, "assistant": assistant.slug, "count": saved},
@@ -36,6 +36,7 @@ from memory.models import MemoryEntry, RAGGroundingLog
 from insights.models import AssistantInsightLog
 from assistants.models.user_preferences import AssistantUserPreferences
 from utils.rag_debug import log_rag_debug
+from utils import telemetry
 from memory.serializers import RAGGroundingLogSerializer
 from assistants.helpers.logging_helper import (
     log_assistant_thought,
@@ -64,6 +65,7 @@ from assistants.models.assistant import (
 from assistants.models.glossary import SuggestionLog
 from assistants.models.reflection import AssistantReflectionLog
 from assistants.models.thoughts import AssistantThoughtLog
+from assistants.utils.thought_integrity import analyze_thought_integrity
 from prompts.models import PromptMutationLog
 from assistants.utils.session_utils import get_cached_thoughts
 from assistants.serializers import (
@@ -75,7 +77,10 @@ from assistants.serializers import (
 from assistants.utils.session_utils import (
     save_message_to_session,
     flush_session_to_db,
+    SESSION_RESPONSE_MESSAGES,
+    load_session_context,
     load_session_messages,
+    session_length,
 )
 from assistants.utils.assistant_thought_engine import AssistantThoughtEngine
 from assistants.helpers.deletion import cascade_delete_assistant
@@ -765,6 +770,37 @@ def _get_demo_starter_memory(assistant):
     return messages
 
 
+def _build_chat_messages(assistant: Assistant, session_id: str, message: str):
+    """Return the system prompt, session history and ``message`` as chat messages."""
+    if assistant.system_prompt:
+        system_prompt = assistant.system_prompt.content
+    else:
+        logger.warning("Assistant %s has no system prompt", assistant.slug)
+        system_prompt = "You are a helpful assistant."
+    if assistant.boost_prompt_in_system and assistant.prompt_notes:
+        system_prompt = f"{system_prompt}\n\n{assistant.prompt_notes}".strip()
+    identity = assistant.get_identity_prompt()
+    if identity:
+        system_prompt = f"{system_prompt}\n\n{identity}"
+    messages = [{"role": "system", "content": system_prompt}]
+    messages += load_session_context(session_id)
+    messages.append({"role": "user", "content": message})
+    return messages
+
+
+def _response_history(request, session_id: str) -> list:
+    """Session messages echoed to the client: the recent tail by default.
+
+    Pass ``full_history`` to receive the whole transcript.
+    """
+    flag = request.data.get("full_history") or request.query_params.get(
+        "full_history"
+    )
+    if str(flag).lower() in ["1", "true", "yes"]:
+        return load_session_messages(session_id)
+    return load_session_messages(session_id, limit=SESSION_RESPONSE_MESSAGES)
+
+
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
 def chat_with_assistant_view(request, slug):
@@ -782,12 +818,12 @@ def chat_with_assistant_view(request, slug):
     message = request.data.get("message")
     session_id = request.data.get("session_id") or str(uuid.uuid4())
     demo_session_id = request.data.get("demo_session_id")
-    history = load_session_messages(session_id)
+    has_history = session_length(session_id) > 0
 
     should_seed = False
     if starter_query:
         should_seed = True
-    if assistant.auto_start_chat and not history:
+    if assistant.auto_start_chat and not has_history:
         should_seed = True
     if inject_starter:
         should_seed = True
@@ -798,7 +834,7 @@ def chat_with_assistant_view(request, slug):
         should_seed,
         bool(starter_query),
         assistant.auto_start_chat,
-        bool(history),
+        has_history,
         inject_starter,
     )
 
@@ -843,11 +879,11 @@ def chat_with_assistant_view(request, slug):
             usage, u_created = get_or_create_usage_for_session(demo_session_id)
             if u_created:
                 logger.debug("[DemoUsage] start %s", demo_session_id)
-        if should_seed and starter_query and not history:
+        if should_seed and starter_query and not has_history:
             save_message_to_session(session_id, "user", starter_query)
             injected = True
-            history = load_session_messages(session_id)
             logger.debug("Injected starter query into session %s", session_id)
+        history = _response_history(request, session_id)
         logger.debug(
             "Ping response slug=%s session=%s injected=%s demo_intro=%s",
             assistant.slug,
@@ -858,6 +894,7 @@ def chat_with_assistant_view(request, slug):
         return Response(
             {
                 "messages": history,
+                "message_count": session_length(session_id),
                 "starter_memory": starter_messages,
                 "demo_intro_message": demo_intro_message,
             }
@@ -867,20 +904,7 @@ def chat_with_assistant_view(request, slug):
         return Response({"error": "Empty message."}, status=status.HTTP_400_BAD_REQUEST)
 
     # Build messages list
-    if assistant.system_prompt:
-        system_prompt = assistant.system_prompt.content
-    else:
-        logger.warning("Assistant %s has no system prompt", assistant.slug)
-        system_prompt = "You are a helpful assistant."
-    if assistant.boost_prompt_in_system and assistant.prompt_notes:
-        system_prompt = f"{system_prompt}\n\n{assistant.prompt_notes}".strip()
-    identity = assistant.get_identity_prompt()
-    if identity:
-        system_prompt = f"{system_prompt}\n\n{identity}"
-    messages = [{"role": "system", "content": system_prompt}]
-    session_history = load_session_messages(session_id)
-    messages += session_history
-    messages.append({"role": "user", "content": message})
+    messages = _build_chat_messages(assistant, session_id, message)
 
     # Save user message to session
     save_message_to_session(session_id, "user", message)
@@ -1024,7 +1048,8 @@ def chat_with_assistant_view(request, slug):
         if tool_obj:
             try:
                 tool_result = execute_tool(tool_obj, payload)
-                ToolUsageLog.objects.create(
+                telemetry.record(
+                    ToolUsageLog,
                     tool=tool_obj,
                     assistant=assistant,
                     input_payload=payload,
@@ -1033,7 +1058,8 @@ def chat_with_assistant_view(request, slug):
                 )
                 reply = json.dumps(tool_result)
             except Exception as e:
-                ToolUsageLog.objects.create(
+                telemetry.record(
+                    ToolUsageLog,
                     tool=tool_obj,
                     assistant=assistant,
                     input_payload=payload,
@@ -1042,17 +1068,18 @@ def chat_with_assistant_view(request, slug):
                 )
                 reply = f"Tool {tool_slug} failed: {e}"
 
-    token_usage.prompt_tokens += getattr(usage, "prompt_tokens", 0)
-    token_usage.completion_tokens += getattr(usage, "completion_tokens", 0)
-    token_usage.total_tokens += getattr(usage, "total_tokens", 0)
-    token_usage.save()
+    if getattr(usage, "total_tokens", 0):
+        token_usage.prompt_tokens += getattr(usage, "prompt_tokens", 0)
+        token_usage.completion_tokens += getattr(usage, "completion_tokens", 0)
+        token_usage.total_tokens += getattr(usage, "total_tokens", 0)
+        token_usage.save()
 
     # Save assistant message
-    save_message_to_session(session_id, "assistant", reply)
+    assistant_replies = save_message_to_session(session_id, "assistant", reply)
 
     if assistant.is_demo:
-        history = load_session_messages(session_id)
-        if sum(1 for m in history if m.get("role") == "assistant") == 1:
+        history = _response_history(request, session_id)
+        if assistant_replies == 1:
             from assistants.tasks import log_demo_reflection_task
 
             log_demo_reflection_task.delay(str(assistant.id), session_id)
@@ -1066,18 +1093,23 @@ def chat_with_assistant_view(request, slug):
         return Response(
             {
                 "messages": history,
+                "message_count": session_length(session_id),
                 "rag_meta": rag_meta,
                 "starter_memory": starter_messages,
                 "demo_intro_message": demo_intro_message,
             }
         )
 
-    AssistantThoughtLog.objects.create(
+    override_thought = "Manually testing role override"
+    telemetry.record(
+        AssistantThoughtLog,
         assistant=assistant,
         project=None,
-        thought="Manually testing role override",
+        thought=override_thought,
         role="user",
         thought_trace="manual",
+        # Buffered rows are bulk-inserted, skipping the save() that sets this
+        integrity_status=analyze_thought_integrity(override_thought),
     )
 
     # Save chat log
@@ -1098,7 +1130,8 @@ def chat_with_assistant_view(request, slug):
     )
     assistant_chat = save_chat_message(chat_session, "assistant", reply)
     if is_first:
-        ChatIntentDriftLog.objects.create(
+        telemetry.record(
+            ChatIntentDriftLog,
             assistant=assistant,
             session=chat_session,
             user_message=user_chat,
@@ -1192,22 +1225,20 @@ def chat_with_assistant_view(request, slug):
     else:
         full_transcript = memory.full_transcript or ""
 
-    tag_names = generate_tags_for_memory(full_transcript) or []
-    tag_objs = []
-    for name in tag_names:
+    tag_names = {}
+    for name in generate_tags_for_memory(full_transcript) or []:
         norm_name = str(name).strip().lower()
-        slug = slugify(norm_name)
-        tag, _ = Tag.objects.get_or_create(slug=slug, defaults={"name": norm_name})
-        tag_objs.append(tag)
-
-    memory.tags.set(tag_objs)
-    memory.save()
-
+        tag_names.setdefault(slugify(norm_name), norm_name)
     if rag_meta.get("anchor_hits") or rag_meta.get("anchor_misses"):
-        tag, _ = Tag.objects.get_or_create(
-            slug="glossary_insight", defaults={"name": "glossary_insight"}
-        )
-        memory.tags.add(tag)
+        tag_names.setdefault("glossary_insight", "glossary_insight")
+    tag_names.pop("", None)
+    # One insert for unseen slugs, one select for all of them
+    Tag.objects.bulk_create(
+        [Tag(slug=slug, name=name) for slug, name in tag_names.items()],
+        ignore_conflicts=True,
+    )
+    memory.tags.set(Tag.objects.filter(slug__in=list(tag_names)))
+    memory.save()
 
     debug_flag = request.query_params.get("debug") or request.data.get("debug")
 
@@ -1215,7 +1246,8 @@ def chat_with_assistant_view(request, slug):
         "rag_fallback", False
     )
     if should_log:
-        RAGGroundingLog.objects.create(
+        telemetry.record(
+            RAGGroundingLog,
             assistant=assistant,
             query=message,
             used_chunk_ids=[c["chunk_id"] for c in rag_meta.get("used_chunks", [])],
@@ -1237,7 +1269,8 @@ def chat_with_assistant_view(request, slug):
         from assistants.utils.self_narration import explain_reasoning
 
         explanation = explain_reasoning(reasoning_trace)
-        AssistantInsightLog.objects.create(
+        telemetry.record(
+            AssistantInsightLog,
             assistant=assistant,
             user=user,
             summary=explanation,
@@ -1252,7 +1285,8 @@ def chat_with_assistant_view(request, slug):
         bool(demo_intro_message),
     )
     resp_data = {
-        "messages": load_session_messages(session_id),
+        "messages": _response_history(request, session_id),
+        "message_count": session_length(session_id),
         "rag_meta": rag_meta,
         "starter_memory": starter_messages,
         "demo_intro_message": demo_intro_message,
@@ -1263,6 +1297,153 @@ def chat_with_assistant_view(request, slug):
     return Response(resp_data)
 
 
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def _finish_streamed_chat(
+    assistant, chat_session, session_id, message, messages, turn, reply
+):
+    """Run the post-reply logging deferred by :func:`chat_stream_view`."""
+    try:
+        reply, summoned_ids, rag_meta, _trace = llm_router.finalize_chat(
+            turn, reply, allow_retry=False
+        )
+        _maybe_log_self_doubt(assistant, reply)
+        save_message_to_session(session_id, "assistant", reply)
+        is_first = not AssistantChatMessage.objects.filter(
+            session=chat_session, role="user"
+        ).exists()
+        user_chat = save_chat_message(
+            chat_session,
+            "user",
+            message,
+            is_first_user_message=is_first,
+            glossary_misses=rag_meta.get("anchor_misses", []),
+        )
+        assistant_chat = save_chat_message(chat_session, "assistant", reply)
+        anchor_slug = (rag_meta.get("anchor_hits") or [None])[0]
+        memory = create_memory_from_chat(
+            assistant_name=assistant.name,
+            session_id=session_id,
+            messages=messages,
+            reply=reply,
+            importance=5,
+            chat_session=chat_session,
+            assistant=assistant,
+            project=chat_session.project,
+            anchor_slug=anchor_slug,
+            fallback_reason=rag_meta.get("fallback_reason"),
+            is_demo=assistant.is_demo,
+        )
+        if rag_meta.get("convergence_log_id"):
+            from memory.models import AnchorConvergenceLog
+
+            AnchorConvergenceLog.objects.filter(
+                id=rag_meta["convergence_log_id"]
+            ).update(memory=memory)
+        engine = AssistantThoughtEngine(assistant=assistant)
+        engine.log_thought(message, role="user")
+        assist_log = engine.log_thought(reply, role="assistant")
+        log_obj = assist_log.get("log") if isinstance(assist_log, dict) else None
+        if log_obj and summoned_ids:
+            log_obj.summoned_memory_ids = summoned_ids
+            log_obj.save(update_fields=["summoned_memory_ids"])
+        user_chat.memory = memory
+        assistant_chat.memory = memory
+        user_chat.save()
+        assistant_chat.save()
+    except Exception:
+        logger.exception("[ChatStream] Failed to log streamed reply for %s", session_id)
+
+
+def _chat_stream_events(tokens, session_id, finish):
+    yield _sse("start", {"session_id": session_id})
+    parts = []
+    try:
+        for token in tokens:
+            parts.append(token)
+            yield _sse("token", {"content": token})
+    except Exception as exc:
+        logger.exception("[ChatStream] Provider stream failed")
+        yield _sse("error", {"error": str(exc)})
+        return
+    yield _sse("done", {"session_id": session_id})
+    finish("".join(parts).strip())
+
+
+async def _achat_stream_events(tokens, session_id, finish):
+    from asgiref.sync import sync_to_async
+
+    # Provider iterators block on network reads, so pull them off the loop
+    next_token = sync_to_async(next, thread_sensitive=False)
+    end = object()
+    yield _sse("start", {"session_id": session_id})
+    parts = []
+    try:
+        while (token := await next_token(tokens, end)) is not end:
+            parts.append(token)
+            yield _sse("token", {"content": token})
+    except Exception as exc:
+        logger.exception("[ChatStream] Provider stream failed")
+        yield _sse("error", {"error": str(exc)})
+        return
+    yield _sse("done", {"session_id": session_id})
+    await sync_to_async(finish)("".join(parts).strip())
+
+
+@api_view(["POST"])
+@permission_classes([IsAuthenticated])
+def chat_stream_view(request, slug):
+    """Stream an assistant reply as server-sent events.
+
+    Emits ``start``, one ``token`` event per chunk from the provider and
+    ``done``. Memory, thought and RAG usage logging run after ``done`` so
+    they never delay the first token. Under ASGI the response is an async
+    iterator; under WSGI it falls back to a sync generator.
+    """
+    from django.core.handlers.asgi import ASGIRequest
+    from django.http import StreamingHttpResponse
+    from functools import partial
+
+    assistant = get_object_or_404(Assistant, slug=slug)
+    message = request.data.get("message")
+    if not message:
+        return Response({"error": "Empty message."}, status=status.HTTP_400_BAD_REQUEST)
+    session_id = request.data.get("session_id") or str(uuid.uuid4())
+
+    messages = _build_chat_messages(assistant, session_id, message)
+    save_message_to_session(session_id, "user", message)
+    chat_session = get_or_create_chat_session(session_id, assistant=assistant)
+
+    focus_only = request.data.get("focus_only", True)
+    turn, tokens = llm_router.stream_chat(
+        messages,
+        assistant,
+        temperature=0.7,
+        auto_expand=not focus_only,
+        focus_anchors_only=focus_only,
+        force_chunks=request.query_params.get("force_chunks") == "true",
+    )
+    finish = partial(
+        _finish_streamed_chat,
+        assistant,
+        chat_session,
+        session_id,
+        message,
+        messages,
+        turn,
+    )
+    if isinstance(request._request, ASGIRequest):
+        events = _achat_stream_events(tokens, session_id, finish)
+    else:
+        events = _chat_stream_events(tokens, session_id, finish)
+    response = StreamingHttpResponse(events, content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
 @api_view(["POST"])
 def flush_chat_session(request, slug):
     try:
@@ -1280,12 +1461,16 @@ def flush_chat_session(request, slug):
 def get_demo_assistants(request):
     """Return all demo assistants using the main serializer."""
     force = request.GET.get("force_seed") == "1"
-    assistants = Assistant.objects.filter(is_demo=True).order_by("demo_slug")
+    assistants = (
+        Assistant.objects.filter(is_demo=True)
+        .select_related("metrics")
+        .order_by("demo_slug")
+    )
     if force or assistants.count() < 3:
         from django.core.management import call_command
 
         call_command("seed_demo_assistants")
-        assistants = Assistant.objects.filter(is_demo=True).order_by("demo_slug")
+        assistants = assistants.all()
     for a in assistants:
         if not a.memories.exists():
             from assistants.utils.starter_chat import seed_chat_starter_memory
@@ -8,7 +8,7 @@ from assistants.models.assistant import Assistant
 from assistants.models.thoughts import AssistantThoughtLog
 from assistants.helpers.chat_helper import get_or_create_chat_session, save_chat_message
 from assistants.utils.session_utils import (
-    load_session_messages,
+    load_session_context,
     save_message_to_session,
 )
 from assistants.helpers.memory_helpers import create_memory_from_chat
@@ -52,7 +52,7 @@ def chat_with_scene(request, slug):
     system_prompt += f"\n\n{injection}"
 
     messages = [{"role": "system", "content": system_prompt}]
-    messages += load_session_messages(session_id)
+    messages += load_session_context(session_id)
     messages.append({"role": "user", "content": message})
 
     save_message_to_session(session_id, "user", message)
@@ -37,7 +37,7 @@ class AssistantViewSet(viewsets.ViewSet):
     permission_classes = [IsAuthenticated]
 
     def list(self, request):
-        assistants = Assistant.objects.all()
+        assistants = Assistant.objects.select_related("metrics")
         order = request.GET.get("order")
         if order == "msi":
             assistants = assistants.order_by("-mood_stability_index")
@@ -6,10 +6,13 @@ import warnings
 from typing import List
 from urllib.parse import urlparse
 
+from django.conf import settings
+from django.db.models import F
 from langchain_community.document_loaders import PDFPlumberLoader
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 from intel_core.utils.processing import (
+    process_pdf_document,
     process_pdfs,
     process_urls,
     process_videos,
@@ -20,7 +23,8 @@ from intel_core.models import (
     DocumentProgress,
     JobStatus,
 )
-from intel_core.core import clean_text
+from intel_core.core import clean_text, lemmatize_text
+from intel_core.core.text_processing import nlp
 from intel_core.helpers.document_helpers import fetch_url, extract_visible_text
 from prompts.utils.token_helpers import count_tokens
 from intel_core.helpers.youtube_video_helper import process_youtube_video
@@ -28,6 +32,10 @@ from intel_core.helpers.youtube_video_helper import process_youtube_video
 logger = get_logger("document_service")
 warnings.filterwarnings("ignore", category=Warning)
 
+# Ingest each PDF as one Document chunked natively instead of one per split
+PDF_SINGLE_DOCUMENT = getattr(settings, "PDF_SINGLE_DOCUMENT", True)
+PDF_PAGES_PER_TASK = getattr(settings, "PDF_PAGES_PER_TASK", 8)
+
 
 def _update_job(job_id: str | None, *, current: int, total: int, message: str):
     """Helper to update JobStatus progress if job_id provided."""
@@ -45,17 +53,136 @@ def _update_job(job_id: str | None, *, current: int, total: int, message: str):
         pass
 
 
+def extract_page_range(file_path: str, start: int, stop: int) -> List[str]:
+    """Return cleaned, lemmatized text of pages ``start:stop`` of a PDF."""
+    import pdfplumber
+
+    pages = []
+    with pdfplumber.open(file_path) as pdf:
+        for page in pdf.pages[start:stop]:
+            cleaned = clean_text(page.extract_text() or "")
+            pages.append(f"{lemmatize_text(cleaned, nlp)}\n\n" if cleaned else "")
+    return pages
+
+
+def _page_count(file_path: str) -> int:
+    import pdfplumber
+
+    with pdfplumber.open(file_path) as pdf:
+        return len(pdf.pages)
+
+
+def pdf_page_ranges(file_path: str) -> List[tuple[int, int]]:
+    """Split the pages of ``file_path`` into ``PDF_PAGES_PER_TASK`` ranges."""
+    total = _page_count(file_path)
+    return [
+        (start, min(start + PDF_PAGES_PER_TASK, total))
+        for start in range(0, total, PDF_PAGES_PER_TASK)
+    ]
+
+
+def record_pages_extracted(job_id: str | None, count: int) -> None:
+    """Advance ``job_id`` by ``count`` pages extracted by a parallel task."""
+    if not job_id:
+        return
+    JobStatus.objects.filter(job_id=job_id, total_chunks__gt=0).update(
+        current_chunk=F("current_chunk") + count,
+        progress=(F("current_chunk") + count) * 100 / F("total_chunks"),
+        message="Extracting PDF pages",
+    )
+
+
+def extract_pdf_pages(file_path: str, job_id: str | None = None) -> List[str]:
+    """Extract the page texts of ``file_path`` range by range in this process.
+
+    Celery ingestion fans the ranges out as ``extract_pdf_page_range``
+    tasks instead (see ``intel_core.tasks.ingest_source_task``).
+    """
+    pages: List[str] = []
+    ranges = pdf_page_ranges(file_path)
+    total = ranges[-1][1] if ranges else 0
+    for start, stop in ranges:
+        pages.extend(extract_page_range(file_path, start, stop))
+        _update_job(
+            job_id,
+            current=stop,
+            total=total,
+            message=f"Extracted {stop}/{total} pages",
+        )
+    return pages
+
+
+def build_pdf_document(
+    pages: List[str],
+    file_path: str,
+    user_provided_title: str | None = None,
+    project_name: str = "General",
+    session_id: str | None = None,
+    job_id: str | None = None,
+) -> Document | None:
+    """Create the Document for ``file_path`` from its extracted ``pages``."""
+    file_name = os.path.basename(file_path)
+    pdf_title = user_provided_title or os.path.splitext(file_name)[0]
+    if not any(pages):
+        logger.warning(f"No content extracted from PDF: {file_path}")
+        return None
+    logger.info(f"Extracted {len(pages)} pages from PDF")
+    document = process_pdf_document(
+        pages, pdf_title, project_name, session_id, file_path
+    )
+    _update_job(
+        job_id,
+        current=len(pages),
+        total=len(pages),
+        message="PDF processing complete" if document else "PDF processing failed",
+    )
+    return document
+
+
+def ingest_pdf_document(
+    file_path: str,
+    user_provided_title: str | None = None,
+    project_name: str = "General",
+    session_id: str | None = None,
+    job_id: str | None = None,
+) -> Document | None:
+    """Ingest ``file_path`` as one Document whose pages are chunked once."""
+    logger.info(f"Processing PDF: {user_provided_title or file_path}")
+    pages = extract_pdf_pages(file_path, job_id)
+    return build_pdf_document(
+        pages, file_path, user_provided_title, project_name, session_id, job_id
+    )
+
+
 def ingest_pdfs(
     file_paths: List[str],
     user_provided_title: str | None = None,
     project_name: str = "General",
     session_id: str | None = None,
     job_id: str | None = None,
+    single_document: bool | None = None,
 ):
     logger.info(f"Loading {len(file_paths)} PDFs for project '{project_name}'")
     if session_id:
         logger.info(f"Using session_id: {session_id}")
 
+    if single_document is None:
+        single_document = PDF_SINGLE_DOCUMENT
+    if single_document:
+        documents = []
+        for file_path in file_paths:
+            try:
+                document = ingest_pdf_document(
+                    file_path, user_provided_title, project_name, session_id, job_id
+                )
+            except Exception as e:
+                logger.error(f"Failed to process PDF {file_path}: {e}")
+                continue
+            if document:
+                documents.append(document)
+        logger.info(f"Completed processing {len(documents)} PDFs")
+        return documents
+
     processed_documents = []
     for file_path in file_paths:
         try:
@@ -841,3 +841,13 @@ def embedding_drift_log(request):
         )
     )
     return Response({"logs": logs})
+
+
+@api_view(["GET"])
+@never_cache
+@permission_classes([IsAuthenticated])
+def artifact_cache_stats(request):
+    """Return hit/miss counters and disk usage of the generated media cache."""
+    from utils.artifact_cache import stats
+
+    return Response(stats())
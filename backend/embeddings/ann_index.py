@@ -0,0 +1,485 @@
+"""
+Process-local Vector Index
+==========================
+
+In-process nearest-neighbour index over chunk and memory embeddings so hot
+retrieval paths can skip Postgres and Python brute force loops.
+
+Vectors are partitioned by scope (``document:<id>``, ``context:<id>``,
+``assistant:<id>``) and each partition is a unit-normalised float32 matrix
+scored with a single matmul. Partitions are persisted as ``.npy`` snapshots
+under ``settings.ANN_INDEX_DIR`` and opened with ``mmap_mode`` so new workers
+start warm without reading every vector into memory. Writers flush on an
+interval and Celery workers after every task; readers pick up newer
+snapshots on their next query.
+
+``hnswlib`` is not part of the dependency set, so partitions are searched
+exactly. Scoping keeps each scan small, and :func:`search` is the single
+place a graph index would be swapped in for very large partitions.
+
+Usage:
+```python
+from embeddings.ann_index import get_index, document_scope
+
+hits = get_index().search(query_vec, k=5, scopes=[document_scope(doc_id)])
+```
+"""
+
+from __future__ import annotations
+
+import atexit
+import fcntl
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from django.conf import settings
+
+logger = logging.getLogger("embeddings")
+
+ANN_INDEX_ENABLED = getattr(settings, "ANN_INDEX_ENABLED", False)
+# Seconds between snapshot writes for a dirty partition
+FLUSH_INTERVAL = getattr(settings, "ANN_INDEX_FLUSH_INTERVAL", 5.0)
+# Seconds between checks for snapshots written by other processes
+RELOAD_INTERVAL = getattr(settings, "ANN_INDEX_RELOAD_INTERVAL", 1.0)
+
+
+def document_scope(document_id) -> str:
+    return f"document:{document_id}"
+
+
+def context_scope(context_id) -> str:
+    return f"context:{context_id}"
+
+
+def assistant_scope(assistant_id) -> str:
+    return f"assistant:{assistant_id}"
+
+
+def _normalize(vec: Sequence[float]) -> np.ndarray:
+    arr = np.asarray(vec, dtype=np.float32).reshape(-1)
+    norm = np.linalg.norm(arr)
+    return arr / norm if norm > 0 else arr
+
+
+class _Partition:
+    """Vectors for one scope with amortised O(1) append and swap-delete."""
+
+    def __init__(self, dim: int, ids: Optional[List[str]] = None, matrix=None):
+        self.dim = dim
+        self.ids: List[str] = list(ids or [])
+        self.positions: Dict[str, int] = {pid: i for i, pid in enumerate(self.ids)}
+        # ``matrix`` may be a read-only memmap until the first write
+        self.matrix = (
+            matrix if matrix is not None else np.zeros((0, dim), dtype=np.float32)
+        )
+        self.dirty = False
+        # Writes since the last flush, replayed onto newer on-disk snapshots
+        self.pending: Dict[str, Optional[np.ndarray]] = {}
+        self.last_flush = time.monotonic()
+        self.snapshot_mtime = 0.0
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _writable(self, rows: int) -> None:
+        if isinstance(self.matrix, np.memmap) or self.matrix.shape[0] < rows:
+            capacity = max(rows, int(self.matrix.shape[0] * 1.5) + 16)
+            grown = np.zeros((capacity, self.dim), dtype=np.float32)
+            grown[: len(self.ids)] = self.matrix[: len(self.ids)]
+            self.matrix = grown
+
+    def upsert(self, item_id: str, vec: np.ndarray) -> None:
+        pos = self.positions.get(item_id)
+        if pos is None:
+            pos = len(self.ids)
+            self._writable(pos + 1)
+            self.ids.append(item_id)
+            self.positions[item_id] = pos
+        else:
+            self._writable(len(self.ids))
+        self.matrix[pos] = vec
+        self.pending[item_id] = vec
+        self.dirty = True
+
+    def remove(self, item_id: str) -> bool:
+        pos = self.positions.pop(item_id, None)
+        if pos is None:
+            return False
+        self._writable(len(self.ids))
+        last = len(self.ids) - 1
+        if pos != last:
+            moved = self.ids[last]
+            self.ids[pos] = moved
+            self.matrix[pos] = self.matrix[last]
+            self.positions[moved] = pos
+        self.ids.pop()
+        self.pending[item_id] = None
+        self.dirty = True
+        return True
+
+    def replay(self, pending: Dict[str, Optional[np.ndarray]]) -> None:
+        """Apply ``pending`` writes from another copy of this partition."""
+        for item_id, vec in pending.items():
+            if vec is None:
+                self.remove(item_id)
+            else:
+                self.upsert(item_id, vec)
+
+    def search(self, query: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        n = len(self.ids)
+        if n == 0 or k <= 0:
+            return []
+        scores = self.matrix[:n] @ query
+        if k < n:
+            top = np.argpartition(-scores, k)[:k]
+        else:
+            top = np.arange(n)
+        top = top[np.argsort(-scores[top])]
+        return [(self.ids[i], float(scores[i])) for i in top]
+
+
+class VectorIndex:
+    """Scope-partitioned vector index persisted to memory-mapped snapshots."""
+
+    def __init__(self, root: Optional[Path] = None, dim: Optional[int] = None):
+        if dim is None:
+            from embeddings.models import EMBEDDING_LENGTH
+
+            dim = EMBEDDING_LENGTH
+        self.root = Path(root) if root else None
+        self.dim = dim
+        self._partitions: Dict[str, _Partition] = {}
+        self._checked: Dict[str, float] = {}
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def _manifest_path(self, scope: str) -> Optional[Path]:
+        if not self.root:
+            return None
+        safe = scope.replace(":", "__").replace("/", "_")
+        return self.root / f"{safe}.json"
+
+    def _load(self, scope: str) -> Optional[_Partition]:
+        manifest = self._manifest_path(scope)
+        if not manifest or not manifest.exists():
+            return None
+        for _attempt in range(2):
+            try:
+                mtime = manifest.stat().st_mtime
+                meta = json.loads(manifest.read_text())
+                matrix = np.load(self.root / meta["vectors"], mmap_mode="r")
+                break
+            except FileNotFoundError:
+                # A writer replaced the snapshot between reads; try again
+                continue
+            except Exception as exc:
+                logger.warning("[ANN] Failed to load %s: %s", scope, exc)
+                return None
+        else:
+            return None
+        ids = meta.get("ids", [])
+        if matrix.shape[0] != len(ids) or matrix.shape[1] != self.dim:
+            logger.warning("[ANN] Snapshot for %s is inconsistent; ignoring", scope)
+            return None
+        part = _Partition(self.dim, ids, matrix)
+        part.snapshot_mtime = mtime
+        return part
+
+    def _refresh(self, scope: str) -> Optional[_Partition]:
+        """Return the partition, reloading it if another process wrote a newer one."""
+        part = self._partitions.get(scope)
+        now = time.monotonic()
+        if part is not None and (
+            part.dirty or now - self._checked.get(scope, 0.0) < RELOAD_INTERVAL
+        ):
+            return part
+        self._checked[scope] = now
+        manifest = self._manifest_path(scope)
+        if manifest is None:
+            return part
+        try:
+            mtime = manifest.stat().st_mtime
+        except FileNotFoundError:
+            return part
+        if part is None or mtime > part.snapshot_mtime:
+            loaded = self._load(scope)
+            if loaded is not None:
+                self._partitions[scope] = loaded
+                part = loaded
+        return part
+
+    def _write(self, scope: str, part: _Partition) -> _Partition:
+        """Persist ``part`` and return the partition now backing ``scope``.
+
+        Writers hold an exclusive lock on the scope and replay their pending
+        writes onto any newer snapshot so concurrent workers do not clobber
+        each other.
+        """
+        manifest = self._manifest_path(scope)
+        if manifest is None:
+            part.dirty = False
+            part.pending = {}
+            return part
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(manifest.with_suffix(".lock"), "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            old_vectors = None
+            if manifest.exists():
+                try:
+                    old_vectors = json.loads(manifest.read_text()).get("vectors")
+                except Exception:
+                    old_vectors = None
+                if manifest.stat().st_mtime > part.snapshot_mtime:
+                    newer = self._load(scope)
+                    if newer is not None:
+                        newer.replay(part.pending)
+                        part = newer
+            vectors_name = f"{manifest.stem}.{uuid.uuid4().hex[:12]}.npy"
+            np.save(
+                self.root / vectors_name,
+                np.ascontiguousarray(part.matrix[: len(part)]),
+            )
+            tmp = manifest.with_suffix(".json.tmp")
+            tmp.write_text(
+                json.dumps({"scope": scope, "vectors": vectors_name, "ids": part.ids})
+            )
+            os.replace(tmp, manifest)
+            if old_vectors and old_vectors != vectors_name:
+                try:
+                    (self.root / old_vectors).unlink()
+                except FileNotFoundError:
+                    pass
+            part.snapshot_mtime = manifest.stat().st_mtime
+        part.dirty = False
+        part.pending = {}
+        part.last_flush = time.monotonic()
+        return part
+
+    def flush(self, scopes: Optional[Iterable[str]] = None, force: bool = True) -> int:
+        """Write dirty partitions to disk and return how many were written."""
+        written = 0
+        with self._lock:
+            targets = list(scopes) if scopes is not None else list(self._partitions)
+            now = time.monotonic()
+            for scope in targets:
+                part = self._partitions.get(scope)
+                if not part or not part.dirty:
+                    continue
+                if not force and now - part.last_flush < FLUSH_INTERVAL:
+                    continue
+                try:
+                    self._partitions[scope] = self._write(scope, part)
+                    written += 1
+                except Exception as exc:
+                    logger.warning("[ANN] Failed to persist %s: %s", scope, exc)
+        return written
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+    def upsert(self, item_id, vector: Sequence[float], scopes: Iterable[str]) -> None:
+        """Insert or replace ``item_id`` in every scope in ``scopes``."""
+        vec = _normalize(vector)
+        if vec.shape[0] != self.dim:
+            logger.warning(
+                "[ANN] Skipping %s: dimension %s != %s", item_id, vec.shape[0], self.dim
+            )
+            return
+        scopes = list(scopes)
+        with self._lock:
+            for scope in scopes:
+                part = self._refresh(scope)
+                if part is None:
+                    part = self._partitions[scope] = _Partition(self.dim)
+                part.upsert(str(item_id), vec)
+        self.flush(scopes, force=False)
+
+    def remove(self, item_id, scopes: Iterable[str]) -> None:
+        scopes = list(scopes)
+        with self._lock:
+            for scope in scopes:
+                part = self._refresh(scope)
+                if part is not None:
+                    part.remove(str(item_id))
+        self.flush(scopes, force=False)
+
+    def drop(self, scope: str) -> None:
+        """Forget ``scope`` in memory and on disk."""
+        with self._lock:
+            self._partitions.pop(scope, None)
+            manifest = self._manifest_path(scope)
+            if manifest and manifest.exists():
+                try:
+                    vectors = json.loads(manifest.read_text()).get("vectors")
+                    if vectors:
+                        (self.root / vectors).unlink(missing_ok=True)
+                finally:
+                    manifest.unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def has_scope(self, scope: str) -> bool:
+        with self._lock:
+            part = self._refresh(scope)
+            return bool(part is not None and len(part))
+
+    def size(self, scope: str) -> int:
+        with self._lock:
+            part = self._refresh(scope)
+            return len(part) if part is not None else 0
+
+    def search(
+        self,
+        query_vec: Sequence[float],
+        k: int = 5,
+        scopes: Optional[Iterable[str]] = None,
+        min_score: Optional[float] = None,
+    ) -> List[Tuple[str, float]]:
+        """Return up to ``k`` ``(item_id, cosine_similarity)`` pairs.
+
+        Results from several scopes are merged and de-duplicated. When
+        ``scopes`` is ``None`` every partition loaded in this process is
+        searched.
+        """
+        query = _normalize(query_vec)
+        if query.shape[0] != self.dim:
+            return []
+        best: Dict[str, float] = {}
+        with self._lock:
+            targets = list(scopes) if scopes is not None else list(self._partitions)
+            for scope in targets:
+                part = self._refresh(scope)
+                if part is None:
+                    continue
+                for item_id, score in part.search(query, k):
+                    if score > best.get(item_id, -2.0):
+                        best[item_id] = score
+        hits = sorted(best.items(), key=lambda x: x[1], reverse=True)
+        if min_score is not None:
+            hits = [h for h in hits if h[1] >= min_score]
+        return hits[:k]
+
+
+_index: Optional[VectorIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_index() -> VectorIndex:
+    """Return the process-wide :class:`VectorIndex`."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                root = getattr(
+                    settings,
+                    "ANN_INDEX_DIR",
+                    Path(settings.BASE_DIR) / "data" / "ann_index",
+                )
+                _index = VectorIndex(root)
+                atexit.register(_index.flush)
+    return _index
+
+
+def flush_index() -> int:
+    """Persist dirty partitions of this process's index, if it was loaded.
+
+    Celery prefork children leave through ``os._exit`` and skip ``atexit``,
+    so workers call this after every task and on process shutdown.
+    """
+    if _index is None:
+        return 0
+    return _index.flush()
+
+
+def chunk_scopes(chunk) -> List[str]:
+    """Return the index scopes a ``DocumentChunk`` belongs to."""
+    scopes = [document_scope(chunk.document_id)]
+    context_id = getattr(chunk.document, "memory_context_id", None)
+    if context_id:
+        scopes.append(context_scope(context_id))
+    return scopes
+
+
+def memory_scopes(memory) -> List[str]:
+    """Return the index scopes a ``MemoryEntry`` belongs to."""
+    scopes = []
+    if memory.context_id:
+        scopes.append(context_scope(memory.context_id))
+    if memory.assistant_id:
+        scopes.append(assistant_scope(memory.assistant_id))
+    return scopes
+
+
+def index_chunk(chunk, vector: Sequence[float]) -> None:
+    """Add ``chunk`` to the process index when ``ANN_INDEX_ENABLED``."""
+    if not ANN_INDEX_ENABLED:
+        return
+    try:
+        get_index().upsert(chunk.id, vector, chunk_scopes(chunk))
+    except Exception as exc:  # pragma: no cover - best effort
+        logger.warning("[ANN] index_chunk failed for %s: %s", chunk.id, exc)
+
+
+def index_memory(memory, vector: Sequence[float]) -> None:
+    """Add ``memory`` to the process index when ``ANN_INDEX_ENABLED``."""
+    if not ANN_INDEX_ENABLED:
+        return
+    scopes = memory_scopes(memory)
+    if not scopes:
+        return
+    try:
+        get_index().upsert(memory.id, vector, scopes)
+    except Exception as exc:  # pragma: no cover - best effort
+        logger.warning("[ANN] index_memory failed for %s: %s", memory.id, exc)
+
+
+def unindex_chunk(chunk) -> None:
+    """Remove a deleted ``chunk`` from the process index."""
+    if not ANN_INDEX_ENABLED:
+        return
+    try:
+        get_index().remove(chunk.id, chunk_scopes(chunk))
+    except Exception as exc:  # pragma: no cover - best effort
+        logger.warning("[ANN] unindex_chunk failed for %s: %s", chunk.id, exc)
+
+
+def unindex_memory(memory) -> None:
+    """Remove a deleted ``memory`` from the process index."""
+    if not ANN_INDEX_ENABLED:
+        return
+    scopes = memory_scopes(memory)
+    if not scopes:
+        return
+    try:
+        get_index().remove(memory.id, scopes)
+    except Exception as exc:  # pragma: no cover - best effort
+        logger.warning("[ANN] unindex_memory failed for %s: %s", memory.id, exc)
+
+
+def search_scopes(
+    query_vec: Sequence[float],
+    scopes: Sequence[str],
+    k: int = 5,
+    min_score: Optional[float] = None,
+) -> Optional[List[Tuple[str, float]]]:
+    """Search ``scopes`` if the index is enabled and every scope is warm.
+
+    ``None`` tells callers to use their exact database path instead; a
+    single cold scope would otherwise silently drop its items.
+    """
+    if not ANN_INDEX_ENABLED or not scopes:
+        return None
+    index = get_index()
+    if not all(index.has_scope(s) for s in scopes):
+        return None
+    return index.search(query_vec, k=k, scopes=scopes, min_score=min_score)
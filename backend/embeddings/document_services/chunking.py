@@ -7,8 +7,9 @@ Text chunking logic for document embeddings.
 import logging
 import re
 import hashlib
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Tuple, Union
 
+import numpy as np
 from intel_core.core.filters import ALL_STOP_WORDS
 import spacy
 from textstat import textstat
@@ -29,8 +30,12 @@ logger = logging.getLogger(__name__)
 
 __all__ = [
     "generate_chunks",
+    "iter_chunks",
     "generate_chunk_fingerprint",
     "fingerprint_similarity",
+    "simhash_fingerprint",
+    "simhash_bands",
+    "simhash_distance",
     "split_text",
     "fingerprint",
     "summarize_chunks",
@@ -159,56 +164,104 @@ def clean_and_score_chunk(text: str, chunk_index: int | None = None) -> dict:
     }
 
 
+def _window_chunks(window: str, start: int, seen: set) -> Iterator[str]:
+    """Yield the chunks kept from one ``chunk_size`` window of text."""
+    chunk = re.sub(r"\s+", " ", window).strip()
+    tokens = len(chunk.split())
+    if tokens > 150:
+        # further split long spans by paragraph boundaries
+        for p in chunk.split("\n\n"):
+            p = p.strip()
+            if not p:
+                continue
+            for pc in split_text(p, max_tokens=150):
+                c = pc.strip()
+                if c and c not in seen:
+                    seen.add(c)
+                    yield c
+        return
+    if tokens < 5:
+        logger.debug(
+            "[Chunking] Skip very short chunk at %d: '%s'", start, chunk[:40]
+        )
+        return
+    if tokens < 10 and lexical_density(chunk) < 0.4:
+        logger.debug(
+            "[Chunking] Skip low-density short chunk at %d: '%s'",
+            start,
+            chunk[:40],
+        )
+        return
+    if not is_chunk_clean(chunk):
+        logger.debug("[Chunking] Chunk failed cleanliness check at %d", start)
+        return
+    seen.add(chunk)
+    yield chunk
+
+
+def _pieces(segments: Union[str, Iterable[str]], size: int) -> Iterator[str]:
+    """Yield preprocessed text in slices of at most ``size`` characters."""
+    if isinstance(segments, str):
+        segments = [segments]
+    for segment in segments:
+        if not segment:
+            continue
+        segment = _preprocess_text(segment)
+        for i in range(0, len(segment), size):
+            yield segment[i : i + size]
+
+
+def iter_chunks(
+    segments: Union[str, Iterable[str]], chunk_size: int = 1000
+) -> Iterator[str]:
+    """
+    Lazily split text into overlapping chunks.
+
+    ``segments`` is a string or an iterable of text pieces (pages, transcript
+    parts) read one at a time, so only about one window of text is held in
+    memory. Windows span segment boundaries exactly as if the pieces had been
+    joined. Duplicate chunks are dropped with a set lookup.
+    """
+    overlap = int(chunk_size * CHUNK_OVERLAP)
+    if chunk_size <= overlap:
+        return
+    step = chunk_size - overlap
+    seen: set = set()
+    kept = 0
+    buffer = ""
+    offset = 0  # position of ``buffer[0]`` in the joined text
+    exhausted = False
+    pieces = _pieces(segments, chunk_size)
+    while True:
+        while not exhausted and len(buffer) < chunk_size:
+            piece = next(pieces, None)
+            if piece is None:
+                exhausted = True
+            else:
+                buffer += piece
+        if not buffer:
+            return
+        for chunk in _window_chunks(buffer[:chunk_size], offset, seen):
+            yield chunk
+            kept += 1
+        if kept >= MAX_CHUNKS_PER_DOCUMENT:
+            return
+        if exhausted and len(buffer) <= step:
+            return
+        buffer = buffer[step:]
+        offset += step
+
+
 def generate_chunks(text: str, chunk_size: int = 1000) -> List[str]:
     """
     Split text into chunks with overlap.
     """
-    overlap = int(chunk_size * CHUNK_OVERLAP)
-    if not text or chunk_size <= overlap:
+    if not text:
         return []
-
-    text = _preprocess_text(text)
-    chunks: List[str] = []
-    text_length = len(text)
-    step = chunk_size - overlap
-    for start in range(0, text_length, step):
-        end = min(start + chunk_size, text_length)
-        chunk = text[start:end]
-        chunk = re.sub(r"\s+", " ", chunk).strip()
-        tokens = len(chunk.split())
-        if tokens > 150:
-            # further split long spans by paragraph boundaries
-            para_chunks = []
-            for p in chunk.split("\n\n"):
-                p = p.strip()
-                if not p:
-                    continue
-                para_chunks.extend(split_text(p, max_tokens=150))
-            for pc in para_chunks:
-                c = pc.strip()
-                if c and c not in chunks:
-                    chunks.append(c)
-            continue
-        if tokens < 5:
-            logger.debug(
-                "[Chunking] Skip very short chunk at %d: '%s'", start, chunk[:40]
-            )
-            continue
-        if tokens < 10 and lexical_density(chunk) < 0.4:
-            logger.debug(
-                "[Chunking] Skip low-density short chunk at %d: '%s'",
-                start,
-                chunk[:40],
-            )
-            continue
-        if not is_chunk_clean(chunk):
-            logger.debug("[Chunking] Chunk failed cleanliness check at %d", start)
-            continue
-        chunks.append(chunk)
-        if len(chunks) >= MAX_CHUNKS_PER_DOCUMENT:
-            break
+    chunks = list(iter_chunks(text, chunk_size))
 
     # If we ended up with a single chunk for a long document, attempt additional splitting
+    text = _preprocess_text(text)
     token_total = len(text.split())
     if token_total > 800 and len(chunks) <= 1:
         extra = split_text(text, max_tokens=max(token_total // 3, 150))
@@ -217,38 +270,50 @@ def generate_chunks(text: str, chunk_size: int = 1000) -> List[str]:
     return chunks
 
 
-def generate_chunk_fingerprint(text: str) -> str:
-    """
-    Generate a fingerprint for deduplicating similar chunks.
-    """
+_FINGERPRINT_STOPWORDS = {
+    "the",
+    "a",
+    "an",
+    "and",
+    "or",
+    "but",
+    "is",
+    "are",
+    "was",
+    "were",
+    "for",
+    "of",
+    "in",
+    "on",
+    "at",
+    "to",
+    "by",
+    "this",
+    "that",
+    "with",
+}
+
+# SimHash width and the LSH bands it is split into; two fingerprints within
+# SIMHASH_BANDS - 1 bits of each other share at least one band exactly
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 4
+_BAND_BITS = SIMHASH_BITS // SIMHASH_BANDS
+_SHINGLE_SIZE = 3
+
+
+def _fingerprint_words(text: str) -> List[str]:
     processed = text.lower()
     processed = re.sub(r"[^\w\s]", " ", processed)
     processed = re.sub(r"\s+", " ", processed).strip()
-    words = processed.split()
     # Remove common stopwords
-    common = {
-        "the",
-        "a",
-        "an",
-        "and",
-        "or",
-        "but",
-        "is",
-        "are",
-        "was",
-        "were",
-        "for",
-        "of",
-        "in",
-        "on",
-        "at",
-        "to",
-        "by",
-        "this",
-        "that",
-        "with",
-    }
-    filtered = [w for w in words if w not in common]
+    return [w for w in processed.split() if w not in _FINGERPRINT_STOPWORDS]
+
+
+def generate_chunk_fingerprint(text: str) -> str:
+    """
+    Generate a fingerprint for deduplicating identical chunks.
+    """
+    filtered = _fingerprint_words(text)
     sampler = filtered
     if len(filtered) > 150:
         mid = len(filtered) // 2
@@ -261,14 +326,72 @@ def generate_chunk_fingerprint(text: str) -> str:
     return hashlib.md5(fingerprint_bytes).hexdigest()
 
 
-def fingerprint_similarity(fp1: str, fp2: str) -> float:
+def simhash_fingerprint(text: str) -> int | None:
+    """
+    Return a 64-bit SimHash of ``text`` as a signed integer.
+
+    Word 3-shingles are hashed and each bit is set when most shingles set it,
+    so small edits flip few bits. ``None`` when the text has no words.
     """
-    Compute similarity between two hex digest fingerprints.
+    words = _fingerprint_words(text or "")
+    if not words:
+        return None
+    size = min(_SHINGLE_SIZE, len(words))
+    hashes = np.fromiter(
+        (
+            int.from_bytes(
+                hashlib.blake2b(
+                    " ".join(words[i : i + size]).encode("utf-8", errors="ignore"),
+                    digest_size=8,
+                ).digest(),
+                "little",
+            )
+            for i in range(len(words) - size + 1)
+        ),
+        dtype=np.uint64,
+    )
+    bits = np.unpackbits(hashes.view(np.uint8).reshape(-1, 8), axis=1)
+    votes = bits.sum(axis=0) * 2 > len(hashes)
+    value = int.from_bytes(np.packbits(votes).tobytes(), "little")
+    # Stored in a signed BIGINT column
+    return value - (1 << SIMHASH_BITS) if value >= 1 << (SIMHASH_BITS - 1) else value
+
+
+def simhash_bands(simhash: int | None) -> List[int]:
+    """
+    Split ``simhash`` into LSH band keys tagged with their position.
+    """
+    if simhash is None:
+        return []
+    value = simhash & ((1 << SIMHASH_BITS) - 1)
+    mask = (1 << _BAND_BITS) - 1
+    return [
+        (band << _BAND_BITS) | ((value >> (band * _BAND_BITS)) & mask)
+        for band in range(SIMHASH_BANDS)
+    ]
+
+
+def simhash_distance(fp1: int, fp2: int) -> int:
+    """
+    Number of differing bits between two SimHash fingerprints.
+    """
+    return bin((fp1 ^ fp2) & ((1 << SIMHASH_BITS) - 1)).count("1")
+
+
+def fingerprint_similarity(fp1: int | str, fp2: int | str) -> float:
+    """
+    Compute similarity between two SimHash fingerprints.
+
+    Accepts the integers from :func:`simhash_fingerprint` or their hex form
+    and returns the share of equal bits (1.0 for identical shingles).
     """
-    if not fp1 or not fp2:
+    if fp1 is None or fp2 is None or fp1 == "" or fp2 == "":
         return 0.0
-    matches = sum(c1 == c2 for c1, c2 in zip(fp1, fp2))
-    return matches / max(len(fp1), len(fp2))
+    if isinstance(fp1, str):
+        fp1 = int(fp1, 16)
+    if isinstance(fp2, str):
+        fp2 = int(fp2, 16)
+    return 1.0 - simhash_distance(fp1, fp2) / SIMHASH_BITS
 
 
 def split_text(text: str, max_tokens: int = 500) -> List[str]:
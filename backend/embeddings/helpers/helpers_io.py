@@ -14,6 +14,8 @@ Public helper functions:
 - ``retrieve_similar_messages``
 - ``search_similar_embeddings_for_model``
 - ``get_embedding_for_text``
+- ``get_embeddings_for_texts``
+- ``save_chunk_embeddings``
 """
 
 try:
@@ -50,8 +52,14 @@ __all__ = [
     "retrieve_similar_messages",
     "search_similar_embeddings_for_model",
     "get_embedding_for_text",
+    "get_embeddings_for_texts",
+    "save_chunk_embeddings",
 ]
 
+# Limits for one embeddings request (OpenAI allows 2048 inputs / 300k tokens)
+EMBEDDING_BATCH_SIZE = 256
+EMBEDDING_BATCH_MAX_TOKENS = 100_000
+
 # numpy not required in this module
 try:
     import numpy as np
@@ -254,10 +262,165 @@ def search_similar_embeddings_for_model(
         return []
 
 
-def get_embedding_for_text(text: str) -> list[float]:
+def _fetch_embedding(text: str) -> list[float]:
     if client is None:
         logger.error("OpenAI library not available; cannot fetch embedding.")
         return []
 
+    from embeddings.micro_batcher import EMBEDDING_MICROBATCH_ENABLED, embed_text
+
+    if EMBEDDING_MICROBATCH_ENABLED:
+        # Shares one request with other texts embedded concurrently
+        return embed_text(text, model=EMBEDDING_MODEL) or []
     response = client.embeddings.create(model=EMBEDDING_MODEL, input=[text])
     return response.data[0].embedding
+
+
+def get_embedding_for_text(text: str, *, use_cache: bool = True) -> list[float]:
+    """Return the embedding for ``text``.
+
+    Repeated texts are served from :mod:`embeddings.query_cache` (process LRU
+    plus Redis) and concurrent identical requests share one API call.
+    """
+    if not use_cache:
+        return _fetch_embedding(text)
+    from embeddings.query_cache import cached_embedding
+
+    return cached_embedding(text, EMBEDDING_MODEL, _fetch_embedding)
+
+
+def _token_bounded_batches(
+    texts: List[str],
+    token_counts: Optional[List[int]],
+    max_batch_size: int,
+    max_batch_tokens: int,
+) -> List[List[int]]:
+    """Split ``texts`` into index batches bounded by item and token count."""
+    if token_counts is None:
+        from prompts.utils.token_helpers import count_tokens
+
+        token_counts = [count_tokens(t) for t in texts]
+    batches: List[List[int]] = []
+    current: List[int] = []
+    current_tokens = 0
+    for i, tokens in enumerate(token_counts):
+        if current and (
+            len(current) >= max_batch_size
+            or current_tokens + tokens > max_batch_tokens
+        ):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(i)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def get_embeddings_for_texts(
+    texts: List[str],
+    *,
+    model: str = EMBEDDING_MODEL,
+    token_counts: Optional[List[int]] = None,
+    max_batch_size: int = EMBEDDING_BATCH_SIZE,
+    max_batch_tokens: int = EMBEDDING_BATCH_MAX_TOKENS,
+) -> List[List[float]]:
+    """Embed ``texts`` with one API request per token-bounded batch.
+
+    Returns vectors in input order. A failed batch raises so callers can
+    mark the affected rows as failed.
+    """
+    if not texts:
+        return []
+    if client is None:
+        logger.error("OpenAI library not available; cannot fetch embeddings.")
+        return []
+
+    vectors: List[Optional[List[float]]] = [None] * len(texts)
+    for batch in _token_bounded_batches(
+        texts, token_counts, max_batch_size, max_batch_tokens
+    ):
+        response = client.embeddings.create(
+            model=model, input=[texts[i] for i in batch]
+        )
+        # ``index`` refers to the position within this request
+        for item in response.data:
+            vectors[batch[item.index]] = item.embedding
+        logger.info(f"Embedded batch of {len(batch)} texts with {model}")
+    return vectors
+
+
+def save_chunk_embeddings(
+    chunks, vectors: List[List[float]], model: str = EMBEDDING_MODEL
+):
+    """Persist ``vectors`` for ``chunks`` with bulk writes.
+
+    Creates one ``Embedding`` and one ``EmbeddingMetadata`` per chunk in two
+    ``bulk_create`` calls and links them with a single ``bulk_update``. Memory
+    entries linked to the chunks get their embeddings the same way. Returns
+    the chunks that were stored.
+    """
+    from embeddings.models import EMBEDDING_LENGTH
+    from intel_core.models import DocumentChunk, EmbeddingMetadata
+    from memory.models import MemoryEntry
+
+    pairs = [(c, v) for c, v in zip(chunks, vectors) if v]
+    if not pairs:
+        return []
+
+    chunk_ct = ContentType.objects.get_for_model(DocumentChunk)
+    embeddings = [
+        Embedding(
+            content_type=chunk_ct,
+            object_id=str(chunk.id),
+            content_id=f"{chunk_ct.model}:{chunk.id}",
+            content=chunk.text,
+            embedding=vector,
+            session_id=getattr(chunk.document, "session_id", None),
+        )
+        for chunk, vector in pairs
+    ]
+    Embedding.objects.bulk_create(embeddings)
+    metas = [
+        EmbeddingMetadata(
+            id=emb.id,
+            model_used=model,
+            num_tokens=chunk.tokens,
+            vector=vector,
+            vector_half=vector if len(vector) == EMBEDDING_LENGTH else None,
+            status="completed",
+            source=getattr(chunk.document, "source_type", ""),
+            embedding=emb,
+        )
+        for (chunk, vector), emb in zip(pairs, embeddings)
+    ]
+    EmbeddingMetadata.objects.bulk_create(metas)
+
+    stored = []
+    for (chunk, _vector), meta in zip(pairs, metas):
+        chunk.embedding = meta
+        chunk.embedding_status = "embedded"
+        stored.append(chunk)
+    DocumentChunk.objects.bulk_update(stored, ["embedding", "embedding_status"])
+
+    vector_map = {str(chunk.id): vector for chunk, vector in pairs}
+    memories = MemoryEntry.objects.filter(
+        linked_content_type=chunk_ct,
+        linked_object_id__in=list(vector_map),
+        embeddings__isnull=True,
+    )
+    memory_ct = ContentType.objects.get_for_model(MemoryEntry)
+    Embedding.objects.bulk_create(
+        [
+            Embedding(
+                content_type=memory_ct,
+                object_id=str(mem.id),
+                content_id=f"{memory_ct.model}:{mem.id}",
+                content=mem.event,
+                embedding=vector_map[str(mem.linked_object_id)],
+            )
+            for mem in memories
+            if str(mem.linked_object_id) in vector_map
+        ]
+    )
+    return stored
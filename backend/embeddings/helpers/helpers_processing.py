@@ -117,7 +117,13 @@ def generate_embedding(
         if len(tokens) > MAX_TOKENS:
             tokens = tokens[:MAX_TOKENS]
             text = tokenizer.decode(tokens)
+    from embeddings.micro_batcher import EMBEDDING_MICROBATCH_ENABLED, embed_text
+
     try:
+        if EMBEDDING_MICROBATCH_ENABLED:
+            # Shares one request with other texts embedded concurrently
+            embedding = retry_with_backoff(embed_text, text, model=model)
+            return embedding if isinstance(embedding, list) else []
         # Generate embedding via OpenAI v1.x SDK
         response = retry_with_backoff(
             client.embeddings.create,
@@ -0,0 +1,75 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from embeddings.micro_batcher import (
+    LOCAL,
+    OPENAI,
+    MicroBatcher,
+    encode_local,
+    encode_openai,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare embedding throughput of one call per text with the micro-batcher "
+        "as the number of concurrent callers grows. The 'simulated' backend sleeps "
+        "--call-ms per call plus --item-ms per text, running at most "
+        "--parallel-calls at once like a single model or a rate-limited API."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--backend", choices=["simulated", LOCAL, OPENAI], default="simulated"
+        )
+        parser.add_argument("--concurrency", default="1,4,16,64")
+        parser.add_argument("--requests", type=int, default=256)
+        parser.add_argument("--max-batch", type=int, default=64)
+        parser.add_argument("--max-wait-ms", type=float, default=10.0)
+        parser.add_argument("--call-ms", type=float, default=60.0)
+        parser.add_argument("--item-ms", type=float, default=0.5)
+        parser.add_argument("--parallel-calls", type=int, default=1)
+
+    def _encoder(self, options):
+        if options["backend"] == LOCAL:
+            return encode_local
+        if options["backend"] == OPENAI:
+            return encode_openai
+        call, item = options["call_ms"] / 1000, options["item_ms"] / 1000
+        slots = threading.BoundedSemaphore(options["parallel_calls"])
+
+        def simulated(texts):
+            with slots:
+                time.sleep(call + item * len(texts))
+            return [[0.0] for _ in texts]
+
+        return simulated
+
+    def _run(self, embed, texts, workers):
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(embed, texts))
+        return len(texts) / (time.perf_counter() - start)
+
+    def handle(self, *args, **options):
+        encode = self._encoder(options)
+        texts = [f"benchmark request {i}" for i in range(options["requests"])]
+        for workers in (int(c) for c in options["concurrency"].split(",")):
+            direct = self._run(lambda t: encode([t])[0], texts, workers)
+            batcher = MicroBatcher(
+                encode,
+                max_batch_size=options["max_batch"],
+                max_wait=options["max_wait_ms"] / 1000,
+                name="benchmark",
+            )
+            batched = self._run(batcher.embed, texts, workers)
+            stats = batcher.stats()
+            batcher.close()
+            self.stdout.write(
+                f"{workers:>4} callers  direct {direct:8.1f}/s  "
+                f"batched {batched:8.1f}/s  x{batched / direct:5.1f}  "
+                f"mean batch {stats['mean_batch']:5.1f}"
+            )
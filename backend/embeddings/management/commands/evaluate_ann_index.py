@@ -0,0 +1,67 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from pgvector.django import CosineDistance, VectorField
+from django.db.models.functions import Cast
+
+from embeddings.ann_index import document_scope, get_index
+from embeddings.models import EMBEDDING_LENGTH
+from intel_core.models import DocumentChunk
+
+
+class Command(BaseCommand):
+    help = "Compare vector index recall and latency against exact pgvector search"
+
+    def add_arguments(self, parser):
+        parser.add_argument("document", help="Document ID whose chunks are queried")
+        parser.add_argument("--queries", type=int, default=20)
+        parser.add_argument("-k", type=int, default=10)
+
+    def handle(self, *args, **options):
+        doc_id = options["document"]
+        k = options["k"]
+        scope = document_scope(doc_id)
+        index = get_index()
+        if not index.has_scope(scope):
+            raise CommandError(f"No index partition for {scope}; run rebuild_ann_index")
+
+        chunks = DocumentChunk.objects.filter(
+            document_id=doc_id,
+            embedding__isnull=False,
+            embedding__vector__len=EMBEDDING_LENGTH,
+        )
+        sample = list(chunks.select_related("embedding")[: options["queries"] * 5])
+        sample = random.sample(sample, min(options["queries"], len(sample)))
+        if not sample:
+            raise CommandError("Document has no embedded chunks")
+
+        vector_expr = Cast("embedding__vector", VectorField(dimensions=EMBEDDING_LENGTH))
+        recalls, ann_ms, exact_ms = [], [], []
+        for chunk in sample:
+            query = chunk.embedding.vector
+
+            start = time.perf_counter()
+            exact = list(
+                chunks.annotate(distance=CosineDistance(vector_expr, query))
+                .order_by("distance")
+                .values_list("id", flat=True)[:k]
+            )
+            exact_ms.append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            approx = index.search(query, k=k, scopes=[scope])
+            ann_ms.append((time.perf_counter() - start) * 1000)
+
+            truth = {str(cid) for cid in exact}
+            found = {cid for cid, _s in approx}
+            recalls.append(len(truth & found) / len(truth) if truth else 1.0)
+
+        def _avg(values):
+            return sum(values) / len(values)
+
+        self.stdout.write(f"Queries: {len(sample)} | k={k} | partition={index.size(scope)}")
+        self.stdout.write(f"Recall@{k}: {_avg(recalls):.3f}")
+        self.stdout.write(
+            f"Latency ms: index={_avg(ann_ms):.2f} postgres={_avg(exact_ms):.2f}"
+        )
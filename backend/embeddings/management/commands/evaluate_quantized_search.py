@@ -0,0 +1,85 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from embeddings.models import EMBEDDING_LENGTH
+from intel_core.models import DocumentChunk, EmbeddingMetadata
+from intel_core.utils.chunk_retriever import RAG_CANDIDATE_LIMIT, fetch_top_chunks
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare RAG candidate search on half-precision vectors plus exact "
+        "re-scoring with exact search over full-precision vectors"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--document", help="Limit the search to one document")
+        parser.add_argument("--queries", type=int, default=20)
+        parser.add_argument(
+            "-k",
+            type=int,
+            default=RAG_CANDIDATE_LIMIT,
+            help="Candidates per query (default RAG_CANDIDATE_LIMIT, the size "
+            "retrieval asks for; small k hides a truncated shortlist)",
+        )
+        parser.add_argument("--factors", default="1,2,4,8")
+
+    def _storage(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT avg(pg_column_size(vector)), avg(pg_column_size(vector_half)) "
+                f"FROM {EmbeddingMetadata._meta.db_table} "
+                "WHERE vector_half IS NOT NULL"
+            )
+            return cursor.fetchone()
+
+    def handle(self, *args, **options):
+        k = options["k"]
+        doc_ids = [options["document"]] if options["document"] else None
+        chunks = DocumentChunk.objects.filter(
+            embedding__vector_half__isnull=False,
+            embedding__vector__len=EMBEDDING_LENGTH,
+        )
+        if doc_ids:
+            chunks = chunks.filter(document_id__in=doc_ids)
+        sample = list(chunks.select_related("embedding")[: options["queries"] * 5])
+        sample = random.sample(sample, min(options["queries"], len(sample)))
+        if not sample:
+            raise CommandError("No chunks with half-precision vectors; backfill first")
+
+        def _timed(**kwargs):
+            results = {}
+            samples = []
+            for chunk in sample:
+                start = time.perf_counter()
+                found = fetch_top_chunks(
+                    chunk.embedding.vector, doc_ids, limit=k, **kwargs
+                )
+                samples.append((time.perf_counter() - start) * 1000)
+                results[chunk.id] = {c.id for c in found}
+            return results, statistics.median(samples)
+
+        exact, exact_ms = _timed(quantized=False)
+        self.stdout.write(f"Queries: {len(sample)} | k={k}")
+        self.stdout.write(f"exact float        p50 {exact_ms:7.2f} ms")
+        for factor in (int(f) for f in options["factors"].split(",")):
+            approx, approx_ms = _timed(quantized=True, rescore_factor=factor)
+            recall = statistics.mean(
+                len(exact[cid] & approx[cid]) / len(exact[cid]) if exact[cid] else 1.0
+                for cid in exact
+            )
+            returned = statistics.mean(len(found) for found in approx.values())
+            self.stdout.write(
+                f"halfvec x{factor:<2} rescore p50 {approx_ms:7.2f} ms  "
+                f"recall@{k} {recall:.3f}  returned {returned:.0f}/{k}"
+            )
+        full, half = self._storage()
+        if full and half:
+            self.stdout.write(
+                f"Bytes per vector: float array {full:.0f}, halfvec {half:.0f} "
+                f"({full / half:.1f}x smaller)"
+            )
@@ -0,0 +1,56 @@
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+
+from embeddings.ann_index import chunk_scopes, get_index, memory_scopes
+from embeddings.models import Embedding
+from intel_core.models import DocumentChunk
+from memory.models import MemoryEntry
+
+
+class Command(BaseCommand):
+    help = "Rebuild the process-local vector index snapshots from the database"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--document", help="Only rebuild this document scope")
+        parser.add_argument("--skip-memories", action="store_true")
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        index = get_index()
+        batch = options["batch_size"]
+
+        chunks = DocumentChunk.objects.filter(
+            embedding__isnull=False, embedding_status="embedded"
+        ).select_related("embedding", "document")
+        if options["document"]:
+            chunks = chunks.filter(document_id=options["document"])
+        chunk_count = 0
+        for chunk in chunks.iterator(chunk_size=batch):
+            if not chunk.embedding.vector:
+                continue
+            index.upsert(chunk.id, chunk.embedding.vector, chunk_scopes(chunk))
+            chunk_count += 1
+        self.stdout.write(f"Indexed {chunk_count} chunks")
+
+        if not options["skip_memories"] and not options["document"]:
+            ct = ContentType.objects.get_for_model(MemoryEntry)
+            memory_count = 0
+            embeddings = Embedding.objects.filter(content_type=ct).only(
+                "object_id", "embedding"
+            )
+            for emb in embeddings.iterator(chunk_size=batch):
+                mem = (
+                    MemoryEntry.objects.filter(id=emb.object_id)
+                    .only("id", "context_id", "assistant_id")
+                    .first()
+                )
+                if not mem or emb.embedding is None:
+                    continue
+                scopes = memory_scopes(mem)
+                if scopes:
+                    index.upsert(mem.id, emb.embedding, scopes)
+                    memory_count += 1
+            self.stdout.write(f"Indexed {memory_count} memories")
+
+        written = index.flush()
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} index partitions"))
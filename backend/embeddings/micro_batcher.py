@@ -0,0 +1,215 @@
+"""Coalesce concurrent embedding requests into batched model calls.
+
+Chat threads and Celery tasks usually need one vector at a time, and each
+request pays a full round trip to the embeddings API or a forward pass of
+the local model. :class:`MicroBatcher` collects requests that arrive within
+a short window, until ``max_batch_size`` are waiting or the oldest has
+waited ``max_wait`` seconds, and serves them all with one call. Callers get
+a :class:`concurrent.futures.Future`.
+
+While a batch is being encoded new requests queue up and form the next
+batch, so throughput grows with concurrency even when ``max_wait`` is 0.
+That is the default: a lone request never waits for company, and a
+positive ``max_wait`` only pays off when callers arrive in bursts.
+Batching is per process: prefork Celery children each run their own
+batcher, threaded and gevent workers share one.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+
+logger = logging.getLogger("embeddings")
+
+EMBEDDING_MICROBATCH_ENABLED = getattr(settings, "EMBEDDING_MICROBATCH_ENABLED", True)
+EMBEDDING_MICROBATCH_MAX_SIZE = getattr(settings, "EMBEDDING_MICROBATCH_MAX_SIZE", 64)
+EMBEDDING_MICROBATCH_MAX_WAIT = getattr(settings, "EMBEDDING_MICROBATCH_MAX_WAIT", 0.0)
+# Longest a caller blocks on its future before giving up
+EMBEDDING_MICROBATCH_TIMEOUT = 60.0
+
+OPENAI = "openai"
+LOCAL = "local"
+
+_STOP = object()
+
+
+class MicroBatcher:
+    """Queue single texts and encode them in batches on a worker thread."""
+
+    def __init__(
+        self,
+        encode_batch: Callable[[List[str]], Sequence],
+        *,
+        max_batch_size: int = EMBEDDING_MICROBATCH_MAX_SIZE,
+        max_wait: float = EMBEDDING_MICROBATCH_MAX_WAIT,
+        name: str = "embeddings",
+    ) -> None:
+        self._encode = encode_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait)
+        self.name = name
+        self._lock = threading.Lock()
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._pid = os.getpid()
+        self._stats = {"requests": 0, "batches": 0, "largest_batch": 0, "errors": 0}
+
+    # -- worker -----------------------------------------------------------
+    def _ensure_worker(self) -> None:
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked child: the parent's thread and queued items are gone
+                self._queue = queue.SimpleQueue()
+                self._thread = None
+                self._pid = os.getpid()
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f"microbatch-{self.name}", daemon=True
+                )
+                self._thread.start()
+
+    def _collect(self, first) -> List[Tuple[str, Future]]:
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = (
+                    self._queue.get(timeout=remaining)
+                    if remaining > 0
+                    else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self._queue.put(_STOP)
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+            self._process(self._collect(first))
+
+    def _process(self, batch: List[Tuple[str, Future]]) -> None:
+        batch = [(t, fut) for t, fut in batch if fut.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        # Identical texts in one window are encoded once
+        unique: Dict[str, int] = {}
+        for text, _fut in batch:
+            unique.setdefault(text, len(unique))
+        texts = list(unique)
+        try:
+            vectors = list(self._encode(texts) or [])
+        except BaseException as exc:
+            with self._lock:
+                self._stats["errors"] += 1
+            logger.warning(
+                "[MicroBatch] %s batch of %d failed: %s", self.name, len(texts), exc
+            )
+            for _text, fut in batch:
+                fut.set_exception(exc)
+            return
+        with self._lock:
+            self._stats["batches"] += 1
+            self._stats["largest_batch"] = max(self._stats["largest_batch"], len(texts))
+        for text, fut in batch:
+            i = unique[text]
+            fut.set_result(vectors[i] if i < len(vectors) else None)
+
+    # -- public API -------------------------------------------------------
+    def submit(self, text: str) -> Future:
+        """Queue ``text`` and return a future resolving to its vector."""
+        self._ensure_worker()
+        fut: Future = Future()
+        with self._lock:
+            self._stats["requests"] += 1
+        self._queue.put((text, fut))
+        return fut
+
+    def submit_many(self, texts: Sequence[str]) -> List[Future]:
+        return [self.submit(text) for text in texts]
+
+    def embed(self, text: str, timeout: float = EMBEDDING_MICROBATCH_TIMEOUT):
+        """Return the vector for ``text``, blocking until its batch ran."""
+        return self.submit(text).result(timeout=timeout)
+
+    def close(self) -> None:
+        """Stop the worker after the queued requests were served."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join(timeout=2.0)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = dict(self._stats)
+        served = stats["batches"] + stats["errors"]
+        stats["mean_batch"] = stats["requests"] / served if served else 0.0
+        return stats
+
+
+def encode_openai(texts: List[str], model: Optional[str] = None) -> List[List[float]]:
+    from embeddings.helpers.helpers_io import EMBEDDING_MODEL, get_embeddings_for_texts
+
+    return get_embeddings_for_texts(texts, model=model or EMBEDDING_MODEL)
+
+
+def encode_local(texts: List[str]) -> List[List[float]]:
+    from embeddings.sentence_transformer_service import get_sentence_transformer
+
+    vectors = get_sentence_transformer().encode(list(texts))
+    if vectors is None:
+        raise RuntimeError("SentenceTransformer model unavailable")
+    return [list(map(float, vec)) for vec in vectors]
+
+
+_batchers: Dict[Tuple[str, Optional[str]], MicroBatcher] = {}
+_registry_lock = threading.Lock()
+
+
+def get_batcher(backend: str = OPENAI, model: Optional[str] = None) -> MicroBatcher:
+    """Return this process's batcher for ``backend`` (and OpenAI ``model``)."""
+    key = (backend, model if backend == OPENAI else None)
+    batcher = _batchers.get(key)
+    if batcher is not None:
+        return batcher
+    with _registry_lock:
+        batcher = _batchers.get(key)
+        if batcher is None:
+            if backend == OPENAI:
+                encode = lambda texts: encode_openai(texts, model)  # noqa: E731
+            elif backend == LOCAL:
+                encode = encode_local
+            else:
+                raise ValueError(f"Unknown embedding backend: {backend}")
+            batcher = _batchers[key] = MicroBatcher(
+                encode, name=f"{backend}:{model}" if model else backend
+            )
+        return batcher
+
+
+def embed_text(
+    text: str,
+    *,
+    backend: str = OPENAI,
+    model: Optional[str] = None,
+    timeout: float = EMBEDDING_MICROBATCH_TIMEOUT,
+):
+    """Embed ``text`` together with whatever else this process is embedding."""
+    return get_batcher(backend, model).embed(text, timeout=timeout)
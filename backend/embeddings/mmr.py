@@ -0,0 +1,88 @@
+"""Maximum Marginal Relevance selection over in-memory vectors.
+
+The candidate vectors are normalised once and the full pairwise cosine
+matrix is computed with a single matmul. Selection keeps a running
+"max similarity to anything selected" vector, so each step is one
+``np.maximum`` over ``N`` entries instead of a query per pair.
+
+Used by :func:`embeddings.vector_utils.apply_maximum_marginal_relevance` and
+as the optional diversity stage in ``assistants.utils.chunk_retriever``.
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, Sequence, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
+
+def pairwise_similarity(vectors: Sequence[Sequence[float]]) -> np.ndarray:
+    """Return the ``(N, N)`` cosine similarity matrix of ``vectors``.
+
+    Zero vectors (e.g. candidates whose embedding could not be loaded) have
+    zero similarity to everything, so they carry no diversity penalty.
+    """
+    mat = np.asarray(vectors, dtype=np.float32)
+    if mat.ndim != 2 or not len(mat):
+        return np.zeros((len(mat), len(mat)), dtype=np.float32)
+    norms = np.linalg.norm(mat, axis=1, keepdims=True)
+    mat = np.divide(mat, norms, out=np.zeros_like(mat), where=norms > 0)
+    return mat @ mat.T
+
+
+def mmr_select(
+    relevance: Sequence[float],
+    vectors: Sequence[Sequence[float]] | None = None,
+    *,
+    lambda_param: float = 0.7,
+    limit: int = 5,
+    similarity: Optional[np.ndarray] = None,
+    first: Optional[int] = None,
+) -> List[int]:
+    """Return the indices chosen by MMR in selection order.
+
+    ``score = lambda * relevance - (1 - lambda) * max_sim_to_selected``.
+    Pass either ``vectors`` or a precomputed ``similarity`` matrix. ``first``
+    forces the initial pick; by default the most relevant candidate is taken.
+    """
+    rel = np.asarray(relevance, dtype=np.float32)
+    n = len(rel)
+    if n == 0 or limit <= 0:
+        return []
+    if similarity is None:
+        similarity = pairwise_similarity(vectors)
+
+    available = np.ones(n, dtype=bool)
+    max_sim = np.full(n, -np.inf, dtype=np.float32)
+    selected: List[int] = []
+    idx = int(np.argmax(rel)) if first is None else first
+    while True:
+        selected.append(idx)
+        available[idx] = False
+        if len(selected) >= min(limit, n):
+            break
+        np.maximum(max_sim, similarity[idx], out=max_sim)
+        scores = lambda_param * rel - (1 - lambda_param) * max_sim
+        scores[~available] = -np.inf
+        idx = int(np.argmax(scores))
+    return selected
+
+
+def diversify(
+    items: Sequence[T],
+    relevance: Sequence[float],
+    vectors: Sequence[Sequence[float]],
+    *,
+    lambda_param: float = 0.7,
+    limit: int = 5,
+    first: Optional[int] = None,
+) -> List[T]:
+    """Return up to ``limit`` of ``items`` re-ordered by :func:`mmr_select`."""
+    if len(items) <= 1:
+        return list(items)[:limit]
+    order = mmr_select(
+        relevance, vectors, lambda_param=lambda_param, limit=limit, first=first
+    )
+    return [items[i] for i in order]
@@ -1,5 +1,5 @@
 from django.db import models
-from pgvector.django import VectorField
+from pgvector.django import HnswIndex, VectorField
 import uuid
 from embeddings.mixins import EmbeddingMixin
 from django.contrib.contenttypes.fields import GenericForeignKey
@@ -89,6 +89,15 @@ class Embedding(models.Model, EmbeddingMixin):
         app_label = "embeddings"
         indexes = [
             models.Index(fields=["content_type", "object_id"]),
+            # Lets scoped top-K queries (e.g. memory summoning) walk the
+            # nearest vectors instead of scoring every row they own
+            HnswIndex(
+                name="embedding_hnsw_cosine",
+                fields=["embedding"],
+                m=16,
+                ef_construction=64,
+                opclasses=["vector_cosine_ops"],
+            ),
         ]
         db_table = "embeddings_embedding"
         ordering = ["-created_at"]
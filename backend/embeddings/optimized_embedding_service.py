@@ -21,7 +21,6 @@ from typing import Dict, List, Set, Any, Optional, Union, Tuple
 from datetime import datetime, timedelta
 from functools import lru_cache
 import threading
-import queue
 
 import numpy as np
 from django.core.cache import cache
@@ -30,7 +29,7 @@ from django.utils import timezone
 # Import from existing modules
 from embeddings.vector_utils import normalize_vector, preprocess_text, cosine_similarity
 from embeddings.helpers.helpers_io import save_embedding
-from embeddings.sentence_transformer_service import get_sentence_transformer
+from embeddings.micro_batcher import LOCAL, MicroBatcher, encode_local
 
 logger = logging.getLogger("django")
 
@@ -44,68 +43,59 @@ HIGH_QUALITY_MODEL = "high-quality"  # Higher quality model for important conten
 BACKGROUND_PROCESSING = True  # Whether to use background processing
 
 
-class BatchProcessor(threading.Thread):
+class BatchProcessor(MicroBatcher):
     """
-    Background thread for processing embedding batches without blocking.
+    Micro-batcher over the local SentenceTransformer model.
+
+    Concurrent ``submit`` calls within ``EMBEDDING_MICROBATCH_MAX_WAIT`` are
+    encoded in one forward pass; each caller gets a future.
     """
 
-    def __init__(self):
-        super().__init__(daemon=True)
-        self.queue = queue.Queue()
-        self.running = False
-
-    def run(self):
-        """Process items from the queue until stopped."""
-        self.running = True
-        while self.running:
-            try:
-                # Get item from queue with timeout
-                batch_items, callback = self.queue.get(timeout=1.0)
-                if batch_items:
-                    try:
-                        # Process the batch
-                        results = []
-                        sentence_transformer = get_sentence_transformer()
-
-                        # Use singleton for batch encoding when possible
-                        if len(batch_items) > 1:
-                            # Batch encode using the singleton transformer
-                            embeddings = sentence_transformer.encode(batch_items)
-                            results = list(zip(batch_items, embeddings))
-                        else:
-                            # Single item processing
-                            for text in batch_items:
-                                if text:
-                                    embedding = sentence_transformer.encode(text)
-                                    results.append((text, embedding))
-
-                        # Call the callback with results
-                        if callback:
-                            callback(results)
-                    except Exception as e:
-                        logger.error(f"Error processing batch: {e}")
-                    finally:
-                        self.queue.task_done()
-            except queue.Empty:
-                # No items in queue, just continue
-                continue
-            except Exception as e:
-                logger.error(f"Error in batch processor: {e}")
+    def __init__(self, **kwargs):
+        kwargs.setdefault("name", LOCAL)
+        super().__init__(encode_local, **kwargs)
+
+    def start(self):
+        """Start the worker thread (it also starts on first submit)."""
+        self._ensure_worker()
 
     def add_batch(self, batch_items, callback=None):
         """
-        Add a batch of items to the processing queue.
+        Queue items and call ``callback`` with ``(text, embedding)`` pairs.
 
         Args:
             batch_items (List): Items to process
             callback (function): Function to call with results
         """
-        self.queue.put((batch_items, callback))
+        items = [text for text in batch_items if text]
+        if not items:
+            return
+        futures = self.submit_many(items)
+        pending = [len(futures)]
+        lock = threading.Lock()
+
+        def _done(_fut):
+            with lock:
+                pending[0] -= 1
+                if pending[0]:
+                    return
+            results = [
+                (text, fut.result())
+                for text, fut in zip(items, futures)
+                if fut.exception() is None and fut.result() is not None
+            ]
+            if callback:
+                try:
+                    callback(results)
+                except Exception as e:
+                    logger.error(f"Error processing batch: {e}")
+
+        for fut in futures:
+            fut.add_done_callback(_done)
 
     def stop(self):
         """Stop the processor thread."""
-        self.running = False
-        self.join(timeout=2.0)
+        self.close()
 
 
 class OptimizedEmbeddingService:
@@ -220,9 +210,11 @@ class OptimizedEmbeddingService:
             self.api_calls += 1
             start_time = time.time()
 
-            # Generate embedding using the singleton transformer
-            sentence_transformer = get_sentence_transformer()
-            embedding = sentence_transformer.encode(preprocessed_text)
+            # Coalesced with concurrent callers into one forward pass
+            if self.batch_processor:
+                embedding = self.batch_processor.embed(preprocessed_text)
+            else:
+                embedding = encode_local([preprocessed_text])[0]
 
             elapsed_ms = int((time.time() - start_time) * 1000)
             logger.debug(f"Generated embedding in {elapsed_ms}ms: {text[:30]}...")
@@ -330,8 +322,8 @@ class OptimizedEmbeddingService:
 
             try:
                 # Generate embeddings in batch
-                for text, model in zip(batch, models):
-                    embedding = self.get_embedding(text, model=model)
+                embeddings = encode_local(batch)
+                for text, model, embedding in zip(batch, models, embeddings):
                     if embedding:
                         cache_key = self._get_cache_key(text, model)
                         cache.set(cache_key, embedding, EMBEDDING_CACHE_TTL)
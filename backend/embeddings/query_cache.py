@@ -0,0 +1,233 @@
+"""Two-tier cache for single-text embeddings.
+
+A chat turn embeds the same user text several times (memory summoning, RAG
+retrieval, anchor matching). :class:`EmbeddingCache` keeps recent vectors in
+a process-local LRU and shares them across workers through the Django cache
+(Redis). Remote values are stored as raw little-endian float16 bytes, about
+3 KB for a 1536-dim vector, instead of a pickled list; the local tier holds
+the same float16-rounded values. Concurrent misses for the same key are
+collapsed so only one embedding request is made.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger("embeddings")
+
+QUERY_EMBEDDING_CACHE_ENABLED = getattr(
+    settings, "QUERY_EMBEDDING_CACHE_ENABLED", True
+)
+QUERY_EMBEDDING_CACHE_SIZE = getattr(settings, "QUERY_EMBEDDING_CACHE_SIZE", 2048)
+QUERY_EMBEDDING_CACHE_TTL = getattr(
+    settings, "QUERY_EMBEDDING_CACHE_TTL", 60 * 60 * 24
+)
+# Longest a caller waits for an identical in-flight request before fetching
+SINGLE_FLIGHT_TIMEOUT = 30.0
+
+_WS_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Return ``text`` with Unicode compatibility forms and whitespace folded.
+
+    Case is preserved since it can change the embedding.
+    """
+    return _WS_RE.sub(" ", unicodedata.normalize("NFKC", text or "")).strip()
+
+
+def cache_key(text: str, model: str) -> str:
+    digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+    return f"qemb:{model}:{digest}"
+
+
+def encode_vector(vector) -> bytes:
+    """Pack ``vector`` as little-endian float16 bytes."""
+    return np.asarray(vector, dtype="<f2").tobytes()
+
+
+def decode_vector(blob: bytes) -> np.ndarray:
+    return np.frombuffer(blob, dtype="<f2").astype(np.float32)
+
+
+class _Flight:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Optional[np.ndarray] = None
+        self.error: Optional[BaseException] = None
+
+
+class EmbeddingCache:
+    """Process-local LRU in front of the shared Django cache."""
+
+    def __init__(
+        self,
+        max_entries: int = QUERY_EMBEDDING_CACHE_SIZE,
+        ttl: int = QUERY_EMBEDDING_CACHE_TTL,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._local: "OrderedDict[str, tuple[float, np.ndarray]]" = OrderedDict()
+        self._inflight: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "local_hits": 0,
+            "remote_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "errors": 0,
+        }
+
+    # -- local tier -------------------------------------------------------
+    def _get_local(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            expires, vec = entry
+            if expires < time.monotonic():
+                del self._local[key]
+                return None
+            self._local.move_to_end(key)
+            self._stats["local_hits"] += 1
+            return vec
+
+    def _set_local(self, key: str, vec: np.ndarray) -> None:
+        with self._lock:
+            self._local[key] = (time.monotonic() + self.ttl, vec)
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_entries:
+                self._local.popitem(last=False)
+
+    # -- remote tier ------------------------------------------------------
+    def _get_remote(self, key: str) -> Optional[np.ndarray]:
+        try:
+            blob = cache.get(key)
+        except Exception as exc:  # pragma: no cover - cache outage
+            logger.debug("Query embedding cache read failed: %s", exc)
+            return None
+        if not blob:
+            return None
+        vec = decode_vector(blob)
+        with self._lock:
+            self._stats["remote_hits"] += 1
+        return vec
+
+    def _set_remote(self, key: str, vec: np.ndarray) -> None:
+        try:
+            cache.set(key, encode_vector(vec), self.ttl)
+        except Exception as exc:  # pragma: no cover - cache outage
+            logger.debug("Query embedding cache write failed: %s", exc)
+
+    # -- public API -------------------------------------------------------
+    def get_or_compute(
+        self, text: str, model: str, compute: Callable[[str], List[float]]
+    ) -> List[float]:
+        """Return the embedding of ``text``, calling ``compute`` at most once.
+
+        Empty results are returned but never cached.
+        """
+        key = cache_key(text, model)
+        vec = self._get_local(key)
+        if vec is not None:
+            return vec.tolist()
+        vec = self._get_remote(key)
+        if vec is not None:
+            self._set_local(key, vec)
+            return vec.tolist()
+
+        with self._lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+                self._stats["misses"] += 1
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            if flight.event.wait(SINGLE_FLIGHT_TIMEOUT):
+                if flight.error is not None:
+                    raise flight.error
+                if flight.result is not None:
+                    return flight.result.tolist()
+            return list(compute(text) or [])
+
+        try:
+            result = compute(text)
+            if result is None or not len(result):
+                return list(result or [])
+            # Keep the float16 precision of the shared tier so every process,
+            # including this one, returns identical values for the key
+            flight.result = decode_vector(encode_vector(result))
+            self._set_local(key, flight.result)
+            self._set_remote(key, flight.result)
+            return flight.result.tolist()
+        except BaseException as exc:
+            flight.error = exc
+            with self._lock:
+                self._stats["errors"] += 1
+            raise
+        finally:
+            flight.event.set()
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def invalidate(self, text: str, model: str) -> None:
+        key = cache_key(text, model)
+        with self._lock:
+            self._local.pop(key, None)
+        try:
+            cache.delete(key)
+        except Exception:  # pragma: no cover - cache outage
+            pass
+
+    def clear_local(self) -> None:
+        with self._lock:
+            self._local.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """Return hit/miss counters and the combined hit rate."""
+        with self._lock:
+            data: Dict[str, float] = dict(self._stats)
+            data["local_size"] = len(self._local)
+        hits = data["local_hits"] + data["remote_hits"] + data["coalesced"]
+        total = hits + data["misses"]
+        data["hit_rate"] = hits / total if total else 0.0
+        return data
+
+
+_cache: Optional[EmbeddingCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Return the process-wide :class:`EmbeddingCache`."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = EmbeddingCache()
+    return _cache
+
+
+def cached_embedding(
+    text: str, model: str, compute: Callable[[str], List[float]]
+) -> List[float]:
+    """Embed ``text`` through the shared cache unless it is disabled."""
+    if not QUERY_EMBEDDING_CACHE_ENABLED or not text:
+        return compute(text)
+    return get_embedding_cache().get_or_compute(text, model, compute)
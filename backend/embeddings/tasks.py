@@ -13,6 +13,7 @@ import traceback
 
 from embeddings.helpers.helpers_processing import generate_embedding
 from embeddings.helpers.helpers_io import save_embedding
+from embeddings.ann_index import index_chunk, index_memory
 from prompts.utils.token_helpers import EMBEDDING_MODEL
 from django.db.models import F
 from intel_core.utils.document_progress import repair_progress
@@ -221,6 +222,7 @@ def embed_and_store(
                 chunk.embedding = meta
                 chunk.embedding_status = "embedded"
                 chunk.save(update_fields=["embedding", "embedding_status"])
+                index_chunk(chunk, embedding)
 
                 doc = chunk.document
                 embedded = doc.chunks.filter(embedding__isnull=False).count()
@@ -261,6 +263,12 @@ def embed_and_store(
                             doc.sync_progress()
                         except Exception as e:  # pragma: no cover - best effort
                             logger.warning(f"repair-progress failed: {e}")
+        if content_type and content_type.replace("_", "").lower() == "memoryentry":
+            from memory.models import MemoryEntry
+
+            memory = MemoryEntry.objects.filter(id=content_id).first()
+            if memory:
+                index_memory(memory, embedding)
         # Trigger post-processing for character embeddings
         if content_type == "CharacterProfile":
             try:
@@ -291,3 +299,172 @@ def embed_and_store(
                 except Exception as e:  # pragma: no cover - best effort
                     logger.warning(f"repair-progress failed: {e}")
         return None
+
+
+# Chunks handed to one ``embed_chunk_batch`` task
+EMBED_TASK_BATCH_SIZE = 128
+
+
+def _sync_document_progress(doc, embedded_now: int) -> None:
+    """Refresh ``doc`` metadata and progress once for a batch of new embeddings."""
+    from django.utils import timezone
+    from intel_core.models import DocumentProgress
+    from prompts.utils.token_helpers import count_tokens
+
+    meta_data = doc.metadata or {}
+    meta_data["embedded_chunks"] = doc.chunks.filter(embedding__isnull=False).count()
+    meta_data.setdefault("chunk_count", doc.chunks.count())
+    if not doc.token_count_int:
+        doc.token_count_int = count_tokens(doc.content)
+        meta_data["token_count"] = doc.token_count_int
+    doc.metadata = meta_data
+    doc.updated_at = timezone.now()
+    doc.save(update_fields=["metadata", "token_count_int", "updated_at"])
+    try:
+        from intel_core.tasks import update_upload_progress
+
+        update_upload_progress.delay(str(doc.id))
+    except Exception as e:  # pragma: no cover - best effort
+        logger.warning(f"update_upload_progress failed: {e}")
+
+    progress_id = meta_data.get("progress_id")
+    if not progress_id:
+        return
+    qs = DocumentProgress.objects.filter(progress_id=progress_id)
+    if not qs.exists():
+        return
+    qs.update(embedded_chunks=F("embedded_chunks") + embedded_now)
+    prog = qs.first()
+    if (
+        prog.status != "failed"
+        and prog.total_chunks > 0
+        and prog.embedded_chunks >= prog.total_chunks
+    ):
+        prog.status = "completed"
+        prog.save(update_fields=["status"])
+    try:
+        repair_progress(document=doc)
+        doc.sync_progress()
+    except Exception as e:  # pragma: no cover - best effort
+        logger.warning(f"repair-progress failed: {e}")
+
+
+def embed_chunks(chunks, model: str = EMBEDDING_MODEL) -> int:
+    """Embed ``chunks`` in token-bounded batches and store them in bulk.
+
+    Applies the same skip rules as :func:`embed_and_store` and returns the
+    number of chunks embedded.
+    """
+    from intel_core.models import DocumentChunk
+    from embeddings.helpers.helpers_io import (
+        get_embeddings_for_texts,
+        save_chunk_embeddings,
+    )
+    from intel_core.utils.chunk_fingerprint import near_duplicate_vectors
+
+    to_embed = []
+    skipped = []
+    for chunk in chunks:
+        if not chunk.text or not should_embed_chunk(chunk):
+            logger.info(
+                "[Chunk Skipped] Chunk %s - score=%.3f", chunk.id, chunk.score
+            )
+            chunk.embedding_status = "skipped"
+            skipped.append(chunk)
+        else:
+            to_embed.append(chunk)
+    if skipped:
+        DocumentChunk.objects.bulk_update(skipped, ["embedding_status"])
+    if not to_embed:
+        return 0
+
+    # Near-duplicates of already embedded chunks reuse the stored vector
+    reused = near_duplicate_vectors(to_embed, model=model)
+    fresh = [c for c in to_embed if c.id not in reused]
+    if reused:
+        logger.info(
+            "[Chunk Reuse] %d near-duplicate chunks reuse stored vectors", len(reused)
+        )
+    try:
+        fresh_vectors = (
+            get_embeddings_for_texts(
+                [c.text for c in fresh],
+                model=model,
+                token_counts=[c.tokens or 0 for c in fresh],
+            )
+            if fresh
+            else []
+        )
+    except Exception as exc:
+        logger.error(f"Batch embedding failed for {len(fresh)} chunks: {exc}")
+        DocumentChunk.objects.filter(id__in=[c.id for c in fresh]).update(
+            embedding_status="failed"
+        )
+        if not reused:
+            return 0
+        to_embed = [c for c in to_embed if c.id in reused]
+        fresh, fresh_vectors = [], []
+    by_id = dict(zip((c.id for c in fresh), fresh_vectors))
+    by_id.update(reused)
+    vectors = [by_id.get(c.id) for c in to_embed]
+
+    valid, valid_vectors, invalid = [], [], []
+    for chunk, vector in zip(to_embed, vectors):
+        if isinstance(vector, list) and len(vector) == EMBEDDING_LENGTH:
+            valid.append(chunk)
+            valid_vectors.append(vector)
+        else:
+            logger.info(
+                "[Chunk Failed] Chunk %s - reason: invalid_vector_size", chunk.id
+            )
+            invalid.append(chunk.id)
+    if invalid:
+        DocumentChunk.objects.filter(id__in=invalid).update(embedding_status="failed")
+
+    stored = save_chunk_embeddings(valid, valid_vectors, model=model)
+    for chunk, vector in zip(valid, valid_vectors):
+        index_chunk(chunk, vector)
+
+    per_doc: dict = {}
+    for chunk in stored:
+        per_doc.setdefault(chunk.document_id, [chunk.document, 0])[1] += 1
+    for doc, count in per_doc.values():
+        _sync_document_progress(doc, count)
+    logger.info(f"Embedded {len(stored)} chunks in bulk ({len(skipped)} skipped)")
+    return len(stored)
+
+
+@shared_task
+def embed_chunk_batch(chunk_ids: list[str], model: str = EMBEDDING_MODEL) -> int:
+    """Embed a batch of ``DocumentChunk`` IDs with one API call per token budget."""
+    from intel_core.models import DocumentChunk
+
+    chunks = list(
+        DocumentChunk.objects.filter(id__in=chunk_ids, embedding__isnull=True)
+        .select_related("document")
+        .order_by("order")
+    )
+    return embed_chunks(chunks, model=model)
+
+
+def queue_chunk_embeddings(chunk_ids, batch_size: int = EMBED_TASK_BATCH_SIZE) -> int:
+    """Enqueue ``embed_chunk_batch`` tasks for ``chunk_ids`` and return the count.
+
+    With ``FORCE_EMBED_SYNC`` (Celery disabled) the batches run inline.
+    """
+    from django.conf import settings
+
+    ids = [str(cid) for cid in chunk_ids]
+    queued = 0
+    for start in range(0, len(ids), batch_size):
+        batch = ids[start : start + batch_size]
+        if getattr(settings, "FORCE_EMBED_SYNC", False):
+            embed_chunk_batch(batch)
+            queued += 1
+            continue
+        try:
+            embed_chunk_batch.delay(batch)
+            queued += 1
+        except Exception as e:
+            logger.warning(f"Failed to queue embedding batch of {len(batch)}: {e}")
+    return queued
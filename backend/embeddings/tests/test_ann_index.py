@@ -0,0 +1,88 @@
+import numpy as np
+
+from embeddings.ann_index import VectorIndex, document_scope
+
+
+def _vectors(n, dim=16, seed=0):
+    return np.random.default_rng(seed).standard_normal((n, dim))
+
+
+def test_search_respects_scope_and_ranks_by_cosine(tmp_path):
+    index = VectorIndex(tmp_path, dim=16)
+    vecs = _vectors(20)
+    for i, vec in enumerate(vecs):
+        index.upsert(i, vec, [document_scope(1 if i < 10 else 2)])
+
+    hits = index.search(vecs[3], k=3, scopes=[document_scope(1)])
+    assert hits[0][0] == "3"
+    assert all(int(item_id) < 10 for item_id, _score in hits)
+
+
+def test_snapshot_is_memory_mapped_and_merges_writers(tmp_path):
+    vecs = _vectors(5)
+    writer_a = VectorIndex(tmp_path, dim=16)
+    writer_a.upsert("a", vecs[0], [document_scope(1)])
+    writer_a.flush()
+
+    writer_b = VectorIndex(tmp_path, dim=16)
+    assert writer_b.size(document_scope(1)) == 1
+    assert isinstance(writer_b._partitions[document_scope(1)].matrix, np.memmap)
+    writer_b.upsert("b", vecs[1], [document_scope(1)])
+    writer_b.flush()
+
+    writer_a.upsert("c", vecs[2], [document_scope(1)])
+    writer_a.flush()
+
+    reader = VectorIndex(tmp_path, dim=16)
+    hits = reader.search(vecs[0], k=5, scopes=[document_scope(1)])
+    ids = {item_id for item_id, _s in hits}
+    assert ids == {"a", "b", "c"}
+
+
+def test_remove_drops_item(tmp_path):
+    index = VectorIndex(tmp_path, dim=16)
+    vecs = _vectors(3)
+    for i, vec in enumerate(vecs):
+        index.upsert(i, vec, [document_scope(1)])
+    index.remove(0, [document_scope(1)])
+    hits = index.search(vecs[0], k=3, scopes=[document_scope(1)])
+    assert "0" not in {item_id for item_id, _s in hits}
+
+
+def test_flush_index_persists_pending_updates(tmp_path, monkeypatch):
+    from embeddings import ann_index
+
+    index = VectorIndex(tmp_path, dim=16)
+    monkeypatch.setattr(ann_index, "_index", index)
+    # An update inside FLUSH_INTERVAL stays in memory until a task ends
+    index.upsert("a", _vectors(1)[0], [document_scope(1)])
+    index.upsert("b", _vectors(2)[1], [document_scope(1)])
+    assert ann_index.flush_index() == 1
+    assert VectorIndex(tmp_path, dim=16).size(document_scope(1)) == 2
+
+
+def test_search_scopes_falls_back_when_any_scope_is_cold(tmp_path, monkeypatch):
+    from embeddings import ann_index
+
+    index = VectorIndex(tmp_path, dim=16)
+    monkeypatch.setattr(ann_index, "_index", index)
+    monkeypatch.setattr(ann_index, "ANN_INDEX_ENABLED", True)
+    vec = _vectors(1)[0]
+    index.upsert("a", vec, [document_scope(1)])
+    assert ann_index.search_scopes(vec, [document_scope(1)])[0][0] == "a"
+    assert ann_index.search_scopes(vec, [document_scope(1), document_scope(2)]) is None
+
+
+def test_unindex_memory_removes_deleted_entry(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    from embeddings import ann_index
+
+    index = VectorIndex(tmp_path, dim=16)
+    monkeypatch.setattr(ann_index, "_index", index)
+    monkeypatch.setattr(ann_index, "ANN_INDEX_ENABLED", True)
+    memory = SimpleNamespace(id="m1", context_id=None, assistant_id=7)
+    vec = _vectors(1)[0]
+    ann_index.index_memory(memory, vec)
+    ann_index.unindex_memory(memory)
+    assert index.search(vec, k=3, scopes=[ann_index.assistant_scope(7)]) == []
@@ -84,3 +84,17 @@ def test_is_chunk_clean_reject_short():
 def test_is_chunk_clean_low_readability(monkeypatch):
     monkeypatch.setattr(ck.textstat, "flesch_reading_ease", lambda t: 0)
     assert ck.is_chunk_clean("This text looks fine but score will be low.") is False
+
+
+def test_simhash_tolerates_small_edits():
+    words = [f"term{i}" for i in range(200)]
+    base = ck.simhash_fingerprint(" ".join(words))
+    words[100] = "edited"
+    edited = ck.simhash_fingerprint(" ".join(words))
+    other = ck.simhash_fingerprint(" ".join(f"other{i}" for i in range(200)))
+
+    assert ck.simhash_distance(base, edited) <= 3
+    assert ck.simhash_distance(base, other) > 10
+    assert set(ck.simhash_bands(base)) & set(ck.simhash_bands(edited))
+    assert ck.fingerprint_similarity(base, base) == 1.0
+    assert ck.simhash_fingerprint("") is None
@@ -8,6 +8,7 @@ from embeddings.helpers.helpers_io import (
     save_embedding,
     retrieve_embeddings,
     queue_for_processing,
+    get_embeddings_for_texts,
 )
 
 
@@ -85,3 +86,21 @@ class HelpersIOTest(SimpleTestCase):
             self.assertIn("content_type=doc", msg)
             self.assertIn("content_id=123", msg)
             self.assertIn("text_length=", msg)
+
+    def test_get_embeddings_for_texts_batches_by_tokens(self):
+        # Three texts with a 10-token budget split into two requests
+        def fake_create(model, input):
+            data = [
+                MagicMock(index=i, embedding=[float(len(t))])
+                for i, t in reversed(list(enumerate(input)))
+            ]
+            return MagicMock(data=data)
+
+        mock_client = MagicMock()
+        mock_client.embeddings.create.side_effect = fake_create
+        with patch("embeddings.helpers.helpers_io.client", mock_client):
+            vectors = get_embeddings_for_texts(
+                ["a", "bb", "ccc"], token_counts=[4, 4, 4], max_batch_tokens=10
+            )
+        self.assertEqual(mock_client.embeddings.create.call_count, 2)
+        self.assertEqual(vectors, [[1.0], [2.0], [3.0]])
@@ -0,0 +1,83 @@
+import threading
+
+import pytest
+
+pytest.importorskip("django")
+
+from embeddings.micro_batcher import MicroBatcher
+
+
+def _recording_encoder(calls):
+    def encode(texts):
+        calls.append(list(texts))
+        return [[float(len(t))] for t in texts]
+
+    return encode
+
+
+def test_concurrent_requests_share_one_call():
+    calls = []
+    batcher = MicroBatcher(_recording_encoder(calls), max_batch_size=16, max_wait=0.2)
+    barrier = threading.Barrier(8)
+    results = {}
+
+    def worker(i):
+        barrier.wait()
+        results[i] = batcher.embed("x" * (i + 1))
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    batcher.close()
+
+    assert results == {i: [float(i + 1)] for i in range(8)}
+    assert len(calls) < 8
+    assert batcher.stats()["requests"] == 8
+
+
+def test_batches_respect_max_size_and_dedupe():
+    calls = []
+    batcher = MicroBatcher(_recording_encoder(calls), max_batch_size=2, max_wait=0.2)
+    futures = batcher.submit_many(["a", "a", "bb", "ccc"])
+    assert [f.result(timeout=5) for f in futures] == [[1.0], [1.0], [2.0], [3.0]]
+    batcher.close()
+
+    assert all(len(batch) <= 2 for batch in calls)
+    assert sum(len(batch) for batch in calls) == 3
+
+
+def test_encoder_errors_reach_every_caller():
+    def failing(texts):
+        raise RuntimeError("boom")
+
+    batcher = MicroBatcher(failing, max_wait=0.05)
+    futures = batcher.submit_many(["a", "b"])
+    for fut in futures:
+        with pytest.raises(RuntimeError):
+            fut.result(timeout=5)
+    batcher.close()
+
+
+def test_zero_wait_batches_requests_queued_behind_a_call():
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow(texts):
+        calls.append(list(texts))
+        started.set()
+        release.wait(5)
+        return [[float(len(t))] for t in texts]
+
+    batcher = MicroBatcher(slow, max_batch_size=16, max_wait=0)
+    first = batcher.submit("a")
+    assert started.wait(5)
+    queued = batcher.submit_many(["bb", "ccc"])
+    release.set()
+
+    assert first.result(timeout=5) == [1.0]
+    assert [f.result(timeout=5) for f in queued] == [[2.0], [3.0]]
+    batcher.close()
+    assert calls == [["a"], ["bb", "ccc"]]
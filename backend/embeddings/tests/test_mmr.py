@@ -0,0 +1,38 @@
+from unittest.mock import patch
+
+import numpy as np
+
+from embeddings.mmr import mmr_select
+
+
+def test_mmr_skips_near_duplicates():
+    base = np.array([1.0, 0.0, 0.0])
+    vectors = [base, base * 0.99 + [0, 0.01, 0], [0.0, 1.0, 0.0]]
+    relevance = [0.9, 0.89, 0.6]
+
+    assert mmr_select(relevance, vectors, lambda_param=1.0, limit=2) == [0, 1]
+    assert mmr_select(relevance, vectors, lambda_param=0.5, limit=2) == [0, 2]
+
+
+def test_mmr_respects_forced_first_and_limit():
+    vectors = np.eye(4)
+    order = mmr_select([0.1, 0.4, 0.3, 0.2], vectors, limit=10, first=0)
+    assert order[0] == 0
+    assert sorted(order) == [0, 1, 2, 3]
+
+
+def test_apply_mmr_loads_vectors_in_one_query():
+    from embeddings.vector_utils import apply_maximum_marginal_relevance
+
+    results = [
+        {"id": f"id-{i}", "final_score": 1.0 - i * 0.1} for i in range(6)
+    ]
+    rows = [(f"id-{i}", [1.0, float(i % 2)]) for i in range(6)]
+    with patch("embeddings.models.Embedding.objects.filter") as mock_filter:
+        mock_filter.return_value.values_list.return_value = rows
+        picked = apply_maximum_marginal_relevance(
+            results, [1.0, 0.0], lambda_param=0.5, limit=3
+        )
+    mock_filter.assert_called_once()
+    assert [r["id"] for r in picked][:2] == ["id-0", "id-1"]
+    assert len(picked) == 3
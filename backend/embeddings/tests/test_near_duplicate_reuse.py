@@ -0,0 +1,37 @@
+import pytest
+from unittest.mock import patch
+
+pytest.importorskip("django")
+
+from embeddings.models import EMBEDDING_LENGTH
+from embeddings.tasks import embed_chunks
+from intel_core.models import Document, DocumentChunk
+
+TEXT = " ".join(f"term{i}" for i in range(200))
+
+
+def _chunk(doc, text, fp):
+    return DocumentChunk.objects.create(
+        document=doc, order=0, text=text, tokens=200, fingerprint=fp
+    )
+
+
+def test_near_duplicate_chunk_reuses_stored_vector(db):
+    first = _chunk(Document.objects.create(title="A", content="a"), TEXT, "fp1")
+    vector = [0.5] * EMBEDDING_LENGTH
+    with patch(
+        "embeddings.helpers.helpers_io.get_embeddings_for_texts",
+        return_value=[vector],
+    ):
+        assert embed_chunks([first]) == 1
+
+    edited = TEXT.replace("term100", "edited")
+    second = _chunk(Document.objects.create(title="B", content="b"), edited, "fp2")
+    with patch("embeddings.helpers.helpers_io.get_embeddings_for_texts") as mock_embed:
+        assert embed_chunks([second]) == 1
+
+    mock_embed.assert_not_called()
+    second.refresh_from_db()
+    assert second.embedding_status == "embedded"
+    assert second.embedding_id != first.embedding_id
+    assert list(second.embedding.vector) == vector
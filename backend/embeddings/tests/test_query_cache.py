@@ -0,0 +1,84 @@
+import threading
+import time
+
+import numpy as np
+from django.test import SimpleTestCase, override_settings
+
+from embeddings.query_cache import (
+    EmbeddingCache,
+    cache_key,
+    decode_vector,
+    encode_vector,
+)
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "query-embedding-cache-test",
+        }
+    }
+)
+class EmbeddingCacheTest(SimpleTestCase):
+    def test_key_ignores_whitespace_but_not_model(self):
+        self.assertEqual(cache_key(" hello   world\n", "m"), cache_key("hello world", "m"))
+        self.assertNotEqual(cache_key("hello", "a"), cache_key("hello", "b"))
+
+    def test_float16_roundtrip(self):
+        vec = np.random.default_rng(0).standard_normal(1536) * 0.05
+        blob = encode_vector(vec)
+        self.assertEqual(len(blob), 1536 * 2)
+        self.assertTrue(np.allclose(decode_vector(blob), vec, atol=1e-3))
+
+    def test_repeat_and_remote_hits(self):
+        calls = []
+
+        def compute(text):
+            calls.append(text)
+            return [0.5, 0.25]
+
+        first = EmbeddingCache()
+        self.assertEqual(first.get_or_compute("q", "m", compute), [0.5, 0.25])
+        self.assertEqual(first.get_or_compute("q ", "m", compute), [0.5, 0.25])
+        # A second process only shares the Redis tier
+        second = EmbeddingCache()
+        self.assertEqual(second.get_or_compute("q", "m", compute), [0.5, 0.25])
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(first.stats()["local_hits"], 1)
+        self.assertEqual(second.stats()["remote_hits"], 1)
+
+    def test_every_process_sees_the_same_values(self):
+        def compute(text):
+            return [0.1, 0.2, 0.3]
+
+        computed = EmbeddingCache().get_or_compute("precision", "m", compute)
+        shared = EmbeddingCache().get_or_compute("precision", "m", compute)
+        self.assertEqual(computed, shared)
+        self.assertTrue(np.allclose(computed, [0.1, 0.2, 0.3], atol=1e-3))
+
+    def test_concurrent_misses_share_one_call(self):
+        calls = []
+
+        def compute(text):
+            calls.append(text)
+            time.sleep(0.05)
+            return [1.0]
+
+        emb_cache = EmbeddingCache()
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    emb_cache.get_or_compute("same", "m-concurrent", compute)
+                )
+            )
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [[1.0]] * 8)
+        self.assertEqual(emb_cache.stats()["hit_rate"], 7 / 8)
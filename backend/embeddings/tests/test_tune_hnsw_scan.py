@@ -0,0 +1,38 @@
+from contextlib import nullcontext
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("django")
+pytest.importorskip("pgvector")
+
+from django.db import DatabaseError
+
+from embeddings import vector_utils
+
+
+def _run(ef_search, fail=()):
+    cursor = MagicMock()
+    cursor.execute.side_effect = lambda stmt: (
+        (_ for _ in ()).throw(DatabaseError(stmt)) if stmt in fail else None
+    )
+    connection = MagicMock()
+    connection.cursor.return_value.__enter__.return_value = cursor
+    with patch.object(vector_utils, "connection", connection), patch.object(
+        vector_utils.transaction, "atomic", nullcontext
+    ):
+        vector_utils.tune_hnsw_scan(ef_search)
+    return [call.args[0] for call in cursor.execute.call_args_list]
+
+
+def test_ef_search_is_clamped_to_pgvector_limit():
+    assert _run(5000) == [
+        f"SET LOCAL hnsw.ef_search = {vector_utils.HNSW_MAX_EF_SEARCH}",
+        "SET LOCAL hnsw.iterative_scan = relaxed_order",
+    ]
+    assert _run(100)[0] == "SET LOCAL hnsw.ef_search = 100"
+
+
+def test_unsupported_iterative_scan_is_ignored():
+    stmt = "SET LOCAL hnsw.iterative_scan = relaxed_order"
+    assert _run(40, fail={stmt}) == ["SET LOCAL hnsw.ef_search = 40", stmt]
@@ -44,13 +44,16 @@ from nltk.stem import PorterStemmer
 from nltk.tokenize import word_tokenize
 from embeddings.helpers.nltk_data_loader import ensure_nltk_data
 from uuid import UUID
-from django.db import connection
+from django.db import DatabaseError, connection, transaction
 from utils.cache_utils import VectorCache
 from django.conf import settings
 
 # Configure logger
 logger = logging.getLogger("django")
 
+# Upper bound pgvector accepts for hnsw.ef_search
+HNSW_MAX_EF_SEARCH = 1000
+
 # Initialize NLTK resources
 ensure_nltk_data("punkt")
 ensure_nltk_data("stopwords")
@@ -686,6 +689,9 @@ def apply_maximum_marginal_relevance(
     """
     Apply Maximum Marginal Relevance algorithm to rerank results for diversity.
 
+    All candidate vectors are loaded in a single query and compared through
+    one precomputed similarity matrix (see :mod:`embeddings.mmr`).
+
     Args:
         results: List of search results with embeddings
         query_embedding: The original query embedding
@@ -700,65 +706,40 @@ def apply_maximum_marginal_relevance(
         return results
 
     from embeddings.models import Embedding
+    from embeddings.mmr import diversify
+
     if np is None:
         return results[:limit]
 
-    # Initialize lists for selected and remaining results
-    selected = []
-    remaining = results.copy()
-
-    # Add the most relevant document first
-    selected.append(remaining.pop(0))
-
-    # Iteratively add the next best document
-    while len(selected) < limit and remaining:
-        max_score = -1.0
-        max_idx = -1
-
-        for i, doc in enumerate(remaining):
-            # Calculate relevance to query (already computed)
-            relevance = doc["final_score"]
-
-            # Calculate diversity (maximum similarity to any selected document)
-            if not selected:
-                diversity_penalty = 0
-            else:
-                # Get embedding for this document
-                doc_id = doc["id"]
-                embedding_obj = Embedding.objects.get(id=doc_id)
-                doc_embedding = embedding_obj.embedding
-
-                # Calculate similarities to all selected documents
-                similarities = []
-                for sel_doc in selected:
-                    sel_id = sel_doc["id"]
-                    sel_embedding_obj = Embedding.objects.get(id=sel_id)
-                    sel_embedding = sel_embedding_obj.embedding
-
-                    # Calculate cosine similarity
-                    similarity = cosine_similarity(doc_embedding, sel_embedding)
-                    similarities.append(similarity)
-
-                # Use maximum similarity as diversity penalty
-                diversity_penalty = max(similarities) if similarities else 0
-
-            # Calculate MMR score
-            mmr_score = (
-                lambda_param * relevance - (1 - lambda_param) * diversity_penalty
-            )
-
-            # Update if this is the best score so far
-            if mmr_score > max_score:
-                max_score = mmr_score
-                max_idx = i
-
-        # Add the document with the highest MMR score
-        if max_idx >= 0:
-            selected.append(remaining.pop(max_idx))
-        else:
+    ids = [str(doc["id"]) for doc in results]
+    stored = {
+        str(emb_id): vec
+        for emb_id, vec in Embedding.objects.filter(id__in=ids).values_list(
+            "id", "embedding"
+        )
+    }
+    dim = len(query_embedding) if query_embedding is not None else 0
+    for vec in stored.values():
+        if vec is not None:
+            dim = len(vec)
             break
-
-    return selected
+    zero = np.zeros(dim, dtype=np.float32)
+    vectors = [
+        zero if stored.get(doc_id) is None else stored[doc_id] for doc_id in ids
+    ]
+    missing = sum(1 for doc_id in ids if stored.get(doc_id) is None)
+    if missing:
+        logger.debug(f"MMR: {missing} candidates without stored embeddings")
+
+    # The top-ranked result always stays first
+    return diversify(
+        results,
+        [doc.get("final_score", doc.get("similarity", 0.0)) for doc in results],
+        vectors,
+        lambda_param=lambda_param,
+        limit=limit,
+        first=0,
+    )
 
 
 def get_content_metadata(content_type, content_id):
@@ -980,6 +961,28 @@ def create_vector_index(model) -> None:
         logger.error(f"Error creating vector index: {str(e)}")
 
 
+def tune_hnsw_scan(ef_search: int) -> None:
+    """Set ``hnsw.ef_search`` and iterative scans for the current transaction.
+
+    ``ef_search`` (pgvector default 40) bounds how many rows one HNSW scan
+    returns, fewer once filters apply; iterative scans (pgvector >= 0.8) keep
+    searching until enough rows pass them. The value is clamped to what
+    pgvector accepts. Must run inside a transaction (``SET LOCAL``); each
+    statement gets a savepoint so an older pgvector only logs.
+    """
+    ef_search = max(1, min(int(ef_search), HNSW_MAX_EF_SEARCH))
+    with connection.cursor() as cursor:
+        for stmt in (
+            f"SET LOCAL hnsw.ef_search = {ef_search}",
+            "SET LOCAL hnsw.iterative_scan = relaxed_order",
+        ):
+            try:
+                with transaction.atomic():
+                    cursor.execute(stmt)
+            except DatabaseError:
+                logger.debug("pgvector setting unsupported: %s", stmt)
+
+
 def optimize_vector_query(
     query_vector: np.ndarray, table_name: str, limit: int = 10, threshold: float = 0.7
 ) -> str:
@@ -27,6 +27,7 @@ from images.utils.editing import (
 from images.models import PromptHelper
 import re
 from tts.tasks import queue_tts_story
+from utils import artifact_cache
 
 
 load_dotenv()
@@ -107,6 +108,43 @@ def debug_sd_env():
     }
 
 
+SD_GENERATE_PATH = "stable-image/generate/ultra"
+
+
+def sd_cache_params(request, full_prompt, negative_prompt) -> dict:
+    """Generation parameters that identify a Stable Diffusion image."""
+    return {
+        "endpoint": SD_GENERATE_PATH,
+        "prompt": full_prompt,
+        "negative_prompt": negative_prompt,
+        "style": request.style_id,
+        "width": request.width,
+        "height": request.height,
+        "steps": request.steps,
+    }
+
+
+def _cached_sd_result(cached_path, prompt):
+    """Copy a cached image into generated_images as a fresh file.
+
+    Returns ``None`` when the entry was evicted after the lookup.
+    """
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    file_name = (
+        f"sd_image_{sanitize_filename(prompt)}_{timestamp}_"
+        f"{str(uuid.uuid4())[:8]}.webp"
+    )
+    relative_path = os.path.join("generated_images", file_name)
+    try:
+        artifact_cache.copy_to(
+            cached_path, os.path.join(settings.MEDIA_ROOT, relative_path)
+        )
+    except OSError as e:
+        logger.warning(f"♻️ SD cache entry unreadable, generating: {e}")
+        return None
+    return {"status": "succeeded", "file_paths": [relative_path]}
+
+
 @shared_task
 def process_sd_image_request(request_id, chat_message_id=None):
     try:
@@ -145,22 +183,36 @@ def process_sd_image_request(request_id, chat_message_id=None):
         logger.warning(f"📓 User-only: {user_prompt_only}")
         logger.warning(f"❌ Negative Prompt: {negative_prompt}")
 
-        # 🎨 Generate the image
-        sd_result = generate_stable_diffusion_image(
-            prompt=full_prompt,
-            width=request.width,
-            height=request.height,
-            api_url=f"{STABILITY_BASE_URL}stable-image/generate/ultra",
-            api_key=STABILITY_API_KEY,
-            style_data=request.style,
-            negative_prompt=negative_prompt,
-            steps=request.steps,
-        )
+        # ♻️ Reuse an identical earlier generation, else 🎨 generate the image
+        cache_params = sd_cache_params(request, full_prompt, negative_prompt)
+        cached = artifact_cache.lookup("sd_image", cache_params, ".webp")
+        sd_result = _cached_sd_result(cached, full_prompt) if cached else None
+        if sd_result:
+            logger.info(f"♻️ SD cache hit for request {request.id}")
+        else:
+            cached = None
+            sd_result = generate_stable_diffusion_image(
+                prompt=full_prompt,
+                width=request.width,
+                height=request.height,
+                api_url=f"{STABILITY_BASE_URL}{SD_GENERATE_PATH}",
+                api_key=STABILITY_API_KEY,
+                style_data=request.style,
+                negative_prompt=negative_prompt,
+                steps=request.steps,
+            )
 
         if sd_result.get("status") != "succeeded":
             raise ValueError("Stable Diffusion generation failed.")
 
         image_paths = sd_result.get("file_paths") or []
+        if image_paths and not cached:
+            artifact_cache.store_file(
+                "sd_image",
+                cache_params,
+                os.path.join(settings.MEDIA_ROOT, image_paths[0]),
+                ".webp",
+            )
         absolute_urls = generate_absolute_urls(image_paths)
 
         if not image_paths or not absolute_urls:
@@ -17,6 +17,32 @@ from intel_core.helpers.document_retrieval_helpers import (
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Connections per host kept open for URL fetches in this process
+HTTP_POOL_SIZE = 20
+_http_session = None
+# Fetched pages with less visible text than this are rendered with Playwright
+STATIC_TEXT_MIN_CHARS = 500
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
+    " AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+)
+
+
+def get_http_session() -> requests.Session:
+    """Return this process's pooled session for fetching ingestion URLs."""
+    global _http_session
+    if _http_session is None:
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _http_session = session
+    return _http_session
+
 
 async def async_fetch_url(url):
     """
@@ -31,27 +57,19 @@ async def async_fetch_url(url):
         return content
 
 
-def fetch_url(url: str) -> str:
-    """Fetch content from a URL.
+def _needs_render(resp: requests.Response) -> bool:
+    """Return True when a fetched page looks like a JavaScript shell."""
+    if "html" not in resp.headers.get("Content-Type", "text/html"):
+        return False
+    return len(extract_visible_text(resp.text)) < STATIC_TEXT_MIN_CHARS
 
-    The helper first tries Playwright for JavaScript-rendered pages and
-    falls back to ``requests`` if Playwright fails (missing dependency or
-    runtime error).
 
-    Args:
-        url: The URL to fetch.
-
-    Returns:
-        The page HTML as a string or an empty string on failure.
-    """
-    user_agent = (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
-        " AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    )
+def _render_url(url: str) -> str:
+    """Return the HTML of ``url`` rendered by Playwright, or ``""`` on failure."""
     try:
         with sync_playwright() as p:
             browser = p.chromium.launch(headless=True)
-            context = browser.new_context(user_agent=user_agent)
+            context = browser.new_context(user_agent=USER_AGENT)
             page = context.new_page()
             page.goto(url, timeout=60000)
             content = page.content()
@@ -60,18 +78,38 @@ def fetch_url(url: str) -> str:
             return content
     except Exception as e:  # noqa: PERF203
         logger.warning("Playwright failed for %s: %s", url, e)
-        try:
-            import requests
-
-            resp = requests.get(url, headers={"User-Agent": user_agent}, timeout=30)
-            if resp.ok:
-                return resp.text
-            logger.warning("requests fallback failed for %s: %s", url, resp.status_code)
-        except Exception as req_exc:  # noqa: PERF203
-            logger.error("requests fallback error for %s: %s", url, req_exc)
         return ""
 
 
+def fetch_url(url: str) -> str:
+    """Fetch content from a URL.
+
+    The page is fetched through the pooled ``requests`` session first and
+    only rendered with Playwright when that fails or yields too little
+    visible text (JavaScript-rendered pages).
+
+    Args:
+        url: The URL to fetch.
+
+    Returns:
+        The page HTML as a string or an empty string on failure.
+    """
+    html = ""
+    try:
+        resp = get_http_session().get(
+            url, headers={"User-Agent": USER_AGENT}, timeout=30
+        )
+        if resp.ok:
+            html = resp.text
+            if not _needs_render(resp):
+                return html
+        else:
+            logger.warning("requests fetch failed for %s: %s", url, resp.status_code)
+    except Exception as req_exc:  # noqa: PERF203
+        logger.warning("requests fetch error for %s: %s", url, req_exc)
+    return _render_url(url) or html
+
+
 def fetch_webpage_metadata(url):
     with sync_playwright() as p:
         browser = p.chromium.launch()
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from embeddings.document_services.chunking import simhash_bands, simhash_fingerprint
+from intel_core.models import DocumentChunk
+
+
+class Command(BaseCommand):
+    help = "Compute SimHash fingerprints for chunks stored before they existed"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch"]
+        qs = DocumentChunk.all_objects.filter(simhash__isnull=True).only("id", "text")
+        batch = []
+        total = 0
+        for chunk in qs.iterator(chunk_size=batch_size):
+            chunk.simhash = simhash_fingerprint(chunk.text)
+            if chunk.simhash is None:
+                continue
+            chunk.simhash_bands = simhash_bands(chunk.simhash)
+            batch.append(chunk)
+            if len(batch) >= batch_size:
+                DocumentChunk.all_objects.bulk_update(
+                    batch, ["simhash", "simhash_bands"]
+                )
+                total += len(batch)
+                batch = []
+        if batch:
+            DocumentChunk.all_objects.bulk_update(batch, ["simhash", "simhash_bands"])
+            total += len(batch)
+        self.stdout.write(self.style.SUCCESS(f"Fingerprinted {total} chunks"))
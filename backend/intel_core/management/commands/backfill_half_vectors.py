@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from django.db.models.functions import Cast
+from pgvector.django import HalfVectorField, VectorField
+
+from intel_core.models import EMBEDDING_LENGTH, EmbeddingMetadata
+
+
+class Command(BaseCommand):
+    help = "Fill EmbeddingMetadata.vector_half for rows stored before it existed"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        pending = EmbeddingMetadata.all_objects.filter(
+            vector_half__isnull=True, vector__len=EMBEDDING_LENGTH
+        )
+        half = Cast(
+            Cast("vector", VectorField(dimensions=EMBEDDING_LENGTH)),
+            HalfVectorField(dimensions=EMBEDDING_LENGTH),
+        )
+        total = 0
+        while True:
+            ids = list(pending.values_list("id", flat=True)[: options["batch"]])
+            if not ids:
+                break
+            # Converted inside Postgres; vectors never reach Python
+            total += EmbeddingMetadata.all_objects.filter(id__in=ids).update(
+                vector_half=half
+            )
+        self.stdout.write(self.style.SUCCESS(f"Stored {total} half-precision vectors"))
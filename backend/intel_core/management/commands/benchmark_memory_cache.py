@@ -0,0 +1,90 @@
+import random
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+
+from intel_core.utils.cache_service import InMemoryCache
+
+
+class _UnboundedCache:
+    """The previous ``InMemoryCache``: a dict, an expiry dict and one RLock."""
+
+    def __init__(self):
+        self._cache = {}
+        self._expiry = {}
+        self._lock = threading.RLock()
+
+    def get(self, key):
+        with self._lock:
+            if key in self._cache:
+                if key in self._expiry and self._expiry[key] < time.time():
+                    del self._cache[key]
+                    del self._expiry[key]
+                    return None
+                return self._cache[key]
+            return None
+
+    def set(self, key, value, timeout=None):
+        with self._lock:
+            self._cache[key] = value
+            if timeout is not None:
+                self._expiry[key] = time.time() + timeout
+
+    def __len__(self):
+        return len(self._cache)
+
+
+class Command(BaseCommand):
+    help = "Benchmark the bounded InMemoryCache against the old unbounded one"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=8)
+        parser.add_argument("--ops", type=int, default=50000, help="Ops per thread")
+        parser.add_argument("--keys", type=int, default=50000)
+        parser.add_argument("--max-entries", type=int, default=10000)
+        parser.add_argument("--read-ratio", type=float, default=0.8)
+
+    def _run(self, cache, options):
+        keyspace = options["keys"]
+        ops = options["ops"]
+        read_ratio = options["read_ratio"]
+        payload = "x" * 256
+
+        def worker(seed):
+            rng = random.Random(seed)
+            for _ in range(ops):
+                key = f"k:{int(rng.paretovariate(0.5)) % keyspace}"
+                if rng.random() < read_ratio:
+                    cache.get(key)
+                else:
+                    cache.set(key, payload, 60)
+
+        threads = [
+            threading.Thread(target=worker, args=(i,))
+            for i in range(options["threads"])
+        ]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return time.perf_counter() - start
+
+    def handle(self, *args, **options):
+        total = options["threads"] * options["ops"]
+        old = _UnboundedCache()
+        old_secs = self._run(old, options)
+        self.stdout.write(
+            f"unbounded: {total / old_secs:,.0f} ops/s, {len(old)} entries kept"
+        )
+
+        new = InMemoryCache(max_entries=options["max_entries"])
+        new_secs = self._run(new, options)
+        stats = new.stats()
+        hit_rate = stats["hits"] / max(1, stats["hits"] + stats["misses"])
+        self.stdout.write(
+            f"bounded:   {total / new_secs:,.0f} ops/s, {stats['entries']} entries, "
+            f"{stats['bytes'] / 1024:.0f} KiB, hit rate {hit_rate:.1%}, "
+            f"{stats['evictions']} evictions"
+        )
@@ -1,5 +1,7 @@
 from django.db import models
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from pgvector.django import HalfVectorField, HnswIndex
 from django.conf import settings
 import uuid
 from django.utils.text import slugify
@@ -174,6 +176,9 @@ class DocumentChunk(models.Model):
     is_glossary = models.BooleanField(default=False)
     tags = ArrayField(models.CharField(max_length=64), default=list, blank=True)
     fingerprint = models.CharField(max_length=64, unique=True)
+    # SimHash of the text and its LSH band keys for near-duplicate lookups
+    simhash = models.BigIntegerField(null=True, blank=True)
+    simhash_bands = ArrayField(models.IntegerField(), default=list, blank=True)
     score = models.FloatField(default=1.0)
     glossary_score = models.FloatField(default=0.0)
     glossary_boost = models.FloatField(
@@ -226,6 +231,9 @@ class DocumentChunk(models.Model):
     objects = ActiveManager()
     all_objects = models.Manager()
 
+    class Meta:
+        indexes = [GinIndex(fields=["simhash_bands"], name="chunk_simhash_bands_gin")]
+
     @property
     def has_glossary_score(self) -> bool:
         """Return True if this glossary chunk has a positive glossary_score."""
@@ -271,6 +279,9 @@ class EmbeddingMetadata(models.Model):
     model_used = models.CharField(max_length=100)
     num_tokens = models.IntegerField()
     vector = ArrayField(models.FloatField())
+    # Half-precision copy searched through its HNSW index; ``vector`` is only
+    # read in Postgres to re-score the top candidates exactly
+    vector_half = HalfVectorField(dimensions=EMBEDDING_LENGTH, null=True, blank=True)
     status = models.CharField(max_length=20, default="pending")
     source = models.CharField(max_length=128, blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -286,11 +297,26 @@ class EmbeddingMetadata(models.Model):
     )
 
     class Meta:
-        pass
+        indexes = [
+            HnswIndex(
+                name="embedding_meta_half_hnsw",
+                fields=["vector_half"],
+                m=16,
+                ef_construction=64,
+                opclasses=["halfvec_cosine_ops"],
+            )
+        ]
 
     objects = ActiveManager()
     all_objects = models.Manager()
 
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "vector" in update_fields:
+            # fill_half_vector (pre_save) refreshes the half copy from vector
+            kwargs["update_fields"] = {*update_fields, "vector_half"}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.model_used} | {self.id}"
 
@@ -12,58 +12,97 @@ def update_document_search_vector(sender, instance, **kwargs):
     pass
 
 
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.contrib.contenttypes.models import ContentType
 from django.db.models import F
 from memory.models import MemoryEntry
 from mcp_core.models import MemoryContext
 from assistants.models.assistant import Assistant
-from .models import DocumentChunk, EmbeddingMetadata, DocumentProgress
+from .models import (
+    EMBEDDING_LENGTH,
+    DocumentChunk,
+    DocumentProgress,
+    EmbeddingMetadata,
+)
+from embeddings.ann_index import ANN_INDEX_ENABLED, unindex_chunk
 from embeddings.models import Embedding
 from embeddings.helpers.helpers_io import save_embedding
 from prompts.utils.token_helpers import EMBEDDING_MODEL
 import logging
 
 
-@receiver(post_save, sender=DocumentChunk)
-def create_memory_from_chunk(sender, instance, created, **kwargs):
-    if not created:
-        return
+@receiver(pre_save, sender=DocumentChunk)
+def fill_chunk_simhash(sender, instance, update_fields=None, **kwargs):
+    """Fingerprint chunks saved one by one; bulk writers set it themselves."""
+    if instance.simhash is None and instance.text and update_fields is None:
+        from embeddings.document_services.chunking import (
+            simhash_bands,
+            simhash_fingerprint,
+        )
+
+        instance.simhash = simhash_fingerprint(instance.text)
+        instance.simhash_bands = simhash_bands(instance.simhash)
+
+
+def create_memories_for_chunks(document, chunks):
+    """Create the document-chunk memories for newly stored ``chunks``.
 
-    doc = instance.document
+    Bulk chunk writes skip ``post_save``, so ingestion calls this once per
+    batch; the document's context and assistants are resolved once.
+    """
+    if not chunks:
+        return
+    doc = document
     if not doc.memory_context:
         a = doc.linked_assistants.first() or doc.assigned_assistants.first()
         if a and a.memory_context:
             doc.memory_context = a.memory_context
             doc.save(update_fields=["memory_context"])
 
+    chunk_ct = ContentType.objects.get_for_model(DocumentChunk)
     assistants = list(doc.linked_assistants.all())
-    if not assistants:
-        MemoryEntry.objects.create(
-            event=instance.text[:200],
-            summary=instance.text[:200],
-            document=doc,
-            linked_content_type=ContentType.objects.get_for_model(DocumentChunk),
-            linked_object_id=instance.id,
-            type="document_chunk",
-        )
-        return
-
     for assistant in assistants:
         if not assistant.memory_context:
             assistant.save()
-        context = assistant.memory_context
-        MemoryEntry.objects.create(
-            event=instance.text[:200],
-            summary=instance.text[:200],
-            document=doc,
-            linked_content_type=ContentType.objects.get_for_model(DocumentChunk),
-            linked_object_id=instance.id,
-            type="document_chunk",
-            assistant=assistant,
-            context=context,
-        )
+    for chunk in chunks:
+        if not assistants:
+            MemoryEntry.objects.create(
+                event=chunk.text[:200],
+                summary=chunk.text[:200],
+                document=doc,
+                linked_content_type=chunk_ct,
+                linked_object_id=chunk.id,
+                type="document_chunk",
+            )
+            continue
+        for assistant in assistants:
+            MemoryEntry.objects.create(
+                event=chunk.text[:200],
+                summary=chunk.text[:200],
+                document=doc,
+                linked_content_type=chunk_ct,
+                linked_object_id=chunk.id,
+                type="document_chunk",
+                assistant=assistant,
+                context=assistant.memory_context,
+            )
+
+
+@receiver(post_save, sender=DocumentChunk)
+def create_memory_from_chunk(sender, instance, created, **kwargs):
+    if not created:
+        return
+    create_memories_for_chunks(instance.document, [instance])
+
+
+@receiver(pre_save, sender=EmbeddingMetadata)
+def fill_half_vector(sender, instance, update_fields=None, **kwargs):
+    """Keep the half-precision search copy in step with ``vector``."""
+    if update_fields is not None and "vector_half" not in update_fields:
+        return
+    vector = instance.vector or []
+    instance.vector_half = vector if len(vector) == EMBEDDING_LENGTH else None
 
 
 @receiver(post_save, sender=Embedding)
@@ -151,3 +190,17 @@ def update_chunk_status(sender, instance, **kwargs):
     if chunk and chunk.embedding_status != DocumentChunk.EmbeddingStatus.EMBEDDED:
         chunk.embedding_status = DocumentChunk.EmbeddingStatus.EMBEDDED
         chunk.save(update_fields=["embedding_status"])
+
+
+def drop_chunk_from_ann_index(sender, instance, **kwargs):
+    unindex_chunk(instance)
+
+
+# Connected only when enabled: any post_delete receiver turns the cascade
+# from Document deletes into per-row deletes
+if ANN_INDEX_ENABLED:
+    post_delete.connect(
+        drop_chunk_from_ann_index,
+        sender=DocumentChunk,
+        dispatch_uid="ann-index-chunk-delete",
+    )
@@ -2,103 +2,107 @@
 Celery tasks for processing document uploads
 """
 
-from celery import shared_task
-from intel_core.utils.ingestion import ingest_urls, ingest_videos, ingest_pdfs
+from celery import chord, shared_task
+from intel_core.utils.ingest_scheduler import (
+    INGEST_DOMAIN_RETRY_DELAY,
+    PDF,
+    acquire_domain_slot,
+    document_ids,
+    ingest_one,
+    record_source_done,
+    release_domain_slot,
+    schedule_ingestion,
+    source_domain,
+)
 from intel_core.models import JobStatus, Document, DocumentSet
 from utils.logging_utils import get_logger
 from utils import coerce_uuid
 
 logger = get_logger(__name__)
 
+# Retries while waiting for a domain slot before ingesting regardless
+DOMAIN_SLOT_MAX_RETRIES = 150
 
-@shared_task(bind=True, name="process_url_upload")
-def process_url_upload(
-    self, urls, title=None, project_name="General", session_id=None, job_id=None
-):
-    """
-    Process URL uploads in a background Celery task
 
-    Args:
-        urls (list): List of URLs to process
-        title (str, optional): Title for the documents
-        project_name (str): Project to associate documents with
-        session_id (str): Session ID for tracking
-        job_id (str): ID of the job status record
+def _pdf_page_chord(source, title, project_name, session_id, job_id, source_job_id):
+    """Return a chord extracting ``source`` page ranges in parallel, or None.
 
-    Returns:
-        int: Number of documents processed
+    Small or unreadable PDFs (a single range) are ingested in-process.
     """
+    from core.services.document_service import PDF_SINGLE_DOCUMENT, pdf_page_ranges
+
+    if not PDF_SINGLE_DOCUMENT:
+        return None
+    try:
+        ranges = pdf_page_ranges(source)
+    except Exception as e:
+        logger.warning(f"[Ingest] Could not count pages of {source}: {e}")
+        return None
+    if len(ranges) < 2:
+        return None
+    if source_job_id:
+        JobStatus.objects.filter(job_id=source_job_id).update(
+            current_chunk=0, total_chunks=ranges[-1][1], progress=0
+        )
+    header = [
+        extract_pdf_page_range.s(source, start, stop, job_id=source_job_id)
+        for start, stop in ranges
+    ]
+    body = finish_pdf_source.s(
+        source,
+        title=title,
+        project_name=project_name,
+        session_id=session_id,
+        job_id=job_id,
+        source_job_id=source_job_id,
+    )
+    return chord(header, body)
+
+
+def _schedule_upload(kind, sources, title, project_name, session_id, job_id):
     job_uuid = coerce_uuid(job_id, "job_id")
     session_uuid = coerce_uuid(session_id, "session_id")
     if not job_uuid:
         logger.error("[UUID Sanity] Aborting task due to invalid job_id")
         return 0
     try:
-        job = JobStatus.objects.get(job_id=job_uuid)
-        job.status = "processing"
-        job.stage = "chunking"
-        job.progress = 10
-        job.total_chunks = len(urls)
-        job.save()
-
-        # Process URLs
-        total_urls = len(urls)
-        processed_docs = []
-
-        for i, url in enumerate(urls):
-            job.current_chunk = i + 1
-            job.progress = int(10 + (i / total_urls) * 80)
-            job.message = f"Processing URL {i+1}/{total_urls}: {url}"
-            job.save()
-
-            # Process in smaller batches
-            batch_result = ingest_urls(
-                [url],
-                title,
-                project_name,
-                str(session_uuid) if session_uuid else None,
-                str(job_uuid),
-            )
-            processed_docs.extend(batch_result)
-
-            # Log progress
-            logger.info(
-                f"Processed URL {i+1}/{total_urls}: {url} - Created {len(batch_result)} documents"
-            )
-
-        # Update final job status
-        job.status = "completed"
-        job.stage = "completed"
-        job.progress = 100
-        job.message = f"Successfully processed {len(urls)} URLs"
-        job.result = {
-            "success": True,
-            "message": f"Successfully processed {len(processed_docs)} documents from {len(urls)} URLs",
-            "document_count": len(processed_docs),
-        }
-        job.save()
-
-        return len(processed_docs)
+        result = schedule_ingestion(
+            **{kind: sources},
+            title=title,
+            project_name=project_name,
+            session_id=str(session_uuid) if session_uuid else None,
+            job_id=str(job_uuid),
+        )
+        return result.id
     except Exception as e:
-        logger.error(f"Error in URL processing task: {str(e)}")
-        if job_uuid:
-            try:
-                job = JobStatus.objects.get(job_id=job_uuid)
-                job.status = "failed"
-                job.message = str(e)
-                job.save()
-            except Exception:
-                pass
+        logger.error(f"Error scheduling {kind} ingestion: {str(e)}")
+        JobStatus.objects.filter(job_id=job_uuid).update(
+            status="failed", message=str(e)
+        )
         raise
 
 
+@shared_task(bind=True, name="process_url_upload")
+def process_url_upload(
+    self, urls, title=None, project_name="General", session_id=None, job_id=None
+):
+    """
+    Process URL uploads in a background Celery task
 
+    Each URL is fetched by its own ``ingest_source`` task; the job is
+    completed by ``finalize_ingest_batch`` once all of them finished.
 
+    Args:
+        urls (list): List of URLs to process
+        title (str, optional): Title for the documents
+        project_name (str): Project to associate documents with
+        session_id (str): Session ID for tracking
+        job_id (str): ID of the job status record
 
-
-
-
-
+    Returns:
+        str: ID of the chord result, or 0 if the job_id was invalid
+    """
+    return _schedule_upload("urls", urls, title, project_name, session_id, job_id)
 
 
 @shared_task(bind=True, name="create_document_set_task")
@@ -117,103 +121,173 @@ def create_document_set_task(
     logger.info(
         f"[Task Start] Triggered by DocumentSet title '{title}' | URLs: {urls} | Session: {session_id}"
     )
-    urls = urls or []
-    videos = videos or []
-    file_paths = file_paths or []
-    tags = tags or []
     job_uuid = coerce_uuid(job_id, "job_id")
     session_uuid = coerce_uuid(session_id, "session_id")
     if not job_uuid:
         logger.error("[UUID Sanity] Aborting task due to invalid job_id")
         return None
     try:
-        job = JobStatus.objects.get(job_id=job_uuid)
-        job.status = "processing"
-        job.stage = "parsing"
-        job.progress = 5
-        job.total_chunks = len(urls) + len(videos) + len(file_paths)
-        job.save()
-
-        docs = []
-        for i, url in enumerate(urls):
-            job.current_chunk = i + 1
-            job.stage = "chunking"
-            job.progress = int(5 + (i / job.total_chunks) * 70)
-            job.message = f"Loading URL {i+1}/{job.total_chunks}"
-            job.save()
-            docs.extend(
-                ingest_urls(
-                    [url],
-                    title,
-                    "General",
-                    str(session_uuid) if session_uuid else None,
-                    str(job_uuid),
-                )
-            )
+        result = schedule_ingestion(
+            urls=urls or [],
+            videos=videos or [],
+            file_paths=file_paths or [],
+            title=title,
+            session_id=str(session_uuid) if session_uuid else None,
+            job_id=str(job_uuid),
+            document_set=True,
+            tags=tags or [],
+        )
+        return result.id
+    except Exception as e:
+        logger.error(f"Error in document set task: {str(e)}")
+        JobStatus.objects.filter(job_id=job_uuid).update(
+            status="failed", message=str(e)
+        )
+        raise
 
-        offset = len(urls)
-        for j, vid in enumerate(videos):
-            job.current_chunk = offset + j + 1
-            job.stage = "chunking"
-            job.progress = int(5 + ((offset + j) / job.total_chunks) * 70)
-            job.message = f"Loading video {j+1}/{len(videos)}"
-            job.save()
-            docs.extend(
-                ingest_videos(
-                    [vid],
-                    title,
-                    "General",
-                    str(session_uuid) if session_uuid else None,
-                    str(job_uuid),
-                )
-            )
 
-        offset += len(videos)
-        for k, path in enumerate(file_paths):
-            job.current_chunk = offset + k + 1
-            job.stage = "chunking"
-            job.progress = int(5 + ((offset + k) / job.total_chunks) * 70)
-            job.message = f"Loading PDF {k+1}/{len(file_paths)}"
-            job.save()
-            docs.extend(
-                ingest_pdfs(
-                    [path],
-                    title,
-                    "General",
-                    str(session_uuid) if session_uuid else None,
-                    str(job_uuid),
-                )
+@shared_task(bind=True, name="ingest_source")
+def ingest_source_task(
+    self,
+    kind,
+    source,
+    title=None,
+    project_name="General",
+    session_id=None,
+    job_id=None,
+    source_job_id=None,
+):
+    """Ingest one URL, video or PDF of a scheduled batch.
+
+    Multi-range PDFs replace this task with a chord of
+    ``extract_pdf_page_range`` tasks so their pages are extracted in
+    parallel across workers. Never raises, so one failing source does not
+    abort the batch's chord.
+    """
+    if kind == PDF:
+        pages = _pdf_page_chord(
+            source, title, project_name, session_id, job_id, source_job_id
+        )
+        if pages is not None:
+            return self.replace(pages)
+    domain = source_domain(kind, source)
+    if not acquire_domain_slot(domain):
+        if self.request.retries < DOMAIN_SLOT_MAX_RETRIES:
+            raise self.retry(
+                countdown=INGEST_DOMAIN_RETRY_DELAY,
+                max_retries=DOMAIN_SLOT_MAX_RETRIES,
             )
+        logger.warning(f"[Ingest] No free slot for {domain}; ingesting {source}")
+        domain = None
+    outcome = {"kind": kind, "source": source, "documents": [], "error": None}
+    try:
+        outcome["documents"] = ingest_one(
+            kind, source, title, project_name, session_id, source_job_id
+        )
+    except Exception as e:
+        logger.error(f"[Ingest] {kind} {source} failed: {str(e)}")
+        outcome["error"] = str(e)
+    finally:
+        release_domain_slot(domain)
+    record_source_done(job_id, f"Processed {kind} {source}")
+    return outcome
 
-        job.stage = "embedding"
-        job.progress = 90
-        job.save()
 
-        document_set = DocumentSet.objects.create(
-            title=title, urls=urls, videos=videos, tags=tags
+@shared_task(name="finalize_ingest_batch")
+def finalize_ingest_batch(
+    outcomes,
+    job_id=None,
+    title=None,
+    urls=None,
+    videos=None,
+    tags=None,
+    document_set=False,
+):
+    """Collect a batch's documents, sync their progress and close the job."""
+    doc_ids = list(
+        dict.fromkeys(d for outcome in outcomes for d in outcome["documents"])
+    )
+    failed = [o["source"] for o in outcomes if o["error"]]
+    docs = list(Document.objects.filter(id__in=doc_ids))
+    for doc in docs:
+        try:
+            doc.sync_progress()
+        except Exception as e:
+            logger.warning(f"[Ingest] Progress sync failed for {doc.id}: {e}")
+
+    set_id = None
+    if document_set:
+        doc_set = DocumentSet.objects.create(
+            title=title, urls=urls or [], videos=videos or [], tags=tags or []
+        )
+        doc_set.documents.add(*docs)
+        set_id = doc_set.id
+
+    if job_id:
+        JobStatus.objects.filter(job_id=job_id).update(
+            status="completed",
+            stage="completed",
+            progress=100,
+            message=f"Successfully processed {len(outcomes)} sources",
+            result={
+                "success": not failed or bool(docs),
+                "message": f"Successfully processed {len(docs)} documents "
+                f"from {len(outcomes)} sources",
+                "document_count": len(docs),
+                "document_ids": [str(d.id) for d in docs],
+                "failed_sources": failed,
+                "document_set_id": set_id,
+            },
         )
-        for doc in docs:
-            if isinstance(doc, Document):
-                document_set.documents.add(doc)
+    logger.info(
+        f"[Ingest] Batch {job_id} finished: {len(docs)} documents, "
+        f"{len(failed)} failed sources"
+    )
+    return set_id if document_set else len(docs)
 
-        job.stage = "completed"
-        job.progress = 100
-        job.status = "completed"
-        job.message = "Document set ingestion complete"
-        job.save()
 
-        return document_set.id
+@shared_task(name="extract_pdf_page_range")
+def extract_pdf_page_range(file_path, start, stop, job_id=None):
+    """Return the texts of pages ``start:stop``; blanks if extraction fails."""
+    from core.services.document_service import (
+        extract_page_range,
+        record_pages_extracted,
+    )
+
+    try:
+        pages = extract_page_range(file_path, start, stop)
     except Exception as e:
-        logger.error(f"Error in document set task: {str(e)}")
-        if job_uuid:
-            try:
-                job = JobStatus.objects.get(job_id=job_uuid)
-                job.status = "failed"
-                job.message = str(e)
-                job.save()
-            except Exception:
-                pass
-        raise
+        logger.error(f"[Ingest] Pages {start}-{stop} of {file_path} failed: {e}")
+        pages = [""] * (stop - start)
+    record_pages_extracted(job_id, stop - start)
+    return pages
+
+
+@shared_task(name="finish_pdf_source")
+def finish_pdf_source(
+    page_ranges,
+    file_path,
+    title=None,
+    project_name="General",
+    session_id=None,
+    job_id=None,
+    source_job_id=None,
+):
+    """Build one PDF's Document from its extracted page ranges, in order."""
+    from core.services.document_service import build_pdf_document
+
+    pages = [page for texts in page_ranges for page in texts]
+    outcome = {"kind": PDF, "source": file_path, "documents": [], "error": None}
+    try:
+        document = build_pdf_document(
+            pages, file_path, title, project_name, session_id, source_job_id
+        )
+        outcome["documents"] = document_ids([document])
+    except Exception as e:
+        logger.error(f"[Ingest] {PDF} {file_path} failed: {str(e)}")
+        outcome["error"] = str(e)
+    record_source_done(job_id, f"Processed {PDF} {file_path}")
+    return outcome
 
 
 @shared_task(bind=True, name="process_video_upload")
@@ -223,6 +297,9 @@ def process_video_upload(
     """
     Process YouTube video uploads in a background Celery task
 
+    Each transcript is downloaded by its own ``ingest_source`` task; the
+    job is completed by ``finalize_ingest_batch`` once all of them finished.
+
     Args:
         video_urls (list): List of YouTube URLs to process
         title (str, optional): Title for the videos
@@ -231,71 +308,11 @@ def process_video_upload(
         job_id (str): ID of the job status record
 
     Returns:
-        int: Number of documents processed
+        str: ID of the chord result, or 0 if the job_id was invalid
     """
-    job_uuid = coerce_uuid(job_id, "job_id")
-    session_uuid = coerce_uuid(session_id, "session_id")
-    if not job_uuid:
-        logger.error("[UUID Sanity] Aborting task due to invalid job_id")
-        return 0
-    try:
-        # Update job status to processing
-        job = JobStatus.objects.get(job_id=job_uuid)
-        job.status = "processing"
-        job.stage = "chunking"
-        job.progress = 10
-        job.total_chunks = len(video_urls)
-        job.save()
-
-        # Process videos
-        total_videos = len(video_urls)
-        processed_docs = []
-
-        for i, url in enumerate(video_urls):
-            job.current_chunk = i + 1
-            job.progress = int(10 + (i / total_videos) * 80)
-            job.message = f"Processing video {i+1}/{total_videos}: {url}"
-            job.save()
-
-            # Videos take longer to process
-            batch_result = ingest_videos(
-                [url],
-                title,
-                project_name,
-                str(session_uuid) if session_uuid else None,
-                str(job_uuid),
-            )
-            processed_docs.extend(batch_result)
-
-            # Log progress
-            logger.info(
-                f"Processed video {i+1}/{total_videos}: {url} - Created {len(batch_result)} documents"
-            )
-
-        # Update final job status
-        job.status = "completed"
-        job.stage = "completed"
-        job.progress = 100
-        job.message = f"Successfully processed {len(video_urls)} videos"
-        job.result = {
-            "success": True,
-            "message": f"Successfully processed {len(processed_docs)} documents from {len(video_urls)} videos",
-            "document_count": len(processed_docs),
-        }
-        job.save()
-
-        return len(processed_docs)
-    except Exception as e:
-        logger.error(f"Error in video processing task: {str(e)}")
-        if job_uuid:
-            try:
-                job = JobStatus.objects.get(job_id=job_uuid)
-                job.status = "failed"
-                job.message = str(e)
-                job.save()
-            except Exception:
-                pass
-        raise
+    return _schedule_upload(
+        "videos", video_urls, title, project_name, session_id, job_id
+    )
 
 
 @shared_task(bind=True, name="process_pdf_upload")
@@ -305,6 +322,9 @@ def process_pdf_upload(
     """
     Process PDF uploads in a background Celery task
 
+    Each file is ingested by its own ``ingest_source`` task; the job is
+    completed by ``finalize_ingest_batch`` once all of them finished.
+
     Args:
         file_paths (list): List of temporary file paths to process
         title (str, optional): Title for the PDFs
@@ -313,72 +333,11 @@ def process_pdf_upload(
         job_id (str): ID of the job status record
 
     Returns:
-        int: Number of documents processed
+        str: ID of the chord result, or 0 if the job_id was invalid
     """
-    job_uuid = coerce_uuid(job_id, "job_id")
-    session_uuid = coerce_uuid(session_id, "session_id")
-    if not job_uuid:
-        logger.error("[UUID Sanity] Aborting task due to invalid job_id")
-        return 0
-    try:
-        # Update job status to processing
-        job = JobStatus.objects.get(job_id=job_uuid)
-        job.status = "processing"
-        job.stage = "chunking"
-        job.progress = 10
-        job.total_chunks = len(file_paths)
-        job.save()
-
-        # Process PDFs
-        total_pdfs = len(file_paths)
-        processed_docs = []
-
-        for i, file_path in enumerate(file_paths):
-            job.current_chunk = i + 1
-            job.progress = int(10 + (i / total_pdfs) * 80)
-            job.message = f"Processing PDF {i+1}/{total_pdfs}"
-            job.save()
-
-            # PDFs process differently than URLs and videos
-            # We'd need to modify this based on how your ingest_pdfs function works
-            batch_result = ingest_pdfs(
-                [file_path],
-                title,
-                project_name,
-                str(session_uuid) if session_uuid else None,
-                str(job_uuid),
-            )
-            processed_docs.extend(batch_result)
-
-            # Log progress
-            logger.info(
-                f"Processed PDF {i+1}/{total_pdfs} - Created {len(batch_result)} documents"
-            )
-
-        # Update final job status
-        job.status = "completed"
-        job.stage = "completed"
-        job.progress = 100
-        job.message = f"Successfully processed {len(file_paths)} PDFs"
-        job.result = {
-            "success": True,
-            "message": f"Successfully processed {len(processed_docs)} documents from {len(file_paths)} PDFs",
-            "document_count": len(processed_docs),
-        }
-        job.save()
-
-        return len(processed_docs)
-    except Exception as e:
-        logger.error(f"Error in PDF processing task: {str(e)}")
-        if job_uuid:
-            try:
-                job = JobStatus.objects.get(job_id=job_uuid)
-                job.status = "failed"
-                job.message = str(e)
-                job.save()
-            except Exception:
-                pass
-        raise
+    return _schedule_upload(
+        "file_paths", file_paths, title, project_name, session_id, job_id
+    )
 
 @shared_task(name="async_repair_progress")
 def async_repair_progress(document_id):
@@ -0,0 +1,102 @@
+import os
+import time
+
+from intel_core.utils.cache_service import CacheService, InMemoryCache, TieredCache
+
+
+class _FakeRedisClient:
+    def __init__(self):
+        self.published = []
+
+    def publish(self, channel, message):
+        self.published.append((channel, message))
+
+
+class _FakeFar(InMemoryCache):
+    """Stands in for RedisCache: shared storage plus a recording client."""
+
+    def __init__(self):
+        super().__init__()
+        self.client = _FakeRedisClient()
+        self.reads = 0
+
+    def get(self, key):
+        self.reads += 1
+        return super().get(key)
+
+    def clear(self, pattern="*"):
+        return super().clear()
+
+
+def _tiered(far):
+    cache = TieredCache(far, channel="test:invalidate")
+    cache._listener_pid = os.getpid()  # no subscriber thread in tests
+    return cache
+
+
+def test_lru_eviction_respects_entry_budget():
+    cache = InMemoryCache(max_entries=4, stripes=1)
+    for i in range(4):
+        cache.set(f"k{i}", i)
+    cache.get("k0")  # k1 becomes least recently used
+    cache.set("k4", 4)
+
+    assert cache.get("k1") is None
+    assert cache.get("k0") == 0
+    stats = cache.stats()
+    assert stats["entries"] == 4
+    assert stats["evictions"] == 1
+
+
+def test_byte_budget_and_expiry_sweep():
+    cache = InMemoryCache(max_bytes=4096, stripes=1, sweep_interval=0)
+    for i in range(20):
+        cache.set(f"k{i}", "x" * 500)
+    assert cache.stats()["bytes"] <= 4096
+
+    cache.set("short", 1, timeout=0)
+    time.sleep(0.01)
+    cache.set("other", 2)  # write triggers the sweep
+    assert "short" not in cache._stripes[0].data
+    assert cache.stats()["expirations"] >= 1
+
+
+def test_incr_and_service_stats():
+    service = CacheService(force_backend="memory")
+    assert service.set("n", 1)
+    assert service.incr("n", 2) == 3
+    assert service.get("n") == 3
+    assert service.get("missing") is None
+    stats = service.stats()["InMemoryCache"]
+    assert stats["hits"] >= 1
+    assert stats["misses"] >= 1
+
+
+def test_tiered_cache_serves_hot_keys_from_near_tier():
+    far = _FakeFar()
+    far.set("profile", {"name": "a"})
+    cache = _tiered(far)
+
+    assert cache.get("profile") == {"name": "a"}
+    assert cache.get("profile") == {"name": "a"}
+    assert far.reads == 1
+
+
+def test_tiered_cache_invalidates_other_processes():
+    far = _FakeFar()
+    writer, reader = _tiered(far), _tiered(far)
+    writer.set("prompt", "v1")
+    assert reader.get("prompt") == "v1"
+
+    writer.set("prompt", "v2")
+    for _channel, message in far.client.published:
+        reader._handle_message(message)
+        writer._handle_message(message)  # own messages are ignored
+
+    assert reader.get("prompt") == "v2"
+    assert writer.stats()["invalidations"] == 0
+    assert reader.stats()["invalidations"] == 2
+
+    writer.clear()
+    reader._handle_message(far.client.published[-1][1])
+    assert reader.near.stats()["entries"] == 0
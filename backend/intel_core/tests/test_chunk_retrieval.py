@@ -40,3 +40,16 @@ def test_weak_glossary_filtered(mock_sim, mock_chunk_model, mock_embed, db):
 
     chunks, *_ = get_relevant_chunks(str(assistant.id), "explain sdk", force_fallback=True)
     assert chunks and chunks[0]["chunk_id"] == "1"
+
+
+def test_vector_update_refreshes_half_vector(db):
+    from embeddings.models import EMBEDDING_LENGTH
+    from intel_core.models import EmbeddingMetadata
+
+    meta = EmbeddingMetadata.objects.create(
+        model_used="m", num_tokens=1, vector=[0.5] * EMBEDDING_LENGTH
+    )
+    meta.vector = [0.25] * EMBEDDING_LENGTH
+    meta.save(update_fields=["vector"])
+    meta.refresh_from_db()
+    assert list(meta.vector_half.to_list()[:2]) == [0.25, 0.25]
@@ -3,7 +3,7 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'server.settings')
 import django
 django.setup()
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from unittest.mock import patch
 from intel_core.models import Document, DocumentChunk, EmbeddingMetadata
 from intel_core.utils import processing
@@ -14,7 +14,7 @@ from django.contrib.contenttypes.models import ContentType
 class DocumentChunkEmbeddingTests(TestCase):
     def test_tasks_scheduled_for_chunks(self):
         doc = Document.objects.create(title="T", content="a" * 120)
-        with patch("intel_core.utils.processing.embed_and_store.delay") as mock_delay:
+        with patch("embeddings.tasks.embed_chunk_batch.delay") as mock_delay:
             with patch(
                 "intel_core.utils.processing.generate_chunks",
                 return_value=["a" * 50, "b" * 50],
@@ -28,9 +28,30 @@ class DocumentChunkEmbeddingTests(TestCase):
                         side_effect=lambda t: {"text": t, "score": 1.0, "keep": True},
                     ):
                         processing._create_document_chunks(doc)
-        self.assertEqual(mock_delay.call_count, 2)
+        # Both chunks go out in a single batch task
+        self.assertEqual(mock_delay.call_count, 1)
+        self.assertEqual(len(mock_delay.call_args.args[0]), 2)
         self.assertEqual(DocumentChunk.objects.filter(document=doc).count(), 2)
 
+    @override_settings(FORCE_EMBED_SYNC=True)
+    def test_chunks_embedded_inline_when_celery_disabled(self):
+        doc = Document.objects.create(title="S", content="a" * 120)
+        with patch("embeddings.tasks.embed_chunk_batch.delay") as mock_delay, patch(
+            "embeddings.tasks.embed_chunks", return_value=2
+        ) as mock_embed, patch(
+            "intel_core.utils.processing.generate_chunks",
+            return_value=["a" * 50, "b" * 50],
+        ), patch(
+            "intel_core.utils.processing.generate_chunk_fingerprint",
+            side_effect=["fp3", "fp4"],
+        ), patch(
+            "intel_core.utils.processing.clean_and_score_chunk",
+            side_effect=lambda t: {"text": t, "score": 1.0, "keep": True},
+        ):
+            processing._create_document_chunks(doc)
+        mock_delay.assert_not_called()
+        self.assertEqual(len(mock_embed.call_args.args[0]), 2)
+
     def test_embedding_signal_links_metadata(self):
         doc = Document.objects.create(title="X", content="y")
         chunk = DocumentChunk.objects.create(
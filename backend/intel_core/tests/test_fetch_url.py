@@ -5,6 +5,15 @@ class DummyResponse:
         self.text = text
         self.ok = True
         self.status_code = 200
+        self.headers = {"Content-Type": "text/html; charset=utf-8"}
+
+
+class DummySession:
+    def __init__(self, resp):
+        self.resp = resp
+
+    def get(self, *args, **kwargs):
+        return self.resp
 
 
 def test_fetch_url_falls_back_to_requests(monkeypatch):
@@ -14,7 +23,21 @@ def test_fetch_url_falls_back_to_requests(monkeypatch):
         raise Exception("playwright missing")
 
     monkeypatch.setattr(helper, "sync_playwright", failing_playwright)
-    monkeypatch.setattr(helper.requests, "get", lambda *a, **kw: dummy_resp)
+    monkeypatch.setattr(helper, "get_http_session", lambda: DummySession(dummy_resp))
 
     result = helper.fetch_url("http://example.com")
     assert result == "<html>ok</html>"
+
+
+def test_static_pages_skip_playwright(monkeypatch):
+    paragraph = "<p>" + "Readable article text. " * 40 + "</p>"
+    article = f"<html><body><main>{paragraph}</main></body></html>"
+    dummy_resp = DummyResponse(article)
+
+    def unexpected_playwright(*args, **kwargs):
+        raise AssertionError("static page was rendered")
+
+    monkeypatch.setattr(helper, "sync_playwright", unexpected_playwright)
+    monkeypatch.setattr(helper, "get_http_session", lambda: DummySession(dummy_resp))
+
+    assert helper.fetch_url("http://example.com/post") == article
@@ -0,0 +1,85 @@
+import os
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "server.settings")
+import django
+
+django.setup()
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from intel_core.models import Document, DocumentSet, JobStatus
+from intel_core.tasks import finalize_ingest_batch, ingest_source_task
+from intel_core.utils import ingest_scheduler
+
+LOCMEM = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM)
+class DomainSlotTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_slots_are_limited_per_domain(self):
+        domain = ingest_scheduler.source_domain("url", "https://Example.com/a")
+        with patch.object(ingest_scheduler, "INGEST_DOMAIN_CONCURRENCY", 2):
+            self.assertTrue(ingest_scheduler.acquire_domain_slot(domain))
+            self.assertTrue(ingest_scheduler.acquire_domain_slot(domain))
+            self.assertFalse(ingest_scheduler.acquire_domain_slot(domain))
+            self.assertTrue(ingest_scheduler.acquire_domain_slot("other.org"))
+            ingest_scheduler.release_domain_slot(domain)
+            self.assertTrue(ingest_scheduler.acquire_domain_slot(domain))
+
+    def test_failing_source_is_reported_not_raised(self):
+        job = JobStatus.objects.create(status="processing", total_chunks=2)
+        with patch(
+            "intel_core.tasks.ingest_one", side_effect=RuntimeError("timeout")
+        ):
+            outcome = ingest_source_task.apply(
+                args=("url", "https://example.com/a"), kwargs={"job_id": job.job_id}
+            ).get()
+        self.assertEqual(outcome["error"], "timeout")
+        job.refresh_from_db()
+        self.assertEqual(job.current_chunk, 1)
+        self.assertEqual(job.progress, 50)
+
+    def test_pdf_pages_are_extracted_by_parallel_tasks(self):
+        doc = Document.objects.create(title="Book", content="x")
+        ranges = [(0, 2), (2, 4), (4, 5)]
+        with patch(
+            "core.services.document_service.pdf_page_ranges", return_value=ranges
+        ), patch(
+            "core.services.document_service.extract_page_range",
+            side_effect=lambda path, start, stop: [f"p{n}" for n in range(start, stop)],
+        ) as extract, patch(
+            "core.services.document_service.build_pdf_document", return_value=doc
+        ) as build:
+            outcome = ingest_source_task.apply(args=("pdf", "/tmp/book.pdf")).get()
+        self.assertEqual(extract.call_count, 3)
+        self.assertEqual(build.call_args.args[0], ["p0", "p1", "p2", "p3", "p4"])
+        self.assertEqual(outcome["documents"], [str(doc.id)])
+
+
+class FinalizeIngestBatchTests(TestCase):
+    def test_batch_is_collected_into_document_set(self):
+        job = JobStatus.objects.create(status="processing", total_chunks=3)
+        docs = [Document.objects.create(title=f"D{i}", content="x") for i in range(2)]
+        outcomes = [
+            {"source": "https://a.com", "documents": [str(docs[0].id)], "error": None},
+            {"source": "https://b.com", "documents": [str(docs[1].id)], "error": None},
+            {"source": "https://c.com", "documents": [], "error": "404"},
+        ]
+        set_id = finalize_ingest_batch(
+            outcomes,
+            job_id=job.job_id,
+            title="Batch",
+            urls=[o["source"] for o in outcomes],
+            document_set=True,
+        )
+        doc_set = DocumentSet.objects.get(id=set_id)
+        self.assertEqual(doc_set.documents.count(), 2)
+        job.refresh_from_db()
+        self.assertEqual(job.status, "completed")
+        self.assertEqual(job.result["failed_sources"], ["https://c.com"])
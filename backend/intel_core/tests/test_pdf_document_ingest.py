@@ -0,0 +1,66 @@
+import os
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "server.settings")
+import django
+
+django.setup()
+
+import sys
+import types
+from unittest.mock import patch
+
+from core.services import document_service as doc_service
+
+
+class _Page:
+    def __init__(self, number):
+        self.number = number
+
+    def extract_text(self):
+        return f"Page {chr(ord('a') + self.number)} explains the protocol."
+
+
+class _PDF:
+    pages = [_Page(n) for n in range(20)]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def _fake_pdfplumber():
+    module = types.ModuleType("pdfplumber")
+    module.open = lambda path: _PDF()
+    return module
+
+
+def test_pages_are_extracted_in_order_across_ranges():
+    with patch.dict(sys.modules, {"pdfplumber": _fake_pdfplumber()}), patch.object(
+        doc_service, "PDF_PAGES_PER_TASK", 3
+    ), patch.object(doc_service, "lemmatize_text", side_effect=lambda t, nlp: t):
+        pages = doc_service.extract_pdf_pages("book.pdf")
+    assert pages == [
+        f"page {chr(ord('a') + n)} explains the protocol\n\n" for n in range(20)
+    ]
+
+
+def test_each_pdf_becomes_one_document():
+    pages = ["first page text\n\n", "second page text\n\n"]
+    with patch.object(
+        doc_service, "extract_pdf_pages", return_value=pages
+    ) as extract, patch.object(
+        doc_service, "process_pdf_document", return_value="doc"
+    ) as process, patch.object(
+        doc_service, "process_pdfs"
+    ) as per_split:
+        docs = doc_service.ingest_pdfs(
+            ["/tmp/a.pdf", "/tmp/b.pdf"], single_document=True
+        )
+
+    assert docs == ["doc", "doc"]
+    assert extract.call_count == 2
+    per_split.assert_not_called()
+    args = process.call_args_list[0].args
+    assert args[0] == pages and args[1] == "a" and args[4] == "/tmp/a.pdf"
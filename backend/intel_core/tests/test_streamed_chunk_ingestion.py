@@ -0,0 +1,44 @@
+import os
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "server.settings")
+import django
+
+django.setup()
+
+from unittest.mock import patch
+
+import pytest
+
+from embeddings.document_services.chunking import generate_chunks, iter_chunks
+from intel_core.models import Document, DocumentChunk
+from intel_core.utils import processing
+from memory.models import MemoryEntry
+
+
+def test_iter_chunks_matches_generate_chunks_across_segments():
+    pages = [f"Page {n} talks about topic {n}. " * 40 for n in range(6)]
+    assert list(iter_chunks(pages)) == generate_chunks("".join(pages))
+
+
+@pytest.mark.django_db
+def test_segments_are_written_and_queued_in_batches():
+    doc = Document.objects.create(title="Big", content="")
+    pages = [f"Section {n} covers the MCP handshake, step {n}. " * 30 for n in range(8)]
+    writer_cls = processing._ChunkWriter
+    with patch("embeddings.tasks.embed_chunk_batch.delay") as mock_delay, patch.object(
+        processing,
+        "clean_and_score_chunk",
+        side_effect=lambda t, chunk_index=None: {"text": t, "score": 1.0, "keep": True},
+    ), patch.object(
+        processing, "_ChunkWriter", side_effect=lambda d: writer_cls(d, batch_size=3)
+    ):
+        queued = processing._create_document_chunks(doc, segments=pages)
+
+    chunks = DocumentChunk.objects.filter(document=doc)
+    assert chunks.count() == len(queued) > 3
+    assert mock_delay.call_count > 1
+    # Acronym intros are appended after the streamed body chunks
+    intro = chunks.get(is_glossary=True)
+    assert intro.order == chunks.order_by("-order").first().order
+    assert MemoryEntry.objects.filter(document=doc).count() == chunks.count()
+    assert doc.metadata["chunk_count"] == chunks.count()
@@ -10,7 +10,9 @@ import json
 import logging
 import time
 import os
+import sys
 import threading
+from collections import OrderedDict
 from typing import Any, Dict, Optional, List, Union, Tuple
 from functools import wraps
 
@@ -35,14 +37,102 @@ except ImportError:
     REDIS_AVAILABLE = False
 
 
-class InMemoryCache:
-    """Simple thread-safe in-memory cache implementation."""
+class _Stripe:
+    """One lock-protected LRU segment of :class:`InMemoryCache`."""
+
+    __slots__ = ("lock", "data", "bytes", "next_sweep", "counters")
 
     def __init__(self):
+        self.lock = threading.Lock()
+        # key -> (value, expires_at or None, size)
+        self.data: "OrderedDict[str, Tuple[Any, Optional[float], int]]" = OrderedDict()
+        self.bytes = 0
+        self.next_sweep = 0.0
+        self.counters = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+
+def _approx_size(value: Any) -> int:
+    """Cheap size estimate: the object plus one level of its contents."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(sys.getsizeof(v) for v in value)
+    return size
+
+
+class InMemoryCache:
+    """Bounded thread-safe in-memory cache.
+
+    Keys are spread over ``stripes`` independent LRU segments, each with its
+    own lock, entry budget and byte budget, so threads touching different
+    keys rarely contend. Least recently used entries are evicted in O(1) when
+    a segment exceeds its budget, and expired entries are swept from a
+    segment at most every ``sweep_interval`` seconds as part of a write.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        max_bytes: int = 64 * 1024 * 1024,
+        stripes: int = 16,
+        sweep_interval: float = 30.0,
+    ):
         """Initialize the in-memory cache."""
-        self._cache = {}
-        self._expiry = {}
-        self._lock = threading.RLock()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
+        self._stripes = [_Stripe() for _ in range(max(1, stripes))]
+        self._stripe_entries = max(1, max_entries // len(self._stripes))
+        self._stripe_bytes = max(1, max_bytes // len(self._stripes))
+
+    def _stripe(self, key: str) -> _Stripe:
+        return self._stripes[hash(key) % len(self._stripes)]
+
+    def _remove(self, stripe: _Stripe, key: str) -> None:
+        _value, _expires, size = stripe.data.pop(key)
+        stripe.bytes -= size
+
+    def _sweep(self, stripe: _Stripe, now: float) -> int:
+        """Drop expired entries from ``stripe``; caller holds its lock."""
+        expired = [k for k, (_v, exp, _s) in stripe.data.items() if exp and exp < now]
+        for key in expired:
+            self._remove(stripe, key)
+        stripe.next_sweep = now + self.sweep_interval
+        return len(expired)
+
+    def _lookup(self, stripe: _Stripe, key: str, now: float) -> Tuple[bool, Any]:
+        entry = stripe.data.get(key)
+        if entry is None:
+            return False, None
+        value, expires, _size = entry
+        if expires is not None and expires < now:
+            self._remove(stripe, key)
+            stripe.counters["expirations"] += 1
+            return False, None
+        stripe.data.move_to_end(key)
+        return True, value
+
+    def _store(
+        self, stripe: _Stripe, key: str, value: Any, timeout: Optional[int], now: float
+    ) -> None:
+        expired = self._sweep(stripe, now) if now >= stripe.next_sweep else 0
+        if key in stripe.data:
+            self._remove(stripe, key)
+        size = _approx_size(key) + _approx_size(value)
+        expires = now + timeout if timeout is not None else None
+        stripe.data[key] = (value, expires, size)
+        stripe.bytes += size
+        evicted = 0
+        while len(stripe.data) > 1 and (
+            len(stripe.data) > self._stripe_entries
+            or stripe.bytes > self._stripe_bytes
+        ):
+            oldest = next(iter(stripe.data))
+            self._remove(stripe, oldest)
+            evicted += 1
+        stripe.counters["expirations"] += expired
+        stripe.counters["evictions"] += evicted
 
     def get(self, key: str) -> Any:
         """
@@ -54,19 +144,13 @@ class InMemoryCache:
         Returns:
             Any: The cached value or None if not found or expired
         """
-        with self._lock:
-            # Check if key exists and is not expired
-            if key in self._cache:
-                # Check expiration
-                if key in self._expiry and self._expiry[key] < time.time():
-                    # Expired, remove it
-                    del self._cache[key]
-                    del self._expiry[key]
-                    return None
-                return self._cache[key]
-            return None
+        stripe = self._stripe(key)
+        with stripe.lock:
+            found, value = self._lookup(stripe, key, time.time())
+            stripe.counters["hits" if found else "misses"] += 1
+        return value
 
-    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
         """
         Set a value in the cache.
 
@@ -75,29 +159,32 @@ class InMemoryCache:
             value (Any): Value to cache
             timeout (int, optional): Expiration time in seconds
         """
-        with self._lock:
-            self._cache[key] = value
-            if timeout is not None:
-                self._expiry[key] = time.time() + timeout
+        stripe = self._stripe(key)
+        with stripe.lock:
+            self._store(stripe, key, value, timeout, time.time())
+        return True
 
-    def delete(self, key: str) -> None:
+    def delete(self, key: str) -> bool:
         """
         Delete a value from the cache.
 
         Args:
             key (str): Cache key
         """
-        with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-            if key in self._expiry:
-                del self._expiry[key]
+        stripe = self._stripe(key)
+        with stripe.lock:
+            if key not in stripe.data:
+                return False
+            self._remove(stripe, key)
+        return True
 
-    def clear(self) -> None:
+    def clear(self) -> bool:
         """Clear all values from the cache."""
-        with self._lock:
-            self._cache.clear()
-            self._expiry.clear()
+        for stripe in self._stripes:
+            with stripe.lock:
+                stripe.data.clear()
+                stripe.bytes = 0
+        return True
 
     def get_many(self, keys: List[str]) -> Dict[str, Any]:
         """
@@ -116,7 +203,7 @@ class InMemoryCache:
                 result[key] = value
         return result
 
-    def set_many(self, data: Dict[str, Any], timeout: Optional[int] = None) -> None:
+    def set_many(self, data: Dict[str, Any], timeout: Optional[int] = None) -> bool:
         """
         Set multiple values in the cache.
 
@@ -126,6 +213,7 @@ class InMemoryCache:
         """
         for key, value in data.items():
             self.set(key, value, timeout)
+        return True
 
     def incr(self, key: str, delta: int = 1) -> int:
         """
@@ -141,16 +229,34 @@ class InMemoryCache:
         Raises:
             ValueError: If the value cannot be incremented
         """
-        with self._lock:
-            value = self.get(key)
-            if value is None:
+        stripe = self._stripe(key)
+        with stripe.lock:
+            now = time.time()
+            found, value = self._lookup(stripe, key, now)
+            if not found:
                 value = 0
             if not isinstance(value, (int, float)):
                 raise ValueError(f"Cannot increment non-numeric value: {value}")
             new_value = value + delta
-            self.set(key, new_value)
+            # Keep the existing expiry, as Redis INCR does
+            expires = stripe.data[key][1] if found else None
+            timeout = expires - now if expires is not None else None
+            self._store(stripe, key, new_value, timeout, now)
             return new_value
 
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/eviction counters and current size."""
+        data = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        entries = total_bytes = 0
+        for stripe in self._stripes:
+            with stripe.lock:
+                entries += len(stripe.data)
+                total_bytes += stripe.bytes
+                for name, count in stripe.counters.items():
+                    data[name] += count
+        data.update(entries=entries, bytes=total_bytes)
+        return data
+
 
 class RedisCache:
     """Redis-based cache implementation."""
@@ -380,6 +486,241 @@ class RedisCache:
                     return value
 
 
+class TieredCache:
+    """Per-process near cache in front of a shared Redis far cache.
+
+    Reads are served from a small :class:`InMemoryCache` when possible and
+    fall through to Redis otherwise. Every write, delete or clear publishes
+    the affected keys on a Redis pub/sub channel; a background listener in
+    each process drops them from its near tier so workers stay coherent.
+    Near entries also expire after ``near_ttl`` seconds as a bound on
+    staleness should an invalidation message be lost.
+    """
+
+    def __init__(
+        self,
+        far: RedisCache,
+        channel: str,
+        near_max_entries: int = 1000,
+        near_ttl: int = 60,
+    ):
+        """
+        Initialize the tiered cache.
+
+        Args:
+            far (RedisCache): Shared backend that also carries invalidations
+            channel (str): Pub/sub channel used for invalidation messages
+            near_max_entries (int): Entry budget of the near tier
+            near_ttl (int): Longest time a value is kept in the near tier
+        """
+        self.far = far
+        self.near = InMemoryCache(max_entries=near_max_entries)
+        self.near_ttl = near_ttl
+        self.channel = channel
+        self.origin = f"{os.getpid()}:{id(self)}"
+        self._listener_pid = None
+        self._listener_lock = threading.Lock()
+        self._invalidations = 0
+
+    # -- invalidation -----------------------------------------------------
+    def _ensure_listener(self) -> None:
+        """Start the subscriber thread once per process (it does not survive fork)."""
+        pid = os.getpid()
+        if self._listener_pid == pid:
+            return
+        with self._listener_lock:
+            if self._listener_pid == pid:
+                return
+            # Anything cached before a fork may already be stale
+            self.near.clear()
+            self.origin = f"{pid}:{id(self)}"
+            thread = threading.Thread(
+                target=self._listen, name="cache-invalidation", daemon=True
+            )
+            thread.start()
+            self._listener_pid = pid
+
+    def _listen(self) -> None:
+        while True:
+            try:
+                pubsub = self.far.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                # Messages may have been missed while disconnected
+                self.near.clear()
+                for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._handle_message(message["data"])
+            except Exception as e:
+                logger.warning(f"⚠️ Cache invalidation listener error: {str(e)}")
+                time.sleep(1)
+
+    def _handle_message(self, data: Union[bytes, str]) -> None:
+        """Apply one invalidation message to the near tier."""
+        try:
+            payload = json.loads(data)
+        except Exception:
+            return
+        if payload.get("origin") == self.origin:
+            return
+        self._invalidations += 1
+        if payload.get("op") == "clear":
+            self.near.clear()
+            return
+        for key in payload.get("keys", []):
+            self.near.delete(key)
+
+    def _publish(self, op: str, keys: List[str] = ()) -> None:
+        message = json.dumps({"origin": self.origin, "op": op, "keys": list(keys)})
+        try:
+            self.far.client.publish(self.channel, message)
+        except Exception as e:
+            logger.error(f"❌ Cache invalidation publish error: {str(e)}")
+
+    def _near_timeout(self, timeout: Optional[int]) -> int:
+        if timeout is None:
+            return self.near_ttl
+        return min(timeout, self.near_ttl)
+
+    # -- cache API --------------------------------------------------------
+    def get(self, key: str) -> Any:
+        """
+        Get a value from the near tier, falling back to Redis.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            Any: The cached value or None if not found
+        """
+        self._ensure_listener()
+        value = self.near.get(key)
+        if value is not None:
+            return value
+        value = self.far.get(key)
+        if value is not None:
+            self.near.set(key, value, self.near_ttl)
+        return value
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        """
+        Set a value in both tiers and invalidate it in other processes.
+
+        Args:
+            key (str): Cache key
+            value (Any): Value to cache
+            timeout (int, optional): Expiration time in seconds
+
+        Returns:
+            bool: True if stored in Redis
+        """
+        self._ensure_listener()
+        success = self.far.set(key, value, timeout)
+        if success:
+            self.near.set(key, value, self._near_timeout(timeout))
+        else:
+            self.near.delete(key)
+        self._publish("del", [key])
+        return success
+
+    def delete(self, key: str) -> bool:
+        """
+        Delete a value from both tiers and from other processes' near tiers.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            bool: True if the key existed in Redis
+        """
+        self.near.delete(key)
+        success = self.far.delete(key)
+        self._publish("del", [key])
+        return success
+
+    def clear(self, pattern: str = "*") -> bool:
+        """
+        Clear matching keys in Redis and every near tier.
+
+        Args:
+            pattern (str): Pattern to match Redis keys
+
+        Returns:
+            bool: True if successful
+        """
+        self.near.clear()
+        success = self.far.clear(pattern)
+        self._publish("clear")
+        return success
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get multiple values, fetching only near-tier misses from Redis.
+
+        Args:
+            keys (List[str]): List of cache keys
+
+        Returns:
+            Dict[str, Any]: Dictionary of found keys and their values
+        """
+        self._ensure_listener()
+        result = self.near.get_many(keys)
+        missing = [key for key in keys if key not in result]
+        if missing:
+            found = self.far.get_many(missing)
+            if found:
+                self.near.set_many(found, self.near_ttl)
+            result.update(found)
+        return result
+
+    def set_many(self, data: Dict[str, Any], timeout: Optional[int] = None) -> bool:
+        """
+        Set multiple values in both tiers.
+
+        Args:
+            data (Dict[str, Any]): Dictionary of key-value pairs
+            timeout (int, optional): Expiration time in seconds
+
+        Returns:
+            bool: True if stored in Redis
+        """
+        self._ensure_listener()
+        success = self.far.set_many(data, timeout)
+        if success:
+            self.near.set_many(data, self._near_timeout(timeout))
+        else:
+            for key in data:
+                self.near.delete(key)
+        self._publish("del", list(data))
+        return success
+
+    def incr(self, key: str, delta: int = 1) -> Optional[int]:
+        """
+        Increment a value in Redis; counters are never served from the near tier.
+
+        Args:
+            key (str): Cache key
+            delta (int): Amount to increment by
+
+        Returns:
+            int: New value, or None if operation failed
+        """
+        self.near.delete(key)
+        result = self.far.incr(key, delta)
+        self._publish("del", [key])
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return near-tier counters plus received invalidations.
+
+        Returns:
+            Dict[str, int]: Counter values
+        """
+        data = self.near.stats()
+        data["invalidations"] = self._invalidations
+        return data
+
+
 class DjangoCache:
     """Django cache framework wrapper."""
 
@@ -518,6 +859,10 @@ class CacheService:
     2. Direct Redis connection (if available)
     3. In-memory cache (always available as final fallback)
 
+    With ``CACHE_NEAR_ENABLED=True`` (or ``force_backend='tiered'``) Redis is
+    used through :class:`TieredCache`, which keeps hot keys in process memory
+    and invalidates them across workers over Redis pub/sub.
+
     Configuration is read from environment variables or Django settings.
     """
 
@@ -526,7 +871,8 @@ class CacheService:
         Initialize the cache service.
 
         Args:
-            force_backend (str, optional): Force a specific backend ('django', 'redis', or 'memory')
+            force_backend (str, optional): Force a specific backend ('django',
+                'redis', 'tiered' or 'memory')
         """
         self.backends = []
         self._primary_backend = None
@@ -539,7 +885,15 @@ class CacheService:
             "REDIS_PASSWORD": os.getenv("REDIS_PASSWORD", None),
             "DEFAULT_TIMEOUT": int(os.getenv("CACHE_DEFAULT_TIMEOUT", 3600)),
             "PREFIX": os.getenv("CACHE_PREFIX", "donkeybetz:"),
+            "MEMORY_MAX_ENTRIES": int(os.getenv("CACHE_MEMORY_MAX_ENTRIES", 10000)),
+            "MEMORY_MAX_BYTES": int(
+                os.getenv("CACHE_MEMORY_MAX_BYTES", 64 * 1024 * 1024)
+            ),
+            "NEAR_CACHE_ENABLED": os.getenv("CACHE_NEAR_ENABLED", "False") == "True",
+            "NEAR_MAX_ENTRIES": int(os.getenv("CACHE_NEAR_MAX_ENTRIES", 1000)),
+            "NEAR_TTL": int(os.getenv("CACHE_NEAR_TTL", 60)),
         }
+        self.config["INVALIDATION_CHANNEL"] = f"{self.config['PREFIX']}invalidate"
 
         # Override with Django settings if available
         if DJANGO_AVAILABLE:
@@ -571,6 +925,8 @@ class CacheService:
         if force_backend:
             if force_backend == "django" and DJANGO_AVAILABLE:
                 self._setup_django_backend()
+            elif force_backend == "tiered" and REDIS_AVAILABLE:
+                self._setup_tiered_backend()
             elif force_backend == "redis" and REDIS_AVAILABLE:
                 self._setup_redis_backend()
             elif force_backend == "memory":
@@ -580,7 +936,13 @@ class CacheService:
         else:
             # Try all backends in order of preference
             try:
-                if DJANGO_AVAILABLE:
+                if REDIS_AVAILABLE and self.config["NEAR_CACHE_ENABLED"]:
+                    self._setup_tiered_backend()
+            except Exception as e:
+                logger.warning(f"⚠️ Tiered cache not available: {str(e)}")
+
+            try:
+                if DJANGO_AVAILABLE and not self._primary_backend:
                     self._setup_django_backend()
             except Exception as e:
                 logger.warning(f"⚠️ Django cache not available: {str(e)}")
@@ -618,9 +980,30 @@ class CacheService:
         if not self._primary_backend:
             self._primary_backend = backend
 
+    def _setup_tiered_backend(self):
+        """Set up the near/far cache in front of Redis."""
+        far = RedisCache(
+            host=self.config["REDIS_HOST"],
+            port=self.config["REDIS_PORT"],
+            db=self.config["REDIS_DB"],
+            password=self.config["REDIS_PASSWORD"],
+        )
+        backend = TieredCache(
+            far,
+            channel=self.config["INVALIDATION_CHANNEL"],
+            near_max_entries=self.config["NEAR_MAX_ENTRIES"],
+            near_ttl=self.config["NEAR_TTL"],
+        )
+        self.backends.insert(0, backend)
+        if not self._primary_backend:
+            self._primary_backend = backend
+
     def _setup_memory_backend(self):
         """Set up in-memory cache backend."""
-        backend = InMemoryCache()
+        backend = InMemoryCache(
+            max_entries=self.config["MEMORY_MAX_ENTRIES"],
+            max_bytes=self.config["MEMORY_MAX_BYTES"],
+        )
         self.backends.append(backend)
         if not self._primary_backend:
             self._primary_backend = backend
@@ -735,7 +1118,7 @@ class CacheService:
         # Try to clear all backends
         for backend in self.backends:
             try:
-                if isinstance(backend, RedisCache):
+                if isinstance(backend, (RedisCache, TieredCache)):
                     if backend.clear(self._format_key(pattern)):
                         success = True
                 else:
@@ -748,6 +1131,26 @@ class CacheService:
 
         return success
 
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Return counters for every backend that tracks them.
+
+        Returns:
+            Dict[str, Dict[str, int]]: Counters keyed by backend class name
+        """
+        result = {}
+        for backend in self.backends:
+            stats_fn = getattr(backend, "stats", None)
+            if stats_fn is None:
+                continue
+            try:
+                result[backend.__class__.__name__] = stats_fn()
+            except Exception as e:
+                logger.error(
+                    f"❌ Cache stats error with {backend.__class__.__name__}: {str(e)}"
+                )
+        return result
+
     def get_many(self, keys: List[str], default: Any = None) -> Dict[str, Any]:
         """
         Get multiple values from the cache.
@@ -8,3 +8,57 @@ def fingerprint_text(text: str) -> str:
         return ""
     normalized = re.sub(r"\s+", " ", text.strip().lower())
     return hashlib.sha256(normalized.encode("utf-8", errors="ignore")).hexdigest()
+
+
+def near_duplicate_vectors(chunks, model: str, max_distance: int = None) -> dict:
+    """Return ``{chunk.id: vector}`` borrowed from embedded near-duplicates.
+
+    Candidates share a SimHash band with the chunk (an indexed array
+    overlap) and are confirmed by Hamming distance; only vectors stored for
+    ``model`` are reused.
+    """
+    from django.conf import settings
+
+    from embeddings.document_services.chunking import (
+        simhash_bands,
+        simhash_distance,
+    )
+    from intel_core.models import DocumentChunk, EmbeddingMetadata
+
+    if max_distance is None:
+        max_distance = getattr(settings, "NEAR_DUPLICATE_MAX_DISTANCE", 3)
+    if max_distance < 0:
+        return {}
+    by_band: dict = {}
+    for chunk in chunks:
+        for band in chunk.simhash_bands or ():
+            by_band.setdefault(band, []).append(chunk)
+    if not by_band:
+        return {}
+
+    candidates = (
+        DocumentChunk.objects.filter(
+            simhash_bands__overlap=list(by_band),
+            embedding__isnull=False,
+            embedding__model_used=model,
+            embedding_valid=True,
+        )
+        .exclude(id__in=[c.id for c in chunks])
+        .values_list("simhash", "embedding_id")
+    )
+    sources: dict = {}
+    for simhash, meta_id in candidates.iterator():
+        for band in simhash_bands(simhash):
+            for chunk in by_band.get(band, ()):
+                if chunk.id not in sources and (
+                    simhash_distance(simhash, chunk.simhash) <= max_distance
+                ):
+                    sources[chunk.id] = meta_id
+    if not sources:
+        return {}
+    vectors = dict(
+        EmbeddingMetadata.objects.filter(id__in=set(sources.values())).values_list(
+            "id", "vector"
+        )
+    )
+    return {cid: vectors[mid] for cid, mid in sources.items() if vectors.get(mid)}
@@ -1,10 +1,31 @@
 import logging
-from typing import Iterable, List
+from typing import Iterable, List, Optional, Sequence
 
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.db.models.functions import Cast
+
+from embeddings.vector_utils import tune_hnsw_scan
 from intel_core.models import DocumentChunk
 
 logger = logging.getLogger(__name__)
 
+# Number of nearest chunks ranked by the database before Python heuristics run
+RAG_CANDIDATE_LIMIT = getattr(settings, "RAG_CANDIDATE_LIMIT", 200)
+# Shortlist candidates from the half-precision HNSW index, then re-score
+# RAG_RESCORE_FACTOR x limit of them against the full-precision vectors
+RAG_QUANTIZED_SEARCH = getattr(settings, "RAG_QUANTIZED_SEARCH", False)
+RAG_RESCORE_FACTOR = getattr(settings, "RAG_RESCORE_FACTOR", 4)
+
+
+def _status_filter(repair: bool) -> Q:
+    """Return the ``embedding_status`` filter used by the fetch helpers."""
+    status_q = Q(embedding_status=DocumentChunk.EmbeddingStatus.EMBEDDED)
+    if repair:
+        status_q |= Q(embedding__status="completed")
+    return status_q
+
 
 def fetch_chunks(
     doc_ids: Iterable[str] | None = None,
@@ -36,3 +57,101 @@ def fetch_chunks(
                 "Skipping chunk %s with status %s", chunk.id, chunk.embedding_status
             )
     return results
+
+
+def fetch_top_chunks(
+    query_vec: Sequence[float],
+    doc_ids: Iterable[str] | None = None,
+    *,
+    chunk_ids: Iterable[str] | None = None,
+    limit: int = RAG_CANDIDATE_LIMIT,
+    preferred_vec: Optional[Sequence[float]] = None,
+    pinned: Optional[Q] = None,
+    repair: bool = False,
+    quantized: Optional[bool] = None,
+    rescore_factor: int = RAG_RESCORE_FACTOR,
+) -> List[DocumentChunk]:
+    """Return the ``limit`` chunks nearest to ``query_vec`` ranked by pgvector.
+
+    ``EmbeddingMetadata.vector`` is a float array, so it is cast to ``vector``
+    and ordered by ``CosineDistance`` inside Postgres. Raw vectors are never
+    loaded; each chunk is annotated with ``similarity`` (``1 - distance``) and,
+    when ``preferred_vec`` is given, ``pref_similarity``. Chunks matching
+    ``pinned`` (e.g. anchor-matched or glossary chunks) are appended even when
+    they fall outside the top ``limit`` so forced inclusion keeps working.
+
+    With ``quantized`` (default ``RAG_QUANTIZED_SEARCH``) only a shortlist
+    of ``limit * rescore_factor`` chunks drawn from the ``vector_half`` HNSW
+    index is cast and scored exactly, so chunks whose half vector was not
+    backfilled yet are only found if pinned. The shortlist never reads the
+    full-precision arrays; the dimension check runs on it alone. The scan's
+    ``ef_search`` is raised to the shortlist size (at most 1000) and
+    iterative scans are enabled, so filters do not silently truncate it.
+
+    Raises the underlying database error when pgvector is unavailable so the
+    caller can fall back to :func:`fetch_chunks`.
+    """
+    from pgvector import HalfVector
+    from pgvector.django import CosineDistance, VectorField
+    from embeddings.models import EMBEDDING_LENGTH
+
+    candidates = DocumentChunk.objects.filter(embedding__isnull=False).filter(
+        _status_filter(repair)
+    )
+    if doc_ids is not None:
+        candidates = candidates.filter(document_id__in=doc_ids)
+    if chunk_ids is not None:
+        candidates = candidates.filter(id__in=chunk_ids)
+    # array_length reads the whole float8[], so only rows that are scored
+    # exactly pay for it; vector_half is only written for full-length vectors
+    qs = candidates.filter(embedding__vector__len=EMBEDDING_LENGTH)
+
+    if quantized is None:
+        quantized = RAG_QUANTIZED_SEARCH
+    ranked = qs
+    if quantized:
+        shortlist = (
+            candidates.filter(embedding__vector_half__isnull=False)
+            .annotate(
+                approx=CosineDistance(
+                    "embedding__vector_half", HalfVector(list(query_vec))
+                )
+            )
+            .order_by("approx")
+            .values("id")[: limit * rescore_factor]
+        )
+        ranked = qs.filter(id__in=shortlist)
+
+    def _scored(rows):
+        vector_expr = Cast(
+            "embedding__vector", VectorField(dimensions=EMBEDDING_LENGTH)
+        )
+        rows = rows.annotate(distance=CosineDistance(vector_expr, list(query_vec)))
+        rows = rows.annotate(similarity=1.0 - F("distance"))
+        if preferred_vec is not None:
+            rows = rows.annotate(
+                pref_similarity=1.0 - CosineDistance(vector_expr, list(preferred_vec))
+            )
+        return rows.select_related("embedding", "document", "anchor").defer(
+            "embedding__vector", "embedding__vector_half"
+        )
+
+    # Savepoint keeps a failed cast from poisoning an outer transaction
+    with transaction.atomic():
+        if quantized:
+            tune_hnsw_scan(max(40, limit * rescore_factor))
+        results = list(_scored(ranked).order_by("distance")[:limit])
+        if pinned is not None:
+            seen = {c.id for c in results}
+            extra = (
+                _scored(qs.filter(pinned)).exclude(id__in=seen).order_by("distance")
+            )
+            results.extend(extra[:limit])
+
+    logger.debug(
+        "[RAG Search] pgvector candidates=%d (limit=%d, quantized=%s)",
+        len(results),
+        limit,
+        quantized,
+    )
+    return results
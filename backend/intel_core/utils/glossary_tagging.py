@@ -10,6 +10,7 @@ if TYPE_CHECKING:  # Avoid circular import during runtime
     from assistants.models.assistant import Assistant
 from intel_core.models import DocumentChunk
 from memory.models import SymbolicMemoryAnchor, MemoryEntry
+from memory.utils.anchor_matcher import GLOSSARY_KINDS, get_anchor_matcher
 
 stemmer = PorterStemmer()
 
@@ -78,11 +79,10 @@ def retag_memory_glossary_terms(memory: MemoryEntry) -> List[str]:
         if memory.assistant
         else SymbolicMemoryAnchor.objects.all()
     )
+    # Same checks as ``_match_anchor``, for every anchor in one pass
+    candidates = get_anchor_matcher().match(text, kinds=GLOSSARY_KINDS)
     matched: List[str] = []
-    for anchor in anchors:
-        found, _ = _match_anchor(anchor, text)
-        if not found:
-            continue
+    for anchor in anchors.filter(slug__in=candidates):
         matched.append(anchor.slug)
         if memory.anchor_id == anchor.id:
             continue
@@ -0,0 +1,170 @@
+"""Fan a batch of URL, video and PDF sources out into parallel Celery tasks.
+
+:func:`schedule_ingestion` queues one ``ingest_source`` task per source as
+the header of a chord whose body, ``finalize_ingest_batch``, links the
+resulting documents into a ``DocumentSet`` (when requested), syncs their
+``DocumentProgress`` and completes the ``JobStatus``. A batch therefore
+takes roughly as long as its slowest source instead of the sum of all.
+
+Sources on the same host share at most ``INGEST_DOMAIN_CONCURRENCY`` slots
+so a large batch does not hammer one site; tasks that find no free slot
+retry after ``INGEST_DOMAIN_RETRY_DELAY`` seconds.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, List, Optional
+from urllib.parse import urlparse
+
+from celery import chord
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+
+from intel_core.models import JobStatus
+from utils.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+URL = "url"
+VIDEO = "video"
+PDF = "pdf"
+
+INGEST_DOMAIN_CONCURRENCY = getattr(settings, "INGEST_DOMAIN_CONCURRENCY", 4)
+INGEST_DOMAIN_RETRY_DELAY = getattr(settings, "INGEST_DOMAIN_RETRY_DELAY", 2)
+# Slots of crashed workers are released when the counter expires
+DOMAIN_SLOT_TTL = 600
+DOMAIN_SLOT_KEY = "ingest:domain_slots:{domain}"
+
+
+def source_domain(kind: str, source: str) -> Optional[str]:
+    """Return the host whose concurrency limit applies to ``source``."""
+    if kind == PDF:
+        return None
+    if kind == VIDEO:
+        return "youtube"
+    return urlparse(source).netloc.lower() or None
+
+
+def acquire_domain_slot(domain: Optional[str]) -> bool:
+    if not domain or INGEST_DOMAIN_CONCURRENCY <= 0:
+        return True
+    key = DOMAIN_SLOT_KEY.format(domain=domain)
+    try:
+        cache.add(key, 0, DOMAIN_SLOT_TTL)
+        if cache.incr(key) <= INGEST_DOMAIN_CONCURRENCY:
+            cache.touch(key, DOMAIN_SLOT_TTL)
+            return True
+        cache.decr(key)
+        return False
+    except Exception:
+        logger.debug("domain slot counter unavailable", exc_info=True)
+        return True
+
+
+def release_domain_slot(domain: Optional[str]) -> None:
+    if not domain or INGEST_DOMAIN_CONCURRENCY <= 0:
+        return
+    try:
+        cache.decr(DOMAIN_SLOT_KEY.format(domain=domain))
+    except Exception:
+        logger.debug("domain slot counter unavailable", exc_info=True)
+
+
+def document_ids(results: Iterable) -> List[str]:
+    """Return IDs of the documents in an ``ingest_*`` result list."""
+    from intel_core.models import Document
+
+    ids = []
+    for item in results or []:
+        if isinstance(item, Document):
+            ids.append(str(item.id))
+        elif isinstance(item, dict) and item.get("document_id"):
+            ids.append(str(item["document_id"]))
+    return ids
+
+
+def ingest_one(
+    kind: str,
+    source: str,
+    title: Optional[str],
+    project_name: str,
+    session_id: Optional[str],
+    job_id: Optional[str],
+) -> List[str]:
+    """Ingest a single source and return the IDs of its documents."""
+    from intel_core.utils.ingestion import ingest_pdfs, ingest_urls, ingest_videos
+
+    ingest = {URL: ingest_urls, VIDEO: ingest_videos, PDF: ingest_pdfs}[kind]
+    return document_ids(ingest([source], title, project_name, session_id, job_id))
+
+
+def record_source_done(job_id: Optional[str], message: str) -> None:
+    """Advance the batch's JobStatus by one finished source."""
+    if not job_id:
+        return
+    JobStatus.objects.filter(job_id=job_id, total_chunks__gt=0).update(
+        current_chunk=F("current_chunk") + 1,
+        progress=10 + (F("current_chunk") + 1) * 80 / F("total_chunks"),
+        message=message,
+    )
+
+
+def schedule_ingestion(
+    *,
+    urls: Iterable[str] = (),
+    videos: Iterable[str] = (),
+    file_paths: Iterable[str] = (),
+    title: Optional[str] = None,
+    project_name: str = "General",
+    session_id: Optional[str] = None,
+    job_id: Optional[str] = None,
+    document_set: bool = False,
+    tags: Optional[List[str]] = None,
+):
+    """Queue every source as its own task and finalize once all finished.
+
+    Returns the chord's ``AsyncResult``.
+    """
+    from intel_core.tasks import finalize_ingest_batch, ingest_source_task
+
+    sources = (
+        [(URL, u) for u in urls]
+        + [(VIDEO, v) for v in videos]
+        + [(PDF, p) for p in file_paths]
+    )
+    if job_id:
+        JobStatus.objects.filter(job_id=job_id).update(
+            status="processing",
+            stage="chunking",
+            progress=10,
+            current_chunk=0,
+            total_chunks=len(sources),
+            message=f"Queued {len(sources)} sources",
+        )
+    # Parallel sources would overwrite each other's fine-grained progress
+    source_job = job_id if len(sources) == 1 else None
+    header = [
+        ingest_source_task.s(
+            kind,
+            source,
+            title=title,
+            project_name=project_name,
+            session_id=session_id,
+            job_id=job_id,
+            source_job_id=source_job,
+        )
+        for kind, source in sources
+    ]
+    body = finalize_ingest_batch.s(
+        job_id=job_id,
+        title=title,
+        urls=[s for k, s in sources if k == URL],
+        videos=[s for k, s in sources if k == VIDEO],
+        tags=tags or [],
+        document_set=document_set,
+    )
+    logger.info("[Ingest] scheduling %d sources for job %s", len(sources), job_id)
+    if not header:
+        return body.delay([])
+    return chord(header)(body)
@@ -1,15 +1,19 @@
 from utils.logging_utils import get_logger
 import re
 import uuid
+from typing import Iterable, Iterator
 
 import numpy as np
 import spacy
 from celery import current_app
 import time
 from django.conf import settings
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
+from django.db.models import Sum
 from embeddings.helpers.helpers_io import (
     get_embedding_for_text,
+    get_embeddings_for_texts,
+    save_chunk_embeddings,
     save_embedding,
 )
 
@@ -19,7 +23,7 @@ from embeddings.helpers.helpers_io import (
 from embeddings.tasks import embed_and_store
 from intel_core.utils.chunk_fingerprint import fingerprint_text
 from intel_core.core import clean_text, detect_topic, lemmatize_text
-from intel_core.models import Document, EmbeddingMetadata
+from intel_core.models import Document
 from mcp_core.models import Tag
 from openai import OpenAI
 
@@ -78,6 +82,9 @@ from embeddings.document_services.chunking import (
     clean_and_score_chunk,
     generate_chunk_fingerprint,
     generate_chunks,
+    iter_chunks,
+    simhash_bands,
+    simhash_fingerprint,
 )
 from intel_core.models import DocumentChunk
 
@@ -89,32 +96,41 @@ from memory.models import SymbolicMemoryAnchor
 # ``intel_core.services.__init__`` which pulls in ``DocumentService``.
 from intel_core.services.acronym_glossary_service import AcronymGlossaryService
 from intel_core.utils.glossary_tagging import _match_anchor
+from memory.utils.anchor_matcher import get_anchor_matcher
 
 
 def compute_glossary_score(text: str, anchors=None):
-    """Return (score, matched_slugs) for glossary anchors in ``text``."""
+    """Return (score, matched_slugs) for glossary anchors in ``text``.
+
+    Without explicit ``anchors`` the compiled anchor matcher is used, so
+    scoring a chunk is one pass over its text instead of one query per
+    anchor.
+    """
     if anchors is None:
-        anchors = SymbolicMemoryAnchor.objects.all().prefetch_related("tags")
-    text_lower = text.lower()
-    matched = []
-    words = text_lower.split()
-    word_set = set(words)
-    for anc in anchors:
-        if anc.slug.lower() in text_lower or anc.label.lower() in text_lower:
-            matched.append(anc.slug)
-            continue
-        tag_slugs = set(anc.tags.values_list("slug", flat=True))
-        tag_names = set(anc.tags.values_list("name", flat=True))
-        if word_set.intersection(tag_slugs) or word_set.intersection(tag_names):
-            matched.append(anc.slug)
-            continue
-        m, _ = _match_anchor(anc, text)
-        if m:
-            matched.append(anc.slug)
-    score = len(matched) / max(len(anchors), 1)
+        matcher = get_anchor_matcher()
+        matched = matcher.match(text)
+        total = len(matcher.slugs)
+    else:
+        text_lower = text.lower()
+        matched = []
+        word_set = set(text_lower.split())
+        for anc in anchors:
+            if anc.slug.lower() in text_lower or anc.label.lower() in text_lower:
+                matched.append(anc.slug)
+                continue
+            tag_slugs = set(anc.tags.values_list("slug", flat=True))
+            tag_names = set(anc.tags.values_list("name", flat=True))
+            if word_set.intersection(tag_slugs) or word_set.intersection(tag_names):
+                matched.append(anc.slug)
+                continue
+            m, _ = _match_anchor(anc, text)
+            if m:
+                matched.append(anc.slug)
+        total = len(anchors)
+    score = len(matched) / max(total, 1)
 
     if matched:
-        density = len(matched) / max(len(words), 1)
+        density = len(matched) / max(len(text.split()), 1)
         score = max(score, density)
         score = max(score, len(matched) / 10)
         score = max(score, 0.1)
@@ -123,18 +139,158 @@ def compute_glossary_score(text: str, anchors=None):
     return round(score, 2), matched
 
 
-from prompts.utils.token_helpers import EMBEDDING_MODEL, count_tokens
+from prompts.utils.token_helpers import count_tokens
+
+# New chunks inserted per query and queued per embedding task batch
+CHUNK_WRITE_BATCH_SIZE = getattr(settings, "CHUNK_WRITE_BATCH_SIZE", 200)
+# Longer documents get their document-level vector from a leading sample
+DOCUMENT_EMBED_MAX_TOKENS = 8000
+
+
+class _ChunkWriter:
+    """Buffer new chunks of ``document`` and insert them in bulk.
+
+    Each flush writes one batch, creates its memories and queues its
+    embeddings, so ingestion holds at most one batch of rows in memory.
+    """
+
+    def __init__(self, document: Document, batch_size: int = CHUNK_WRITE_BATCH_SIZE):
+        self.document = document
+        self.batch_size = batch_size
+        self.queued: list = []
+        self.count = 0
+        self._pending: list[DocumentChunk] = []
+        self._seen: set[str] = set()
+
+    def add(self, text: str, order: int, fingerprint: str = None, **fields) -> bool:
+        """Buffer a chunk; return False if its fingerprint was already used."""
+        fingerprint = fingerprint or generate_chunk_fingerprint(text)
+        if fingerprint in self._seen:
+            logger.warning(
+                "🔁 Duplicate fingerprint %s for chunk %d on document %s, skipping",
+                fingerprint,
+                order,
+                self.document.id,
+            )
+            return False
+        self._seen.add(fingerprint)
+        fields.setdefault("tokens", count_tokens(text))
+        fields.setdefault("chunk_type", "body")
+        fields.setdefault("embedding_status", "pending")
+        simhash = simhash_fingerprint(text)
+        self._pending.append(
+            DocumentChunk(
+                document=self.document,
+                order=order,
+                text=text,
+                fingerprint=fingerprint,
+                simhash=simhash,
+                simhash_bands=simhash_bands(simhash),
+                **fields,
+            )
+        )
+        self.count += 1
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+        return True
+
+    def _insert(self, batch: list[DocumentChunk]) -> list[DocumentChunk]:
+        taken = set(
+            DocumentChunk.all_objects.filter(
+                fingerprint__in=[c.fingerprint for c in batch]
+            ).values_list("fingerprint", flat=True)
+        )
+        if taken:
+            logger.warning(
+                "🔁 %d chunks of document %s already stored elsewhere, skipping",
+                len(taken),
+                self.document.id,
+            )
+            batch = [c for c in batch if c.fingerprint not in taken]
+        try:
+            with transaction.atomic():
+                return DocumentChunk.objects.bulk_create(batch)
+        except IntegrityError:
+            # A concurrent ingest claimed a fingerprint; insert row by row
+            created = []
+            for chunk in batch:
+                try:
+                    with transaction.atomic():
+                        created.extend(DocumentChunk.objects.bulk_create([chunk]))
+                except IntegrityError:
+                    logger.warning(
+                        "🔁 Duplicate fingerprint %s on document %s, skipping",
+                        chunk.fingerprint,
+                        self.document.id,
+                    )
+            return created
+
+    def flush(self) -> list:
+        """Write buffered chunks and queue their embeddings; return new IDs."""
+        from embeddings.tasks import queue_chunk_embeddings
+        from intel_core.signals import create_memories_for_chunks
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return []
+        created = self._insert(batch)
+        self.count -= len(batch) - len(created)
+        # ``bulk_create`` skips post_save, which would create these memories
+        create_memories_for_chunks(self.document, created)
+        ids = [c.id for c in created if c.embedding_status == "pending"]
+        # One task per batch of chunks instead of one per chunk
+        queue_chunk_embeddings(ids)
+        self.queued.extend(ids)
+        logger.info(
+            "📦 Stored %d chunks for %s, %d queued for embedding",
+            len(created),
+            self.document.id,
+            len(ids),
+        )
+        return ids
+
+
+def _with_glossary_tail(chunks: Iterable[str]) -> Iterator[tuple[str, bool]]:
+    """Yield ``(chunk, False)`` then ``(intro, True)`` glossary intros.
+
+    Streaming counterpart of ``AcronymGlossaryService.insert_glossary_chunk``:
+    acronyms are only known once every chunk was seen, so intros come last.
+    """
+    found: dict[str, str] = {}
+    expanded: set[str] = set()
+    for chunk in chunks:
+        lowered = chunk.lower()
+        expanded.update(
+            e for e in AcronymGlossaryService.KNOWN.values() if e.lower() in lowered
+        )
+        found.update(AcronymGlossaryService.extract(chunk))
+        yield chunk, False
+    for acronym, expansion in found.items():
+        if expansion not in expanded:
+            yield f"{acronym} refers to {expansion}.", True
+
+
+def _record_retry(document: Document, meta: dict, progress, attempts: int) -> None:
+    if progress:
+        progress.error_message = f"retry_attempts:{attempts}"
+        progress.save(update_fields=["error_message"])
+    meta["chunk_retry_attempts"] = attempts
+    document.metadata = meta
+    document.save(update_fields=["metadata"])
 
 
-def _create_document_chunks(document: Document):
-    from embeddings.tasks import embed_and_store
+def _create_document_chunks(document: Document, segments: Iterable[str] = None):
+    """Create DocumentChunk objects for ``document`` if none exist.
 
-    """Create DocumentChunk objects for ``document`` if none exist."""
+    ``segments`` (e.g. pages) are chunked lazily instead of the full
+    ``document.content``; rows are written in batches of
+    ``CHUNK_WRITE_BATCH_SIZE`` as the chunks stream in.
+    """
     if DocumentChunk.objects.filter(document=document).exists():
         logger.info(
             "[Chunk Filter] %s already has chunks — skipping creation", document.id
         )
-        return
+        return []
 
     meta = document.metadata or {}
     progress_id = meta.get("progress_id")
@@ -145,50 +301,29 @@ def _create_document_chunks(document: Document):
         progress = DocumentProgress.objects.filter(progress_id=progress_id).first()
     retry_attempts = meta.get("chunk_retry_attempts", 0)
 
-    chunks = generate_chunks(document.content)
-    chunks = AcronymGlossaryService.insert_glossary_chunk(chunks)
-    anchors = list(SymbolicMemoryAnchor.objects.all().prefetch_related("tags"))
-    queued_chunks = []
-    if not chunks and document.summary:
-        try:
-            fallback_text = document.summary
-            token_len = count_tokens(fallback_text)
-            if token_len < 5:
-                logger.warning(
-                    "[Fallback] Skipping synthetic summary chunk due to token count %d",
-                    token_len,
-                )
-            else:
-                fingerprint = fingerprint_text(fallback_text)
-                existing = DocumentChunk.objects.filter(fingerprint=fingerprint).first()
-                if not existing:
-                    new_chunk = DocumentChunk.objects.create(
-                        document=document,
-                        order=0,
-                        text=fallback_text,
-                        tokens=token_len,
-                        chunk_type="summary",
-                        fingerprint=fingerprint,
-                        force_embed=True,
-                    )
-                    new_chunk.embedding_status = "pending"
-                    new_chunk.save(update_fields=["embedding_status"])
-                    embed_and_store.delay(
-                        str(new_chunk.id), session_id=str(document.session_id)
-                    )
-                    chunks = [fallback_text]
-                    queued_chunks.append(new_chunk.id)
-                    logger.warning("[Fallback] Injected synthetic summary chunk.")
-                else:
-                    logger.warning(
-                        "[Fallback] Chunk with identical fingerprint already exists. Skipping fallback."
-                    )
-        except Exception:
-            logger.exception("Failed to inject synthetic summary chunk")
+    if segments is None:
+        chunks = generate_chunks(document.content)
+        chunks = AcronymGlossaryService.insert_glossary_chunk(chunks)
+        stream = ((chunk, False) for chunk in chunks)
+    else:
+        stream = _with_glossary_tail(iter_chunks(segments))
+
+    writer = _ChunkWriter(document)
+    force_all = getattr(settings, "DISABLE_CHUNK_SKIP_FILTERS", False)
+    # Raw chunks are only kept for the retries while nothing was accepted
+    retry_pool: list[tuple[int, str]] = []
     short_candidates: list[tuple[int, dict]] = []
     skipped = 0
-    for i, chunk in enumerate(chunks):
-        info = clean_and_score_chunk(chunk, chunk_index=i)
+    total = 0
+    for i, (chunk, is_intro) in enumerate(stream):
+        total += 1
+        if writer.count:
+            retry_pool.clear()
+            short_candidates.clear()
+        else:
+            retry_pool.append((i, chunk))
+        # Intros are short by design; score them with first-chunk leniency
+        info = clean_and_score_chunk(chunk, chunk_index=0 if is_intro else i)
         if not info["keep"]:
             skipped += 1
             logger.debug(
@@ -207,133 +342,102 @@ def _create_document_chunks(document: Document):
                 info.get("score", 0.0),
             )
             if info.get("reason") in ("too_short", "short_low_quality"):
-                short_candidates.append((i, info))
-            if not getattr(settings, "DISABLE_CHUNK_SKIP_FILTERS", False):
+                if not writer.count:
+                    short_candidates.append((i, info))
+            if not force_all:
                 continue
             logger.debug("⚠️ Filter bypass enabled — keeping chunk %d", i)
-        fingerprint = generate_chunk_fingerprint(info["text"])
+        text = info["text"]
+        fingerprint = generate_chunk_fingerprint(text)
+        is_glossary = "refers to" in text.lower()
         anchor = None
-        if "refers to" in info["text"].lower():
-            match = re.match(r"([A-Z]{2,})\s+refers to", info["text"])
+        if is_glossary:
+            match = re.match(r"([A-Z]{2,})\s+refers to", text)
             if match:
                 slug = match.group(1).lower()
                 anchor, _ = SymbolicMemoryAnchor.objects.get_or_create(
                     slug=slug, defaults={"label": match.group(1)}
                 )
-        try:
-            glossary_score, matched = compute_glossary_score(info["text"], anchors)
-            new_chunk = DocumentChunk.objects.create(
-                document=document,
-                order=i,
-                text=info["text"],
-                tokens=count_tokens(info["text"]),
-                chunk_type="body",
-                is_glossary="refers to" in info["text"].lower(),
-                tags=["glossary"] if "refers to" in info["text"].lower() else [],
-                fingerprint=fingerprint,
-                anchor=anchor,
-                glossary_score=glossary_score,
-                matched_anchors=matched,
-                force_embed=getattr(settings, "DISABLE_CHUNK_SKIP_FILTERS", False),
-            )
-            logger.debug(
-                f"🧠 Chunk created: {new_chunk.id} for Document {document.id} | text preview: {new_chunk.text[:60]}"
+        glossary_score, matched = compute_glossary_score(text)
+        writer.add(
+            text,
+            i,
+            fingerprint,
+            is_glossary=is_glossary,
+            tags=["glossary"] if is_glossary else [],
+            anchor=anchor,
+            glossary_score=glossary_score,
+            matched_anchors=matched,
+            force_embed=force_all,
+        )
+    writer.flush()
+
+    if not total and document.summary:
+        fallback_text = document.summary
+        token_len = count_tokens(fallback_text)
+        if token_len < 5:
+            logger.warning(
+                "[Fallback] Skipping synthetic summary chunk due to token count %d",
+                token_len,
             )
-            logger.debug(f"🚀 Scheduling embedding for chunk {new_chunk.id}")
-            new_chunk.embedding_status = "pending"
-            new_chunk.save(update_fields=["embedding_status"])
-            logger.info(f"📦 Queuing chunk for embedding: {new_chunk.id}")
+        else:
             try:
-                embed_and_store.delay(
-                    str(new_chunk.id), session_id=str(document.session_id)
-                )
-                queued_chunks.append(new_chunk.id)
-            except Exception as e:
-                logger.warning(
-                    f"Failed to queue embedding task for chunk {new_chunk.id}: {e}"
+                writer.add(
+                    fallback_text,
+                    0,
+                    fingerprint_text(fallback_text),
+                    tokens=token_len,
+                    chunk_type="summary",
+                    force_embed=True,
                 )
-        except IntegrityError:
-            logger.warning(
-                f"🔁 Duplicate fingerprint {fingerprint} for chunk {i} on document {document.id}, skipping"
-            )
+                if writer.flush():
+                    total = 1
+                    logger.warning("[Fallback] Injected synthetic summary chunk.")
+            except Exception:
+                logger.exception("Failed to inject synthetic summary chunk")
 
-    if not queued_chunks and short_candidates:
+    if not writer.queued and short_candidates:
         logger.warning(
             "🟠 No long chunks queued; retrying with %d short candidates",
             len(short_candidates),
         )
         retry_attempts += 1
-        if progress:
-            progress.error_message = f"retry_attempts:{retry_attempts}"
-            progress.save(update_fields=["error_message"])
-        meta["chunk_retry_attempts"] = retry_attempts
-        document.metadata = meta
-        document.save(update_fields=["metadata"])
+        _record_retry(document, meta, progress, retry_attempts)
         for i, info in short_candidates:
-            try:
-                fingerprint = generate_chunk_fingerprint(info["text"])
-                glossary_score, matched = compute_glossary_score(info["text"], anchors)
-                new_chunk = DocumentChunk.objects.create(
-                    document=document,
-                    order=i,
-                    text=info["text"],
-                    tokens=count_tokens(info["text"]),
-                    chunk_type="body",
-                    fingerprint=fingerprint,
-                    glossary_score=glossary_score,
-                    matched_anchors=matched,
-                    force_embed=True,
-                )
-                new_chunk.embedding_status = "pending"
-                new_chunk.save(update_fields=["embedding_status"])
-                embed_and_store.delay(
-                    str(new_chunk.id), session_id=str(document.session_id)
-                )
-                queued_chunks.append(new_chunk.id)
-            except IntegrityError:
-                continue
+            glossary_score, matched = compute_glossary_score(info["text"])
+            writer.add(
+                info["text"],
+                i,
+                glossary_score=glossary_score,
+                matched_anchors=matched,
+                force_embed=True,
+            )
+        writer.flush()
 
-    skip_ratio = skipped / max(len(chunks), 1)
-    if not queued_chunks and skip_ratio >= 0.9:
+    skip_ratio = skipped / max(total, 1)
+    if not writer.queued and skip_ratio >= 0.9:
         logger.warning(
             "🚨 90%% of chunks skipped for %s; retrying with filters disabled",
             document.id,
         )
         retry_attempts += 1
-        if progress:
-            progress.error_message = f"retry_attempts:{retry_attempts}"
-            progress.save(update_fields=["error_message"])
-        meta["chunk_retry_attempts"] = retry_attempts
-        document.metadata = meta
-        document.save(update_fields=["metadata"])
-        for i, chunk in enumerate(chunks):
+        _record_retry(document, meta, progress, retry_attempts)
+        for i, chunk in retry_pool:
             text = chunk.strip()
             if not text:
                 continue
-            try:
-                fingerprint = generate_chunk_fingerprint(text)
-                glossary_score, matched = compute_glossary_score(text, anchors)
-                new_chunk = DocumentChunk.objects.create(
-                    document=document,
-                    order=i,
-                    text=text,
-                    tokens=count_tokens(text),
-                    chunk_type="body",
-                    fingerprint=fingerprint,
-                    glossary_score=glossary_score,
-                    matched_anchors=matched,
-                    force_embed=True,
-                )
-                new_chunk.embedding_status = "pending"
-                new_chunk.save(update_fields=["embedding_status"])
-                embed_and_store.delay(
-                    str(new_chunk.id), session_id=str(document.session_id)
-                )
-                queued_chunks.append(new_chunk.id)
-            except IntegrityError:
-                continue
+            glossary_score, matched = compute_glossary_score(text)
+            writer.add(
+                text,
+                i,
+                glossary_score=glossary_score,
+                matched_anchors=matched,
+                force_embed=True,
+            )
+        writer.flush()
+    retry_pool.clear()
 
-    if not queued_chunks:
+    if not writer.queued:
         logger.warning(
             "⚠️ No chunks queued — all appear to be already embedded or skipped"
         )
@@ -353,30 +457,21 @@ def _create_document_chunks(document: Document):
         if paragraphs:
             text = "\n\n".join(paragraphs)
             try:
-                fingerprint = generate_chunk_fingerprint(text)
-                new_chunk = DocumentChunk.objects.create(
-                    document=document,
-                    order=0,
-                    text=text,
-                    tokens=count_tokens(text),
+                token_len = count_tokens(text)
+                writer.add(
+                    text,
+                    0,
+                    tokens=token_len,
                     chunk_type="meta",
-                    fingerprint=fingerprint,
                     force_embed=True,
+                    embedding_status="pending" if token_len > 50 else "skipped",
                 )
-                token_len = new_chunk.tokens
+                writer.flush()
                 if token_len > 50:
-                    new_chunk.embedding_status = "pending"
-                    new_chunk.save(update_fields=["embedding_status"])
-                    embed_and_store.delay(
-                        str(new_chunk.id), session_id=str(document.session_id)
-                    )
-                    queued_chunks.append(new_chunk.id)
                     logger.warning(
                         "🧠 No valid chunks. Fallback meta-chunk created and embedded."
                     )
                 else:
-                    new_chunk.embedding_status = "skipped"
-                    new_chunk.save(update_fields=["embedding_status"])
                     logger.warning(
                         "[Fallback] Skipping meta-chunk due to token count %d",
                         token_len,
@@ -384,15 +479,20 @@ def _create_document_chunks(document: Document):
             except Exception:
                 logger.exception("Failed to create fallback meta-chunk")
 
+    queued_chunks = writer.queued
+
     # Update document metadata with chunk and token stats
     try:
-        token_total = sum(
-            c.tokens for c in DocumentChunk.objects.filter(document=document)
+        token_total = (
+            DocumentChunk.objects.filter(document=document).aggregate(
+                total=Sum("tokens")
+            )["total"]
+            or 0
         )
     except Exception:
         token_total = 0
     meta = document.metadata or {}
-    meta["chunk_count"] = len(chunks)
+    meta["chunk_count"] = total
     meta["embedded_chunks"] = DocumentChunk.objects.filter(
         document=document, embedding__isnull=False
     ).count()
@@ -410,42 +510,44 @@ def _create_document_chunks(document: Document):
         else:
             progress.error_message = f"retry_attempts:{retry_attempts}"
         progress.save(update_fields=["error_message"])
+    return queued_chunks
 
 
 def _embed_document_chunks(document: Document):
-    """Generate embeddings for chunks lacking vectors."""
-    unembedded = DocumentChunk.objects.filter(document=document, embedding__isnull=True)
-    for chunk in unembedded:
-        try:
-            vector = get_embedding_for_text(chunk.text)
-        except Exception as e:  # pragma: no cover - embedding errors
-            logger.warning(f"Failed to embed chunk {chunk.id}: {e}")
-            chunk.embedding_status = "failed"
-            chunk.save(update_fields=["embedding_status"])
-            continue
-
-        if vector is None or (hasattr(vector, "__len__") and len(vector) == 0):
-            continue
-        if hasattr(vector, "tolist"):
-            vector = vector.tolist()
-
-        meta = EmbeddingMetadata.objects.create(
-            model_used=EMBEDDING_MODEL,
-            num_tokens=chunk.tokens,
-            vector=vector,
-            status="completed",
-            source=document.source_type,
+    """Generate embeddings for chunks lacking vectors in token-bounded batches."""
+    unembedded = list(
+        DocumentChunk.objects.filter(document=document, embedding__isnull=True)
+    )
+    if not unembedded:
+        return
+    try:
+        vectors = get_embeddings_for_texts(
+            [chunk.text for chunk in unembedded],
+            token_counts=[chunk.tokens or 0 for chunk in unembedded],
         )
-        chunk.embedding = meta
-        chunk.embedding_status = "embedded"
-        chunk.save(update_fields=["embedding", "embedding_status"])
-        try:
-            save_embedding(chunk, vector)
-        except Exception as e:
-            logger.warning(f"Failed to register embedding for chunk {chunk.id}: {e}")
+    except Exception as e:  # pragma: no cover - embedding errors
+        logger.warning(f"Failed to embed {len(unembedded)} chunks: {e}")
+        for chunk in unembedded:
+            chunk.embedding_status = "failed"
+        DocumentChunk.objects.bulk_update(unembedded, ["embedding_status"])
+        return
 
+    pairs = [
+        (chunk, vector.tolist() if hasattr(vector, "tolist") else vector)
+        for chunk, vector in zip(unembedded, vectors)
+        if vector is not None and len(vector) > 0
+    ]
+    for chunk, _vector in pairs:
+        chunk.document = document
+    save_chunk_embeddings([c for c, _v in pairs], [v for _c, v in pairs])
 
-def save_document_to_db(content, metadata, session_id=None):
+
+def save_document_to_db(content, metadata, session_id=None, segments=None):
+    """Save ``content`` as a Document and chunk it.
+
+    ``segments`` (e.g. PDF pages joining to ``content``) are streamed into
+    the chunker instead of the full text.
+    """
     title = metadata.get("title", "Untitled")
     logger.info(f"📝 Attempting to save document: {title}")
     logger.info(f"🧐 Full Metadata: {metadata}")
@@ -456,7 +558,12 @@ def save_document_to_db(content, metadata, session_id=None):
             logger.error("❌ Document content is empty or too short")
             return None
 
-        embedding = get_embedding_for_text(content)
+        token_count = count_tokens(content)
+        # Whole books exceed the embedding model's input limit
+        if token_count > DOCUMENT_EMBED_MAX_TOKENS:
+            embedding = get_embedding_for_text(content[:5000])
+        else:
+            embedding = get_embedding_for_text(content)
         if not embedding:
             logger.warning("🔄 Retrying with content sample")
             sample_content = content[:5000]
@@ -555,9 +662,12 @@ def save_document_to_db(content, metadata, session_id=None):
                 f"✅ Saved embedding: {embedding_id} for document: {document.title}"
             )
 
-        from embeddings.tasks import embed_and_store
+        from embeddings.tasks import embed_chunks, queue_chunk_embeddings
 
-        _create_document_chunks(document)
+        queued_ids = {
+            str(cid)
+            for cid in _create_document_chunks(document, segments=segments) or []
+        }
         document.status = "processing"
         document.save(update_fields=["status"])
         chunks = list(DocumentChunk.objects.filter(document=document))
@@ -565,7 +675,7 @@ def save_document_to_db(content, metadata, session_id=None):
         logger.info("[Chunking] Generated %d chunks", chunk_count)
 
         if not document.token_count_int:
-            document.token_count_int = count_tokens(content)
+            document.token_count_int = token_count
         meta = document.metadata or {}
         meta["token_count"] = document.token_count_int
         meta["chunk_count"] = chunk_count
@@ -614,28 +724,24 @@ def save_document_to_db(content, metadata, session_id=None):
         document.metadata = meta
         document.save(update_fields=["metadata", "token_count_int"])
 
-        num_chunks_queued = 0
-        for chunk in chunks:
-            if not chunk.embedding_id or chunk.embedding_status != "embedded":
-                chunk.embedding_status = "pending"
-                chunk.save(update_fields=["embedding_status"])
-                if settings.FORCE_EMBED_SYNC:
-                    logger.info(
-                        f"⚠️ Celery disabled — embedding chunk {chunk.id} synchronously"
-                    )
-                    embed_and_store(
-                        text_or_id=str(chunk.id),
-                        model="text-embedding-3-small",
-                        session_id=str(document.session_id),
-                    )
-                else:
-                    embed_and_store.delay(
-                        text_or_id=str(chunk.id),
-                        model="text-embedding-3-small",
-                        session_id=str(document.session_id),
-                    )
-                logger.info(f"📦 Queued chunk {chunk.id} for embedding")
-                num_chunks_queued += 1
+        # Chunks created above were already queued in batches; pick up the rest
+        pending = [
+            chunk
+            for chunk in chunks
+            if (not chunk.embedding_id or chunk.embedding_status != "embedded")
+            and str(chunk.id) not in queued_ids
+        ]
+        for chunk in pending:
+            chunk.embedding_status = "pending"
+        DocumentChunk.objects.bulk_update(pending, ["embedding_status"])
+        if settings.FORCE_EMBED_SYNC:
+            logger.info(
+                f"⚠️ Celery disabled — embedding {len(pending)} chunks synchronously"
+            )
+            embed_chunks(pending, model="text-embedding-3-small")
+        else:
+            queue_chunk_embeddings([chunk.id for chunk in pending])
+        num_chunks_queued = len(pending) + len(queued_ids)
 
         logger.info(
             f"✅ Queued {num_chunks_queued} / {len(chunks)} chunks for embedding"
@@ -758,6 +864,31 @@ def process_pdfs(pdf, pdf_title, project_name, session_id):
         return None
 
 
+def process_pdf_document(pages, pdf_title, project_name, session_id, source_path):
+    """Save the cleaned ``pages`` of one PDF as a single Document."""
+    try:
+        metadata_dict = {
+            "title": pdf_title,
+            "project": project_name,
+            "source_type": "pdf",
+            "session_id": session_id,
+            "source_path": source_path,
+            "page_count": len(pages),
+        }
+        logger.info(f"📄 Processing PDF: {pdf_title} [{len(pages)} pages]")
+        document = save_document_to_db(
+            "".join(pages), metadata_dict, session_id, segments=pages
+        )
+        if document is None:
+            logger.error(f"❌ Failed to save PDF '{pdf_title}'")
+            return None
+        logger.info(f"✅ PDF processed and saved: {pdf_title}")
+        return document
+    except Exception as e:
+        logger.error(f"❌ Error processing PDF {pdf_title}: {str(e)}")
+        return None
+
+
 # Process URLs
 def process_urls(content, url_title, project_name, metadata, session_id):
     try:
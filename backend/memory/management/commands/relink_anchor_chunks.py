@@ -14,6 +14,11 @@ class Command(BaseCommand):
         parser.add_argument("--dry-run", action="store_true")
         parser.add_argument("--threshold", type=float, default=0.25)
         parser.add_argument("--purge-existing", action="store_true")
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Only relink anchors and chunks changed since the last run",
+        )
 
     def handle(self, *args, **options):
         assistant = None
@@ -29,6 +34,7 @@ class Command(BaseCommand):
             purge=options["purge_existing"],
             dry_run=options["dry_run"],
             stdout=self.stdout,
+            incremental=options["incremental"],
         )
         if options["dry_run"]:
             self.stdout.write(self.style.SUCCESS(f"Would create {count} links"))
@@ -573,6 +573,7 @@ class SymbolicMemoryAnchor(models.Model):
     stabilized_at = models.DateTimeField(null=True, blank=True)
     drift_priority_score = models.FloatField(default=0.0)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, null=True)
 
     class Meta:
         ordering = ["slug"]
@@ -111,6 +111,45 @@ class MemoryEntrySerializer(serializers.ModelSerializer):
             "negative_feedback_count",
         ]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Load the relations and counts used by this serializer up front."""
+        from django.db.models import Count, OuterRef, Prefetch, Subquery
+        from agents.models.core import Agent
+        from assistants.models.assistant import DelegationEvent
+
+        first_delegation = DelegationEvent.objects.filter(
+            triggering_memory=OuterRef("pk")
+        ).order_by("pk")
+        return (
+            queryset.select_related(
+                "assistant__parent_assistant",
+                "linked_thought__assistant",
+                "narrative_thread",
+                "anchor",
+                "source_user",
+            )
+            .prefetch_related(
+                "tags",
+                "simulated_forks",
+                Prefetch(
+                    "linked_agents",
+                    queryset=Agent.objects.select_related(
+                        "parent_assistant"
+                    ).prefetch_related("trained_documents"),
+                ),
+            )
+            .annotate(
+                delegation_event_id=Subquery(first_delegation.values("id")[:1]),
+                positive_feedback_total=Count(
+                    "feedback", filter=Q(feedback__rating="positive")
+                ),
+                negative_feedback_total=Count(
+                    "feedback", filter=Q(feedback__rating="negative")
+                ),
+            )
+        )
+
     def get_source_name(self, obj):
         return obj.source_name
 
@@ -169,10 +208,14 @@ class MemoryEntrySerializer(serializers.ModelSerializer):
 
     def get_positive_feedback_count(self, obj):
         """Return count of positive feedback items for this memory."""
+        if hasattr(obj, "positive_feedback_total"):
+            return obj.positive_feedback_total
         return obj.feedback.filter(rating="positive").count()
 
     def get_negative_feedback_count(self, obj):
         """Return count of negative feedback items for this memory."""
+        if hasattr(obj, "negative_feedback_total"):
+            return obj.negative_feedback_total
         return obj.feedback.filter(rating="negative").count()
 
 
@@ -1,8 +1,11 @@
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 from django.apps import apps
 
-from .models import MemoryEntry
+from embeddings.ann_index import ANN_INDEX_ENABLED, unindex_memory
+from .models import MemoryEntry, SymbolicMemoryAnchor
+from .utils.anchor_matcher import drop_anchor_matcher, invalidate_anchor_matcher
 from tasks import auto_tag_new_memory
 from intel_core.utils.glossary_tagging import retag_memory_glossary_terms
 
@@ -40,3 +43,29 @@ def auto_retag_on_update(sender, instance, created, update_fields=None, **kwargs
         return
     if instance.assistant and instance.assistant.reinforced_anchors.exists():
         retag_memory_glossary_terms(instance)
+
+
+@receiver(post_save, sender=SymbolicMemoryAnchor)
+@receiver(post_delete, sender=SymbolicMemoryAnchor)
+@receiver(m2m_changed, sender=SymbolicMemoryAnchor.tags.through)
+def rebuild_anchor_matcher(sender, **kwargs):
+    # The matcher only reads slug, label and tags; skip score-only saves
+    update_fields = kwargs.get("update_fields")
+    if update_fields and not {"slug", "label"} & set(update_fields):
+        return
+    if kwargs.get("action", "post_").startswith("post_"):
+        drop_anchor_matcher()
+        transaction.on_commit(invalidate_anchor_matcher)
+
+
+def drop_memory_from_ann_index(sender, instance, **kwargs):
+    unindex_memory(instance)
+
+
+# Connected only when enabled so memory deletes keep Django's fast path
+if ANN_INDEX_ENABLED:
+    post_delete.connect(
+        drop_memory_from_ann_index,
+        sender=MemoryEntry,
+        dispatch_uid="ann-index-memory-delete",
+    )
@@ -0,0 +1,62 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, TestCase
+
+from memory.models import SymbolicMemoryAnchor
+from memory.utils.anchor_matcher import (
+    GLOSSARY_KINDS,
+    SLUG,
+    AnchorMatcher,
+    get_anchor_matcher,
+)
+from mcp_core.models import Tag
+
+
+class AnchorMatcherTest(SimpleTestCase):
+    def setUp(self):
+        self.matcher = AnchorMatcher(
+            [
+                ("vector-db", "Vector Database"),
+                ("rag", "Retrieval"),
+                ("he", "He"),
+                ("hers", "Hers"),
+                ("embedding", "Embeddings"),
+            ],
+            tags=[("rag", "grounding", "Grounding")],
+        )
+
+    def test_overlapping_patterns_found_in_one_pass(self):
+        self.assertEqual(self.matcher.match("ushers", kinds=[SLUG]), ["he", "hers"])
+
+    def test_match_kinds(self):
+        found = self.matcher.find("How does our vector db handle grounding")
+        self.assertEqual(found, {"vector-db": "phrase", "rag": "tag"})
+        self.assertEqual(self.matcher.match("we embedded it"), ["embedding"])
+        self.assertEqual(self.matcher.find("vector databse")["vector-db"], "fuzzy")
+
+    def test_glossary_kinds_skip_raw_slugs_and_tags(self):
+        text = "our vector-db config and grounding"
+        self.assertEqual(self.matcher.match(text, kinds=GLOSSARY_KINDS), [])
+        self.assertEqual(self.matcher.match(text), ["rag", "vector-db"])
+
+
+class AnchorMatcherInvalidationTest(TestCase):
+    def test_anchor_changes_rebuild_matcher(self):
+        anchor = SymbolicMemoryAnchor.objects.create(slug="latency", label="Latency")
+        self.assertEqual(get_anchor_matcher().match("p99 latency"), ["latency"])
+
+        anchor.tags.add(Tag.objects.create(name="slo", slug="slo"))
+        self.assertEqual(get_anchor_matcher().match("our slo"), ["latency"])
+
+        anchor.delete()
+        self.assertEqual(get_anchor_matcher().match("p99 latency"), [])
+
+    def test_score_only_saves_keep_matcher(self):
+        anchor = SymbolicMemoryAnchor.objects.create(slug="uptime", label="Uptime")
+        with patch("memory.signals.drop_anchor_matcher") as drop:
+            anchor.avg_score = 0.7
+            anchor.save(update_fields=["avg_score"])
+            drop.assert_not_called()
+            anchor.label = "Availability"
+            anchor.save(update_fields=["label"])
+            drop.assert_called_once()
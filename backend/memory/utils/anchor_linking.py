@@ -1,64 +1,292 @@
+"""Link symbolic anchors to the document chunks that discuss them.
+
+:func:`relink_anchor_chunks` embeds every anchor label in batched API calls,
+streams chunk vectors in blocks and scores each block against all anchors
+with one matrix multiply, keeping a running top-``limit`` per anchor. Anchors
+with no embedding match fall back to chunks their RAG grounding logs used.
+Links are written as ``ChunkTag`` rows in bulk.
+
+With ``incremental=True`` only anchors and chunks changed since the previous
+run for the same scope are relinked. Changed anchors drop their links and
+are re-ranked against all chunks. Every other anchor is re-ranked against the
+changed chunks plus the chunks it already links to, so a better new chunk
+replaces its weakest link while each anchor keeps at most ``limit`` links.
+"""
+
 from __future__ import annotations
 
+import logging
 from collections import defaultdict
-from typing import Optional
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from embeddings.helpers.helpers_io import get_embedding_for_text
-from embeddings.vector_utils import compute_similarity
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils import timezone
+
+from embeddings.ann_index import document_scope, search_scopes
+from embeddings.helpers.helpers_io import get_embeddings_for_texts
 from intel_core.models import DocumentChunk, ChunkTag
 from memory.models import SymbolicMemoryAnchor, RAGGroundingLog
 
+logger = logging.getLogger(__name__)
 
-def _embedding_matches(
-    anchor: SymbolicMemoryAnchor, threshold: float = 0.25, limit: int = 5
-) -> list[DocumentChunk]:
+# Chunk vectors scored per matrix multiply
+RELINK_BLOCK_SIZE = getattr(settings, "ANCHOR_RELINK_BLOCK_SIZE", 4096)
+LAST_RUN_KEY = "memory:anchor_relink:last_run:{scope}"
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _embed_labels(anchors: List[SymbolicMemoryAnchor]) -> Dict[str, np.ndarray]:
+    """Return unit label vectors by slug, embedded in token-bounded batches."""
+    labels = [a.label or a.slug for a in anchors]
     try:
-        vec = get_embedding_for_text(anchor.label)
-    except Exception:
-        return []
-    if not vec:
-        return []
-
-    results: list[tuple[float, DocumentChunk]] = []
-    qs = DocumentChunk.objects.filter(embedding__isnull=False).select_related(
-        "embedding"
+        vectors = get_embeddings_for_texts(labels)
+    except Exception as exc:  # pragma: no cover - network
+        logger.warning("Anchor label embedding failed: %s", exc)
+        return {}
+    out = {}
+    for anchor, vec in zip(anchors, vectors):
+        if vec:
+            arr = np.asarray(vec, dtype=np.float32)
+            norm = np.linalg.norm(arr)
+            if norm > 0:
+                out[anchor.slug] = arr / norm
+    return out
+
+
+def _chunk_blocks(chunks, dim: int, block_size: int):
+    """Yield ``(chunk_ids, doc_ids, unit_matrix)`` blocks of embedded chunks."""
+    rows = chunks.filter(embedding__isnull=False).values_list(
+        "id", "document_id", "embedding__vector"
     )
-    if anchor.assistant_id:
-        doc_ids = anchor.assistant.documents.values_list("id", flat=True)
-        qs = qs.filter(document_id__in=list(doc_ids))
+    ids, docs, vecs = [], [], []
+    for chunk_id, doc_id, vec in rows.iterator(chunk_size=block_size):
+        if not vec or len(vec) != dim:
+            continue
+        ids.append(chunk_id)
+        docs.append(doc_id)
+        vecs.append(vec)
+        if len(ids) >= block_size:
+            yield ids, docs, _normalize_rows(np.asarray(vecs, dtype=np.float32))
+            ids, docs, vecs = [], [], []
+    if ids:
+        yield ids, docs, _normalize_rows(np.asarray(vecs, dtype=np.float32))
+
+
+def _indexed_matches(
+    vec: np.ndarray, doc_ids: set, chunks, threshold: float, limit: int
+) -> Optional[List[Tuple[float, object]]]:
+    """Top chunks of ``doc_ids`` from the warm ANN index, or ``None`` if cold."""
+    hits = search_scopes(
+        vec, [document_scope(d) for d in doc_ids], k=limit, min_score=threshold
+    )
+    if hits is None:
+        return None
+    present = {
+        str(pk): pk
+        for pk in chunks.filter(id__in=[cid for cid, _s in hits]).values_list(
+            "id", flat=True
+        )
+    }
+    return [(score, present[cid]) for cid, score in hits if cid in present]
+
 
-    for ch in qs.iterator():
-        if not ch.embedding:
+def _embedding_matches(
+    anchors: List[SymbolicMemoryAnchor],
+    chunks,
+    threshold: float,
+    limit: int,
+    block_size: int = RELINK_BLOCK_SIZE,
+) -> Dict[str, List[Tuple[float, object]]]:
+    """Return ``{slug: [(score, chunk_id), ...]}`` best first for ``anchors``.
+
+    Anchors owned by an assistant only match chunks of that assistant's
+    documents, served from the ANN index when those scopes are warm.
+    """
+    label_vecs = _embed_labels(anchors)
+    allowed_docs: Dict[object, set] = {}
+    for anchor in anchors:
+        if anchor.assistant_id and anchor.assistant_id not in allowed_docs:
+            allowed_docs[anchor.assistant_id] = set(
+                anchor.assistant.documents.values_list("id", flat=True)
+            )
+
+    results: Dict[str, List[Tuple[float, object]]] = {}
+    scored = []
+    for anchor in anchors:
+        if anchor.slug not in label_vecs:
             continue
-        score = compute_similarity(vec, ch.embedding.vector)
-        if score >= threshold:
-            results.append((score, ch))
+        hits = None
+        if anchor.assistant_id:
+            hits = _indexed_matches(
+                label_vecs[anchor.slug],
+                allowed_docs[anchor.assistant_id],
+                chunks,
+                threshold,
+                limit,
+            )
+        if hits is None:
+            scored.append(anchor)
+        elif hits:
+            results[anchor.slug] = hits
+    if not scored:
+        return results
+    anchor_matrix = np.stack([label_vecs[a.slug] for a in scored])
+    dim = anchor_matrix.shape[1]
 
-    results.sort(key=lambda x: x[0], reverse=True)
-    return [c for _s, c in results[:limit]]
+    best_scores = np.full((len(scored), limit), -np.inf, dtype=np.float32)
+    best_ids = np.full((len(scored), limit), None, dtype=object)
+    for chunk_ids, doc_ids, chunk_matrix in _chunk_blocks(chunks, dim, block_size):
+        scores = anchor_matrix @ chunk_matrix.T
+        masks = {
+            owner: np.fromiter((d in docs for d in doc_ids), bool, len(doc_ids))
+            for owner, docs in allowed_docs.items()
+        }
+        for row, anchor in enumerate(scored):
+            if anchor.assistant_id:
+                scores[row, ~masks[anchor.assistant_id]] = -np.inf
+        scores[scores < threshold] = -np.inf
+        # Merge this block's scores into the running top-``limit`` per anchor
+        merged_scores = np.concatenate([best_scores, scores], axis=1)
+        block_ids = np.tile(np.asarray(chunk_ids, dtype=object), (len(scored), 1))
+        merged_ids = np.concatenate([best_ids, block_ids], axis=1)
+        keep = np.argpartition(-merged_scores, limit - 1, axis=1)[:, :limit]
+        best_scores = np.take_along_axis(merged_scores, keep, axis=1)
+        best_ids = np.take_along_axis(merged_ids, keep, axis=1)
 
+    for row, anchor in enumerate(scored):
+        pairs = [
+            (float(s), cid)
+            for s, cid in zip(best_scores[row], best_ids[row])
+            if np.isfinite(s)
+        ]
+        if pairs:
+            results[anchor.slug] = sorted(pairs, key=lambda p: p[0], reverse=True)
+    return results
 
-def _log_matches(
-    anchor: SymbolicMemoryAnchor, threshold: float = 0.25, limit: int = 5
-) -> list[DocumentChunk]:
-    score_map: defaultdict[str, list[float]] = defaultdict(list)
-    logs = RAGGroundingLog.objects.filter(expected_anchor=anchor.slug)
-    for log in logs:
-        score = log.adjusted_score or log.corrected_score or log.retrieval_score or 0.0
-        for cid in log.used_chunk_ids:
-            score_map[cid].append(score)
 
+def _log_matches(
+    slugs: Iterable[str], chunks, threshold: float = 0.25, limit: int = 5
+) -> Dict[str, List[Tuple[float, object]]]:
+    """Return ``(avg_score, chunk_id)`` pairs from grounding logs for each slug."""
+    score_map: Dict[str, Dict[str, List[float]]] = defaultdict(
+        lambda: defaultdict(list)
+    )
+    logs = RAGGroundingLog.objects.filter(
+        expected_anchor__in=list(slugs)
+    ).values_list(
+        "expected_anchor",
+        "adjusted_score",
+        "corrected_score",
+        "retrieval_score",
+        "used_chunk_ids",
+    )
+    for slug, adjusted, corrected, retrieval, used in logs:
+        score = adjusted or corrected or retrieval or 0.0
+        for cid in used or []:
+            score_map[slug][str(cid)].append(score)
     if not score_map:
-        return []
+        return {}
+
+    all_ids = {cid for per_slug in score_map.values() for cid in per_slug}
+    existing = {
+        str(pk): pk
+        for pk in chunks.filter(id__in=all_ids).values_list("id", flat=True)
+    }
+    results = {}
+    for slug, per_chunk in score_map.items():
+        ranked = sorted(
+            (
+                (sum(scores) / len(scores), existing[cid])
+                for cid, scores in per_chunk.items()
+                if cid in existing
+            ),
+            key=lambda p: p[0],
+            reverse=True,
+        )
+        picked = [(avg, cid) for avg, cid in ranked if avg >= threshold][:limit]
+        if picked:
+            results[slug] = picked
+    return results
+
+
+def _write_links(
+    links: Dict[str, List[object]],
+    *,
+    purge: bool,
+    dry_run: bool,
+    replace: Iterable[str] = (),
+) -> int:
+    """Create missing ``ChunkTag`` rows for ``{slug: [chunk_id]}`` (best first).
+
+    Anchors in ``replace`` end up linked to exactly ``links[slug]``: their
+    other links are deleted. Returns the number of links created.
+    """
+    replace = set(replace)
+    wanted = [(cid, slug) for slug, ids in links.items() for cid in ids]
+    if not wanted and not replace:
+        return 0
+    chunk_ids = {cid for cid, _slug in wanted}
+    if purge and not dry_run:
+        for slug, ids in links.items():
+            ChunkTag.objects.filter(chunk_id__in=ids, name=slug).delete()
+        existing = set()
+    else:
+        existing = set(
+            ChunkTag.objects.filter(
+                chunk_id__in=chunk_ids, name__in=list(links)
+            ).values_list("chunk_id", "name")
+        )
+    if replace and not dry_run:
+        keep = {(slug, cid) for cid, slug in wanted}
+        stale = [
+            pk
+            for pk, cid, slug in ChunkTag.objects.filter(
+                name__in=list(replace)
+            ).values_list("id", "chunk_id", "name")
+            if (slug, cid) not in keep
+        ]
+        if stale:
+            ChunkTag.objects.filter(id__in=stale).delete()
+    missing = [pair for pair in wanted if pair not in existing]
+    if not dry_run and missing:
+        ChunkTag.objects.bulk_create(
+            [ChunkTag(chunk_id=cid, name=slug) for cid, slug in missing],
+            ignore_conflicts=True,
+        )
+    return len(missing)
 
-    chunk_qs = DocumentChunk.objects.filter(id__in=score_map.keys())
-    results: list[tuple[float, DocumentChunk]] = []
-    for ch in chunk_qs:
-        avg = sum(score_map[str(ch.id)]) / len(score_map[str(ch.id)])
-        if avg >= threshold:
-            results.append((avg, ch))
-    results.sort(key=lambda x: x[0], reverse=True)
-    return [c for _s, c in results[:limit]]
+
+def _top(pairs: Iterable[Tuple[float, object]], limit: int) -> List[object]:
+    """Chunk IDs of the ``limit`` best-scoring distinct pairs."""
+    best: Dict[object, float] = {}
+    for score, cid in pairs:
+        if score > best.get(cid, -np.inf):
+            best[cid] = score
+    return sorted(best, key=best.get, reverse=True)[:limit]
+
+
+def _match(anchors, chunks, threshold, limit, stdout, dry_run):
+    """Return ``{slug: [(score, chunk_id), ...]}`` for ``anchors``."""
+    links = _embedding_matches(anchors, chunks, threshold, limit)
+    unmatched = [a.slug for a in anchors if a.slug not in links]
+    if unmatched:
+        links.update(_log_matches(unmatched, chunks, threshold, limit))
+    if stdout:
+        for anchor in anchors:
+            if anchor.slug not in links:
+                stdout.write(f"⚠️ no chunks for {anchor.slug}")
+            elif dry_run:
+                stdout.write(f"{anchor.slug}: {len(links[anchor.slug])}")
+    return links
 
 
 def relink_anchor_chunks(
@@ -68,31 +296,66 @@ def relink_anchor_chunks(
     purge: bool = False,
     dry_run: bool = False,
     stdout=None,
+    incremental: bool = False,
+    since: Optional[datetime] = None,
+    limit: int = 5,
 ) -> int:
     """Reconnect anchors to chunks via ChunkTag entries.
 
-    Returns number of ChunkTag links created.
+    ``incremental`` relinks only anchors and chunks changed since ``since``
+    (default: the previous run for this scope). Returns number of ChunkTag
+    links created.
     """
-    anchors = SymbolicMemoryAnchor.objects.all()
+    started = timezone.now()
+    scope = str(assistant.id) if assistant else "all"
+    anchors = SymbolicMemoryAnchor.objects.select_related("assistant")
     if assistant:
         anchors = anchors.filter(assistant=assistant)
+    chunks = DocumentChunk.objects.all()
+    if assistant:
+        # Every anchor in scope belongs to the assistant and can only match
+        # chunks of its documents
+        chunks = chunks.filter(document__in=assistant.documents.values("id"))
 
-    created = 0
-    for anchor in anchors:
-        chunks = _embedding_matches(anchor, threshold)
-        if not chunks:
-            chunks = _log_matches(anchor, threshold)
-        if not chunks:
-            if stdout:
-                stdout.write(f"⚠️ no chunks for {anchor.slug}")
-            continue
-        if purge and not dry_run:
-            ChunkTag.objects.filter(chunk__in=chunks, name=anchor.slug).delete()
-        for ch in chunks:
-            if not ChunkTag.objects.filter(chunk=ch, name=anchor.slug).exists():
-                created += 1
-                if not dry_run:
-                    ChunkTag.objects.create(chunk=ch, name=anchor.slug)
-        if stdout and dry_run:
-            stdout.write(f"{anchor.slug}: {len(chunks)}")
+    if incremental and since is None:
+        since = cache.get(LAST_RUN_KEY.format(scope=scope))
+        if since is None:
+            logger.info("[Anchor Relink] no previous run for %s; full relink", scope)
+    if not incremental:
+        since = None
+
+    replace = set()
+    if since is None:
+        found = _match(list(anchors), chunks, threshold, limit, stdout, dry_run)
+        links = {slug: _top(pairs, limit) for slug, pairs in found.items()}
+    else:
+        # Relabeled or new anchors start over against every chunk
+        changed_anchors = list(
+            anchors.filter(Q(created_at__gte=since) | Q(updated_at__gte=since))
+        )
+        links = {}
+        if changed_anchors:
+            found = _match(changed_anchors, chunks, threshold, limit, stdout, dry_run)
+            links = {slug: _top(pairs, limit) for slug, pairs in found.items()}
+            replace = {a.slug for a in changed_anchors}
+        changed_chunks = chunks.filter(
+            Q(updated_at__gte=since) | Q(embedding__updated_at__gte=since)
+        )
+        others = [a for a in anchors if a.slug not in replace]
+        if others and changed_chunks.exists():
+            # Current links compete with the changed chunks for the top ``limit``
+            linked = ChunkTag.objects.filter(
+                name__in=[a.slug for a in others]
+            ).values("chunk_id")
+            candidates = chunks.filter(
+                Q(id__in=changed_chunks.values("id")) | Q(id__in=linked)
+            )
+            found = _match(others, candidates, threshold, limit, stdout, dry_run)
+            for slug, pairs in found.items():
+                links[slug] = _top(pairs, limit)
+                replace.add(slug)
+
+    created = _write_links(links, purge=purge, dry_run=dry_run, replace=replace)
+    if not dry_run:
+        cache.set(LAST_RUN_KEY.format(scope=scope), started, None)
     return created
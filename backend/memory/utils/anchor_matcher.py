@@ -0,0 +1,253 @@
+"""Single-pass detection of glossary anchors mentioned in a piece of text.
+
+Chat, RAG and glossary tagging all need to know which
+``SymbolicMemoryAnchor`` rows a query mentions. Testing every anchor against
+the text makes each turn linear in glossary size, so the anchors are compiled
+once per process into an :class:`AnchorMatcher`:
+
+- slugs, labels and hyphen-free slugs go into an Aho–Corasick automaton and
+  are found as substrings in one scan of the text
+- tag slugs/names and stemmed terms are looked up per query token
+- fuzzy matches only compare terms whose length could reach the ratio
+
+Anchor and anchor-tag changes drop this process's matcher at once and, on
+commit, bump a version in the shared cache so other workers rebuild on their
+next check (see ``memory.signals``). Matches are candidates: callers confirm
+them against the database, which also filters anchors deleted elsewhere
+since the last rebuild.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import re
+import threading
+import time
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from nltk.stem import PorterStemmer
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "memory:anchor_matcher:version"
+# Seconds between checks of the shared version key
+CHECK_INTERVAL = getattr(settings, "ANCHOR_MATCHER_CHECK_INTERVAL", 2.0)
+FUZZY_RATIO = 0.85
+
+# Match kinds, in the order a slug reports them
+SLUG = "slug"  # raw slug is a substring of the text
+LABEL = "label"  # label is a substring
+PHRASE = "phrase"  # slug with hyphens as spaces is a substring
+TAG = "tag"  # a tag slug or name equals a whitespace token
+STEM = "stem"  # stemmed slug phrase or label equals a stemmed word
+FUZZY = "fuzzy"  # whole text is within FUZZY_RATIO of a term
+ALL_KINDS = (SLUG, LABEL, PHRASE, TAG, STEM, FUZZY)
+# The checks ``glossary_tagging._match_anchor`` performs
+GLOSSARY_KINDS = (LABEL, PHRASE, STEM, FUZZY)
+
+_stemmer = PorterStemmer()
+_WORD_RE = re.compile(r"[a-zA-Z0-9']+")
+
+
+class _Automaton:
+    """Aho–Corasick automaton over lowercase patterns."""
+
+    def __init__(self, patterns: Iterable[Tuple[str, object]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[object]] = [[]]
+        for pattern, value in patterns:
+            if pattern:
+                self._add(pattern, value)
+        self._link()
+
+    def _add(self, pattern: str, value) -> None:
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(value)
+
+    def _link(self) -> None:
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                # Inherit outputs of the longest proper suffix
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def search(self, text: str) -> Set[object]:
+        """Return the values of every pattern occurring in ``text``."""
+        found: Set[object] = set()
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
+class AnchorMatcher:
+    """All anchors compiled for single-pass matching."""
+
+    def __init__(self, anchors: Iterable[Tuple[str, str]], tags=(), version=0):
+        self.version = version
+        self.slugs: Set[str] = set()
+        substrings = []
+        self._stems: Dict[str, Set[str]] = defaultdict(set)
+        fuzzy: List[Tuple[int, str, str]] = []
+        for slug, label in anchors:
+            self.slugs.add(slug)
+            phrase = slug.replace("-", " ")
+            substrings.append((slug.lower(), (slug, SLUG)))
+            for kind, term in ((PHRASE, phrase), (LABEL, label)):
+                term = (term or "").lower()
+                if not term:
+                    continue
+                substrings.append((term, (slug, kind)))
+                stem = _stemmer.stem(term)
+                self._stems[stem].add(slug)
+                self._stems[stem.rstrip("s")].add(slug)
+                fuzzy.append((len(term), term, slug))
+        self._automaton = _Automaton(substrings)
+        fuzzy.sort()
+        self._fuzzy = fuzzy
+        self._fuzzy_lengths = [length for length, _t, _s in fuzzy]
+        self._tags: Dict[str, Set[str]] = defaultdict(set)
+        for slug, tag_slug, tag_name in tags:
+            for value in (tag_slug, tag_name):
+                if value:
+                    self._tags[value].add(slug)
+
+    @classmethod
+    def from_db(cls, version=0) -> "AnchorMatcher":
+        from memory.models import SymbolicMemoryAnchor
+
+        anchors = SymbolicMemoryAnchor.objects.values_list("slug", "label")
+        tags = SymbolicMemoryAnchor.tags.through.objects.values_list(
+            "symbolicmemoryanchor__slug", "tag__slug", "tag__name"
+        )
+        return cls(anchors, tags, version=version)
+
+    def find(self, text: str, kinds: Iterable[str] = ALL_KINDS) -> Dict[str, str]:
+        """Return ``{slug: kind}`` for anchors ``text`` mentions.
+
+        Only the requested ``kinds`` are checked; each slug reports the first
+        kind that matched in :data:`ALL_KINDS` order.
+        """
+        if not text:
+            return {}
+        kinds = set(kinds)
+        hits: Dict[str, Set[str]] = defaultdict(set)
+        q = text.lower()
+
+        for slug, kind in self._automaton.search(q):
+            if kind in kinds:
+                hits[slug].add(kind)
+        if TAG in kinds:
+            for token in q.split():
+                for slug in self._tags.get(token, ()):
+                    hits[slug].add(TAG)
+        if STEM in kinds:
+            for word in set(_WORD_RE.findall(q)):
+                for slug in self._stems.get(_stemmer.stem(word), ()):
+                    hits[slug].add(STEM)
+        if FUZZY in kinds:
+            for slug in self._fuzzy_matches(q):
+                hits[slug].add(FUZZY)
+
+        return {
+            slug: next(k for k in ALL_KINDS if k in found)
+            for slug, found in hits.items()
+        }
+
+    def match(self, text: str, kinds: Iterable[str] = ALL_KINDS) -> List[str]:
+        """Return the matching slugs sorted like ``SymbolicMemoryAnchor``."""
+        return sorted(self.find(text, kinds))
+
+    def _fuzzy_matches(self, q: str) -> Set[str]:
+        # ratio = 2 * matches / (len(a) + len(b)) can only reach FUZZY_RATIO
+        # when the shorter string is long enough relative to the longer one
+        size = len(q)
+        lo = bisect.bisect_left(self._fuzzy_lengths, size * FUZZY_RATIO / 1.15)
+        hi = bisect.bisect_right(self._fuzzy_lengths, size * 1.15 / FUZZY_RATIO)
+        found = set()
+        for _len, term, slug in self._fuzzy[lo:hi]:
+            if slug in found:
+                continue
+            if SequenceMatcher(None, term, q).ratio() >= FUZZY_RATIO:
+                found.add(slug)
+        return found
+
+
+_matcher: Optional[AnchorMatcher] = None
+_lock = threading.Lock()
+_checked_at = 0.0
+
+
+def _shared_version() -> int:
+    try:
+        return cache.get(VERSION_KEY) or 0
+    except Exception:
+        logger.debug("anchor matcher version unavailable", exc_info=True)
+        return 0
+
+
+def get_anchor_matcher() -> AnchorMatcher:
+    """Return this process's matcher, rebuilding it when anchors changed."""
+    global _matcher, _checked_at
+    matcher = _matcher
+    now = time.monotonic()
+    if matcher is not None and now - _checked_at < CHECK_INTERVAL:
+        return matcher
+    version = _shared_version()
+    _checked_at = now
+    if matcher is not None and matcher.version == version:
+        return matcher
+    with _lock:
+        if _matcher is None or _matcher.version != version:
+            _matcher = AnchorMatcher.from_db(version=version)
+            logger.debug(
+                "[Anchor Matcher] compiled %d anchors (v%s)",
+                len(_matcher.slugs),
+                version,
+            )
+        return _matcher
+
+
+def drop_anchor_matcher() -> None:
+    """Rebuild this process's matcher on next use."""
+    global _matcher
+    _matcher = None
+
+
+def invalidate_anchor_matcher() -> None:
+    """Drop the compiled matcher here and tell other processes to rebuild."""
+    drop_anchor_matcher()
+    try:
+        if not cache.add(VERSION_KEY, 1, None):
+            cache.incr(VERSION_KEY)
+    except Exception:
+        logger.debug("anchor matcher version bump failed", exc_info=True)
@@ -11,6 +11,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status, viewsets
 from rest_framework.pagination import PageNumberPagination
+from api.pagination import keyset_list_response
 from django.core.cache import cache
 import uuid
 import warnings
@@ -495,7 +496,7 @@ def list_memories(request):
         resp = Response({"detail": "rate limit"}, status=429)
         resp["X-Rate-Limited"] = "true"
         return resp
-    queryset = MemoryEntry.objects.all().order_by("-created_at")
+    queryset = MemoryEntry.objects.all()
 
     # Optional filters
     assistant_slug = request.GET.get("assistant_slug")
@@ -530,8 +531,7 @@ def list_memories(request):
     if campaign_id:
         queryset = queryset.filter(related_campaign_id=campaign_id)
 
-    serializer = MemoryEntrySerializer(queryset, many=True)
-    return Response(serializer.data)
+    return keyset_list_response(request, queryset, MemoryEntrySerializer)
 
 
 @api_view(["POST"])
@@ -59,7 +59,7 @@ class ProjectSerializer(serializers.ModelSerializer):
 
     def get_team(self, obj):
         from assistants.serializers import AssistantSerializer
-        return AssistantSerializer(obj.team.all(), many=True).data
+        return AssistantSerializer(obj.team.select_related("metrics"), many=True).data
 
 
 class ProjectTaskSerializer(serializers.ModelSerializer):
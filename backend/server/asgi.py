@@ -2,6 +2,8 @@
 ASGI config for server project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+This is the app served in production (``uvicorn server.asgi:application``) so
+streaming responses such as the SSE chat endpoint are not buffered.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
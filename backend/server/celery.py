@@ -43,6 +43,15 @@ def log_worker_ready(**_):
     )
 
 
+# Persist in-process ANN index updates; prefork children skip atexit.
+@signals.task_postrun.connect
+@signals.worker_process_shutdown.connect
+def flush_ann_index(**_):
+    from embeddings.ann_index import flush_index
+
+    flush_index()
+
+
 # Configure beat schedule
 app.conf.beat_schedule = {
     "cleanup-expired-contexts": {
@@ -61,6 +70,11 @@ app.conf.beat_schedule = {
         "task": "embeddings.embedding_tasks.run_daily_embedding_repair",
         "schedule": crontab(minute=0, hour=3),
     },
+    "refresh-assistant-metrics": {
+        "task": "assistants.tasks.refresh_all_assistant_metrics",
+        "schedule": crontab(minute="*/30"),
+        "options": {"expires": 1800},
+    },
 }
 
 # Configure task routing
@@ -139,6 +139,8 @@ CRISPY_TEMPLATE_PACK = "bootstrap4"
 
 ROOT_URLCONF = "server.urls"
 WSGI_APPLICATION = "server.wsgi.application"
+# Served by uvicorn so chat replies can stream over SSE
+ASGI_APPLICATION = "server.asgi.application"
 
 # === 🗃️ Database ===
 DATABASES = {
@@ -168,6 +170,16 @@ SESSION_ENGINE = "django.contrib.sessions.backends.cache"
 SESSION_CACHE_ALIAS = "default"
 SESSION_COOKIE_AGE = 3600
 SESSION_SAVE_EVERY_REQUEST = True
+# Chat sessions in Redis: recent messages sent to the LLM verbatim, and how
+# many older ones accumulate before they are folded into the rolling summary
+CHAT_SESSION_WINDOW = int(os.getenv("CHAT_SESSION_WINDOW", "40"))
+CHAT_SESSION_SUMMARY_STEP = int(os.getenv("CHAT_SESSION_SUMMARY_STEP", "20"))
+CHAT_SESSION_SUMMARY_MAX_CHARS = int(
+    os.getenv("CHAT_SESSION_SUMMARY_MAX_CHARS", "4000")
+)
+# Most recent messages returned with each chat response (full_history=true
+# returns the whole transcript)
+CHAT_RESPONSE_MESSAGES = int(os.getenv("CHAT_RESPONSE_MESSAGES", "100"))
 
 # === 🔑 Authentication ===
 AUTH_USER_MODEL = "accounts.CustomUser"
@@ -306,6 +318,14 @@ CELERY_BEAT_SCHEDULE = {
 STATIC_URL = "/static/"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
+# Content-addressed cache of generated TTS audio and images, LRU-evicted
+# once it holds more than ARTIFACT_CACHE_MAX_BYTES (0 disables caching)
+ARTIFACT_CACHE_DIR = Path(
+    os.getenv("ARTIFACT_CACHE_DIR", str(BASE_DIR / "artifact_cache"))
+)
+ARTIFACT_CACHE_MAX_BYTES = int(
+    os.getenv("ARTIFACT_CACHE_MAX_BYTES", str(2 * 1024**3))
+)
 
 # === 🧾 API Docs ===
 SPECTACULAR_SETTINGS = {
@@ -459,6 +479,90 @@ FORCE_EMBED_SYNC = os.getenv("FORCE_EMBED_SYNC", "False") == "True"
 DISABLE_CHUNK_SKIP_FILTERS = os.getenv("DISABLE_CHUNK_SKIP_FILTERS", "False") == "True"
 # Minimum score for embedding a chunk
 CHUNK_EMBED_SCORE_THRESHOLD = float(os.getenv("CHUNK_EMBED_SCORE_THRESHOLD", "0.3"))
+# New document chunks inserted per query during ingestion
+CHUNK_WRITE_BATCH_SIZE = int(os.getenv("CHUNK_WRITE_BATCH_SIZE", "200"))
+# Ingest each PDF as one Document (False: one Document per 1,000-char split)
+# with pages extracted by parallel Celery tasks of PDF_PAGES_PER_TASK pages each
+PDF_SINGLE_DOCUMENT = os.getenv("PDF_SINGLE_DOCUMENT", "True") == "True"
+PDF_PAGES_PER_TASK = int(os.getenv("PDF_PAGES_PER_TASK", "8"))
+# Longest text per TTS provider call; stories are synthesized and streamed
+# segment by segment
+TTS_SEGMENT_CHARS = int(os.getenv("TTS_SEGMENT_CHARS", "600"))
+# Ingestion tasks allowed to fetch from one host at a time (0 = unlimited)
+# and seconds a task waits before retrying for a free slot
+INGEST_DOMAIN_CONCURRENCY = int(os.getenv("INGEST_DOMAIN_CONCURRENCY", "4"))
+INGEST_DOMAIN_RETRY_DELAY = int(os.getenv("INGEST_DOMAIN_RETRY_DELAY", "2"))
+# Max SimHash bit distance for a chunk to reuse a near-duplicate's vector
+# (at most 3 so a shared LSH band is guaranteed; -1 disables reuse)
+NEAR_DUPLICATE_MAX_DISTANCE = int(os.getenv("NEAR_DUPLICATE_MAX_DISTANCE", "3"))
+
+# Number of nearest chunks ranked in Postgres before RAG heuristics run
+RAG_CANDIDATE_LIMIT = int(os.getenv("RAG_CANDIDATE_LIMIT", "200"))
+# Draw RAG candidates from the half-precision chunk vector index and re-score
+# RAG_RESCORE_FACTOR x RAG_CANDIDATE_LIMIT of them at full precision
+RAG_QUANTIZED_SEARCH = os.getenv("RAG_QUANTIZED_SEARCH", "False") == "True"
+RAG_RESCORE_FACTOR = int(os.getenv("RAG_RESCORE_FACTOR", "4"))
+
+# Memory summoning: recency window in days (0 = all history) and the HNSW
+# candidate list size used by the pgvector top-K query
+MEMORY_SUMMON_WINDOW_DAYS = int(os.getenv("MEMORY_SUMMON_WINDOW_DAYS", "0"))
+MEMORY_SUMMON_EF_SEARCH = int(os.getenv("MEMORY_SUMMON_EF_SEARCH", "100"))
+
+# Seconds between checks for anchor changes made by other processes before
+# the compiled anchor matcher is reused
+ANCHOR_MATCHER_CHECK_INTERVAL = float(
+    os.getenv("ANCHOR_MATCHER_CHECK_INTERVAL", "2.0")
+)
+
+# Async LLM router: max in-flight requests per provider and pooled connections
+LLM_PROVIDER_CONCURRENCY = {
+    "openai": int(os.getenv("LLM_OPENAI_CONCURRENCY", "16")),
+    "openrouter": int(os.getenv("LLM_OPENROUTER_CONCURRENCY", "8")),
+    "ollama": int(os.getenv("LLM_OLLAMA_CONCURRENCY", "4")),
+}
+LLM_POOL_SIZE = int(os.getenv("LLM_POOL_SIZE", "32"))
+LLM_HTTP_TIMEOUT = float(os.getenv("LLM_HTTP_TIMEOUT", "120"))
+# Prompt each council member through the LLM (one paid call per member per
+# round) instead of logging placeholder thoughts
+COUNCIL_LLM_THOUGHTS = os.getenv("COUNCIL_LLM_THOUGHTS", "False") == "True"
+
+# Shared cache for single-text embeddings (process LRU + Redis)
+QUERY_EMBEDDING_CACHE_ENABLED = (
+    os.getenv("QUERY_EMBEDDING_CACHE_ENABLED", "True") == "True"
+)
+QUERY_EMBEDDING_CACHE_SIZE = int(os.getenv("QUERY_EMBEDDING_CACHE_SIZE", "2048"))
+QUERY_EMBEDDING_CACHE_TTL = int(os.getenv("QUERY_EMBEDDING_CACHE_TTL", "86400"))
+
+# Coalesce concurrent single-text embedding requests into one call: up to
+# MAX_SIZE texts, waiting at most MAX_WAIT seconds for more to arrive. With the
+# default of 0 a lone request is sent at once; requests that arrive while a call
+# is in flight still form the next batch
+EMBEDDING_MICROBATCH_ENABLED = (
+    os.getenv("EMBEDDING_MICROBATCH_ENABLED", "True") == "True"
+)
+EMBEDDING_MICROBATCH_MAX_SIZE = int(os.getenv("EMBEDDING_MICROBATCH_MAX_SIZE", "64"))
+EMBEDDING_MICROBATCH_MAX_WAIT = float(
+    os.getenv("EMBEDDING_MICROBATCH_MAX_WAIT", "0")
+)
+
+# Re-order strong RAG matches with Maximum Marginal Relevance (1.0 = relevance only)
+RAG_MMR_ENABLED = os.getenv("RAG_MMR_ENABLED", "False") == "True"
+RAG_MMR_LAMBDA = float(os.getenv("RAG_MMR_LAMBDA", "0.7"))
+
+# Process-local vector index for chunk and memory retrieval
+ANN_INDEX_ENABLED = os.getenv("ANN_INDEX_ENABLED", "False") == "True"
+ANN_INDEX_DIR = Path(os.getenv("ANN_INDEX_DIR", BASE_DIR / "data" / "ann_index"))
+
+# Materialized assistant metrics: max snapshot age before an inline refresh,
+# and the window used to coalesce signal-triggered refreshes (seconds)
+ASSISTANT_METRICS_MAX_AGE = int(os.getenv("ASSISTANT_METRICS_MAX_AGE", "3600"))
+ASSISTANT_METRICS_DEBOUNCE = int(os.getenv("ASSISTANT_METRICS_DEBOUNCE", "30"))
+
+# Write-behind buffer for chat telemetry rows (see utils.telemetry)
+TELEMETRY_BUFFER_ENABLED = os.getenv("TELEMETRY_BUFFER_ENABLED", "False") == "True"
+TELEMETRY_BUFFER_SIZE = int(os.getenv("TELEMETRY_BUFFER_SIZE", "10000"))
+TELEMETRY_BATCH_SIZE = int(os.getenv("TELEMETRY_BATCH_SIZE", "500"))
+TELEMETRY_FLUSH_INTERVAL = float(os.getenv("TELEMETRY_FLUSH_INTERVAL", "0.5"))
 
 # Score below which glossary anchors are considered weak
 GLOSSARY_WEAK_THRESHOLD = float(os.getenv("GLOSSARY_WEAK_THRESHOLD", "0.2"))
@@ -36,6 +36,7 @@ from devtools.views import (
     repair_context_embeddings,
     ignore_context_embeddings,
     embedding_drift_log,
+    artifact_cache_stats,
     cli_command_list,
     run_cli_command,
     cli_command_summary,
@@ -149,6 +150,7 @@ urlpatterns = [
     ),
     path("api/dev/embedding-audit/repair-low-score/", repair_low_score_embeddings),
     path("api/dev/embedding-drift-log/", embedding_drift_log),
+    path("api/dev/artifact-cache/", artifact_cache_stats),
     path("api/dev/cli/list/", cli_command_list),
     path("api/dev/cli/run/", run_cli_command),
     path("api/dev/cli/commands/", cli_command_summary),
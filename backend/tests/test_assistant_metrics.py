@@ -0,0 +1,58 @@
+import pytest
+pytest.importorskip("django")
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.utils import timezone
+
+from assistants.models import Assistant, AssistantMetrics
+from assistants.models.reflection import AssistantReflectionLog
+from assistants.serializers import AssistantOverviewSerializer, AssistantSerializer
+from assistants.utils.assistant_metrics import refresh_assistant_metrics
+
+
+@pytest.mark.django_db
+def test_serializers_read_materialized_metrics():
+    a = Assistant.objects.create(name="M", skill_badges=["one"])
+    refresh_assistant_metrics(a)
+    AssistantMetrics.objects.filter(assistant=a).update(
+        trust_score=42, health_score=0.5, memory_count=7
+    )
+
+    a = Assistant.objects.select_related("metrics").get(id=a.id)
+    data = AssistantSerializer(a).data
+    assert data["health_score"] == 0.5
+    overview = AssistantOverviewSerializer(a).data
+    assert overview["trust_score"] == 42
+    assert overview["memory_count"] == 7
+    assert overview["earned_badge_count"] == 1
+
+
+@pytest.mark.django_db
+def test_stale_snapshot_is_recomputed():
+    a = Assistant.objects.create(name="S")
+    AssistantReflectionLog.objects.create(assistant=a, title="r", summary="s")
+    AssistantMetrics.objects.create(
+        assistant=a,
+        reflections_last_7d=0,
+        refreshed_at=timezone.now() - timedelta(days=1),
+    )
+
+    a = Assistant.objects.select_related("metrics").get(id=a.id)
+    assert AssistantOverviewSerializer(a).data["reflections_last_7d"] == 1
+
+
+@pytest.mark.django_db
+def test_log_rows_schedule_refresh(django_capture_on_commit_callbacks):
+    a = Assistant.objects.create(name="Q")
+    with patch(
+        "assistants.tasks.refresh_assistant_metrics_task.apply_async"
+    ) as mock_async, patch(
+        "assistants.utils.assistant_metrics.cache.add", return_value=True
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            AssistantReflectionLog.objects.create(assistant=a, title="r", summary="s")
+
+    queued = [c.args[0] for c in mock_async.call_args_list]
+    assert (str(a.id),) in queued
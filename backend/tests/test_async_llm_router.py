@@ -0,0 +1,90 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("django")
+
+from utils import async_llm_router
+
+
+class _StubLLMHandler(BaseHTTPRequestHandler):
+    """Emulates OpenAI ``/chat/completions`` and Ollama ``/api/chat``."""
+
+    delay = 0.2
+    # Set by a test to require that many requests to be in flight at once
+    barrier = None
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        prompt = body["messages"][-1]["content"]
+        if self.barrier is not None:
+            self.barrier.wait()
+        time.sleep(self.delay)
+        if self.path == "/api/chat":
+            data = {"message": {"role": "assistant", "content": f"ollama:{prompt}"}}
+        else:
+            data = {"choices": [{"message": {"content": f" openai:{prompt} "}}]}
+        payload = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubLLMHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    monkeypatch.setenv("OPENAI_BASE_URL", url)
+    monkeypatch.setenv("OLLAMA_BASE_URL", url)
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    yield url
+    server.shutdown()
+    _StubLLMHandler.barrier = None
+    # Pooled clients keep this server's base URL; drop them between tests
+    asyncio.run_coroutine_threadsafe(
+        async_llm_router.aclose_clients(), async_llm_router._background_loop()
+    ).result()
+
+
+def test_gather_llm_runs_calls_concurrently(stub_server):
+    calls = [[{"role": "user", "content": f"q{i}"}] for i in range(5)]
+    calls.append(
+        {"messages": [{"role": "user", "content": "local"}], "model": "ollama:llama3"}
+    )
+
+    # Every request blocks until all six are in flight; serial calls would
+    # break the barrier
+    _StubLLMHandler.barrier = threading.Barrier(len(calls), timeout=5)
+    replies = async_llm_router.gather_llm(calls)
+
+    assert replies == [f"openai:q{i}" for i in range(5)] + ["ollama:local"]
+
+
+def test_gather_llm_reuses_pooled_clients(stub_server):
+    call = [[{"role": "user", "content": "x"}]]
+    async_llm_router.gather_llm(call)
+    pool = async_llm_router._pools[async_llm_router._background_loop()]
+    client = pool.clients["openai"]
+    async_llm_router.gather_llm(call)
+
+    assert pool.clients["openai"] is client
+    assert not client.is_closed
+
+
+def test_gather_llm_returns_exceptions(stub_server, monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY")
+    replies = async_llm_router.gather_llm(
+        [[{"role": "user", "content": "x"}]], return_exceptions=True
+    )
+    assert isinstance(replies[0], ValueError)
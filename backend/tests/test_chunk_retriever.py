@@ -34,3 +34,29 @@ def test_basic_chunk_retrieval(mock_sim, mock_embed, db):
     chunks, *_ = get_relevant_chunks(str(assistant.id), "help me reflect")
     assert chunks
     assert chunks[0]["document_id"] == str(doc.id)
+
+
+@patch("assistants.utils.chunk_retriever.get_embedding_for_text")
+@patch("assistants.utils.chunk_retriever.compute_similarity")
+@patch("intel_core.utils.chunk_retriever.fetch_top_chunks")
+def test_chunk_retrieval_uses_db_similarity(mock_top, mock_sim, mock_embed, db):
+    assistant = Assistant.objects.create(name="Ranked", slug="ranked")
+    doc = Document.objects.create(title="Ranked Guide", content="text")
+    assistant.documents.add(doc)
+    chunk = DocumentChunk.objects.create(
+        document=doc,
+        order=1,
+        text="Ranked by pgvector before heuristics run",
+        tokens=6,
+        fingerprint="ranked-f1",
+        embedding_status="embedded",
+    )
+    chunk.similarity = 0.9
+    mock_top.return_value = [chunk]
+    mock_embed.return_value = [0.1]
+
+    chunks, *_ = get_relevant_chunks(str(assistant.id), "pgvector ranking")
+
+    assert chunks and chunks[0]["chunk_id"] == str(chunk.id)
+    mock_sim.assert_not_called()
+    assert mock_top.call_args.kwargs["limit"] > 0
@@ -6,7 +6,7 @@ from intel_core.utils import processing
 
 pytest.importorskip("django")
 
-@patch("intel_core.utils.processing.embed_and_store.delay")
+@patch("embeddings.tasks.embed_chunk_batch.delay")
 @patch("intel_core.utils.processing.generate_chunk_fingerprint", return_value="fp")
 @patch("intel_core.utils.processing.clean_and_score_chunk", side_effect=lambda t, chunk_index=None: {"text": t, "score": 1.0, "keep": True})
 @patch("intel_core.utils.processing.generate_chunks", return_value=["body text"])
@@ -0,0 +1,105 @@
+import json
+from unittest.mock import patch
+
+import pytest
+pytest.importorskip("django")
+
+from asgiref.sync import async_to_sync
+
+from rest_framework.test import APIRequestFactory
+from rest_framework.request import Request
+
+from agents.models.lore import LoreEntry
+from agents.serializers import LoreEntrySerializer
+from api import pagination
+from api.pagination import decode_cursor, iter_keyset, keyset_list_response, keyset_page
+
+
+def _entries(n):
+    return [
+        LoreEntry.objects.create(title=f"t{i}", summary="s") for i in range(n)
+    ]
+
+
+def _request(params):
+    return Request(APIRequestFactory().get("/lore/", params))
+
+
+@async_to_sync
+async def _consume(response):
+    return b"".join([chunk async for chunk in response.streaming_content])
+
+
+def test_keyset_pages_cover_every_row_once(db):
+    created = _entries(7)
+    seen, cursor = [], None
+    while True:
+        rows, next_cursor = keyset_page(LoreEntry.objects.all(), cursor=cursor, limit=3)
+        seen.extend(r.pk for r in rows)
+        if next_cursor is None:
+            break
+        cursor = decode_cursor(next_cursor)
+    assert sorted(seen) == sorted(e.pk for e in created)
+    assert len(seen) == len(set(seen))
+    assert sum(len(b) for b in iter_keyset(LoreEntry.objects.all(), batch_size=2)) == 7
+
+
+def test_list_response_modes(db):
+    _entries(5)
+    qs = LoreEntry.objects.all()
+
+    page = keyset_list_response(_request({"limit": 2}), qs, LoreEntrySerializer)
+    assert len(page.data["results"]) == 2
+    assert page.data["has_more"] is True
+
+    rest = keyset_list_response(
+        _request({"cursor": page.data["next_cursor"], "limit": 10}),
+        qs,
+        LoreEntrySerializer,
+    )
+    assert len(rest.data["results"]) == 3
+    assert rest.data["next_cursor"] is None
+
+    streamed = keyset_list_response(_request({"stream": "1"}), qs, LoreEntrySerializer)
+    assert streamed.is_async
+    body = json.loads(_consume(streamed))
+    assert [e["title"] for e in body] == ["t4", "t3", "t2", "t1", "t0"]
+
+    legacy = keyset_list_response(_request({}), qs, LoreEntrySerializer)
+    assert len(legacy.data) == 5
+    assert not legacy.has_header("X-Next-Cursor")
+
+
+def test_plain_list_is_capped(db):
+    _entries(5)
+    with patch.object(pagination, "LEGACY_MAX_ROWS", 3):
+        legacy = keyset_list_response(
+            _request({}), LoreEntry.objects.all(), LoreEntrySerializer
+        )
+    assert [e["title"] for e in legacy.data] == ["t4", "t3", "t2"]
+    rest = keyset_list_response(
+        _request({"cursor": legacy["X-Next-Cursor"]}),
+        LoreEntry.objects.all(),
+        LoreEntrySerializer,
+    )
+    assert [e["title"] for e in rest.data["results"]] == ["t1", "t0"]
+
+
+def test_stream_reads_one_batch_per_chunk(db):
+    _entries(5)
+    with patch.object(
+        pagination, "keyset_page", wraps=pagination.keyset_page
+    ) as page:
+        streamed = pagination.stream_json_list(
+            LoreEntry.objects.all(), LoreEntrySerializer, batch_size=2
+        )
+
+        async def first_chunks():
+            chunks = streamed.streaming_content
+            return [await chunks.__anext__(), await chunks.__anext__()]
+
+        opening, first_batch = async_to_sync(first_chunks)()
+    assert opening == b"["
+    assert len(json.loads(f"[{first_batch.decode()}]")) == 2
+    # Only the first batch had been read when it was sent
+    assert page.call_count == 1
@@ -0,0 +1,51 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("django")
+
+from utils import llm_router
+
+
+def _openai_event(content):
+    delta = SimpleNamespace(content=content)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+@patch("utils.llm_router.client")
+def test_stream_openai_yields_deltas(mock_client):
+    mock_client.chat.completions.create.return_value = iter(
+        [_openai_event("Hel"), _openai_event(None), _openai_event("lo")]
+    )
+    tokens = list(llm_router.stream_llm([{"role": "user", "content": "hi"}]))
+    assert tokens == ["Hel", "lo"]
+    assert mock_client.chat.completions.create.call_args.kwargs["stream"] is True
+
+
+@patch("utils.llm_router.requests.post")
+def test_stream_openrouter_parses_sse(mock_post, monkeypatch):
+    monkeypatch.setenv("OPENROUTER_API_KEY", "key")
+    lines = [
+        ": keep-alive",
+        "data: " + json.dumps({"choices": [{"delta": {"content": "a"}}]}),
+        "",
+        "data: " + json.dumps({"choices": [{"delta": {"content": "b"}}]}),
+        "data: [DONE]",
+    ]
+    resp = MagicMock()
+    resp.iter_lines.return_value = iter(lines)
+    mock_post.return_value.__enter__.return_value = resp
+
+    tokens = list(
+        llm_router.stream_llm(
+            [{"role": "user", "content": "hi"}], model="openrouter:some/model"
+        )
+    )
+    assert tokens == ["a", "b"]
+
+
+def test_stream_llm_rejects_unknown_provider():
+    with pytest.raises(ValueError):
+        llm_router.stream_llm([{"role": "user", "content": "hi"}], model="foo:bar")
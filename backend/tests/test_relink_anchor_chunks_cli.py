@@ -13,14 +13,17 @@ from django.core.management import call_command
 from assistants.models import Assistant
 from intel_core.models import Document, DocumentChunk, EmbeddingMetadata
 from memory.models import SymbolicMemoryAnchor, ChunkTag
+from memory.utils import relink_anchor_chunks
 
 pytest.importorskip("django")
 
 
-@patch("embeddings.helpers.helpers_io.get_embedding_for_text", return_value=[0.1])
-@patch("embeddings.vector_utils.compute_similarity", return_value=0.9)
+@patch(
+    "memory.utils.anchor_linking.get_embeddings_for_texts",
+    side_effect=lambda texts: [[0.1] for _ in texts],
+)
 @pytest.mark.django_db
-def test_relink_anchor_chunks_links(mock_sim, mock_embed):
+def test_relink_anchor_chunks_links(mock_embed):
     a = Assistant.objects.create(name="A", slug="a")
     doc = Document.objects.create(title="D", content="t")
     emb = EmbeddingMetadata.objects.create(model_used="m", num_tokens=1, vector=[0.1])
@@ -40,10 +43,12 @@ def test_relink_anchor_chunks_links(mock_sim, mock_embed):
     assert ChunkTag.objects.filter(chunk=chunk, name="term").exists()
 
 
-@patch("embeddings.helpers.helpers_io.get_embedding_for_text", return_value=[0.1])
-@patch("embeddings.vector_utils.compute_similarity", return_value=0.9)
+@patch(
+    "memory.utils.anchor_linking.get_embeddings_for_texts",
+    side_effect=lambda texts: [[0.1] for _ in texts],
+)
 @pytest.mark.django_db
-def test_relink_anchor_chunks_dry_run(mock_sim, mock_embed):
+def test_relink_anchor_chunks_dry_run(mock_embed):
     anchor = SymbolicMemoryAnchor.objects.create(slug="x", label="X")
     doc = Document.objects.create(title="D2", content="t")
     emb = EmbeddingMetadata.objects.create(model_used="m", num_tokens=1, vector=[0.1])
@@ -62,10 +67,12 @@ def test_relink_anchor_chunks_dry_run(mock_sim, mock_embed):
     assert ChunkTag.objects.count() == 0
 
 
-@patch("embeddings.helpers.helpers_io.get_embedding_for_text", return_value=[0.1])
-@patch("embeddings.vector_utils.compute_similarity", return_value=0.9)
+@patch(
+    "memory.utils.anchor_linking.get_embeddings_for_texts",
+    side_effect=lambda texts: [[0.1] for _ in texts],
+)
 @pytest.mark.django_db
-def test_relink_anchor_chunks_purge(mock_sim, mock_embed):
+def test_relink_anchor_chunks_purge(mock_embed):
     anchor = SymbolicMemoryAnchor.objects.create(slug="y", label="Y")
     doc = Document.objects.create(title="D3", content="t")
     emb = EmbeddingMetadata.objects.create(model_used="m", num_tokens=1, vector=[0.1])
@@ -81,3 +88,89 @@ def test_relink_anchor_chunks_purge(mock_sim, mock_embed):
     ChunkTag.objects.create(chunk=chunk, name="y")
     call_command("relink_anchor_chunks", "--purge-existing")
     assert ChunkTag.objects.filter(name="y").count() == 1
+
+
+@patch(
+    "memory.utils.anchor_linking.get_embeddings_for_texts",
+    side_effect=lambda texts: [[0.1] for _ in texts],
+)
+@pytest.mark.django_db
+def test_relink_anchor_chunks_incremental(mock_embed):
+    SymbolicMemoryAnchor.objects.create(slug="inc", label="Inc")
+    doc = Document.objects.create(title="D4", content="t")
+
+    def make_chunk(order):
+        emb = EmbeddingMetadata.objects.create(
+            model_used="m", num_tokens=1, vector=[0.1]
+        )
+        return DocumentChunk.objects.create(
+            document=doc,
+            order=order,
+            text="inc",
+            tokens=5,
+            fingerprint=f"inc{order}",
+            embedding=emb,
+            embedding_status="embedded",
+        )
+
+    make_chunk(1)
+    assert relink_anchor_chunks() == 1
+
+    new_chunk = make_chunk(2)
+    assert relink_anchor_chunks(incremental=True) == 1
+    assert ChunkTag.objects.filter(chunk=new_chunk, name="inc").exists()
+
+    mock_embed.reset_mock()
+    assert relink_anchor_chunks(incremental=True) == 0
+    mock_embed.assert_not_called()
+
+
+def _embedded_chunk(doc, order, vector):
+    emb = EmbeddingMetadata.objects.create(model_used="m", num_tokens=1, vector=vector)
+    return DocumentChunk.objects.create(
+        document=doc,
+        order=order,
+        text=f"chunk {order}",
+        tokens=5,
+        fingerprint=f"{doc.title}-{order}",
+        embedding=emb,
+        embedding_status="embedded",
+    )
+
+
+@patch(
+    "memory.utils.anchor_linking.get_embeddings_for_texts",
+    side_effect=lambda texts: [[1.0, 0.0] for _ in texts],
+)
+@pytest.mark.django_db
+def test_relink_anchor_chunks_incremental_replaces_weaker_link(mock_embed):
+    SymbolicMemoryAnchor.objects.create(slug="cap", label="Cap")
+    doc = Document.objects.create(title="D5", content="t")
+    _embedded_chunk(doc, 1, [0.6, 0.8])
+    assert relink_anchor_chunks(limit=1) == 1
+
+    better = _embedded_chunk(doc, 2, [1.0, 0.0])
+    assert relink_anchor_chunks(incremental=True, limit=1) == 1
+    linked = ChunkTag.objects.filter(name="cap").values_list("chunk_id", flat=True)
+    assert list(linked) == [better.id]
+
+
+@patch(
+    "memory.utils.anchor_linking.get_embeddings_for_texts",
+    side_effect=lambda texts: [
+        [1.0, 0.0] if text == "Old" else [0.0, 1.0] for text in texts
+    ],
+)
+@pytest.mark.django_db
+def test_relink_anchor_chunks_incremental_relinks_relabeled_anchor(mock_embed):
+    anchor = SymbolicMemoryAnchor.objects.create(slug="moved", label="Old")
+    doc = Document.objects.create(title="D6", content="t")
+    _embedded_chunk(doc, 1, [1.0, 0.0])
+    new_match = _embedded_chunk(doc, 2, [0.0, 1.0])
+    assert relink_anchor_chunks(limit=1) == 1
+
+    anchor.label = "New"
+    anchor.save()
+    assert relink_anchor_chunks(incremental=True, limit=1) == 1
+    linked = ChunkTag.objects.filter(name="moved").values_list("chunk_id", flat=True)
+    assert list(linked) == [new_match.id]
@@ -0,0 +1,38 @@
+import pytest
+pytest.importorskip("django")
+
+from unittest.mock import patch
+
+from assistants.models import Assistant
+from assistants.models.reflection import AssistantReflectionLog
+from utils.telemetry import TelemetryBuffer
+
+
+@pytest.mark.django_db
+def test_buffered_rows_are_written_in_one_flush():
+    a = Assistant.objects.create(name="T")
+    buffer = TelemetryBuffer(max_records=10, batch_size=100, flush_interval=60)
+    for i in range(3):
+        buffer.record(AssistantReflectionLog, assistant=a, title=f"r{i}", summary="s")
+
+    assert AssistantReflectionLog.objects.filter(assistant=a).count() == 0
+    with patch("assistants.signals.schedule_metrics_refresh") as mock_refresh:
+        assert buffer.flush() == 3
+
+    assert AssistantReflectionLog.objects.filter(assistant=a).count() == 3
+    mock_refresh.assert_called_once_with(a.id)
+    assert buffer.stats()["written"] == 3
+    assert buffer.stats()["pending"] == 0
+
+
+@pytest.mark.django_db
+def test_full_buffer_drops_oldest_rows():
+    a = Assistant.objects.create(name="D")
+    buffer = TelemetryBuffer(max_records=2, batch_size=100, flush_interval=60)
+    for i in range(5):
+        buffer.record(AssistantReflectionLog, assistant=a, title=f"r{i}", summary="s")
+
+    assert buffer.stats()["dropped"] == 3
+    buffer.flush()
+    titles = set(AssistantReflectionLog.objects.values_list("title", flat=True))
+    assert titles == {"r3", "r4"}
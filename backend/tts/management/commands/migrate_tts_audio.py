@@ -0,0 +1,67 @@
+import base64
+import binascii
+
+from django.core.files.base import ContentFile
+from django.core.management.base import BaseCommand
+
+from tts.models import SceneAudio, StoryAudio
+
+
+class Command(BaseCommand):
+    help = (
+        "Move base64 audio still stored on TTS rows into audio files and clear "
+        "the column, one row at a time"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch", type=int, default=100)
+        parser.add_argument("--dry-run", action="store_true")
+
+    def _migrate(self, model, prefix, batch_size, dry_run):
+        pending = model.objects.exclude(base64_audio__isnull=True).exclude(
+            base64_audio=""
+        )
+        ids = list(pending.values_list("id", flat=True))
+        written = cleared = 0
+        for start in range(0, len(ids), batch_size):
+            batch = ids[start : start + batch_size]
+            rows = model.objects.filter(id__in=batch).only(
+                "id", "provider", "audio_file"
+            )
+            for row in rows:
+                field = row.audio_file
+                if not (field and field.storage.exists(field.name)):
+                    # Only this row's base64 text is held in memory
+                    encoded = model.objects.values_list(
+                        "base64_audio", flat=True
+                    ).get(id=row.id)
+                    try:
+                        audio = base64.b64decode(encoded, validate=True)
+                    except (binascii.Error, ValueError):
+                        self.stderr.write(f"{model.__name__} {row.id}: invalid base64")
+                        continue
+                    if not dry_run:
+                        row.audio_file.save(
+                            f"{prefix}_{row.id}_{row.provider}.mp3",
+                            ContentFile(audio),
+                        )
+                    written += 1
+                if not dry_run:
+                    model.objects.filter(id=row.id).update(base64_audio=None)
+                cleared += 1
+            self.stdout.write(
+                f"{model.__name__}: {min(start + batch_size, len(ids))}/{len(ids)}"
+            )
+        return written, cleared
+
+    def handle(self, *args, **options):
+        for model, prefix in ((StoryAudio, "tts"), (SceneAudio, "scene_tts")):
+            written, cleared = self._migrate(
+                model, prefix, options["batch"], options["dry_run"]
+            )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{model.__name__}: wrote {written} files, "
+                    f"cleared base64 on {cleared} rows"
+                )
+            )
@@ -21,9 +21,8 @@ class StoryAudio(models.Model):
 
     user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
     prompt = models.TextField()
-    base64_audio = models.TextField(
-        blank=True, null=True
-    )  # optional: base64 for frontend preview
+    # Deprecated: audio lives only in audio_file; emptied by migrate_tts_audio
+    base64_audio = models.TextField(blank=True, null=True)
     audio_file = models.FileField(upload_to="tts_audio/", blank=True, null=True)
 
     project = models.ForeignKey(
@@ -97,6 +96,7 @@ class SceneAudio(models.Model):
         SceneImageModel, on_delete=models.CASCADE, related_name="scene_audios"
     )
     prompt = models.TextField()
+    # Deprecated: audio lives only in audio_file; emptied by migrate_tts_audio
     base64_audio = models.TextField(blank=True, null=True)
     audio_file = models.FileField(upload_to="tts_scene_audio/", blank=True, null=True)
     voice_style = models.CharField(max_length=100, blank=True, null=True)
@@ -2,8 +2,18 @@ from rest_framework import serializers
 from tts.models import StoryAudio, SceneAudio
 
 
+# /api/tts/ is deprecated; the same viewsets are routed under /api/v1/tts/
+STORY_STREAM_PATH = "/api/v1/tts/stories/{pk}/stream/"
+SCENE_STREAM_PATH = "/api/v1/tts/scenes/{pk}/stream/"
+
+
+def _absolute(request, url):
+    return request.build_absolute_uri(url) if request else url
+
+
 class StoryAudioSerializer(serializers.ModelSerializer):
     audio_url = serializers.SerializerMethodField()
+    stream_url = serializers.SerializerMethodField()
     # Generation backend: stability (SDXL), replicate, or openai
     model_backend = serializers.ChoiceField(
         choices=StoryAudio.MODEL_BACKEND_CHOICES,
@@ -21,13 +31,13 @@ class StoryAudioSerializer(serializers.ModelSerializer):
             "model_backend",
             "status",
             "audio_url",
-            "base64_audio",
+            "stream_url",
             "created_at",
             "user",
         ]
         read_only_fields = [
             "audio_url",
-            "base64_audio",
+            "stream_url",
             "created_at",
             "user",
             "status",
@@ -43,11 +53,18 @@ class StoryAudioSerializer(serializers.ModelSerializer):
             )
         return None
 
+    def get_stream_url(self, obj):
+        if not obj.audio_file:
+            return None
+        url = STORY_STREAM_PATH.format(pk=obj.pk)
+        return _absolute(self.context.get("request"), url)
+
 
 class SceneAudioSerializer(serializers.ModelSerializer):
     """Serializer for TTS narration of scene images"""
 
     audio_url = serializers.SerializerMethodField()
+    stream_url = serializers.SerializerMethodField()
     image = serializers.PrimaryKeyRelatedField(read_only=True)
 
     class Meta:
@@ -60,7 +77,7 @@ class SceneAudioSerializer(serializers.ModelSerializer):
             "provider",
             "status",
             "audio_url",
-            "base64_audio",
+            "stream_url",
             "task_id",
             "created_at",
         ]
@@ -68,7 +85,7 @@ class SceneAudioSerializer(serializers.ModelSerializer):
             "id",
             "status",
             "audio_url",
-            "base64_audio",
+            "stream_url",
             "task_id",
             "created_at",
         ]
@@ -82,3 +99,9 @@ class SceneAudioSerializer(serializers.ModelSerializer):
                 else obj.audio_file.url
             )
         return None
+
+    def get_stream_url(self, obj):
+        if not obj.audio_file:
+            return None
+        url = SCENE_STREAM_PATH.format(pk=obj.pk)
+        return _absolute(self.context.get("request"), url)
@@ -1,17 +1,100 @@
 # tts/tasks.py
-import os
-import base64
 import logging
 from django.utils.timezone import now
 from celery import shared_task
 from tts.models import StoryAudio
 from tts.utils.openai_tts import generate_openai_tts
 from tts.utils.elevenlabs_tts import generate_elevenlabs_tts
-from django.core.files.base import ContentFile
+from tts.utils.segments import TTS_SEGMENT_CHARS, split_tts_segments
+from django.core.files.base import ContentFile, File
+from utils import artifact_cache
 
 logger = logging.getLogger("django")
 
 
+def _synthesize(provider: str, text: str, voice: str) -> bytes:
+    if provider == "openai":
+        return generate_openai_tts(text, voice)
+    if provider == "elevenlabs":
+        return generate_elevenlabs_tts(text, voice)
+    raise ValueError(f"Unsupported TTS provider: {provider}")
+
+
+def tts_cache_params(audio) -> dict:
+    """Generation parameters that identify a synthesized story or scene."""
+    return {
+        "text": audio.prompt,
+        "voice": audio.voice_style,
+        "provider": audio.provider,
+        "segment_chars": TTS_SEGMENT_CHARS,
+    }
+
+
+def synthesize_to_file(audio, filename: str) -> None:
+    """Synthesize ``audio.prompt`` segment by segment into ``audio_file``.
+
+    Audio generated before for the same text, voice and provider is copied
+    from the artifact cache without calling the provider. Otherwise, on
+    local storage the file is saved after the first segment and later
+    segments are appended, so the stream endpoint can start playing while
+    the rest is generated. Other storages receive the file once complete.
+    """
+    params = tts_cache_params(audio)
+    cached = artifact_cache.lookup("tts", params, ".mp3")
+    if cached:
+        try:
+            with open(cached, "rb") as fh:
+                audio.audio_file.save(filename, File(fh), save=False)
+        except OSError as e:
+            # Evicted between lookup and open: synthesize as on a miss
+            logger.warning(f"🔊 TTS cache entry unreadable, synthesizing: {e}")
+        else:
+            audio.save(update_fields=["audio_file", "updated_at"])
+            logger.info(f"🔊 TTS cache hit | {audio.audio_file.name}")
+            return
+
+    segments = split_tts_segments(audio.prompt) or [audio.prompt]
+    first = _synthesize(audio.provider, segments[0], audio.voice_style)
+    try:
+        audio.audio_file.storage.path(filename)
+    except NotImplementedError:
+        parts = [first]
+        parts += [
+            _synthesize(audio.provider, text, audio.voice_style)
+            for text in segments[1:]
+        ]
+        data = b"".join(parts)
+        audio.audio_file.save(filename, ContentFile(data), save=False)
+        audio.save(update_fields=["audio_file", "updated_at"])
+        artifact_cache.store("tts", params, data, ".mp3")
+        return
+
+    audio.audio_file.save(filename, ContentFile(first), save=False)
+    audio.save(update_fields=["audio_file", "updated_at"])
+    path = audio.audio_file.path
+    for text in segments[1:]:
+        data = _synthesize(audio.provider, text, audio.voice_style)
+        # MP3 frames concatenate, so the growing file stays playable
+        with open(path, "ab") as fh:
+            fh.write(data)
+    artifact_cache.store_file("tts", params, path, ".mp3")
+    logger.info(f"🔊 Synthesized {len(segments)} segments | {audio.audio_file.name}")
+
+
+def _link_chat_message(chat_message_id, audio) -> None:
+    try:
+        from assistants.models import AssistantChatMessage
+
+        msg = AssistantChatMessage.objects.get(id=chat_message_id)
+        msg.audio_url = audio.audio_file.url
+        msg.message_type = "audio"
+        msg.tts_model = audio.provider
+        msg.style = audio.voice_style
+        msg.save(update_fields=["audio_url", "message_type", "tts_model", "style"])
+    except AssistantChatMessage.DoesNotExist:
+        pass
+
+
 @shared_task
 def queue_tts_story(
     prompt_text: str,
@@ -19,6 +102,7 @@ def queue_tts_story(
     voice: str = "echo",
     provider: str = "openai",
     chat_message_id: int | None = None,
+    story_audio_id: int | None = None,
 ):
     if not prompt_text:
         logger.warning("TTS prompt is empty, skipping.")
@@ -29,102 +113,66 @@ def queue_tts_story(
             f"🔊 TTS generation started | Provider: {provider} | Voice: {voice}"
         )
 
-        # Create DB entry first to track status
-        story = StoryAudio.objects.create(
-            user_id=user_id,
-            prompt=prompt_text,
-            voice_style=voice,
-            provider=provider,
-            status="processing",
-        )
-
-        if provider == "openai":
-            audio_bytes = generate_openai_tts(prompt_text, voice)
-        elif provider == "elevenlabs":
-            audio_bytes = generate_elevenlabs_tts(prompt_text, voice)
+        # Reuse the row the API created, or create one to track status
+        story = None
+        if story_audio_id:
+            story = (
+                StoryAudio.objects.defer("base64_audio")
+                .filter(id=story_audio_id)
+                .first()
+            )
+        if story:
+            story.voice_style = voice
+            story.provider = provider
+            story.status = "processing"
+            story.save(
+                update_fields=["voice_style", "provider", "status", "updated_at"]
+            )
         else:
-            raise ValueError(f"Unsupported TTS provider: {provider}")
-
-        # Save as file
-        filename = f"tts_{story.id}_{provider}.mp3"
-        story.audio_file.save(filename, ContentFile(audio_bytes))
-
-        # Also save base64 for fast access (optional)
-        story.base64_audio = base64.b64encode(audio_bytes).decode("utf-8")
+            story = StoryAudio.objects.create(
+                user_id=user_id,
+                prompt=prompt_text,
+                voice_style=voice,
+                provider=provider,
+                status="processing",
+            )
+
+        synthesize_to_file(story, f"tts_{story.id}_{provider}.mp3")
         story.status = "completed"
-        story.completed_at = now()
-        story.save()
+        story.save(update_fields=["status", "updated_at"])
 
         logger.info(f"✅ TTS generated & saved | Story ID: {story.id}")
 
         if chat_message_id:
-            try:
-                from assistants.models import AssistantChatMessage
-
-                msg = AssistantChatMessage.objects.get(id=chat_message_id)
-                msg.audio_url = story.audio_file.url
-                msg.message_type = "audio"
-                msg.tts_model = provider
-                msg.style = voice
-                msg.save(update_fields=["audio_url", "message_type", "tts_model", "style"])
-            except AssistantChatMessage.DoesNotExist:
-                pass
+            _link_chat_message(chat_message_id, story)
 
     except Exception as e:
         logger.exception("🔥 TTS generation failed")
-        if "story" in locals():
+        if "story" in locals() and story is not None:
             story.status = "failed"
-            story.save()
+            story.save(update_fields=["status", "updated_at"])
 
 
 @shared_task
 def queue_tts_scene(scene_audio_id: int, chat_message_id: int | None = None):
     """Async task to generate TTS audio for a scene image."""
     from tts.models import SceneAudio
-    from tts.utils.openai_tts import generate_openai_tts
-    from tts.utils.elevenlabs_tts import generate_elevenlabs_tts
-    from django.utils.timezone import now
-    from django.core.files.base import ContentFile
-    import base64
-    import logging
-
-    logger = logging.getLogger("django")
+
     try:
-        scene = SceneAudio.objects.get(id=scene_audio_id)
+        scene = SceneAudio.objects.defer("base64_audio").get(id=scene_audio_id)
         scene.status = "processing"
-        scene.save()
-        # Generate audio bytes
-        if scene.provider == "openai":
-            audio_bytes = generate_openai_tts(scene.prompt, scene.voice_style)
-        elif scene.provider == "elevenlabs":
-            audio_bytes = generate_elevenlabs_tts(scene.prompt, scene.voice_style)
-        else:
-            raise ValueError(f"Unsupported TTS provider: {scene.provider}")
-        # Save audio file
-        filename = f"scene_tts_{scene.id}_{scene.provider}.mp3"
-        scene.audio_file.save(filename, ContentFile(audio_bytes))
-        # Save base64 and mark completed
-        scene.base64_audio = base64.b64encode(audio_bytes).decode("utf-8")
+        scene.save(update_fields=["status", "updated_at"])
+        synthesize_to_file(scene, f"scene_tts_{scene.id}_{scene.provider}.mp3")
         scene.status = "completed"
         scene.completed_at = now()
-        scene.save()
+        scene.save(update_fields=["status", "completed_at", "updated_at"])
 
         if chat_message_id:
-            try:
-                from assistants.models import AssistantChatMessage
-
-                msg = AssistantChatMessage.objects.get(id=chat_message_id)
-                msg.audio_url = scene.audio_file.url
-                msg.message_type = "audio"
-                msg.tts_model = scene.provider
-                msg.style = scene.voice_style
-                msg.save(update_fields=["audio_url", "message_type", "tts_model", "style"])
-            except AssistantChatMessage.DoesNotExist:
-                pass
+            _link_chat_message(chat_message_id, scene)
     except Exception:
         logger.exception("🔥 TTS scene generation failed")
         try:
             scene.status = "failed"
-            scene.save()
-        except:
+            scene.save(update_fields=["status", "updated_at"])
+        except Exception:
             pass
@@ -1,3 +1,153 @@
-from django.test import TestCase
+import asyncio
+import tempfile
+from unittest.mock import patch
 
-# Create your tests here.
+from asgiref.sync import async_to_sync, sync_to_async
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.core.handlers.asgi import ASGIHandler
+from django.core.signals import request_finished, request_started
+from django.db import close_old_connections
+from django.db.models.fields.files import FieldFile
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+
+from tts.models import StoryAudio
+from tts.utils.segments import split_tts_segments
+from tts.utils.streaming import (
+    open_range_start,
+    parse_range,
+    ranged_file_response,
+    tailing_file_response,
+)
+
+
+class _Field:
+    storage = None
+
+
+def _body(response):
+    @async_to_sync
+    async def collect():
+        return b"".join([block async for block in response.streaming_content])
+
+    return collect()
+
+
+async def _finished():
+    return False
+
+
+class RangeStreamingTests(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        storage = FileSystemStorage(location=self.tmp.name)
+        name = storage.save("story.mp3", ContentFile(bytes(range(256)) * 4))
+        field = _Field()
+        field.storage = storage
+        self.file = FieldFile(None, field, name)
+
+    def _get(self, range_header=None):
+        headers = {"HTTP_RANGE": range_header} if range_header else {}
+        request = RequestFactory().get("/stream/", **headers)
+        return ranged_file_response(request, self.file)
+
+    def test_parse_range(self):
+        self.assertEqual(parse_range("bytes=0-99", 1024), (0, 99))
+        self.assertEqual(parse_range("bytes=1000-", 1024), (1000, 1023))
+        self.assertEqual(parse_range("bytes=-24", 1024), (1000, 1023))
+        self.assertIsNone(parse_range("bytes=0-1,5-9", 1024))
+        with self.assertRaises(ValueError):
+            parse_range("bytes=2000-", 1024)
+
+    def test_partial_content(self):
+        response = self._get("bytes=256-511")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Range"], "bytes 256-511/1024")
+        self.assertEqual(_body(response), bytes(range(256)))
+
+    def test_full_and_unsatisfiable(self):
+        response = self._get()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertEqual(len(_body(response)), 1024)
+        self.assertEqual(self._get("bytes=4096-").status_code, 416)
+
+    def test_open_range_tails_from_offset(self):
+        self.assertEqual(open_range_start("bytes=768-"), 768)
+        self.assertIsNone(open_range_start("bytes=0-99"))
+        self.assertIsNone(open_range_start("bytes=-24"))
+        response = tailing_file_response(self.file, _finished, start=768)
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Range"], "bytes 768-1023/*")
+        self.assertFalse(response.has_header("Content-Length"))
+        self.assertEqual(_body(response), bytes(range(256)))
+
+
+class AsgiTailStreamingTests(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        media = override_settings(MEDIA_ROOT=self.tmp.name)
+        media.enable()
+        self.addCleanup(media.disable)
+        self.audio = StoryAudio.objects.create(prompt="Once", status="processing")
+        self.audio.audio_file.save("story.mp3", ContentFile(b"x" * 1024))
+        # Like the test client, keep the handler from closing the test connection
+        for signal in (request_started, request_finished):
+            signal.disconnect(close_old_connections)
+            self.addCleanup(signal.connect, close_old_connections)
+
+    @patch("tts.utils.streaming.TAIL_POLL_SECONDS", 0.01)
+    def test_first_block_arrives_while_processing(self):
+        audio = self.audio
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": f"/api/tts/stories/{audio.id}/stream/",
+            "query_string": b"",
+            "headers": [(b"host", b"testserver")],
+        }
+
+        @async_to_sync
+        async def stream():
+            received, sent = asyncio.Queue(), asyncio.Queue()
+            received.put_nowait({"type": "http.request", "body": b""})
+            task = asyncio.create_task(ASGIHandler()(scope, received.get, sent.put))
+            start = await asyncio.wait_for(sent.get(), 5)
+            first = await asyncio.wait_for(sent.get(), 5)
+            status = await sync_to_async(
+                lambda: StoryAudio.objects.get(id=audio.id).status
+            )()
+            await sync_to_async(
+                StoryAudio.objects.filter(id=audio.id).update
+            )(status="completed")
+            body = [first]
+            while body[-1].get("more_body"):
+                body.append(await asyncio.wait_for(sent.get(), 5))
+            await asyncio.wait_for(task, 5)
+            return start, status, body
+
+        start, status, body = stream()
+        self.assertEqual(start["status"], 200)
+        self.assertEqual(body[0]["body"], b"x" * 1024)
+        self.assertTrue(body[0]["more_body"])
+        self.assertEqual(status, "processing")
+        self.assertEqual(b"".join(m.get("body", b"") for m in body), b"x" * 1024)
+
+
+class SegmentTests(SimpleTestCase):
+    def test_first_segment_is_one_sentence_and_rest_are_packed(self):
+        text = "It began at dawn. The wind rose. Ships left the bay. Nobody returned."
+        segments = split_tts_segments(text, max_chars=40)
+        self.assertEqual(segments[0], "It began at dawn.")
+        self.assertTrue(all(len(s) <= 40 for s in segments))
+        self.assertEqual(" ".join(segments), text)
+
+    def test_long_sentences_are_cut_at_spaces(self):
+        segments = split_tts_segments("word " * 50, max_chars=32)
+        self.assertTrue(all(len(s) <= 32 for s in segments))
+        self.assertEqual(" ".join(segments).split(), ["word"] * 50)
@@ -0,0 +1,36 @@
+# tts/utils/segments.py
+import re
+
+from django.conf import settings
+
+# Longest text sent to the TTS provider per call; OpenAI accepts 4096 chars
+TTS_SEGMENT_CHARS = getattr(settings, "TTS_SEGMENT_CHARS", 600)
+
+_SENTENCE_END = re.compile(r"(?:(?<=[.!?…])|(?<=[.!?…][\"')\]]))\s+")
+
+
+def split_tts_segments(text: str, max_chars: int = TTS_SEGMENT_CHARS) -> list[str]:
+    """Split ``text`` into sentence-aligned segments of at most ``max_chars``.
+
+    The first segment is a single sentence so playback can start as soon
+    as possible; later ones pack whole sentences. Sentences longer than
+    ``max_chars`` are cut at the last space that fits.
+    """
+    sentences = []
+    for sentence in _SENTENCE_END.split(text.strip()):
+        sentence = sentence.strip()
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars)
+            cut = cut if cut > 0 else max_chars
+            sentences.append(sentence[:cut].strip())
+            sentence = sentence[cut:].strip()
+        if sentence:
+            sentences.append(sentence)
+
+    segments: list[str] = []
+    for sentence in sentences:
+        if len(segments) > 1 and len(segments[-1]) + 1 + len(sentence) <= max_chars:
+            segments[-1] = f"{segments[-1]} {sentence}"
+        else:
+            segments.append(sentence)
+    return segments
@@ -0,0 +1,145 @@
+# tts/utils/streaming.py
+import asyncio
+import logging
+import re
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse, StreamingHttpResponse
+
+logger = logging.getLogger("django")
+
+STREAM_BLOCK_SIZE = 64 * 1024
+# How long a stream of unfinished audio waits for the next segment
+TAIL_POLL_SECONDS = 0.5
+TAIL_TIMEOUT_SECONDS = 120
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def parse_range(header: str | None, size: int):
+    """Return ``(start, end)`` for a single-range ``Range`` header.
+
+    ``None`` means serve the whole file; ``ValueError`` means the range
+    cannot be satisfied.
+    """
+    if not header:
+        return None
+    match = _RANGE_RE.match(header.strip())
+    if not match or match.groups() == ("", ""):
+        # Multiple or malformed ranges: ignore the header as RFC 9110 allows
+        return None
+    first, last = match.groups()
+    if first == "":
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError(header)
+    return start, end
+
+
+def open_range_start(header: str | None):
+    """Return ``N`` for an open-ended ``bytes=N-`` header, else ``None``."""
+    match = _RANGE_RE.match((header or "").strip())
+    if not match or match.group(1) == "" or match.group(2) != "":
+        return None
+    return int(match.group(1))
+
+
+def _off_loop(func):
+    """Run blocking file I/O in a worker thread so other streams keep flowing."""
+    return sync_to_async(func, thread_sensitive=False)
+
+
+async def _read_blocks(handle, remaining: int):
+    read = _off_loop(handle.read)
+    try:
+        while remaining > 0:
+            block = await read(min(STREAM_BLOCK_SIZE, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            yield block
+    finally:
+        await _off_loop(handle.close)()
+
+
+def ranged_file_response(request, field_file, content_type: str = "audio/mpeg"):
+    """Serve ``field_file`` honouring a ``Range`` header (206/416).
+
+    Blocks are read asynchronously so ASGI servers stream them one by one.
+    """
+    size = field_file.size
+    try:
+        byte_range = parse_range(request.headers.get("Range"), size)
+    except ValueError:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+        return response
+
+    handle = field_file.storage.open(field_file.name, "rb")
+    if byte_range is None:
+        start, end, status = 0, size - 1, 200
+    else:
+        (start, end), status = byte_range, 206
+        handle.seek(start)
+    length = end - start + 1 if size else 0
+    response = StreamingHttpResponse(
+        _read_blocks(handle, length), status=status, content_type=content_type
+    )
+    response["Accept-Ranges"] = "bytes"
+    response["Content-Length"] = str(length)
+    if status == 206:
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return response
+
+
+async def _tail_blocks(field_file, is_growing, start: int = 0):
+    """Yield the file's bytes from ``start``, waiting while segments are added.
+
+    ``is_growing`` is an async callable; polling sleeps on the event loop.
+    """
+    handle = await _off_loop(field_file.storage.open)(field_file.name, "rb")
+    read = _off_loop(handle.read)
+    waited = 0.0
+    try:
+        await _off_loop(handle.seek)(start)
+        while True:
+            block = await read(STREAM_BLOCK_SIZE)
+            if block:
+                waited = 0.0
+                yield block
+                continue
+            if not await is_growing() or waited >= TAIL_TIMEOUT_SECONDS:
+                # Catch bytes appended between the last read and the check
+                rest = await read()
+                if rest:
+                    yield rest
+                return
+            await asyncio.sleep(TAIL_POLL_SECONDS)
+            waited += TAIL_POLL_SECONDS
+    finally:
+        await _off_loop(handle.close)()
+
+
+def tailing_file_response(
+    field_file, is_growing, content_type: str = "audio/mpeg", start: int = 0
+):
+    """Stream audio that is still being synthesized, segment by segment.
+
+    The body is an async iterator so ASGI servers send each block as it is
+    read instead of collecting the whole tail first. A non-zero ``start``
+    answers an open-ended ``bytes=N-`` request with a 206 whose total length
+    is unknown (``*``) and no ``Content-Length``.
+    """
+    response = StreamingHttpResponse(
+        _tail_blocks(field_file, is_growing, start),
+        status=206 if start else 200,
+        content_type=content_type,
+    )
+    response["Accept-Ranges"] = "bytes"
+    if start:
+        end = max(field_file.size - 1, start)
+        response["Content-Range"] = f"bytes {start}-{end}/*"
+    return response
@@ -5,13 +5,38 @@ from rest_framework.permissions import AllowAny
 from tts.utils.elevenlabs_voices import get_elevenlabs_voices
 from rest_framework.decorators import action
 from rest_framework import filters
-from .models import StoryAudio
+from django.http import Http404
+from .models import SceneAudio, StoryAudio
 from .serializers import StoryAudioSerializer
 from tts.tasks import queue_tts_story
+from tts.utils.streaming import (
+    open_range_start,
+    ranged_file_response,
+    tailing_file_response,
+)
+
+
+def stream_audio(request, audio):
+    """Stream ``audio.audio_file``, following it while segments are added."""
+    if not audio.audio_file:
+        raise Http404("Audio not generated yet")
+    range_header = request.headers.get("Range")
+    start = open_range_start(range_header)
+    if audio.status == "processing" and (range_header is None or start is not None):
+        # Players resume with ``bytes=N-``; follow the file from N while growing
+
+        async def is_growing():
+            return await (
+                type(audio).objects.filter(id=audio.id, status="processing").aexists()
+            )
+
+        return tailing_file_response(audio.audio_file, is_growing, start=start or 0)
+    return ranged_file_response(request, audio.audio_file)
 
 
 class StoryAudioViewSet(viewsets.ModelViewSet):
-    queryset = StoryAudio.objects.all().order_by("-created_at")
+    # Legacy rows may still carry the base64 copy; never load it
+    queryset = StoryAudio.objects.defer("base64_audio").order_by("-created_at")
     serializer_class = StoryAudioSerializer
     permission_classes = [AllowAny]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
@@ -32,6 +57,7 @@ class StoryAudioViewSet(viewsets.ModelViewSet):
             user_id=self.request.user.id,
             voice=voice,
             provider=provider,
+            story_audio_id=story.id,
         )
 
     def create(self, request, *args, **kwargs):
@@ -70,6 +96,7 @@ class StoryAudioViewSet(viewsets.ModelViewSet):
                 user_id=request.user.id,
                 voice=story.voice_style or "echo",
                 provider=story.provider or "openai",
+                story_audio_id=story.id,
             )
 
             return Response(
@@ -80,6 +107,21 @@ class StoryAudioViewSet(viewsets.ModelViewSet):
         except StoryAudio.DoesNotExist:
             return Response({"error": "TTS request not found."}, status=404)
 
+    @action(detail=True, methods=["get"], url_path="stream")
+    def stream(self, request, pk=None):
+        """Serve the MP3 with HTTP Range support."""
+        return stream_audio(request, self.get_object())
+
+
+class SceneAudioViewSet(viewsets.GenericViewSet):
+    queryset = SceneAudio.objects.defer("base64_audio")
+    permission_classes = [permissions.IsAuthenticated]
+
+    @action(detail=True, methods=["get"], url_path="stream")
+    def stream(self, request, pk=None):
+        """Serve a scene narration MP3 with HTTP Range support."""
+        return stream_audio(request, self.get_object())
+
 
 class ElevenLabsVoiceViewSet(viewsets.ViewSet):
     permission_classes = [AllowAny]
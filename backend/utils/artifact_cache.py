@@ -0,0 +1,217 @@
+"""
+Content-addressed cache for generated media (TTS audio, images).
+
+Artifacts are keyed on a SHA-256 of the canonical JSON of their generation
+parameters and stored under ``ARTIFACT_CACHE_DIR`` (next to ``MEDIA_ROOT``)
+as ``<kind>/<key[:2]>/<key><suffix>``. A hit refreshes the file's mtime, and
+writes evict the least recently used files once the directory grows past
+``ARTIFACT_CACHE_MAX_BYTES``. Hit/miss counters and a running byte total
+live in the Django cache; the directory is only rescanned when that total
+is unknown or over budget.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_CACHE_DIR = Path(
+    getattr(
+        settings,
+        "ARTIFACT_CACHE_DIR",
+        Path(settings.MEDIA_ROOT).parent / "artifact_cache",
+    )
+)
+ARTIFACT_CACHE_MAX_BYTES = getattr(settings, "ARTIFACT_CACHE_MAX_BYTES", 2 * 1024**3)
+# Evict down to this fraction of the budget to leave headroom for new writes
+EVICT_TO_FRACTION = 0.9
+
+STATS_PREFIX = "artifact_cache"
+# Outside STATS_PREFIX so stats() does not read it as a hit/miss counter
+TOTAL_BYTES_KEY = "artifact_cache_total_bytes"
+
+
+def artifact_key(kind: str, params: Dict[str, Any]) -> str:
+    """Return the hex SHA-256 of ``kind`` plus canonical JSON of ``params``."""
+    canonical = json.dumps(
+        params, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(f"{kind}\n{canonical}".encode("utf-8")).hexdigest()
+
+
+def _artifact_path(kind: str, key: str, suffix: str) -> Path:
+    return ARTIFACT_CACHE_DIR / kind / key[:2] / f"{key}{suffix}"
+
+
+def _count(kind: str, outcome: str) -> None:
+    key = f"{STATS_PREFIX}:{kind}:{outcome}"
+    try:
+        cache.add(key, 0, None)
+        cache.incr(key)
+    except Exception as e:
+        logger.debug(f"Artifact cache stats unavailable: {e}")
+
+
+def _add_bytes(delta: int) -> Optional[int]:
+    """Add ``delta`` to the running byte total; ``None`` if it is unknown."""
+    try:
+        return cache.incr(TOTAL_BYTES_KEY, delta)
+    except ValueError:
+        return None
+    except Exception as e:
+        logger.debug(f"Artifact cache byte total unavailable: {e}")
+        return None
+
+
+def _set_total(total: int) -> None:
+    try:
+        cache.set(TOTAL_BYTES_KEY, total, None)
+    except Exception as e:
+        logger.debug(f"Artifact cache byte total unavailable: {e}")
+
+
+def lookup(kind: str, params: Dict[str, Any], suffix: str = "") -> Optional[Path]:
+    """Return the cached file for ``params`` or ``None``, recording hit/miss."""
+    path = _artifact_path(kind, artifact_key(kind, params), suffix)
+    try:
+        # Refresh recency for LRU eviction; atime is unreliable (noatime)
+        os.utime(path)
+    except OSError:
+        _count(kind, "misses")
+        return None
+    _count(kind, "hits")
+    return path
+
+
+def store(
+    kind: str, params: Dict[str, Any], data: bytes, suffix: str = ""
+) -> Optional[Path]:
+    """Write ``data`` as the artifact for ``params`` and enforce the byte budget.
+
+    Caching is best effort: failures are logged and ``None`` is returned.
+    """
+    if ARTIFACT_CACHE_MAX_BYTES <= 0 or len(data) > ARTIFACT_CACHE_MAX_BYTES:
+        return None
+    path = _artifact_path(kind, artifact_key(kind, params), suffix)
+    try:
+        replaced = path.stat().st_size
+    except OSError:
+        replaced = 0
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so readers never see a partial artifact
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".part")
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning(f"Could not cache {kind} artifact: {e}")
+        return None
+    total = _add_bytes(len(data) - replaced)
+    if total is None or total > ARTIFACT_CACHE_MAX_BYTES:
+        evict()
+    return path
+
+
+def store_file(
+    kind: str, params: Dict[str, Any], source: str, suffix: str = ""
+) -> Optional[Path]:
+    """Cache the file at ``source``; see ``store``."""
+    try:
+        with open(source, "rb") as fh:
+            data = fh.read()
+    except OSError as e:
+        logger.warning(f"Could not read {kind} artifact {source}: {e}")
+        return None
+    return store(kind, params, data, suffix)
+
+
+def copy_to(path: Path, destination: str) -> None:
+    """Copy a cached artifact to ``destination`` on local disk."""
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+    shutil.copyfile(path, destination)
+
+
+def _entries():
+    if not ARTIFACT_CACHE_DIR.exists():
+        return []
+    entries = []
+    for path in ARTIFACT_CACHE_DIR.glob("*/*/*"):
+        if path.suffix == ".part":
+            continue
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+    return entries
+
+
+def evict(max_bytes: Optional[int] = None) -> int:
+    """Delete least recently used artifacts while over budget; return bytes freed.
+
+    Also resets the running byte total to what remains on disk.
+    """
+    max_bytes = ARTIFACT_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    entries = _entries()
+    total = sum(size for _, size, _ in entries)
+    if total <= max_bytes:
+        _set_total(total)
+        return 0
+    target = int(max_bytes * EVICT_TO_FRACTION)
+    freed = 0
+    for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+        if total - freed <= target:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        freed += size
+    _set_total(total - freed)
+    logger.info(f"🧹 Artifact cache evicted {freed} bytes")
+    return freed
+
+
+def stats() -> Dict[str, Any]:
+    """Return hit/miss counters per kind plus current size on disk."""
+    entries = _entries()
+    kinds: Dict[str, Dict[str, Any]] = {}
+    for _, size, path in entries:
+        kind = path.parent.parent.name
+        row = kinds.setdefault(kind, {"entries": 0, "bytes": 0})
+        row["entries"] += 1
+        row["bytes"] += size
+    try:
+        counter_keys = cache.keys(f"{STATS_PREFIX}:*")
+    except Exception:
+        counter_keys = [
+            f"{STATS_PREFIX}:{kind}:{outcome}"
+            for kind in kinds
+            for outcome in ("hits", "misses")
+        ]
+    for key in counter_keys:
+        _, kind, outcome = key.split(":", 2)
+        kinds.setdefault(kind, {"entries": 0, "bytes": 0})[outcome] = (
+            cache.get(key) or 0
+        )
+    for row in kinds.values():
+        row.setdefault("hits", 0)
+        row.setdefault("misses", 0)
+        lookups = row["hits"] + row["misses"]
+        row["hit_rate"] = round(row["hits"] / lookups, 4) if lookups else None
+    return {
+        "path": str(ARTIFACT_CACHE_DIR),
+        "max_bytes": ARTIFACT_CACHE_MAX_BYTES,
+        "bytes": sum(size for _, size, _ in entries),
+        "kinds": kinds,
+    }
@@ -0,0 +1,207 @@
+"""asyncio counterpart of :mod:`utils.llm_router`.
+
+Calls go straight to each provider's HTTP API through one pooled
+``httpx.AsyncClient`` per provider (HTTP/2 keep-alive when ``h2`` is
+installed). A per-provider semaphore bounds how many requests are in flight.
+:func:`gather_llm` runs independent prompts concurrently, so multi-prompt
+workflows pay for the slowest call instead of the sum of all of them.
+Synchronous callers submit to one long-lived event loop on a background
+thread, which owns the pool, so connections stay alive between calls.
+
+Base URLs come from ``OPENAI_BASE_URL``, ``OLLAMA_BASE_URL`` and
+``OPENROUTER_BASE_URL``, so the router can be pointed at a local stub server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import weakref
+from typing import Any, Iterable, Mapping, Sequence, Union
+
+import httpx
+from django.conf import settings
+
+from utils.llm_router import DEFAULT_MODEL, _resolve_model
+
+try:  # HTTP/2 needs the optional ``h2`` package
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except Exception:  # pragma: no cover - optional dependency
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Max concurrent requests per provider, e.g. {"openai": 16, "ollama": 2}
+LLM_PROVIDER_CONCURRENCY = getattr(
+    settings, "LLM_PROVIDER_CONCURRENCY", {"openai": 16, "openrouter": 8, "ollama": 4}
+)
+LLM_HTTP_TIMEOUT = getattr(settings, "LLM_HTTP_TIMEOUT", 120.0)
+LLM_POOL_SIZE = getattr(settings, "LLM_POOL_SIZE", 32)
+
+LLMCall = Union[Sequence[dict], Mapping[str, Any]]
+
+
+def _base_url(provider: str) -> str:
+    if provider == "ollama":
+        return os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+    if provider == "openrouter":
+        return os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1")
+    return os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
+
+
+def _headers(provider: str) -> dict:
+    if provider == "ollama":
+        return {}
+    env = "OPENROUTER_API_KEY" if provider == "openrouter" else "OPENAI_API_KEY"
+    api_key = os.getenv(env)
+    if not api_key:
+        raise ValueError(f"{env} not set")
+    return {"Authorization": f"Bearer {api_key}"}
+
+
+class _ProviderPool:
+    """Clients and semaphores for one event loop.
+
+    ``httpx.AsyncClient`` and ``asyncio.Semaphore`` are bound to the loop they
+    are first used on, so every loop (e.g. each ``asyncio.run`` in a Celery
+    task) gets its own pool.
+    """
+
+    def __init__(self) -> None:
+        self.clients: dict[str, httpx.AsyncClient] = {}
+        self.semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def client(self, provider: str) -> httpx.AsyncClient:
+        client = self.clients.get(provider)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                base_url=_base_url(provider),
+                http2=HTTP2_AVAILABLE,
+                timeout=LLM_HTTP_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=LLM_POOL_SIZE,
+                    max_keepalive_connections=LLM_POOL_SIZE,
+                ),
+            )
+            self.clients[provider] = client
+        return client
+
+    def semaphore(self, provider: str) -> asyncio.Semaphore:
+        sem = self.semaphores.get(provider)
+        if sem is None:
+            sem = asyncio.Semaphore(int(LLM_PROVIDER_CONCURRENCY.get(provider, 8)))
+            self.semaphores[provider] = sem
+        return sem
+
+    async def aclose(self) -> None:
+        for client in self.clients.values():
+            await client.aclose()
+        self.clients.clear()
+
+
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _ProviderPool]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _pool() -> _ProviderPool:
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = _pools[loop] = _ProviderPool()
+    return pool
+
+
+async def aclose_clients() -> None:
+    """Close the pooled clients of the running loop."""
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool:
+        await pool.aclose()
+
+
+async def _post(provider: str, path: str, payload: dict) -> dict:
+    pool = _pool()
+    async with pool.semaphore(provider):
+        resp = await pool.client(provider).post(
+            path, json=payload, headers=_headers(provider)
+        )
+    resp.raise_for_status()
+    return resp.json()
+
+
+async def acall_llm(
+    messages: list[dict], model: str = DEFAULT_MODEL, **kwargs
+) -> str:
+    """Async :func:`utils.llm_router.call_llm` over pooled connections."""
+    if not messages:
+        raise ValueError("messages list is required")
+    provider, actual = _resolve_model(model)
+    payload = {"model": actual, "messages": messages}
+    payload.update(kwargs)
+    if provider == "ollama":
+        payload["stream"] = False
+        data = await _post(provider, "/api/chat", payload)
+        if isinstance(data.get("message"), dict):
+            return data["message"].get("content", "").strip()
+        if data.get("choices"):
+            return data["choices"][0]["message"]["content"].strip()
+        return ""
+    logger.info("Calling %s with model %s", provider, actual)
+    data = await _post(provider, "/chat/completions", payload)
+    return data["choices"][0]["message"]["content"].strip()
+
+
+def _as_call(call: LLMCall) -> tuple[list[dict], dict]:
+    if isinstance(call, Mapping):
+        kwargs = dict(call)
+        return kwargs.pop("messages"), kwargs
+    return list(call), {}
+
+
+async def agather_llm(
+    calls: Iterable[LLMCall], *, return_exceptions: bool = False
+) -> list:
+    """Run ``calls`` concurrently and return replies in input order.
+
+    Each call is either a messages list or a mapping with ``messages`` plus
+    any :func:`acall_llm` keyword arguments (``model``, ``temperature``...).
+    """
+    coros = [acall_llm(msgs, **kw) for msgs, kw in map(_as_call, calls)]
+    return await asyncio.gather(*coros, return_exceptions=return_exceptions)
+
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_pid: int | None = None
+_loop_lock = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Return this process's router loop, starting its thread on first use.
+
+    Threads do not survive ``fork``, so a Celery child starts its own loop.
+    """
+    global _loop, _loop_pid
+    with _loop_lock:
+        if _loop is None or _loop_pid != os.getpid():
+            _loop = asyncio.new_event_loop()
+            _loop_pid = os.getpid()
+            threading.Thread(
+                target=_loop.run_forever, name="async-llm-router", daemon=True
+            ).start()
+        return _loop
+
+
+def gather_llm(calls: Iterable[LLMCall], *, return_exceptions: bool = False) -> list:
+    """Synchronous entry point to :func:`agather_llm` for views and tasks.
+
+    Calls run on the background loop, reusing its keep-alive connections.
+    """
+    future = asyncio.run_coroutine_threadsafe(
+        agather_llm(list(calls), return_exceptions=return_exceptions),
+        _background_loop(),
+    )
+    return future.result()
@@ -1,5 +1,9 @@
 import os
+import json
 import logging
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+
 import requests
 from openai import OpenAI
 from intel_core.models import GlossaryUsageLog, GlossaryMissReflectionLog, DocumentChunk
@@ -13,6 +17,7 @@ from memory.services.reinforcement import (
     reinforce_glossary_anchor,
     REINFORCEMENT_THRESHOLD,
 )
+from memory.utils.anchor_matcher import SLUG, get_anchor_matcher
 
 DEFAULT_MODEL = "gpt-4o-mini"
 client = OpenAI()
@@ -71,6 +76,91 @@ def _call_openrouter(messages: list[dict], model: str, **kwargs) -> str:
     return data["choices"][0]["message"]["content"].strip()
 
 
+def _stream_openai(messages: list[dict], model: str, **kwargs) -> Iterator[str]:
+    logger.info("Streaming OpenAI with model %s", model)
+    stream = client.chat.completions.create(
+        model=model,
+        messages=messages,
+        stream=True,
+        **kwargs,
+    )
+    for event in stream:
+        if not event.choices:
+            continue
+        delta = event.choices[0].delta.content
+        if delta:
+            yield delta
+
+
+def _stream_ollama(messages: list[dict], model: str, **kwargs) -> Iterator[str]:
+    base = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+    url = f"{base.rstrip('/')}/api/chat"
+    payload = {"model": model, "messages": messages}
+    payload.update(kwargs)
+    payload["stream"] = True
+    with requests.post(url, json=payload, stream=True) as resp:
+        resp.raise_for_status()
+        # Ollama streams one JSON object per line
+        for line in resp.iter_lines():
+            if not line:
+                continue
+            data = json.loads(line)
+            content = (data.get("message") or {}).get("content")
+            if content:
+                yield content
+            if data.get("done"):
+                break
+
+
+def _stream_openrouter(messages: list[dict], model: str, **kwargs) -> Iterator[str]:
+    api_key = os.getenv("OPENROUTER_API_KEY")
+    if not api_key:
+        raise ValueError("OPENROUTER_API_KEY not set")
+    url = "https://openrouter.ai/api/v1/chat/completions"
+    payload = {"model": model, "messages": messages}
+    payload.update(kwargs)
+    payload["stream"] = True
+    headers = {"Authorization": f"Bearer {api_key}"}
+    with requests.post(url, json=payload, headers=headers, stream=True) as resp:
+        resp.raise_for_status()
+        # OpenAI-compatible SSE: ``data: {...}`` lines ending with ``[DONE]``
+        for line in resp.iter_lines(decode_unicode=True):
+            if not line or not line.startswith("data:"):
+                continue
+            data = line[len("data:") :].strip()
+            if data == "[DONE]":
+                break
+            choices = json.loads(data).get("choices") or []
+            delta = (choices[0].get("delta") or {}).get("content") if choices else None
+            if delta:
+                yield delta
+
+
+def _resolve_model(model: str) -> tuple[str, str]:
+    """Split ``model`` into ``(provider, model_name)``."""
+    if ":" in model:
+        prefix, actual = model.split(":", 1)
+        if prefix in ("ollama", "openrouter", "openai"):
+            return prefix, actual
+        raise ValueError(f"Unsupported model: {model}")
+    return "openai", model
+
+
+def stream_llm(
+    messages: list[dict], model: str = DEFAULT_MODEL, **kwargs
+) -> Iterator[str]:
+    """Like :func:`call_llm` but yield reply tokens as the provider sends them."""
+    if not messages:
+        raise ValueError("messages list is required")
+    provider, actual = _resolve_model(model)
+    backend = {
+        "openai": _stream_openai,
+        "ollama": _stream_ollama,
+        "openrouter": _stream_openrouter,
+    }[provider]
+    return backend(messages, actual, **kwargs)
+
+
 def call_llm(messages: list[dict], model: str = DEFAULT_MODEL, **kwargs) -> str:
     """Route LLM calls to OpenAI, Ollama, or OpenRouter based on model name."""
     if not messages:
@@ -88,17 +178,43 @@ def call_llm(messages: list[dict], model: str = DEFAULT_MODEL, **kwargs) -> str:
         return _call_openai(messages, model, **kwargs)
 
 
-def chat(
+@dataclass
+class ChatTurn:
+    """State carried from :func:`prepare_chat` to :func:`finalize_chat`."""
+
+    assistant: Any
+    msgs: list[dict]
+    summoned: list[str]
+    rag_meta: dict
+    query_text: str
+    chunks: list[dict]
+    reason: Optional[str]
+    top_score: float
+    top_chunk_id: Optional[str]
+    glossary_present: bool
+    glossary_forced: bool
+    anchor_matches: list[str]
+    llm_kwargs: dict = field(default_factory=dict)
+    playback_anchor_missed: str = ""
+
+    @property
+    def model(self) -> str:
+        return getattr(self.assistant, "preferred_model", DEFAULT_MODEL)
+
+
+def prepare_chat(
     messages: list[dict],
     assistant,
     *,
     focus_anchors_only: bool = False,
-    retry_on_miss: bool = False,
-    enable_retry_logging: bool = False,
     force_chunks: bool = False,
     **kwargs,
-) -> tuple[str, list[str], dict, dict]:
-    """High-level chat call that can summon memories and RAG context."""
+) -> ChatTurn:
+    """Build the prompt for a chat turn: memory summoning and RAG injection.
+
+    Only the work the LLM call depends on happens here; usage logging and
+    reflections run later in :func:`finalize_chat`.
+    """
     from assistants.utils.memory_summoner import summon_relevant_memories
     from assistants.utils.chunk_retriever import get_relevant_chunks, format_chunks
 
@@ -172,11 +288,12 @@ def chat(
             f"Invalid embedding status for chunks: {ids}"
         )
     query_terms = AcronymGlossaryService.extract(query_text)
-    all_anchors = list(SymbolicMemoryAnchor.objects.values_list("slug", flat=True))
-    anchor_matches = [s for s in all_anchors if s.lower() in query_text.lower()]
-    anchor_objs = SymbolicMemoryAnchor.objects.filter(slug__in=anchor_matches).order_by(
-        "slug"
+    anchor_objs = list(
+        SymbolicMemoryAnchor.objects.filter(
+            slug__in=get_anchor_matcher().match(query_text, kinds=[SLUG])
+        ).order_by("slug")
     )
+    anchor_matches = [a.slug for a in anchor_objs]
     guidance_map = {
         a.slug: [
             line.strip() for line in a.glossary_guidance.split("\n") if line.strip()
@@ -230,38 +347,9 @@ def chat(
                 f"\u26a0\ufe0f Weak context fallback: used chunk {first_id} (score {first_score})"
             )
     rag_meta["fallback_reason"] = reason
-    retried = False
-    retry_type = "standard"
-    retry_log = None
-    gloss_log = GlossaryUsageLog.objects.create(
-        query=query_text,
-        rag_used=bool(chunks),
-        glossary_present=glossary_present,
-        retrieval_score=top_score,
-        assistant=assistant,
-        linked_chunk_id=top_chunk_id,
-    )
-    gloss_reflection = None
+    retrieved_chunks = list(chunks)
+    playback_anchor_missed = (rag_meta.get("anchor_misses") or [""])[0]
     if chunks:
-        try:
-            from utils.rag_playback import record_rag_playback
-
-            anchor_missed = ""
-            if rag_meta.get("anchor_misses"):
-                anchor_missed = rag_meta["anchor_misses"][0]
-            playback = record_rag_playback(
-                query_text,
-                assistant,
-                assistant.memory_context,
-                chunks,
-                query_term=query_text,
-                score_cutoff=top_score,
-                fallback_reason=reason,
-                anchor_missed=anchor_missed,
-            )
-            rag_meta["playback_id"] = str(playback.id)
-        except Exception:
-            pass
         if fallback or focus_anchors_only:
             gloss_first = [c for c in chunks if c.get("is_glossary")]
             non_gloss = [c for c in chunks if not c.get("is_glossary")]
@@ -397,51 +485,133 @@ def chat(
         logger.warning(
             "\u26a0\ufe0f No relevant chunks found — skipping memory injection"
         )
-        if glossary_present:
-            logger.info("Glossary present but unused")
-            from memory.services import MemoryService
-            from mcp_core.models import Tag
-
-            tag, _ = Tag.objects.get_or_create(
-                slug="missed_glossary_context",
-                defaults={"name": "missed_glossary_context"},
-            )
-            mem = MemoryService.create_entry(
-                event=f"Glossary unused for query: {query_text}\nChunk: {top_chunk_id}",
-                assistant=assistant,
-                source_role="system",
+
+    return ChatTurn(
+        assistant=assistant,
+        msgs=msgs,
+        summoned=summoned,
+        rag_meta=rag_meta,
+        query_text=query_text,
+        chunks=retrieved_chunks,
+        reason=reason,
+        top_score=top_score,
+        top_chunk_id=top_chunk_id,
+        glossary_present=glossary_present,
+        glossary_forced=glossary_forced,
+        anchor_matches=anchor_matches,
+        llm_kwargs=kwargs,
+        playback_anchor_missed=playback_anchor_missed,
+    )
+
+
+def _log_retrieval(turn: ChatTurn):
+    """Record retrieval usage for ``turn`` and reflect on unused glossaries.
+
+    Returns the glossary reflection log, if one was created.
+    """
+    assistant = turn.assistant
+    query_text = turn.query_text
+    anchor_matches = turn.anchor_matches
+    rag_meta = turn.rag_meta
+    chunks = turn.chunks
+    top_chunk_id = turn.top_chunk_id
+    top_score = turn.top_score
+    reason = turn.reason
+    glossary_present = turn.glossary_present
+    gloss_log = GlossaryUsageLog.objects.create(
+        query=query_text,
+        rag_used=bool(chunks),
+        glossary_present=glossary_present,
+        retrieval_score=top_score,
+        assistant=assistant,
+        linked_chunk_id=top_chunk_id,
+    )
+    gloss_reflection = None
+    if chunks:
+        try:
+            from utils.rag_playback import record_rag_playback
+
+            playback = record_rag_playback(
+                query_text,
+                assistant,
+                assistant.memory_context,
+                chunks,
+                query_term=query_text,
+                score_cutoff=top_score,
+                fallback_reason=reason,
+                anchor_missed=turn.playback_anchor_missed,
             )
-            mem.tags.add(tag)
-            from assistants.utils.assistant_thought_engine import (
-                AssistantThoughtEngine,
+            rag_meta["playback_id"] = str(playback.id)
+        except Exception:
+            pass
+    if not chunks and glossary_present:
+        logger.info("Glossary present but unused")
+        from memory.services import MemoryService
+        from mcp_core.models import Tag
+
+        tag, _ = Tag.objects.get_or_create(
+            slug="missed_glossary_context",
+            defaults={"name": "missed_glossary_context"},
+        )
+        mem = MemoryService.create_entry(
+            event=f"Glossary unused for query: {query_text}\nChunk: {top_chunk_id}",
+            assistant=assistant,
+            source_role="system",
+        )
+        mem.tags.add(tag)
+        from assistants.utils.assistant_thought_engine import (
+            AssistantThoughtEngine,
+        )
+
+        engine = AssistantThoughtEngine(assistant=assistant)
+        try:
+            missing_anchor = anchor_matches[0] if anchor_matches else ""
+            gloss_reflection = engine.reflect_on_rag_failure(
+                query_text, missing_anchor
             )
+            gloss_log.reflected_on = True
+            gloss_log.save(update_fields=["reflected_on"])
+            from assistants.models.glossary import AssistantGlossaryLog
 
-            engine = AssistantThoughtEngine(assistant=assistant)
-            try:
-                missing_anchor = anchor_matches[0] if anchor_matches else ""
-                gloss_reflection = engine.reflect_on_rag_failure(
-                    query_text, missing_anchor
-                )
-                gloss_log.reflected_on = True
-                gloss_log.save(update_fields=["reflected_on"])
-                from assistants.models.glossary import AssistantGlossaryLog
+            AssistantGlossaryLog.objects.create(
+                assistant=assistant,
+                query=query_text,
+                anchor=SymbolicMemoryAnchor.objects.filter(
+                    slug=missing_anchor
+                ).first(),
+                ignored=True,
+            )
+        except Exception:
+            logger.exception("Failed to reflect on glossary miss")
+            gloss_reflection = None
+    return gloss_reflection
 
-                AssistantGlossaryLog.objects.create(
-                    assistant=assistant,
-                    query=query_text,
-                    anchor=SymbolicMemoryAnchor.objects.filter(
-                        slug=missing_anchor
-                    ).first(),
-                    ignored=True,
-                )
-            except Exception:
-                logger.exception("Failed to reflect on glossary miss")
-                gloss_reflection = None
 
-    logger.debug("Final messages array: %s", msgs)
-    reply = call_llm(
-        msgs, model=getattr(assistant, "preferred_model", DEFAULT_MODEL), **kwargs
-    )
+def finalize_chat(
+    turn: ChatTurn,
+    reply: str,
+    *,
+    retry_on_miss: bool = False,
+    enable_retry_logging: bool = False,
+    allow_retry: bool = True,
+) -> tuple[str, list[str], dict, dict]:
+    """Log retrieval, reflect and reinforce anchors once ``reply`` is known.
+
+    ``allow_retry=False`` skips the escalated/revision LLM retries, which is
+    required when ``reply`` has already been streamed to the client.
+    """
+    assistant = turn.assistant
+    msgs = turn.msgs
+    rag_meta = turn.rag_meta
+    query_text = turn.query_text
+    anchor_matches = turn.anchor_matches
+    glossary_forced = turn.glossary_forced
+    summoned = turn.summoned
+    kwargs = turn.llm_kwargs
+    gloss_reflection = _log_retrieval(turn)
+    retried = False
+    retry_type = "standard"
+    retry_log = None
     first_reply = reply
     if rag_meta.get("glossary_debug"):
         ignored = []
@@ -451,7 +621,7 @@ def chat(
                 ignored.append(g["id"])
         rag_meta["glossary_ignored"] = ignored
         logger.debug("Glossary chunks ignored by LLM: %s", ignored)
-    escalate = (
+    escalate = allow_retry and (
         rag_meta.get("glossary_present")
         and rag_meta.get("guidance_appended")
         and rag_meta.get("glossary_ignored")
@@ -554,7 +724,7 @@ def chat(
                     assistant_response=reply,
                     glossary_injected=rag_meta.get("prompt_appended_glossary", False),
                 )
-                if retry_on_miss:
+                if retry_on_miss and allow_retry:
                     retried = True
                     msgs.append(
                         {
@@ -756,3 +926,55 @@ def chat(
     except Exception:
         pass
     return reply, summoned, rag_meta, trace
+
+
+def chat(
+    messages: list[dict],
+    assistant,
+    *,
+    focus_anchors_only: bool = False,
+    retry_on_miss: bool = False,
+    enable_retry_logging: bool = False,
+    force_chunks: bool = False,
+    **kwargs,
+) -> tuple[str, list[str], dict, dict]:
+    """High-level chat call that can summon memories and RAG context."""
+    turn = prepare_chat(
+        messages,
+        assistant,
+        focus_anchors_only=focus_anchors_only,
+        force_chunks=force_chunks,
+        **kwargs,
+    )
+    logger.debug("Final messages array: %s", turn.msgs)
+    reply = call_llm(turn.msgs, model=turn.model, **turn.llm_kwargs)
+    return finalize_chat(
+        turn,
+        reply,
+        retry_on_miss=retry_on_miss,
+        enable_retry_logging=enable_retry_logging,
+    )
+
+
+def stream_chat(
+    messages: list[dict],
+    assistant,
+    *,
+    focus_anchors_only: bool = False,
+    force_chunks: bool = False,
+    **kwargs,
+) -> tuple[ChatTurn, Iterator[str]]:
+    """Prepare a chat turn and return it with a token iterator for the reply.
+
+    Call :func:`finalize_chat` with ``allow_retry=False`` and the joined
+    tokens once the stream is exhausted.
+    """
+    turn = prepare_chat(
+        messages,
+        assistant,
+        focus_anchors_only=focus_anchors_only,
+        force_chunks=force_chunks,
+        **kwargs,
+    )
+    logger.debug("Final messages array: %s", turn.msgs)
+    return turn, stream_llm(turn.msgs, model=turn.model, **turn.llm_kwargs)
@@ -0,0 +1,159 @@
+"""Write-behind buffer for telemetry rows written on the chat path.
+
+Request handlers call :func:`record` instead of ``Model.objects.create`` for
+log rows nobody reads back in the same request. Rows are queued in a bounded
+process-local buffer; a daemon thread drains it every
+``TELEMETRY_FLUSH_INTERVAL`` seconds (or as soon as ``TELEMETRY_BATCH_SIZE``
+rows are waiting) and writes one ``bulk_create`` per model.
+
+When the buffer is full the oldest row is dropped and counted, so a slow or
+unavailable database never blocks a response. ``bulk_create`` does not send
+``post_save``; receivers that care listen to :data:`telemetry_flushed`.
+
+With ``TELEMETRY_BUFFER_ENABLED`` off (the default, and what tests use)
+:func:`record` writes the row immediately.
+"""
+
+import atexit
+import logging
+import os
+import threading
+from collections import defaultdict, deque
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.dispatch import Signal
+
+logger = logging.getLogger(__name__)
+
+TELEMETRY_BUFFER_ENABLED = getattr(settings, "TELEMETRY_BUFFER_ENABLED", False)
+TELEMETRY_BUFFER_SIZE = getattr(settings, "TELEMETRY_BUFFER_SIZE", 10000)
+TELEMETRY_BATCH_SIZE = getattr(settings, "TELEMETRY_BATCH_SIZE", 500)
+TELEMETRY_FLUSH_INTERVAL = getattr(settings, "TELEMETRY_FLUSH_INTERVAL", 0.5)
+
+# Sent after each bulk write with ``sender=model`` and ``instances=[...]``
+telemetry_flushed = Signal()
+
+
+class TelemetryBuffer:
+    """Bounded queue of unsaved model instances flushed in bulk."""
+
+    def __init__(
+        self,
+        max_records: int = TELEMETRY_BUFFER_SIZE,
+        batch_size: int = TELEMETRY_BATCH_SIZE,
+        flush_interval: float = TELEMETRY_FLUSH_INTERVAL,
+    ):
+        self.max_records = max_records
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: deque = deque()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._flusher_pid: Optional[int] = None
+        self._stats = {"recorded": 0, "written": 0, "dropped": 0, "failed": 0}
+
+    def record(self, model, **fields) -> None:
+        """Queue ``model(**fields)`` for the next bulk write."""
+        self._ensure_flusher()
+        instance = model(**fields)
+        with self._lock:
+            if len(self._queue) >= self.max_records:
+                self._queue.popleft()
+                self._stats["dropped"] += 1
+            self._queue.append(instance)
+            self._stats["recorded"] += 1
+            pending = len(self._queue)
+        if pending >= self.batch_size:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """Write everything queued so far; return the number of rows stored."""
+        with self._flush_lock:
+            with self._lock:
+                items = list(self._queue)
+                self._queue.clear()
+            if not items:
+                return 0
+            by_model = defaultdict(list)
+            for instance in items:
+                by_model[type(instance)].append(instance)
+            written = 0
+            for model, instances in by_model.items():
+                try:
+                    model.objects.bulk_create(instances, batch_size=self.batch_size)
+                except Exception:
+                    logger.exception(
+                        "Dropping %d %s telemetry rows", len(instances), model.__name__
+                    )
+                    with self._lock:
+                        self._stats["failed"] += len(instances)
+                    continue
+                written += len(instances)
+                try:
+                    telemetry_flushed.send(sender=model, instances=instances)
+                except Exception:
+                    logger.exception("telemetry_flushed receiver failed")
+            with self._lock:
+                self._stats["written"] += written
+            return written
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            data = dict(self._stats)
+            data["pending"] = len(self._queue)
+        return data
+
+    # -- background flusher -----------------------------------------------
+    def _ensure_flusher(self) -> None:
+        """Start the flush thread once per process (threads do not survive fork)."""
+        pid = os.getpid()
+        if self._flusher_pid == pid:
+            return
+        with self._lock:
+            if self._flusher_pid == pid:
+                return
+            # Rows inherited from the parent are flushed by the parent
+            self._queue.clear()
+            self._wake = threading.Event()
+            thread = threading.Thread(
+                target=self._run, name="telemetry-flusher", daemon=True
+            )
+            thread.start()
+            self._flusher_pid = pid
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:  # pragma: no cover - keep the thread alive
+                logger.exception("Telemetry flush failed")
+            finally:
+                close_old_connections()
+
+
+_buffer: Optional[TelemetryBuffer] = None
+_buffer_lock = threading.Lock()
+
+
+def get_telemetry_buffer() -> TelemetryBuffer:
+    """Return the process-wide :class:`TelemetryBuffer`."""
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = TelemetryBuffer()
+                atexit.register(_buffer.flush)
+    return _buffer
+
+
+def record(model, **fields) -> None:
+    """Store a telemetry row, write-behind when the buffer is enabled."""
+    if not TELEMETRY_BUFFER_ENABLED:
+        model.objects.create(**fields)
+        return
+    get_telemetry_buffer().record(model, **fields)
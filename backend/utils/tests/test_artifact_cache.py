@@ -0,0 +1,72 @@
+import os
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "server.settings")
+import django
+
+django.setup()
+
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from utils import artifact_cache
+
+LOCMEM = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM)
+class ArtifactCacheTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        patcher = patch.object(artifact_cache, "ARTIFACT_CACHE_DIR", Path(tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_key_is_canonical(self):
+        a = artifact_cache.artifact_key("tts", {"text": "hi", "voice": "echo"})
+        b = artifact_cache.artifact_key("tts", {"voice": "echo", "text": "hi"})
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, artifact_cache.artifact_key("sd_image", {"text": "hi"}))
+
+    def test_store_then_lookup_counts_hits_and_misses(self):
+        params = {"text": "hello", "voice": "echo", "provider": "openai"}
+        self.assertIsNone(artifact_cache.lookup("tts", params, ".mp3"))
+        artifact_cache.store("tts", params, b"mp3-bytes", ".mp3")
+        path = artifact_cache.lookup("tts", params, ".mp3")
+        self.assertEqual(path.read_bytes(), b"mp3-bytes")
+
+        row = artifact_cache.stats()["kinds"]["tts"]
+        self.assertEqual((row["hits"], row["misses"]), (1, 1))
+        self.assertEqual((row["entries"], row["bytes"]), (1, 9))
+
+    def test_least_recently_used_is_evicted_first(self):
+        with patch.object(artifact_cache, "ARTIFACT_CACHE_MAX_BYTES", 250):
+            for i in range(2):
+                path = artifact_cache.store("sd_image", {"i": i}, b"x" * 100)
+                os.utime(path, (i, i))
+            # Touching the older entry makes the other one least recent
+            artifact_cache.lookup("sd_image", {"i": 0})
+            artifact_cache.store("sd_image", {"i": 2}, b"x" * 100)
+
+            self.assertIsNotNone(artifact_cache.lookup("sd_image", {"i": 0}))
+            self.assertIsNone(artifact_cache.lookup("sd_image", {"i": 1}))
+            self.assertIsNotNone(artifact_cache.lookup("sd_image", {"i": 2}))
+            self.assertLessEqual(artifact_cache.stats()["bytes"], 250)
+
+    def test_writes_under_budget_do_not_rescan(self):
+        with patch.object(
+            artifact_cache, "_entries", wraps=artifact_cache._entries
+        ) as entries:
+            for i in range(5):
+                artifact_cache.store("tts", {"i": i}, b"x" * 10)
+            # Only the first write scans, to seed the running total
+            self.assertEqual(entries.call_count, 1)
+            self.assertEqual(cache.get(artifact_cache.TOTAL_BYTES_KEY), 50)
+            artifact_cache.store("tts", {"i": 0}, b"x" * 4)
+            self.assertEqual(cache.get(artifact_cache.TOTAL_BYTES_KEY), 44)
+            self.assertEqual(entries.call_count, 1)